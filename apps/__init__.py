@@ -5,6 +5,8 @@ from apps.messaging import *
 from walkoff.appgateway.console import ConsoleLoggingHandler
 import dill
 
+from walkoff.appgateway.accumulators import get_execution_state_expiration
+from walkoff.appgateway.appinstance import app_fields_key
 from walkoff.cache import make_cache
 import walkoff.config
 
@@ -58,17 +60,14 @@ class App(object):
         self.context = context
         self._cache = make_cache(walkoff.config.Config.CACHE)
 
+    def _get_cache_key(self):
+        return app_fields_key(self.context['workflow_execution_id'])
+
     def _format_cache_key(self, field_name):
-        return self.__cache_separator.join(
-            [str(self.context['workflow_execution_id']), self.app_name, str(self.device_id), field_name]
-        )
+        return self.__cache_separator.join([self.app_name, str(self.device_id), field_name])
 
-    def _get_field_pattern(self, context=None):
-        if context is None:
-            context = self.context
-        return self.__cache_separator.join(
-            [str(context['workflow_execution_id']), self.app_name, str(self.device_id), '*']
-        )
+    def _get_field_prefix(self):
+        return self._format_cache_key('')
 
     def get_all_devices(self):
         """Gets all the devices associated with this app
@@ -82,15 +81,17 @@ class App(object):
         self._load_from_context()
 
     def _load_from_context(self):
-        key_pattern = self._get_field_pattern()
-        for key in self._cache.scan(key_pattern):
-            value = dill.loads(self._cache.get(key))
-            field = key.split(self.__cache_separator)[-1]
-            self.__dict__[field] = value
+        prefix = self._get_field_prefix()
+        for key, value in self._cache.hgetall(self._get_cache_key()).items():
+            if key.startswith(prefix):
+                self.__dict__[key[len(prefix):]] = dill.loads(value)
 
     def _clear_cache(self):
-        for key in self._cache.scan(self._get_field_pattern()):
-            self._cache.delete(key)
+        prefix = self._get_field_prefix()
+        cache_key = self._get_cache_key()
+        fields = [key for key in self._cache.hkeys(cache_key) if key.startswith(prefix)]
+        if fields:
+            self._cache.hdel(cache_key, *fields)
 
     def shutdown(self):
         """When implemented, this method performs shutdown procedures for the app
@@ -110,11 +111,10 @@ class App(object):
         try:
             return object.__getattribute__(self, item)
         except AttributeError:
-            key = self._format_cache_key(item)
-            if not self._cache.exists(key):
+            obj = self._cache.hget(self._get_cache_key(), self._format_cache_key(item))
+            if obj is None:
                 raise AttributeError
             else:
-                obj = self._cache.get(key)
                 return dill.loads(obj)
 
     def __setattr__(self, key, value):
@@ -125,7 +125,8 @@ class App(object):
         else:
             value = dill.dumps(value)
             key = self._format_cache_key(key)
-            self._cache.set(key, value)
+            self._cache.hset_multiple(self._get_cache_key(), {key: value},
+                                      expire=get_execution_state_expiration(walkoff.config.Config))
 
     @classmethod
     def from_cache(cls, app, device, context):
@@ -199,6 +199,15 @@ class InterfaceEventDispatcher(object):
 
         return handler
 
+    @classmethod
+    def get_subscribed_events(cls):
+        """Gets the events which have at least one registered interface event handler
+
+        Returns:
+            set(WalkoffEvent): The events
+        """
+        return cls.event_dispatcher.get_registered_events()
+
     @classmethod
     def _clear(cls):
         """Clears all the registered callbacks
@@ -375,6 +375,15 @@ class EventDispatcher(object):
         return (sender_id is not None
                 and sender_id in self._router and event in self._router[sender_id])
 
+    def get_registered_events(self):
+        """Gets the events which have at least one registered callback
+
+        Returns:
+            set(WalkoffEvent): The events
+        """
+        return {event for events in self._router.values() for event, callbacks in events.items()
+                if callbacks.strong or len(callbacks.weak)}
+
     def is_registered(self, entry, event, func):
         """Is a function registered for a given entry ID and event?
 
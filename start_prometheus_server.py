@@ -1,9 +1,14 @@
 from flask import Flask
 from prometheus_flask_exporter import PrometheusMetrics
 
+import walkoff.cache
 import walkoff.config
+from walkoff.server.pipelinecollector import register_pipeline_metrics
 
 if __name__ == "__main__":
+    walkoff.config.Config.load_config()
+    walkoff.config.Config.load_env_vars()
     app = Flask('prometheus')
     PrometheusMetrics(app, path='/prometheus_metrics')
+    register_pipeline_metrics(walkoff.cache.make_cache(walkoff.config.Config.CACHE))
     app.run(host=walkoff.config.Config.HOST, port=walkoff.config.Config.PORT)
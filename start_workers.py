@@ -5,7 +5,9 @@ import os
 import signal
 import time
 
+import walkoff.cache
 import walkoff.config
+from walkoff.worker.supervisor import WorkerSupervisor
 from walkoff.worker.worker import Worker
 
 logger = logging.getLogger(__name__)
@@ -16,6 +18,8 @@ def parse_args():
     parser.add_argument('-n', '--num', help='Number of workers to spawn')
     parser.add_argument('-v', '--version', help='Get the version of WALKOFF running', action='store_true')
     parser.add_argument('-c', '--config', help='Configuration file to use')
+    parser.add_argument('-e', '--elastic', help='Resize the pool of workers to fit the workflow request queue',
+                        action='store_true')
     args = parser.parse_args()
     if args.version:
         print(walkoff.__version__)
@@ -38,6 +42,21 @@ def spawn_worker_processes():
         shutdown_procs(pids)
 
 
+def make_worker_supervisor():
+    """Makes a supervisor which keeps between MIN_WORKER_PROCESSES and MAX_WORKER_PROCESSES workers running
+
+    Returns:
+        (WorkerSupervisor): The supervisor
+    """
+    config = walkoff.config.Config
+    return WorkerSupervisor(walkoff.cache.make_cache(config.CACHE), config.CONFIG_PATH,
+                            int(config.MIN_WORKER_PROCESSES), int(config.MAX_WORKER_PROCESSES),
+                            int(config.NUMBER_THREADS_PER_PROCESS), interval=float(config.WORKER_SCALE_INTERVAL),
+                            scale_up_utilization=float(config.WORKER_SCALE_UP_UTILIZATION),
+                            scale_down_utilization=float(config.WORKER_SCALE_DOWN_UTILIZATION),
+                            scale_down_checks=int(config.WORKER_SCALE_DOWN_CHECKS))
+
+
 def shutdown_procs(procs):
     for proc in procs:
         if proc.is_alive():
@@ -58,6 +77,16 @@ if __name__ == '__main__':
     else:
         walkoff.config.initialize()
 
+    if args.elastic or walkoff.config.Config.WORKER_POOL_MODE == 'elastic':
+        supervisor = make_worker_supervisor()
+        try:
+            supervisor.run()
+        except KeyboardInterrupt:
+            supervisor.shutdown()
+            shutdown_procs(supervisor.processes)
+        finally:
+            os._exit(0)
+
     processes = spawn_worker_processes()
 
     try:
@@ -49,6 +49,16 @@ __all__ = ['test_accumulators',
            'test_playbook',
            'test_redis_cache_adapter',
            'test_redis_subscription',
+           'test_request_queue_lanes',
+           'test_request_queue_reaper',
+           'test_result_store',
+           'test_result_liveness',
+           'test_pure_results',
+           'test_receiver_metrics',
+           'test_status_persister',
+           'test_event_filter',
+           'test_latency_histograms',
+           'test_pipeline_metrics',
            'test_problem',
            'test_remote_action_exec_strategy',
            'test_roles_pages_database',
@@ -58,6 +68,7 @@ __all__ = ['test_accumulators',
            'test_scheduler_actions',
            'test_scheduler',
            'test_scheduler_utils',
+           'test_serialization',
            'test_simple_workflow',
            'test_sse_stream',
            'test_streamable_blueprint',
@@ -74,7 +85,12 @@ __all__ = ['test_accumulators',
            'test_workflow_results_handler',
            'test_workflow_results_stream',
            'test_workflow_server',
+           'test_workflow_executor',
+           'test_execution_plan',
+           'test_execution_state_reaper',
+           'test_parallel_workflow_execution',
            'test_workflow_status',
+           'test_worker_supervisor',
            'test_zmq_communication',
            'test_zmq_communication_server',
            'testapps']
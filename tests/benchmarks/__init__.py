@@ -0,0 +1,6 @@
+"""Benchmarks for performance sensitive parts of WALKOFF.
+
+These are not run as part of the test suites. Run them individually as modules from the root directory, e.g.
+``python -m tests.benchmarks.benchmark_dispatch``. Benchmarks which use the cache flush the database they are pointed
+at, so run them against a scratch Redis database.
+"""
@@ -0,0 +1,68 @@
+"""Compares the 'external' accumulator, which keeps each entry under its own cache key, with the 'external_hash'
+accumulator, which keeps the entries of each execution in one hash.
+
+The accumulators of a number of other executions are filled first, since the 'external' accumulator scans the whole
+keyspace to list or count its entries. Each simulated execution then seeds its branch counters, writes and reads the
+result of each of its actions, and lists every entry when it shuts down, the way `WorkflowExecutionContext` does.
+
+Usage:
+    python -m tests.benchmarks.benchmark_accumulator [--executions N] [--actions N] [--background N] [--db DB]
+"""
+import argparse
+import time
+from uuid import uuid4
+
+import walkoff.cache
+from walkoff.appgateway.accumulators import ExternallyCachedAccumulator, ExternallyCachedHashAccumulator
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the externally cached accumulators')
+    parser.add_argument('-e', '--executions', type=int, default=100, help='Number of executions to simulate')
+    parser.add_argument('-a', '--actions', type=int, default=20, help='Number of actions per execution')
+    parser.add_argument('-b', '--background', type=int, default=500,
+                        help='Number of other executions with entries in the cache')
+    parser.add_argument('--host', default='localhost', help='Redis host')
+    parser.add_argument('--port', type=int, default=6379, help='Redis port')
+    parser.add_argument('--db', type=int, default=15, help='Redis database to use. This database will be flushed')
+    return parser.parse_args()
+
+
+def simulate_execution(accumulator, actions):
+    accumulator.update({uuid4(): 0 for _ in range(actions)})
+    action_ids = [uuid4() for _ in range(actions)]
+    for i, action_id in enumerate(action_ids):
+        if i:
+            accumulator[action_ids[i - 1]]
+        accumulator[action_id] = {'status': 'Success', 'result': 'x' * 100}
+    len(accumulator)
+    dict(accumulator.items())
+    accumulator.clear()
+
+
+def run_layout(accumulator_class, cache, args):
+    cache.clear()
+    for _ in range(args.background):
+        accumulator_class(cache, uuid4()).update({uuid4(): 0 for _ in range(args.actions)})
+
+    start = time.time()
+    for _ in range(args.executions):
+        simulate_execution(accumulator_class(cache, uuid4()), args.actions)
+    return time.time() - start
+
+
+def main():
+    args = parse_args()
+    cache = walkoff.cache.make_cache({'type': 'redis', 'host': args.host, 'port': args.port, 'db': args.db})
+
+    print('{:>14} {:>12} {:>12} {:>18}'.format('layout', 'executions', 'elapsed (s)', 'ms per execution'))
+    for name, accumulator_class in (('external', ExternallyCachedAccumulator),
+                                    ('external_hash', ExternallyCachedHashAccumulator)):
+        elapsed = run_layout(accumulator_class, cache, args)
+        print('{:>14} {:>12} {:>12.3f} {:>18.2f}'.format(
+            name, args.executions, elapsed, elapsed / args.executions * 1000))
+    cache.clear()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Compares the throughput of admitting workflows by polling for free capacity and by waiting on workflow slots.
+
+A dequeuer thread mimics `Worker.receive_workflows`, taking requests from an in-memory queue and submitting them to a
+thread pool. Each request sleeps for a short, random time, like the short workflows which make up most of the load. In
+'polling' admission the dequeuer counts the executing workflows under a lock and sleeps for 100 ms whenever the pool is
+full. In 'semaphore' admission it waits on `WorkflowExecutor.acquire_slots`, which wakes it as soon as a workflow
+finishes.
+
+Usage:
+    python -m tests.benchmarks.benchmark_admission [--requests N] [--threads N] [--duration MS]
+"""
+import argparse
+import random
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from six.moves import queue
+
+import walkoff.config
+from walkoff.appgateway.appinstancerepo import AppInstanceRepo
+from walkoff.worker.workflow_exec_strategy import WorkflowExecutor
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the workflow admission strategies')
+    parser.add_argument('-n', '--requests', type=int, default=500, help='Number of requests to execute per strategy')
+    parser.add_argument('-t', '--threads', type=int, default=4, help='Number of workflow threads')
+    parser.add_argument('-d', '--duration', type=float, default=5., help='Mean workflow duration in milliseconds')
+    return parser.parse_args()
+
+
+def make_requests(count):
+    requests = queue.Queue()
+    for i in range(count):
+        requests.put(i)
+    return requests
+
+
+def take_batch(requests, count):
+    batch = []
+    while len(batch) < count:
+        try:
+            batch.append(requests.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def run_polling(args, durations):
+    requests = make_requests(args.requests)
+    threadpool = ThreadPoolExecutor(max_workers=args.threads)
+    lock = threading.Lock()
+    executing = [0]
+
+    def execute(request):
+        time.sleep(durations[request])
+        with lock:
+            executing[0] -= 1
+
+    start = time.time()
+    while not requests.empty():
+        with lock:
+            available_capacity = args.threads - executing[0]
+        if available_capacity:
+            batch = take_batch(requests, available_capacity)
+            with lock:
+                executing[0] += len(batch)
+            for request in batch:
+                threadpool.submit(execute, request)
+        time.sleep(0.1)
+    threadpool.shutdown(wait=True)
+    return time.time() - start
+
+
+def run_semaphore(args, durations):
+    requests = make_requests(args.requests)
+    threadpool = ThreadPoolExecutor(max_workers=args.threads)
+    workflow_executor = WorkflowExecutor(walkoff.config.Config, args.threads, None, AppInstanceRepo)
+
+    start = time.time()
+    while not requests.empty():
+        slots = workflow_executor.acquire_slots(timeout=1)
+        batch = take_batch(requests, slots)
+        for request in batch:
+            future = threadpool.submit(time.sleep, durations[request])
+            future.add_done_callback(lambda _: workflow_executor.release_slots())
+        if len(batch) < slots:
+            workflow_executor.release_slots(slots - len(batch))
+    threadpool.shutdown(wait=True)
+    return time.time() - start
+
+
+def main():
+    args = parse_args()
+    durations = [random.uniform(0, 2 * args.duration) / 1000. for _ in range(args.requests)]
+
+    print('{:>10} {:>10} {:>12} {:>16}'.format('admission', 'requests', 'elapsed (s)', 'workflows/s'))
+    for name, run in (('polling', run_polling), ('semaphore', run_semaphore)):
+        elapsed = run(args, durations)
+        print('{:>10} {:>10} {:>12.2f} {:>16.1f}'.format(name, args.requests, elapsed, args.requests / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""Compares the queue latency and idle cache traffic of the 'polling' and 'blocking' workflow dispatch modes.
+
+A consumer thread mimics `Worker.receive_workflows` on top of a `WorkflowReceiver`, while a producer pushes encrypted
+`ExecuteWorkflowMessage`s onto the request queue at random intervals. The time between a request being pushed and the
+consumer receiving it is the queue latency added by the dispatch mode.
+
+Usage:
+    python -m tests.benchmarks.benchmark_dispatch [--requests N] [--timeout SECONDS] [--db DB]
+"""
+import argparse
+import random
+import threading
+import time
+from uuid import uuid4
+
+from nacl.public import PrivateKey, Box
+
+import walkoff.cache
+from walkoff.proto.build.data_pb2 import ExecuteWorkflowMessage
+from walkoff.worker.zmq_workflow_receivers import WorkflowReceiver
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the workflow dispatch modes')
+    parser.add_argument('-n', '--requests', type=int, default=50, help='Number of requests to send per mode')
+    parser.add_argument('-i', '--idle', type=float, default=3.0, help='Seconds to measure idle cache traffic for')
+    parser.add_argument('-t', '--timeout', type=int, default=5, help='Blocking dispatch timeout in seconds')
+    parser.add_argument('--host', default='localhost', help='Redis host')
+    parser.add_argument('--port', type=int, default=6379, help='Redis port')
+    parser.add_argument('--db', type=int, default=15, help='Redis database to use. This database will be flushed')
+    return parser.parse_args()
+
+
+class CountingCache(object):
+    """Wraps a cache and counts the number of queue operations sent to it"""
+
+    def __init__(self, cache):
+        self._cache = cache
+        self.calls = 0
+
+    def rpop(self, key):
+        self.calls += 1
+        return self._cache.rpop(key)
+
+    def rpop_multiple(self, key, count):
+        self.calls += 1
+        return self._cache.rpop_multiple(key, count)
+
+    def brpop(self, keys, timeout=0):
+        self.calls += 1
+        return self._cache.brpop(keys, timeout=timeout)
+
+    def __getattr__(self, item):
+        return getattr(self._cache, item)
+
+
+class Consumer(threading.Thread):
+    def __init__(self, receiver):
+        super(Consumer, self).__init__()
+        self.daemon = True
+        self.receiver = receiver
+        self.received = {}
+
+    def run(self):
+        workflow_generator = self.receiver.receive_workflows()
+        while not self.receiver._exit:
+            workflow_data = next(workflow_generator, None)
+            if workflow_data is not None:
+                self.received[workflow_data[1]] = time.time()
+                continue
+            elif self.receiver.is_blocking:
+                continue
+            time.sleep(0.1)
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(percent / 100. * (len(values) - 1))))
+    return values[index]
+
+
+def run_mode(mode, cache_config, keys, args):
+    worker_key, server_key = keys
+    receiver = WorkflowReceiver(worker_key, server_key.public_key, cache_config, dispatch_mode=mode,
+                                dispatch_timeout=args.timeout)
+    cache = receiver.cache
+    cache.clear()
+    receiver.cache = CountingCache(cache)
+    box = Box(server_key, worker_key.public_key)
+
+    consumer = Consumer(receiver)
+    consumer.start()
+
+    time.sleep(0.5)
+    receiver.cache.calls = 0
+    time.sleep(args.idle)
+    idle_rate = receiver.cache.calls / args.idle
+
+    sent = {}
+    for _ in range(args.requests):
+        message = ExecuteWorkflowMessage()
+        message.workflow_id = str(uuid4())
+        message.workflow_execution_id = str(uuid4())
+        encrypted = box.encrypt(message.SerializeToString())
+        sent[message.workflow_execution_id] = time.time()
+        cache.lpush('request_queue', encrypted)
+        time.sleep(random.uniform(0.01, 0.2))
+
+    deadline = time.time() + 10
+    while len(consumer.received) < len(sent) and time.time() < deadline:
+        time.sleep(0.05)
+    receiver._exit = True
+    consumer.join(timeout=receiver.dispatch_timeout + 1)
+
+    latencies = [(consumer.received[execution_id] - sent_at) * 1000.
+                 for execution_id, sent_at in sent.items() if execution_id in consumer.received]
+    return idle_rate, latencies
+
+
+def main():
+    args = parse_args()
+    cache_config = {'type': 'redis', 'host': args.host, 'port': args.port, 'db': args.db}
+    keys = PrivateKey.generate(), PrivateKey.generate()
+
+    print('{:>10} {:>10} {:>12} {:>12} {:>12} {:>12}'.format(
+        'mode', 'received', 'idle ops/s', 'mean (ms)', 'p95 (ms)', 'max (ms)'))
+    for mode in ('polling', 'blocking'):
+        idle_rate, latencies = run_mode(mode, cache_config, keys, args)
+        if not latencies:
+            print('{:>10} {:>10}'.format(mode, 0))
+            continue
+        print('{:>10} {:>10} {:>12.1f} {:>12.2f} {:>12.2f} {:>12.2f}'.format(
+            mode, len(latencies), idle_rate, sum(latencies) / len(latencies), percentile(latencies, 95),
+            max(latencies)))
+    walkoff.cache.make_cache(cache_config).clear()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Compares the cost of validating the arguments of an app action when its API is compiled on every call and when the
+compiled validator is cached.
+
+A synthetic action API is built with string, integer, array, and object parameters, some of them unconstrained.
+'per call' validation compiles the API into jsonschema validators on each call, which costs what validation cost before
+validators were cached, and 'cached' validation goes through the validator `validate_app_action_parameters` keeps for
+each app action.
+
+Usage:
+    python -m tests.benchmarks.benchmark_validation [--calls N] [--parameters N]
+"""
+import argparse
+import time
+
+from walkoff.appgateway.validator import validate_parameters, validate_app_action_parameters
+from walkoff.executiondb.argument import Argument
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark app action argument validation')
+    parser.add_argument('-c', '--calls', type=int, default=5000, help='Number of validations to run')
+    parser.add_argument('-p', '--parameters', type=int, default=10, help='Number of parameters of the action')
+    return parser.parse_args()
+
+
+def make_parameter(i):
+    kind = i % 5
+    name = 'param{}'.format(i)
+    if kind == 4:
+        return {'name': name, 'type': 'string', 'description': 'A parameter without constraints'}, 'value'
+    elif kind == 0:
+        return ({'name': name, 'type': 'string', 'minLength': 1, 'maxLength': 64, 'pattern': '^[a-z0-9.]+$'},
+                'host{}.example.com'.format(i))
+    elif kind == 1:
+        return {'name': name, 'type': 'integer', 'minimum': 0, 'maximum': 65535, 'required': True}, str(i * 100)
+    elif kind == 2:
+        return ({'name': name, 'type': 'array', 'items': {'type': 'string', 'format': 'ipv4'}},
+                ['10.0.0.{}'.format(octet) for octet in range(10)])
+    return ({'name': name,
+             'schema': {'type': 'object', 'required': ['ioc'],
+                        'properties': {'ioc': {'type': 'string'}, 'score': {'type': 'number'}}}},
+            {'ioc': 'evil.example.com', 'score': '9.5'})
+
+
+def main():
+    args = parse_args()
+    parameters = [make_parameter(i) for i in range(args.parameters)]
+    api = [parameter for parameter, _ in parameters]
+    arguments = [Argument(parameter['name'], value=value) for parameter, value in parameters]
+
+    def per_call():
+        validate_parameters(api, arguments, 'app Benchmark action benchmark', accumulator={})
+
+    def cached():
+        validate_app_action_parameters(api, arguments, 'Benchmark', 'benchmark', accumulator={})
+
+    print('{:>10} {:>8} {:>12} {:>14}'.format('validator', 'calls', 'elapsed (s)', 'us per call'))
+    for name, validate in (('per call', per_call), ('cached', cached)):
+        start = time.time()
+        for _ in range(args.calls):
+            validate()
+        elapsed = time.time() - start
+        print('{:>10} {:>8} {:>12.3f} {:>14.2f}'.format(name, args.calls, elapsed, elapsed / args.calls * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compares the cost of looking up the next Action and its Branches by scanning a workflow and through a
+`WorkflowIndex`.
+
+A synthetic workflow is built with a number of actions, and branches from random sources to random destinations. Each
+step of an execution looks up the executing action and the branches leaving it, sorted by priority. 'scan' lookups do
+this the way `WorkflowExecutionContext` did before it was indexed, and 'indexed' lookups go through the
+`WorkflowIndex` the context now builds.
+
+Usage:
+    python -m tests.benchmarks.benchmark_workflow_lookup [--actions N] [--branches N] [--steps N]
+"""
+import argparse
+import random
+import time
+from uuid import uuid4
+
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.workflow import Workflow
+from walkoff.worker.workflow_exec_context import WorkflowIndex
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark action and branch lookups in large workflows')
+    parser.add_argument('-a', '--actions', type=int, default=300, help='Number of actions in the workflow')
+    parser.add_argument('-b', '--branches', type=int, default=500, help='Number of branches in the workflow')
+    parser.add_argument('-s', '--steps', type=int, default=10000, help='Number of steps to look up')
+    return parser.parse_args()
+
+
+def make_workflow(action_count, branch_count):
+    actions = [Action('HelloWorld', 'helloWorld', 'action{}'.format(i), id=uuid4()) for i in range(action_count)]
+    branches = [Branch(source_id=random.choice(actions).id, destination_id=random.choice(actions).id,
+                       priority=random.randint(1, 10))
+                for _ in range(branch_count)]
+    return Workflow('benchmark', actions[0].id, actions=actions, branches=branches)
+
+
+def scan_step(workflow, action_id):
+    action = next((action for action in workflow.actions if action.id == action_id), None)
+    branches = sorted(workflow.get_branches_by_action_id(action_id), key=lambda branch_: branch_.priority)
+    return action, branches
+
+
+def indexed_step(index, action_id):
+    return index.actions.get(action_id), index.branches.get(action_id, [])
+
+
+def main():
+    args = parse_args()
+    workflow = make_workflow(args.actions, args.branches)
+    steps = [random.choice(workflow.actions).id for _ in range(args.steps)]
+
+    start = time.time()
+    index = WorkflowIndex(workflow)
+    index_time = time.time() - start
+
+    print('{:>8} {:>10} {:>12} {:>14}'.format('lookup', 'steps', 'elapsed (s)', 'us per step'))
+    for name, step, target in (('scan', scan_step, workflow), ('indexed', indexed_step, index)):
+        start = time.time()
+        for action_id in steps:
+            step(target, action_id)
+        elapsed = time.time() - start
+        print('{:>8} {:>10} {:>12.3f} {:>14.2f}'.format(name, args.steps, elapsed, elapsed / args.steps * 1e6))
+    print('Building the index took {:.2f} ms'.format(index_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -21,15 +21,20 @@ add_tests_to_suite(server_suite, __server_tests)
 
 __execution_tests = [test_validatable, test_argument, test_remote_action_exec_strategy, test_action,
                      test_helper_functions, test_workflow_results_handler, test_make_cache,
-                     test_workflow_communication_receiver, test_workflow_receiver,
-                     test_transform, test_condition, test_branch, test_app_instance, test_metrics, test_app_utilities,
-                     test_input_validation, test_decorators, test_app_api_validation, test_playbook,
-                     test_condition_transform_validation, test_roles_pages_database, test_users_roles_database,
-                     test_scheduler, test_walkoff_tag, test_app_cache, test_app_base, test_console_logging_handler,
-                     test_workflow_communication_sender, test_device_database, test_device_field_database,
-                     test_action_exec_strategy_factory, test_accumulators, test_accumulator_factory,
-                     test_conditional_expression, test_app_cache_entry, test_app_database, test_device_validation,
-                     test_scheduler_utils]
+                     test_workflow_communication_receiver, test_workflow_receiver, test_request_queue_reaper,
+                     test_request_queue_lanes, test_worker_supervisor, test_workflow_executor, test_execution_plan,
+                     test_parallel_workflow_execution, test_transform, test_condition, test_branch, test_app_instance,
+                     test_metrics, test_app_utilities, test_input_validation, test_decorators, test_app_api_validation,
+                     test_playbook, test_condition_transform_validation, test_roles_pages_database,
+                     test_users_roles_database, test_scheduler, test_walkoff_tag, test_app_cache, test_app_base,
+                     test_console_logging_handler, test_workflow_communication_sender, test_device_database,
+                     test_device_field_database, test_action_exec_strategy_factory, test_accumulators,
+                     test_accumulator_factory, test_conditional_expression, test_app_cache_entry, test_app_database,
+                     test_device_validation, test_scheduler_utils, test_serialization,
+                     test_result_store, test_execution_state_reaper, test_result_liveness, test_pure_results,
+                     test_receiver_metrics, test_status_persister,
+                     test_event_filter, test_latency_histograms,
+                     test_pipeline_metrics]
 
 execution_suite = TestSuite()
 add_tests_to_suite(execution_suite, __execution_tests)
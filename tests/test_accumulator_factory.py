@@ -31,6 +31,40 @@ class TestAccumulatorFactory(TestCase):
         cache = make_cache(Config.CACHE)
         self.assertIs(acc._cache, cache)
 
+    def test_make_external_hash_accumulator(self):
+        class MockConfig(Config):
+            ACCUMULATOR_TYPE = 'external_hash'
+
+        acc = make_accumulator(self.workflow, MockConfig)
+        self.assertIsInstance(acc, ExternallyCachedHashAccumulator)
+        self.assertIs(acc._cache, make_cache(Config.CACHE))
+
+    def test_make_tiered_accumulator(self):
+        class MockConfig(Config):
+            ACCUMULATOR_TYPE = 'tiered'
+            TIERED_ACCUMULATOR_BACKEND = 'external_hash'
+
+        acc = make_accumulator(self.workflow, MockConfig)
+        self.assertIsInstance(acc, TieredAccumulator)
+        self.assertIsInstance(acc._backing, ExternallyCachedHashAccumulator)
+
+    def test_make_tiered_accumulator_bad_backend(self):
+        class MockConfig(Config):
+            ACCUMULATOR_TYPE = 'tiered'
+            TIERED_ACCUMULATOR_BACKEND = 'invalid'
+
+        with self.assertRaises(ValueError):
+            make_accumulator(self.workflow, MockConfig)
+
+    def test_make_tiered_accumulator_non_external_backend(self):
+        for backend in ('memory', 'tiered'):
+            class MockConfig(Config):
+                ACCUMULATOR_TYPE = 'tiered'
+                TIERED_ACCUMULATOR_BACKEND = backend
+
+            with self.assertRaises(ValueError):
+                make_accumulator(self.workflow, MockConfig)
+
     def test_make_accumulator_bad_config(self):
         class MockConfig(Config):
             ACCUMULATOR_TYPE = 'invalid'
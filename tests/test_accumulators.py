@@ -2,7 +2,9 @@ from unittest import TestCase
 from uuid import uuid4
 
 from tests.util.mock_objects import MockRedisCacheAdapter
-from walkoff.appgateway.accumulators import InMemoryAccumulator, ExternallyCachedAccumulator
+from walkoff.appgateway.accumulators import InMemoryAccumulator, ExternallyCachedAccumulator, \
+    ExternallyCachedHashAccumulator, TieredAccumulator, delete_accumulators
+from walkoff.appgateway.serialization import Serializer, JsonFormat
 
 
 class TestInMemoryAccumulator(TestCase):
@@ -145,3 +147,344 @@ class TestExternallyCachedAccumulator(TestCase):
         self.assertEqual(
             self.cache.format_key('a'),
             '{0}{1}{2}{1}a'.format('accumulator', self.cache._cache_separator, self.workflow_id))
+
+    def test_expire(self):
+        cache = ExternallyCachedAccumulator(self.redis_cache, self.workflow_id, expire=10000)
+        cache['a'] = '1'
+        cache.update({'b': '2'})
+        for key in ('a', 'b'):
+            self.assertGreater(self.redis_cache.cache.pttl(cache.format_key(key)), 0)
+
+    def test_discard(self):
+        self.cache.update({'a': '1', 'b': '2'})
+        self.cache.discard('a', 'c')
+        self.assertNotIn('a', self.cache)
+        self.assertEqual(self.cache['b'], '2')
+
+    def test_touch(self):
+        self.cache['a'] = '1'
+        self.assertEqual(self.redis_cache.cache.pttl(self.cache.format_key('a')), -1)
+        self.cache._expire = 10000
+        self.cache.touch()
+        self.assertGreater(self.redis_cache.cache.pttl(self.cache.format_key('a')), 0)
+
+    def test_persist(self):
+        cache = ExternallyCachedAccumulator(self.redis_cache, self.workflow_id, expire=10000)
+        cache.update({'a': '1', 'b': '2'})
+        cache.persist()
+        for key in ('a', 'b'):
+            self.assertEqual(self.redis_cache.cache.pttl(cache.format_key(key)), -1)
+
+
+class TestExternallyCachedHashAccumulator(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.redis_cache = MockRedisCacheAdapter()
+
+    def setUp(self):
+        self.workflow_id = uuid4()
+        self.cache = ExternallyCachedHashAccumulator(self.redis_cache, self.workflow_id)
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_setitem_getitem(self):
+        self.cache['a'] = '42'
+        self.assertEqual(self.cache['a'], '42')
+        self.cache[42] = 'abc'
+        self.assertEqual(self.cache[42], 'abc')
+
+    def test_uuid_and_str_keys_equivalent(self):
+        key = uuid4()
+        self.cache[key] = {'result': 1}
+        self.assertDictEqual(self.cache[str(key)], {'result': 1})
+
+    def test_getitem_dne(self):
+        with self.assertRaises(KeyError):
+            self.cache['a']
+
+    def test_len_empty(self):
+        self.assertEqual(len(self.cache), 0)
+
+    def test_len(self):
+        self.cache.update({'a': '1', 'b': '2', 'c': '3'})
+        self.assertEqual(len(self.cache), 3)
+
+    def test_executions_isolated(self):
+        other = ExternallyCachedHashAccumulator(self.redis_cache, uuid4())
+        self.cache['a'] = '1'
+        self.assertNotIn('a', other)
+        self.assertEqual(len(other), 0)
+
+    def test_delitem(self):
+        self.cache['a'] = '42'
+        del self.cache['a']
+        with self.assertRaises(KeyError):
+            self.cache['a']
+
+    def test_delitem_dne(self):
+        with self.assertRaises(KeyError):
+            del self.cache['a']
+
+    def test_clear(self):
+        self.cache.update({'a': '1', 'b': '2', 'c': '3'})
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_update(self):
+        dict1 = {'a': '1', 'b': '2'}
+        dict2 = {'c': '3'}
+        dict3 = {'d': '4', 'e': '5'}
+        self.cache['f'] = '6'
+        self.cache.update(dict1, dict2, **dict3)
+        for new_dict in (dict1, dict2, dict3):
+            for key, value in new_dict.items():
+                self.assertEqual(self.cache[key], value)
+        self.assertEqual(self.cache['f'], '6')
+
+    def test_keys_values_items(self):
+        entries = {'a': '1', 'b': '2', 'c': '3'}
+        self.cache.update(entries)
+        self.assertSetEqual(set(self.cache.keys()), set(entries))
+        self.assertSetEqual(set(self.cache), set(entries))
+        self.assertSetEqual(set(self.cache.values()), set(entries.values()))
+        self.assertDictEqual(dict(self.cache.items()), entries)
+
+    def test_pop(self):
+        self.cache.update({'a': '1', 'b': '2'})
+        self.assertEqual(self.cache.pop('a', '2'), '1')
+        self.assertNotIn('a', self.cache)
+
+    def test_pop_with_default(self):
+        self.assertEqual(self.cache.pop('c', '3'), '3')
+
+    def test_pop_dne(self):
+        with self.assertRaises(KeyError):
+            self.cache.pop('a')
+
+    def test_pop_too_many_args(self):
+        with self.assertRaises(TypeError):
+            self.cache.pop(1, '2', '3')
+
+    def test_serializer(self):
+        cache = ExternallyCachedHashAccumulator(self.redis_cache, self.workflow_id,
+                                                serializer=Serializer(JsonFormat, compression_threshold=100))
+        cache['a'] = ['1.2.3.4'] * 100
+        self.assertListEqual(self.cache['a'], ['1.2.3.4'] * 100)
+
+    def test_bytes_written(self):
+        self.cache['a'] = 'x' * 100
+        self.cache.update({'a': 'y' * 100, 'b': 1})
+        self.assertGreater(self.cache.bytes_written['a'], 200)
+        self.assertLess(self.cache.bytes_written['b'], self.cache.bytes_written['a'])
+
+    def test_contains(self):
+        self.assertFalse('a' in self.cache)
+        self.assertFalse(self.cache.has_key('a'))
+        self.cache['a'] = '3'
+        self.assertTrue('a' in self.cache)
+        self.assertTrue(self.cache.has_key('a'))
+
+
+    def test_expire(self):
+        cache = ExternallyCachedHashAccumulator(self.redis_cache, self.workflow_id, expire=10000)
+        cache['a'] = '1'
+        self.assertGreater(self.redis_cache.cache.pttl(cache._key), 0)
+
+    def test_touch(self):
+        self.cache['a'] = '1'
+        self.assertEqual(self.redis_cache.cache.pttl(self.cache._key), -1)
+        self.cache._expire = 10000
+        self.cache.touch()
+        self.assertGreater(self.redis_cache.cache.pttl(self.cache._key), 0)
+
+    def test_persist(self):
+        cache = ExternallyCachedHashAccumulator(self.redis_cache, self.workflow_id, expire=10000)
+        cache['a'] = '1'
+        cache.persist()
+        self.assertEqual(self.redis_cache.cache.pttl(cache._key), -1)
+
+    def test_discard(self):
+        self.cache.update({'a': '1', 'b': '2'})
+        self.cache.discard('a', 'c')
+        self.cache.discard()
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache['b'], '2')
+
+    def test_delete_accumulators(self):
+        self.cache['a'] = '1'
+        ExternallyCachedAccumulator(self.redis_cache, self.workflow_id)['b'] = '2'
+        delete_accumulators(self.redis_cache, self.workflow_id)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(len(ExternallyCachedAccumulator(self.redis_cache, self.workflow_id)), 0)
+
+    def test_delete_accumulators_not_keyed(self):
+        self.cache['a'] = '1'
+        ExternallyCachedAccumulator(self.redis_cache, self.workflow_id)['b'] = '2'
+        delete_accumulators(self.redis_cache, self.workflow_id, keyed=False)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(len(ExternallyCachedAccumulator(self.redis_cache, self.workflow_id)), 1)
+
+
+class TestTieredAccumulator(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.redis_cache = MockRedisCacheAdapter()
+
+    def setUp(self):
+        self.workflow_id = uuid4()
+        self.backing = ExternallyCachedHashAccumulator(self.redis_cache, self.workflow_id)
+        self.cache = TieredAccumulator(self.backing)
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_persist(self):
+        self.backing._expire = 10000
+        self.cache['a'] = '1'
+        self.cache.flush()
+        self.assertGreater(self.redis_cache.cache.pttl(self.backing._key), 0)
+        self.cache.persist()
+        self.assertEqual(self.redis_cache.cache.pttl(self.backing._key), -1)
+
+    def test_setitem_getitem(self):
+        self.cache['a'] = '42'
+        self.assertEqual(self.cache['a'], '42')
+        key = uuid4()
+        self.cache[key] = 'abc'
+        self.assertEqual(self.cache[str(key)], 'abc')
+
+    def test_writes_buffered_until_flush(self):
+        self.cache.update({'a': '1', 'b': '2'})
+        self.cache['c'] = '3'
+        self.assertEqual(len(self.backing), 0)
+        self.cache.flush()
+        self.assertDictEqual(dict(self.backing.items()), {'a': '1', 'b': '2', 'c': '3'})
+
+    def test_getitem_reads_through(self):
+        self.backing['a'] = '1'
+        self.assertEqual(self.cache['a'], '1')
+        self.assertIn('a', self.cache)
+
+    def test_getitem_dne(self):
+        with self.assertRaises(KeyError):
+            self.cache['a']
+
+    def test_delitem(self):
+        self.cache['a'] = '1'
+        self.cache.flush()
+        del self.cache['a']
+        self.assertNotIn('a', self.cache)
+        with self.assertRaises(KeyError):
+            self.cache['a']
+        self.cache.flush()
+        self.assertNotIn('a', self.backing)
+
+    def test_delitem_dne(self):
+        with self.assertRaises(KeyError):
+            del self.cache['a']
+
+    def test_discard(self):
+        self.cache['a'] = '1'
+        self.cache.flush()
+        self.cache['b'] = '2'
+        self.cache.discard('a', 'b', 'c')
+        self.assertNotIn('a', self.cache)
+        self.assertNotIn('b', self.cache)
+        self.cache.flush()
+        self.assertEqual(len(self.backing), 0)
+
+    def test_len_and_items_flush(self):
+        entries = {'a': '1', 'b': '2'}
+        self.cache.update(entries)
+        self.assertEqual(len(self.cache), 2)
+        self.assertDictEqual(dict(self.cache.items()), entries)
+        self.assertSetEqual(set(self.cache), set(entries))
+
+    def test_pop(self):
+        self.cache['a'] = '1'
+        self.assertEqual(self.cache.pop('a'), '1')
+        self.assertNotIn('a', self.cache)
+        self.assertEqual(self.cache.pop('a', '2'), '2')
+        with self.assertRaises(KeyError):
+            self.cache.pop('a')
+
+    def test_evict(self):
+        self.cache['a'] = '1'
+        self.cache.evict('a')
+        self.assertEqual(self.cache['a'], '1')
+        self.cache.flush()
+        self.backing['a'] = '2'
+        self.assertEqual(self.cache['a'], '1')
+        self.cache.evict('a')
+        self.assertEqual(self.cache['a'], '2')
+
+    def test_clear(self):
+        self.cache['a'] = '1'
+        self.cache.flush()
+        self.cache['b'] = '2'
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(len(self.backing), 0)
+
+
+class FailingAccumulator(InMemoryAccumulator):
+    def __init__(self):
+        super(FailingAccumulator, self).__init__()
+        self.failing = False
+
+    def update(self, *args, **kwargs):
+        if self.failing:
+            raise IOError('cache unavailable')
+        super(FailingAccumulator, self).update(*args, **kwargs)
+
+    def discard(self, *keys):
+        if self.failing:
+            raise IOError('cache unavailable')
+        for key in keys:
+            self.pop(key, None)
+
+
+class TestTieredAccumulatorFlush(TestCase):
+
+    def setUp(self):
+        self.backing = FailingAccumulator()
+        self.cache = TieredAccumulator(self.backing)
+
+    def test_failed_flush_kept_for_next_flush(self):
+        self.backing['b'] = '1'
+        self.cache['a'] = '1'
+        self.cache.discard('b')
+        self.backing.failing = True
+        with self.assertRaises(IOError):
+            self.cache.flush()
+        self.backing.failing = False
+        self.cache.flush()
+        self.assertDictEqual(dict(self.backing), {'a': '1'})
+
+    def test_failed_flush_does_not_overwrite_newer_writes(self):
+        self.cache['a'] = '1'
+        self.cache['b'] = '1'
+        self.backing.failing = True
+        with self.assertRaises(IOError):
+            self.cache.flush()
+        self.cache['a'] = '2'
+        del self.cache['b']
+        self.backing.failing = False
+        self.cache.flush()
+        self.assertDictEqual(dict(self.backing), {'a': '2'})
+
+    def test_entries_being_flushed_not_evicted(self):
+        self.cache['a'] = '1'
+        evicted = []
+
+        def update(*args, **kwargs):
+            self.cache.evict('a')
+            evicted.append(self.cache['a'])
+            FailingAccumulator.update(self.backing, *args, **kwargs)
+
+        self.backing.update = update
+        self.cache.flush()
+        self.assertListEqual(evicted, ['1'])
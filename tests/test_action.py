@@ -284,6 +284,26 @@ class TestAction(unittest.TestCase):
         self.assertTrue(result['started_triggered'])
         self.assertTrue(result['result_triggered'])
 
+    def test_execute_with_accumulator_reuses_literal_arguments(self):
+        action = Action(app_name='HelloWorld', action_name='Add Three', name='helloWorld',
+                        arguments=[Argument('num1', reference='1'),
+                                   Argument('num2', value='4.3'),
+                                   Argument('num3', value='10.2')])
+        self.assertDictEqual(action._literal_arguments, {'num2': 4.3, 'num3': 10.2})
+        instance = TestAction._make_app_instance()
+        accumulator = {'1': '-5.6'}
+        action.execute(LocalActionExecutionStrategy(), accumulator, instance.instance)
+        self.assertAlmostEqual(accumulator[action.id], 8.9)
+        accumulator['1'] = '1.5'
+        action.execute(LocalActionExecutionStrategy(), accumulator, instance.instance)
+        self.assertAlmostEqual(accumulator[action.id], 16.0)
+
+    def test_prepare_literal_arguments_invalid(self):
+        action = Action(app_name='HelloWorld', action_name='Add Three', name='helloWorld',
+                        arguments=[Argument('num1', value='invalid')])
+        action.prepare_literal_arguments()
+        self.assertIsNone(action._literal_arguments)
+
     def test_execute_with_complex_args(self):
         action = Action(app_name='HelloWorld', action_name='Json Sample', name='helloWorld',
                         arguments=[
@@ -100,12 +100,14 @@ class TestAppBase(TestCase):
         app._cache = self.cache
         app.foo = 42
         app.bar = 23
+        self.assertSetEqual(set(self.cache.scan()), {app._get_cache_key()})
         self.assertSetEqual(
-            set(self.cache.scan()),
+            set(self.cache.hkeys(app._get_cache_key())),
             {app._format_cache_key('foo'), app._format_cache_key('bar')}
         )
         for field, expected in (('foo', 42), ('bar', 23)):
-            self.assertEqual(dill.loads(self.cache.get(app._format_cache_key(field))), expected)
+            self.assertEqual(dill.loads(self.cache.hget(app._get_cache_key(), app._format_cache_key(field))),
+                             expected)
 
     def test_getattr_gets_from_cache(self):
         workflow_id = uuid4()
@@ -114,8 +116,8 @@ class TestAppBase(TestCase):
         app._cache = self.cache
         app.foo = 42
         app.bar = 23
-        self.cache.set(app._format_cache_key('foo'), dill.dumps('a'))
-        self.cache.set(app._format_cache_key('bar'), dill.dumps('b'))
+        self.cache.hset(app._get_cache_key(), app._format_cache_key('foo'), dill.dumps('a'))
+        self.cache.hset(app._get_cache_key(), app._format_cache_key('bar'), dill.dumps('b'))
         self.assertEqual(app.foo, 'a')
         self.assertEqual(app.bar, 'b')
         with self.assertRaises(AttributeError):
@@ -5,6 +5,7 @@ from uuid import uuid4
 import walkoff.appgateway
 from tests.util import execution_db_help, initialize_test_config
 from walkoff.appgateway import appinstance
+from walkoff.appgateway.appinstancerepo import AppInstanceRepo
 
 
 class TestInstance(unittest.TestCase):
@@ -45,6 +46,22 @@ class TestInstance(unittest.TestCase):
         created_app.bar = 'abc'
         cache = created_app._cache
 
-        pattern = created_app._get_field_pattern()
+        cache_key = created_app._get_cache_key()
+        inst.shutdown()
+        self.assertListEqual(cache.hkeys(cache_key), [])
+
+    def test_persist_and_touch_fields(self):
+        execution_id = uuid4()
+        inst = appinstance.AppInstance.create("HelloWorld", "testDevice", {'workflow_execution_id': execution_id})
+        created_app = inst()
+        created_app.foo = 42
+        cache = created_app._cache
+        cache_key = appinstance.app_fields_key(execution_id)
+        self.assertGreater(cache.cache.pttl(cache_key), 0)
+
+        repo = AppInstanceRepo()
+        repo.persist_fields(execution_id)
+        self.assertEqual(cache.cache.pttl(cache_key), -1)
+        repo.touch_fields(execution_id)
+        self.assertGreater(cache.cache.pttl(cache_key), 0)
         inst.shutdown()
-        self.assertListEqual(list(cache.scan(pattern)), [])
@@ -1,7 +1,7 @@
 from unittest import TestCase
 
 from walkoff.appgateway.apiutil import InvalidArgument
-from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.argument import Argument, compile_selection
 
 
 class TestArgument(TestCase):
@@ -50,30 +50,48 @@ class TestArgument(TestCase):
         arg = Argument('test_name', reference='some_id', selection=[1, 'a', 2])
         self.assert_init_equals(arg, 'test_name', reference='some_id', selection=[1, 'a', 2])
 
-    def test_get_next_selection_key_on_dict(self):
-        self.assertEqual(Argument._get_next_selection({'a': 1, '2': 'something'}, 'a'), 1)
+    def test_compile_selection_key_on_dict(self):
+        self.assertEqual(compile_selection(['a'])({'a': 1, '2': 'something'}), 1)
 
-    def test_get_next_selection_key_on_list(self):
+    def test_compile_selection_key_on_list(self):
         with self.assertRaises(ValueError):
-            Argument._get_next_selection(['a', 1, '2', 'something'], 'a')
+            compile_selection(['a'])(['a', 1, '2', 'something'])
 
-    def test_get_next_selection_key_on_value(self):
+    def test_compile_selection_key_on_value(self):
         with self.assertRaises(ValueError):
-            Argument._get_next_selection('something', 'a')
+            compile_selection(['a'])('something')
 
-    def test_get_next_selection_index_on_dict(self):
+    def test_compile_selection_index_on_dict(self):
         with self.assertRaises(KeyError):
-            Argument._get_next_selection({'a': 1, '2': 'something'}, 3)
+            compile_selection([3])({'a': 1, '2': 'something'})
 
-    def test_get_next_selection_int_index_on_list(self):
-        self.assertEqual(Argument._get_next_selection(['a', 1, '2', 'something'], 3), 'something')
+    def test_compile_selection_int_index_on_list(self):
+        self.assertEqual(compile_selection([3])(['a', 1, '2', 'something']), 'something')
 
-    def test_get_next_selection_str_index_on_list(self):
-        self.assertEqual(Argument._get_next_selection(['a', 1, '2', 'something'], '3'), 'something')
+    def test_compile_selection_str_index_on_list(self):
+        self.assertEqual(compile_selection(['3'])(['a', 1, '2', 'something']), 'something')
 
-    def test_get_next_selection_index_on_list_out_of_bounds(self):
+    def test_compile_selection_index_on_list_out_of_bounds(self):
         with self.assertRaises(IndexError):
-            Argument._get_next_selection(['a', 1, '2', 'something'], 10)
+            compile_selection([10])(['a', 1, '2', 'something'])
+
+    def test_compile_selection_empty(self):
+        self.assertEqual(compile_selection([])({'a': 1}), {'a': 1})
+
+    def test_compile_selection_invalid_selector(self):
+        for selector in (None, 1.5, True, {'a': 1}, ['a']):
+            with self.assertRaises(ValueError):
+                compile_selection(['a', selector])
+
+    def test_init_with_invalid_selection(self):
+        arg = Argument('test', reference='some_id', selection=['a', None])
+        self.assertEqual(len(arg.errors), 1)
+
+    def test_select_selection_changed(self):
+        arg = Argument('test', reference='some_id', selection=['a'])
+        self.assertEqual(arg._select({'a': 1, 'b': 2}), 1)
+        arg.selection = ['b']
+        self.assertEqual(arg._select({'a': 1, 'b': 2}), 2)
 
     def test_select_one_on_list(self):
         arg = Argument('test', reference='some_id', selection=[1])
@@ -61,6 +61,27 @@ class TestCondition(unittest.TestCase):
         condition = Condition('HelloWorld', action_name='Top Condition', transforms=transforms)
         self.__compare_init(condition, 'HelloWorld', 'Top Condition', transforms, [])
 
+    def test_init_pure(self):
+        self.assertTrue(Condition('HelloWorld', action_name='mod1_flag2', arguments=[Argument('arg1', value=3)])._pure)
+        self.assertFalse(Condition('HelloWorld', 'Top Condition')._pure)
+
+    def test_execute_pure_memoized(self):
+        strategy = LocalActionExecutionStrategy()
+        for data, expected in (('5', True), ('5', True), ('4', False)):
+            condition = Condition('HelloWorld', action_name='mod1_flag2', arguments=[Argument('arg1', value=3)])
+            self.assertEqual(condition.execute(strategy, data, {}), expected)
+        self.assertEqual(strategy.pure_results.hits, 1)
+        self.assertEqual(strategy.pure_results.misses, 2)
+
+    def test_execute_pure_memoized_negated(self):
+        strategy = LocalActionExecutionStrategy()
+        condition = Condition('HelloWorld', action_name='mod1_flag2', arguments=[Argument('arg1', value=3)])
+        negated = Condition('HelloWorld', action_name='mod1_flag2', arguments=[Argument('arg1', value=3)],
+                            is_negated=True)
+        self.assertTrue(condition.execute(strategy, '5', {}))
+        self.assertFalse(negated.execute(strategy, '5', {}))
+        self.assertEqual(strategy.pure_results.hits, 1)
+
     def test_execute_action_only_no_arguments_valid_data_no_conversion(self):
         self.assertTrue(Condition('HelloWorld', 'Top Condition').execute(LocalActionExecutionStrategy(), 3.4, {}))
 
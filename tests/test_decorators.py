@@ -47,3 +47,33 @@ class TestDecorators(unittest.TestCase):
 
         self.assertTrue(getattr(add_one, 'transform'))
         self.assertEqual(add_one(1), 2)
+
+    def test_flag_decorator_pure(self):
+        @condition(pure=True)
+        def is_even(x):
+            return x % 2 == 0
+
+        self.assertTrue(getattr(is_even, 'condition'))
+        self.assertTrue(is_pure(is_even))
+        self.assertTrue(is_even(2))
+
+    def test_filter_decorator_pure(self):
+        @transform(pure=True)
+        def add_one(x):
+            return x + 1
+
+        self.assertTrue(getattr(add_one, 'transform'))
+        self.assertTrue(is_pure(add_one))
+        self.assertEqual(add_one(1), 2)
+
+    def test_decorators_not_pure(self):
+        @condition
+        def is_even(x):
+            return x % 2 == 0
+
+        @transform
+        def add_one(x):
+            return x + 1
+
+        self.assertFalse(is_pure(is_even))
+        self.assertFalse(is_pure(add_one))
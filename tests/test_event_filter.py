@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+from tests.util.mock_objects import MockRedisCacheAdapter
+from walkoff.events import WalkoffEvent
+from walkoff.worker.event_filter import EventFilter, is_emitted_at_level, publish_subscribed_events, \
+    get_subscribed_events
+
+
+class MockWorkflow(object):
+    def __init__(self, event_level=None):
+        self.event_level = event_level
+
+
+class TestEventFilter(TestCase):
+
+    def test_is_emitted_at_level(self):
+        self.assertTrue(is_emitted_at_level(WalkoffEvent.ConditionSuccess, 'all'))
+        self.assertTrue(is_emitted_at_level(WalkoffEvent.ConditionError, 'errors'))
+        self.assertFalse(is_emitted_at_level(WalkoffEvent.ConditionSuccess, 'errors'))
+        self.assertFalse(is_emitted_at_level(WalkoffEvent.TransformError, 'none'))
+
+    def test_init_default(self):
+        event_filter = EventFilter()
+        self.assertEqual(event_filter.level, 'all')
+        self.assertDictEqual(event_filter.type_levels, {})
+        self.assertSetEqual(set(event_filter.subscribed_events), set())
+
+    def test_init_invalid_level(self):
+        event_filter = EventFilter(level='invalid')
+        self.assertEqual(event_filter.level, 'all')
+
+    def test_init_invalid_type_levels(self):
+        event_filter = EventFilter(type_levels={'invalid': 'none', 'transform': 'invalid'})
+        self.assertEqual(len(event_filter.type_levels), 1)
+        self.assertEqual(list(event_filter.type_levels.values()), ['all'])
+
+    def test_workflow_and_action_events_always_emitted(self):
+        event_filter = EventFilter(level='none')
+        for event in (WalkoffEvent.WorkflowExecutionStart, WalkoffEvent.ActionStarted,
+                      WalkoffEvent.ActionExecutionSuccess, WalkoffEvent.WorkflowShutdown):
+            self.assertTrue(event_filter.is_emitted(event))
+
+    def test_errors_level(self):
+        event_filter = EventFilter(level='errors')
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.ConditionSuccess))
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.BranchTaken))
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.TransformSuccess))
+        self.assertTrue(event_filter.is_emitted(WalkoffEvent.ConditionError))
+        self.assertTrue(event_filter.is_emitted(WalkoffEvent.TransformError))
+
+    def test_none_level(self):
+        event_filter = EventFilter(level='none')
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.ConditionError))
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.ConditionalExpressionTrue))
+
+    def test_type_levels(self):
+        event_filter = EventFilter(level='none', type_levels={'transform': 'all'})
+        self.assertTrue(event_filter.is_emitted(WalkoffEvent.TransformSuccess))
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.ConditionSuccess))
+
+    def test_workflow_level_overrides(self):
+        event_filter = EventFilter(level='none', type_levels={'condition': 'none'})
+        self.assertTrue(event_filter.is_emitted(WalkoffEvent.ConditionSuccess, MockWorkflow('all')))
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.ConditionSuccess, MockWorkflow()))
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.ConditionSuccess))
+
+    def test_subscribed_events_always_emitted(self):
+        event_filter = EventFilter(level='none', subscribed_events={WalkoffEvent.BranchTaken})
+        self.assertTrue(event_filter.is_emitted(WalkoffEvent.BranchTaken, MockWorkflow('none')))
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.BranchNotTaken))
+
+    def test_update_subscribed_events(self):
+        event_filter = EventFilter(level='none')
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.BranchTaken))
+        event_filter.update_subscribed_events({WalkoffEvent.BranchTaken})
+        self.assertTrue(event_filter.is_emitted(WalkoffEvent.BranchTaken))
+        event_filter.update_subscribed_events(set())
+        self.assertFalse(event_filter.is_emitted(WalkoffEvent.BranchTaken))
+
+
+class TestSubscribedEvents(TestCase):
+
+    def setUp(self):
+        self.cache = MockRedisCacheAdapter()
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_get_subscribed_events_empty(self):
+        self.assertSetEqual(get_subscribed_events(self.cache), set())
+
+    def test_publish_subscribed_events(self):
+        publish_subscribed_events(self.cache, {WalkoffEvent.ConditionSuccess, WalkoffEvent.TransformError})
+        publish_subscribed_events(self.cache, {WalkoffEvent.BranchTaken})
+        self.assertSetEqual(get_subscribed_events(self.cache),
+                            {WalkoffEvent.ConditionSuccess, WalkoffEvent.TransformError, WalkoffEvent.BranchTaken})
+
+    def test_publish_subscribed_events_ignores_unfiltered_events(self):
+        publish_subscribed_events(self.cache, {WalkoffEvent.ActionStarted, WalkoffEvent.WorkflowShutdown})
+        self.assertSetEqual(get_subscribed_events(self.cache), set())
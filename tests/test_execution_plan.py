@@ -0,0 +1,117 @@
+import threading
+from unittest import TestCase
+
+import walkoff.appgateway
+import walkoff.config
+from tests.util import execution_db_help, initialize_test_config
+from tests.util.mock_objects import PubSubCacheSpy
+from walkoff.executiondb import ExecutionDatabase
+from walkoff.worker.execution_plan import ExecutionPlanCache, publish_plan_invalidation, workflow_plans_channel, \
+    invalidate_all_message
+
+
+class MockSubscription(object):
+    def __init__(self, messages):
+        self.messages = messages
+
+    def listen(self):
+        return iter(self.messages)
+
+
+class TestExecutionPlanCache(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        cls.execution_db = execution_db_help.setup_dbs()
+
+    def setUp(self):
+        self.workflow = execution_db_help.load_workflow('basicWorkflowTest', 'helloWorldWorkflow')
+        self.workflow_id = self.workflow.id
+        self.plan_cache = ExecutionPlanCache(self.execution_db, max_plans=2)
+
+    def tearDown(self):
+        execution_db_help.cleanup_execution_db()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_execution_db()
+        walkoff.appgateway.clear_cache()
+
+    def test_get_loads_workflow(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        self.assertEqual(plan.workflow.id, self.workflow_id)
+        self.assertEqual(len(plan.workflow.actions), len(self.workflow.actions))
+
+    def test_get_indexes_workflow(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        for action in plan.workflow.actions:
+            self.assertIs(plan.index.actions[action.id], action)
+        for branch in plan.workflow.branches:
+            self.assertIn(branch, plan.index.branches[branch.source_id])
+
+    def test_get_detaches_workflow(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        self.assertNotIn(plan.workflow, ExecutionDatabase.instance.session)
+
+    def test_get_unknown_workflow(self):
+        self.assertIsNone(self.plan_cache.get('e7c87cd4-4b8f-4a6c-8fd3-0a1a0f7a6e21'))
+
+    def test_get_reuses_plan(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        self.assertIs(self.plan_cache.get(str(self.workflow_id)), plan)
+
+    def test_get_resets_plan(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        for branch in plan.workflow.branches:
+            branch._counter = 3
+        plan = self.plan_cache.get(self.workflow_id)
+        for branch in plan.workflow.branches:
+            self.assertEqual(branch._counter, 0)
+
+    def test_invalidate_workflow(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        self.plan_cache.invalidate(self.workflow_id)
+        new_plan = self.plan_cache.get(self.workflow_id)
+        self.assertIsNot(new_plan, plan)
+        self.assertIs(self.plan_cache.get(self.workflow_id), new_plan)
+
+    def test_invalidate_all(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        self.plan_cache.invalidate()
+        self.assertIsNot(self.plan_cache.get(self.workflow_id), plan)
+
+    def test_app_apis_reloaded(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        walkoff.config.load_app_apis()
+        self.assertIsNot(self.plan_cache.get(self.workflow_id), plan)
+
+    def test_plans_are_per_thread(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        plans = []
+        thread = threading.Thread(target=lambda: plans.append(self.plan_cache.get(self.workflow_id)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(plans[0], plan)
+
+    def test_least_recently_used_plan_dropped(self):
+        workflows = [execution_db_help.load_workflow('multiactionWorkflowTest', 'multiactionWorkflow'),
+                     execution_db_help.load_workflow('dataflowTest', 'dataflowWorkflow')]
+        plan = self.plan_cache.get(self.workflow_id)
+        for workflow in workflows:
+            self.plan_cache.get(workflow.id)
+        self.assertIsNot(self.plan_cache.get(self.workflow_id), plan)
+
+    def test_receive_invalidations(self):
+        plan = self.plan_cache.get(self.workflow_id)
+        self.plan_cache.receive_invalidations(MockSubscription([str(self.workflow_id).encode('utf-8')]))
+        plan2 = self.plan_cache.get(self.workflow_id)
+        self.assertIsNot(plan2, plan)
+        self.plan_cache.receive_invalidations(MockSubscription([invalidate_all_message.encode('utf-8')]))
+        self.assertIsNot(self.plan_cache.get(self.workflow_id), plan2)
+
+    def test_publish_plan_invalidation(self):
+        cache = PubSubCacheSpy()
+        publish_plan_invalidation(cache, [self.workflow_id])
+        publish_plan_invalidation(cache)
+        self.assertListEqual(cache.published[workflow_plans_channel], [str(self.workflow_id), invalidate_all_message])
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+from uuid import uuid4
+
+from tests.util import execution_db_help, initialize_test_config
+from tests.util.mock_objects import MockRedisCacheAdapter
+from walkoff.appgateway.accumulators import ExternallyCachedHashAccumulator
+from walkoff.appgateway.appinstance import app_fields_key
+from walkoff.executiondb import ExecutionDatabase
+from walkoff.executiondb.workflowresults import WorkflowStatus
+from walkoff.multiprocessedexecutor.executionstate import ExecutionStateReaper
+
+
+class TestExecutionStateReaper(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        cls.execution_db = execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_execution_db()
+
+    def setUp(self):
+        self.cache = MockRedisCacheAdapter()
+        self.reaper = ExecutionStateReaper(self.cache, ExecutionDatabase.instance, interval=1)
+
+    def tearDown(self):
+        self.cache.clear()
+        execution_db_help.cleanup_execution_db()
+
+    def add_execution(self, aborted, completed_at=None):
+        execution_id = uuid4()
+        status = WorkflowStatus(execution_id, uuid4(), 'test')
+        if aborted:
+            status.aborted()
+            if completed_at:
+                status.completed_at = completed_at
+        else:
+            status.paused()
+        ExecutionDatabase.instance.session.add(status)
+        ExecutionDatabase.instance.session.commit()
+        ExternallyCachedHashAccumulator(self.cache, execution_id)['a'] = '1'
+        self.cache.hset(app_fields_key(execution_id), 'HelloWorld:device:field', 'value')
+        return execution_id
+
+    def test_init(self):
+        self.assertIs(self.reaper.cache, self.cache)
+        self.assertEqual(self.reaper.interval, 1)
+        self.assertIsNone(self.reaper.last_reaped)
+
+    def test_reap_nothing(self):
+        self.assertEqual(self.reaper.reap(), 0)
+        self.assertIsNotNone(self.reaper.last_reaped)
+
+    def test_reap_aborted(self):
+        aborted = self.add_execution(aborted=True)
+        paused = self.add_execution(aborted=False)
+        self.assertEqual(self.reaper.reap(), 1)
+        self.assertEqual(len(ExternallyCachedHashAccumulator(self.cache, aborted)), 0)
+        self.assertFalse(self.cache.exists(app_fields_key(aborted)))
+        self.assertEqual(len(ExternallyCachedHashAccumulator(self.cache, paused)), 1)
+        self.assertEqual(self.cache.hget(app_fields_key(paused), 'HelloWorld:device:field'), b'value')
+
+    def test_reap_only_since_last_sweep(self):
+        self.add_execution(aborted=True, completed_at=datetime.utcnow() - timedelta(minutes=5))
+        self.assertEqual(self.reaper.reap(), 1)
+        self.assertEqual(self.reaper.reap(), 0)
+
+    def test_reap_overlaps_last_sweep(self):
+        self.reaper.reap()
+        self.add_execution(aborted=True, completed_at=self.reaper.last_reaped - timedelta(milliseconds=500))
+        self.assertEqual(self.reaper.reap(), 1)
+
+    def test_last_sweep_shared_between_reapers(self):
+        self.add_execution(aborted=True, completed_at=datetime.utcnow() - timedelta(minutes=5))
+        self.assertEqual(self.reaper.reap(), 1)
+        reaper = ExecutionStateReaper(self.cache, ExecutionDatabase.instance, interval=1)
+        self.assertEqual(reaper.last_reaped, self.reaper.last_reaped)
+        self.assertEqual(reaper.reap(), 0)
+
+    def test_reap_locked(self):
+        self.add_execution(aborted=True)
+        lock = self.cache.lock('execution_state:reaper', timeout=10)
+        lock.acquire()
+        try:
+            self.assertEqual(self.reaper.reap(), 0)
+        finally:
+            lock.release()
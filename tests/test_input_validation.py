@@ -2,7 +2,8 @@ import json
 import unittest
 
 from walkoff.appgateway.apiutil import InvalidArgument
-from walkoff.appgateway.validator import validate_parameter, validate_parameters, convert_json
+from walkoff.appgateway.validator import validate_parameter, validate_parameters, convert_json, ApiValidator, \
+    get_api_validator, clear_api_validators, validate_app_action_parameters
 from walkoff.executiondb.argument import Argument
 
 
@@ -428,3 +429,64 @@ class TestInputValidation(unittest.TestCase):
         expected = ['@action1', 2, {'a': 'v', 'b': 6}]
         converted = convert_json(parameter_api, value, self.message)
         self.assertListEqual(converted, expected)
+
+    def test_api_validator_reused(self):
+        parameter_apis = [
+            {'name': 'name1', 'type': 'string', 'minLength': 1, 'maxLength': 25, 'enum': ['test', 'test3']},
+            {'name': 'name2', 'type': 'integer', 'minimum': -3, 'maximum': 25}]
+        validator = ApiValidator(parameter_apis)
+        for value in ('5', 6):
+            self.assertDictEqual(validator.validate([Argument('name1', value='test'), Argument('name2', value=value)],
+                                                    self.message),
+                                 {'name1': 'test', 'name2': int(value)})
+        with self.assertRaises(InvalidArgument):
+            validator.validate([Argument('name1', value='test'), Argument('name2', value='30')], self.message)
+
+    def test_api_validator_does_not_modify_api(self):
+        parameter_apis = [{'name': 'name1', 'type': 'user', 'required': True}]
+        ApiValidator(parameter_apis).validate([Argument('name1', value='3')], self.message)
+        self.assertDictEqual(parameter_apis[0], {'name': 'name1', 'type': 'user', 'required': True})
+
+    def test_get_api_validator_cached(self):
+        clear_api_validators()
+        parameter_apis = [{'name': 'name1', 'type': 'string'}]
+        validator = get_api_validator(('action', 'app1', 'action1'), parameter_apis)
+        self.assertIs(get_api_validator(('action', 'app1', 'action1'), parameter_apis), validator)
+        self.assertDictEqual(validate_app_action_parameters(parameter_apis, [Argument('name1', value='a')],
+                                                            'app1', 'action1'),
+                             {'name1': 'a'})
+
+    def test_get_api_validator_api_reloaded(self):
+        clear_api_validators()
+        validator = get_api_validator(('action', 'app1', 'action1'), [{'name': 'name1', 'type': 'string'}])
+        reloaded_apis = [{'name': 'name1', 'type': 'integer'}]
+        reloaded = get_api_validator(('action', 'app1', 'action1'), reloaded_apis)
+        self.assertIsNot(reloaded, validator)
+        self.assertIs(reloaded.api, reloaded_apis)
+
+    def test_api_validator_validate_references(self):
+        parameter_apis = [{'name': 'name1', 'type': 'string', 'required': True},
+                          {'name': 'name2', 'type': 'integer', 'required': True},
+                          {'name': 'name3', 'type': 'integer', 'default': 5}]
+        arguments = [Argument('name1', value='test'), Argument('name2', reference='action1')]
+        validator = ApiValidator(parameter_apis)
+        literals = validator.validate(arguments, self.message)
+        self.assertDictEqual(literals, {'name1': 'test', 'name3': 5})
+        self.assertDictEqual(validator.validate_references(arguments, self.message, literals, {'action1': '10'}),
+                             {'name1': 'test', 'name2': 10, 'name3': 5})
+        self.assertDictEqual(literals, {'name1': 'test', 'name3': 5})
+
+    def test_api_validator_validate_references_invalid(self):
+        parameter_apis = [{'name': 'name1', 'type': 'integer', 'required': True}]
+        arguments = [Argument('name1', reference='action1')]
+        validator = ApiValidator(parameter_apis)
+        with self.assertRaises(InvalidArgument):
+            validator.validate_references(arguments, self.message, {}, {'action1': 'invalid'})
+
+    def test_api_validator_validate_references_copies_literals(self):
+        parameter_apis = [{'name': 'name1', 'type': 'array', 'items': {'type': 'integer'}}]
+        arguments = [Argument('name1', value=['1', '2'])]
+        validator = ApiValidator(parameter_apis)
+        literals = validator.validate(arguments, self.message)
+        validator.validate_references(arguments, self.message, literals, {'action1': '10'})['name1'].append(3)
+        self.assertDictEqual(literals, {'name1': [1, 2]})
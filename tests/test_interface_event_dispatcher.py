@@ -99,6 +99,19 @@ class TestInterfaceEventDispatcher(TestCase):
         self.assertNotIn('names', doc)
         self.assertIn('def handler()', doc)
 
+    def test_get_subscribed_events_none(self):
+        self.assertSetEqual(InterfaceEventDispatcher.get_subscribed_events(), set())
+
+    def test_get_subscribed_events(self):
+        @dispatcher.on_walkoff_events(WalkoffEvent.ConditionSuccess, sender_ids='a')
+        def x(data): pass
+
+        @dispatcher.on_walkoff_events(WalkoffEvent.ActionStarted, sender_ids='b', weak=False)
+        def y(data): pass
+
+        self.assertSetEqual(InterfaceEventDispatcher.get_subscribed_events(),
+                            {WalkoffEvent.ConditionSuccess, WalkoffEvent.ActionStarted})
+
     def test_on_walkoff_events_single_invalid_event(self):
         with self.assertRaises(UnknownEvent):
             @dispatcher.on_walkoff_events('Invalid', sender_ids='a')
@@ -0,0 +1,184 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+from uuid import uuid4
+
+from mock import patch
+
+from tests.util import execution_db_help, initialize_test_config
+from walkoff.executiondb import ExecutionDatabase
+from walkoff.executiondb.metrics import LatencyHistogram, ActionStatusMetric, WorkflowMetric
+from walkoff.server.latencyhistograms import Histogram, LatencyHistograms, get_latency_summaries
+from walkoff.server.statuspersister import StatusPersister, StatusTransition
+
+
+class TestHistogram(TestCase):
+
+    def test_empty(self):
+        self.assertDictEqual(Histogram().summary(),
+                             {'count': 0, 'mean_ms': 0., 'p50_ms': 0., 'p95_ms': 0., 'p99_ms': 0., 'max_ms': 0.})
+
+    def test_record(self):
+        histogram = Histogram()
+        for seconds in (0.1, 0.2, 0.3):
+            histogram.record(seconds)
+        self.assertEqual(histogram.count, 3)
+        self.assertAlmostEqual(histogram.total, 0.6)
+        self.assertEqual(histogram.max, 0.3)
+        self.assertEqual(sum(histogram.buckets.values()), 3)
+
+    def test_percentiles_within_bucket_error(self):
+        histogram = Histogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000.)
+        summary = histogram.summary()
+        self.assertEqual(summary['count'], 1000)
+        self.assertAlmostEqual(summary['mean_ms'], 500.5)
+        self.assertAlmostEqual(summary['max_ms'], 1000)
+        for name, expected in (('p50_ms', 500), ('p95_ms', 950), ('p99_ms', 990)):
+            self.assertGreaterEqual(summary[name], expected)
+            self.assertLessEqual(summary[name], expected * 1.19)
+
+    def test_percentile_capped_at_max(self):
+        histogram = Histogram()
+        histogram.record(0.0015)
+        self.assertEqual(histogram.percentile(0.99), 0.0015)
+
+    def test_overflow(self):
+        histogram = Histogram()
+        histogram.record(10 ** 7)
+        self.assertEqual(histogram.percentile(0.5), 10 ** 7)
+
+    def test_negative_latency(self):
+        histogram = Histogram()
+        histogram.record(-1)
+        self.assertEqual(histogram.max, 0)
+        self.assertEqual(histogram.count, 1)
+
+    def test_merge(self):
+        histogram1 = Histogram()
+        histogram1.record(0.1)
+        histogram2 = Histogram()
+        histogram2.record(0.1)
+        histogram2.record(2)
+        histogram1.merge(histogram2)
+        self.assertEqual(histogram1.count, 3)
+        self.assertAlmostEqual(histogram1.total, 2.2)
+        self.assertEqual(histogram1.max, 2)
+        self.assertEqual(sum(histogram1.buckets.values()), 3)
+
+    def test_average_metrics_are_means(self):
+        action_status_metric = ActionStatusMetric('success', 1)
+        workflow_metric = WorkflowMetric(uuid4(), 'workflow', 1)
+        for seconds in (2, 3, 6):
+            action_status_metric.update(seconds)
+            workflow_metric.update(seconds)
+        self.assertEqual(action_status_metric.count, 4)
+        self.assertAlmostEqual(action_status_metric.avg_time, 3)
+        self.assertEqual(workflow_metric.count, 4)
+        self.assertAlmostEqual(workflow_metric.avg_time, 3)
+
+
+class TestLatencyHistograms(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_execution_db()
+
+    def setUp(self):
+        self.execution_db = ExecutionDatabase.instance
+        self.action_id = str(uuid4())
+        self.now = datetime.utcnow()
+
+    def tearDown(self):
+        execution_db_help.cleanup_execution_db()
+
+    def get_rows(self):
+        self.execution_db.session.expire_all()
+        return self.execution_db.session.query(LatencyHistogram).all()
+
+    def test_record_held_in_memory(self):
+        histograms = LatencyHistograms(flush_interval=60)
+        histograms.record('action', 'HelloWorld', self.action_id, 'success', 0.5, self.now)
+        self.assertEqual(len(histograms), 1)
+        self.assertEqual(histograms.flush_if_due(self.execution_db), 0)
+        self.assertListEqual(self.get_rows(), [])
+
+    def test_flush(self):
+        histograms = LatencyHistograms(interval=60)
+        histograms.record('action', 'HelloWorld', self.action_id, 'success', 0.5, self.now)
+        histograms.record('action', 'HelloWorld', self.action_id, 'success', 1.5, self.now)
+        histograms.record('action', 'HelloWorld', self.action_id, 'error', 0.1, self.now)
+        self.assertEqual(histograms.flush(self.execution_db), 2)
+        self.assertEqual(len(histograms), 0)
+        rows = {row.status: row for row in self.get_rows()}
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows['success'].count, 2)
+        self.assertAlmostEqual(rows['success'].total, 2)
+        self.assertEqual(rows['success'].max, 1.5)
+        self.assertEqual(rows['success'].interval_start.second, 0)
+        self.assertEqual(rows['error'].count, 1)
+
+    def test_flush_merges_into_interval(self):
+        histograms = LatencyHistograms(interval=3600)
+        histograms.record('workflow', None, self.action_id, None, 1, self.now)
+        histograms.flush(self.execution_db)
+        histograms.record('workflow', None, self.action_id, None, 3, self.now)
+        histograms.flush(self.execution_db)
+        rows = self.get_rows()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0].count, 2)
+        self.assertEqual(rows[0].max, 3)
+
+    def test_flush_deletes_expired(self):
+        histograms = LatencyHistograms(retention=600)
+        histograms.record('workflow', None, self.action_id, None, 1, self.now - timedelta(hours=1))
+        histograms.record('workflow', None, self.action_id, None, 1, self.now)
+        histograms.flush(self.execution_db)
+        self.assertEqual(len(self.get_rows()), 1)
+
+    def test_failed_flush_kept_for_next_flush(self):
+        histograms = LatencyHistograms(interval=60)
+        histograms.record('action', 'HelloWorld', self.action_id, 'success', 0.5, self.now)
+        with patch.object(self.execution_db.session, 'commit', side_effect=Exception):
+            self.assertEqual(histograms.flush(self.execution_db), 0)
+        self.assertEqual(len(histograms), 1)
+        histograms.record('action', 'HelloWorld', self.action_id, 'success', 1.5, self.now)
+        self.assertEqual(histograms.flush(self.execution_db), 1)
+        rows = self.get_rows()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0].count, 2)
+        self.assertEqual(rows[0].max, 1.5)
+
+    def test_get_latency_summaries(self):
+        histograms = LatencyHistograms(interval=60)
+        histograms.record('action', 'HelloWorld', self.action_id, 'success', 0.1, self.now)
+        histograms.record('action', 'HelloWorld', self.action_id, 'success', 0.2, self.now - timedelta(minutes=30))
+        histograms.record('workflow', None, self.action_id, None, 1, self.now)
+        histograms.flush(self.execution_db)
+
+        latencies = get_latency_summaries(self.execution_db.session, 'action', [3600, 300], now=self.now)
+        summaries = latencies.get('HelloWorld', self.action_id, 'success')
+        self.assertListEqual([summary['window'] for summary in summaries], [300, 3600])
+        self.assertEqual(summaries[0]['count'], 1)
+        self.assertAlmostEqual(summaries[0]['max_ms'], 100)
+        self.assertEqual(summaries[1]['count'], 2)
+        self.assertAlmostEqual(summaries[1]['max_ms'], 200)
+        self.assertAlmostEqual(summaries[1]['mean_ms'], 150)
+        self.assertEqual(latencies.get('HelloWorld', self.action_id, 'error')[1]['count'], 0)
+
+    def test_status_persister_records_latencies_once_written(self):
+        histograms = LatencyHistograms()
+        persister = StatusPersister(latency_histograms=histograms)
+
+        def apply(batch, transition):
+            batch.record_latency('action', 'HelloWorld', self.action_id, 'success', 0.5, transition.timestamp)
+
+        persister.record(self.execution_db, StatusTransition(apply, {}))
+        self.assertEqual(len(histograms), 0)
+        persister.flush(self.execution_db)
+        self.assertEqual(len(histograms), 1)
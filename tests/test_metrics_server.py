@@ -4,11 +4,13 @@ from datetime import timedelta
 
 from flask import current_app
 
+import walkoff.config
 from tests.util import execution_db_help
 from tests.util.assertwrappers import orderless_list_compare
 from tests.util.servertestcase import ServerTestCase
 from walkoff.executiondb.metrics import AppMetric, ActionMetric, ActionStatusMetric, WorkflowMetric
 from walkoff.server.endpoints.metrics import _convert_action_time_averages, _convert_workflow_time_averages
+from walkoff.server.latencyhistograms import Histogram
 from walkoff.server import workflowresults  # Need this import
 
 
@@ -16,6 +18,15 @@ class MetricsServerTest(ServerTestCase):
     def tearDown(self):
         execution_db_help.cleanup_execution_db()
 
+    @staticmethod
+    def empty_latency():
+        latency = []
+        for window in sorted(walkoff.config.Config.METRICS_LATENCY_WINDOWS):
+            summary = Histogram().summary()
+            summary['window'] = window
+            latency.append(summary)
+        return latency
+
     def test_convert_action_time_average(self):
         expected_json = {'apps': [{'count': 100,
                                    'name': 'app2',
@@ -32,6 +43,11 @@ class MetricsServerTest(ServerTestCase):
                                                {'error_metrics': {'count': 2,
                                                                   'avg_time': '0:00:00.001000'},
                                                 'name': 'action2'}]}]}
+        for app in expected_json['apps']:
+            for action in app['actions']:
+                for key in ('success_metrics', 'error_metrics'):
+                    if key in action:
+                        action[key]['latency'] = self.empty_latency()
 
         action_status_one = ActionStatusMetric("success", timedelta(100, 0, 1).total_seconds())
         action_status_one.count = 0
@@ -88,6 +104,8 @@ class MetricsServerTest(ServerTestCase):
                                        {'count': 0,
                                         'avg_time': '100 days, 0:00:00.000001',
                                         'name': 'workflow1'}]}
+        for workflow in expected_json['workflows']:
+            workflow['latency'] = self.empty_latency()
 
         wf1 = WorkflowMetric(uuid.uuid4(), 'workflow1', timedelta(100, 0, 1).total_seconds())
         wf1.count = 0
@@ -132,3 +150,25 @@ class MetricsServerTest(ServerTestCase):
         self.assertEqual(response.status_code, 200)
         response = json.loads(response.get_data(as_text=True))
         self.assertDictEqual(response, _convert_workflow_time_averages())
+
+    def test_queue_metrics(self):
+        response = self.test_client.get('/api/metrics/queue', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        response = json.loads(response.get_data(as_text=True))
+        self.assertSetEqual(set(response.keys()), {'high', 'normal', 'low'})
+        for lane_metrics in response.values():
+            self.assertSetEqual(set(lane_metrics.keys()), {'depth', 'received', 'average_wait_ms'})
+
+    def test_worker_pool_metrics(self):
+        response = self.test_client.get('/api/metrics/workers', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        response = json.loads(response.get_data(as_text=True))
+        self.assertSetEqual(set(response.keys()),
+                            {'workers', 'draining', 'busy_threads', 'queue_depth', 'scale_ups', 'scale_downs'})
+
+    def test_results_receiver_metrics(self):
+        response = self.test_client.get('/api/metrics/results', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        response = json.loads(response.get_data(as_text=True))
+        self.assertSetEqual(set(response.keys()),
+                            {'received', 'wakeups', 'average_batch_size', 'average_lag_ms', 'last_batch_max_lag_ms'})
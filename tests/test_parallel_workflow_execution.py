@@ -0,0 +1,236 @@
+from collections import Counter
+from unittest import TestCase
+from uuid import uuid4
+
+import walkoff.appgateway
+import walkoff.config
+from tests.util import execution_db_help, initialize_test_config
+from walkoff.appgateway.appinstancerepo import AppInstanceRepo
+from walkoff.events import WalkoffEvent
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.condition import Condition
+from walkoff.executiondb.conditionalexpression import ConditionalExpression
+from walkoff.executiondb.workflow import Workflow
+from walkoff.worker.action_exec_strategy import LocalActionExecutionStrategy
+from walkoff.worker.workflow_exec_context import WorkflowExecutionContext
+from walkoff.worker.workflow_exec_strategy import ParallelWorkflowExecutionStrategy, WorkflowExecutor, \
+    SerialWorkflowExecutionStrategy
+
+
+class TestParallelWorkflowExecution(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        walkoff.appgateway.clear_cache()
+        execution_db_help.tear_down_execution_db()
+
+    def setUp(self):
+        self.started = []
+        self.events = []
+        self.results = None
+
+        def log_event(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.ActionStarted:
+                self.started.append(sender.name)
+            elif kwargs['event'] == WalkoffEvent.WorkflowShutdown:
+                self.results = kwargs['data']
+            self.events.append(kwargs['event'])
+
+        self.log_event = log_event
+        WalkoffEvent.CommonWorkflowSignal.connect(self.log_event)
+
+    def tearDown(self):
+        WalkoffEvent.CommonWorkflowSignal.value.signal.disconnect(self.log_event)
+
+    @staticmethod
+    def make_action(name, is_join=False):
+        return Action('HelloWorld', 'repeatBackToMe', name, id=uuid4(), arguments=[Argument('call', value=name)],
+                      is_join=is_join)
+
+    def make_diamond(self, is_join, keep_all_results=False):
+        actions = [self.make_action('start'), self.make_action('left'), self.make_action('right'),
+                   self.make_action('end', is_join=is_join)]
+        start, left, right, end = actions
+        branches = [Branch(start.id, left.id, id=uuid4()), Branch(start.id, right.id, id=uuid4()),
+                    Branch(left.id, end.id, id=uuid4()), Branch(right.id, end.id, id=uuid4())]
+        return Workflow('diamond', start.id, actions=actions, branches=branches, execution_strategy='parallel',
+                        keep_all_results=keep_all_results)
+
+    def execute(self, workflow):
+        workflow_context = WorkflowExecutionContext(workflow, AppInstanceRepo(), uuid4())
+        strategy = ParallelWorkflowExecutionStrategy(LocalActionExecutionStrategy(), max_actions=2)
+        strategy.execute(workflow_context)
+        return workflow_context
+
+    def test_every_taken_branch_followed(self):
+        self.execute(self.make_diamond(is_join=False))
+        self.assertEqual(self.started[0], 'start')
+        self.assertDictEqual(Counter(self.started), {'start': 1, 'left': 1, 'right': 1, 'end': 2})
+
+    def test_join_waits_for_all_branches(self):
+        self.execute(self.make_diamond(is_join=True))
+        self.assertEqual(len(self.started), 4)
+        self.assertEqual(self.started[-1], 'end')
+        self.assertEqual(self.events[-1], WalkoffEvent.WorkflowShutdown)
+
+    def test_join_not_executed_if_branch_not_taken(self):
+        workflow = self.make_diamond(is_join=True)
+        workflow.branches[3].status = 'Failure'
+        self.execute(workflow)
+        self.assertNotIn('end', self.started)
+        self.assertEqual(self.events[-1], WalkoffEvent.WorkflowShutdown)
+
+    def test_accumulator_holds_every_result(self):
+        workflow = self.make_diamond(is_join=True, keep_all_results=True)
+        self.execute(workflow)
+        for action in workflow.actions:
+            self.assertEqual(self.results[str(action.id)], 'REPEATING: {}'.format(action.name))
+
+    def test_dead_results_freed(self):
+        workflow = self.make_diamond(is_join=True)
+        start, left, right, end = workflow.actions
+        end.arguments = [Argument('call', reference=left.id)]
+        self.execute(workflow)
+        self.assertEqual(self.results[str(end.id)], 'REPEATING: REPEATING: left')
+        self.assertIn(str(left.id), self.results)
+        self.assertNotIn(str(start.id), self.results)
+        self.assertNotIn(str(right.id), self.results)
+
+    def test_abort(self):
+        workflow = self.make_diamond(is_join=True)
+        workflow_context = WorkflowExecutionContext(workflow, AppInstanceRepo(), uuid4())
+        workflow_context.abort()
+        ParallelWorkflowExecutionStrategy(LocalActionExecutionStrategy()).execute(workflow_context)
+        self.assertListEqual(self.started, [])
+        self.assertEqual(self.events[-1], WalkoffEvent.WorkflowAborted)
+
+    def test_pause(self):
+        workflow = self.make_diamond(is_join=True)
+        workflow_context = WorkflowExecutionContext(workflow, AppInstanceRepo(), uuid4())
+        workflow_context.pause()
+        ParallelWorkflowExecutionStrategy(LocalActionExecutionStrategy()).execute(workflow_context)
+        self.assertListEqual(self.started, [])
+        self.assertEqual(self.events[-1], WalkoffEvent.WorkflowPaused)
+        self.assertEqual(workflow_context.executing_action, workflow.actions[0])
+
+    def test_pause_waits_for_branches_to_join(self):
+        workflow = self.make_diamond(is_join=True)
+        start, left, right, end = workflow.actions
+        workflow_context = WorkflowExecutionContext(workflow, AppInstanceRepo(), uuid4())
+
+        def pause_at_left(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.ActionStarted and sender.name == 'left':
+                workflow_context.pause()
+
+        WalkoffEvent.CommonWorkflowSignal.connect(pause_at_left)
+        try:
+            ParallelWorkflowExecutionStrategy(LocalActionExecutionStrategy(), max_actions=2).execute(
+                workflow_context)
+        finally:
+            WalkoffEvent.CommonWorkflowSignal.value.signal.disconnect(pause_at_left)
+        self.assertSetEqual(set(self.started), {'start', 'left', 'right'})
+        self.assertEqual(self.events[-1], WalkoffEvent.WorkflowPaused)
+        self.assertEqual(workflow_context.executing_action, end)
+
+    def test_pause_waits_for_single_path(self):
+        workflow = self.make_diamond(is_join=False)
+        end = workflow.actions[3]
+        workflow_context = WorkflowExecutionContext(workflow, AppInstanceRepo(), uuid4())
+
+        def pause_at_left(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.ActionStarted and sender.name == 'left':
+                workflow_context.pause()
+
+        WalkoffEvent.CommonWorkflowSignal.connect(pause_at_left)
+        try:
+            ParallelWorkflowExecutionStrategy(LocalActionExecutionStrategy(), max_actions=2).execute(
+                workflow_context)
+        finally:
+            WalkoffEvent.CommonWorkflowSignal.value.signal.disconnect(pause_at_left)
+        self.assertDictEqual(Counter(self.started), {'start': 1, 'left': 1, 'right': 1, 'end': 1})
+        self.assertEqual(self.events[-1], WalkoffEvent.WorkflowPaused)
+        self.assertEqual(workflow_context.executing_action, end)
+
+    def test_strategy_selected_per_workflow(self):
+        executor = WorkflowExecutor(walkoff.config.Config, 1, None, AppInstanceRepo)
+        workflow = self.make_diamond(is_join=False)
+        strategy = executor.make_workflow_execution_strategy(workflow, LocalActionExecutionStrategy())
+        self.assertIsInstance(strategy, ParallelWorkflowExecutionStrategy)
+        self.assertEqual(strategy.max_actions, walkoff.config.Config.WORKFLOW_PARALLEL_ACTIONS)
+        workflow.execution_strategy = 'serial'
+        strategy = executor.make_workflow_execution_strategy(workflow, LocalActionExecutionStrategy())
+        self.assertNotIsInstance(strategy, ParallelWorkflowExecutionStrategy)
+        self.assertIsInstance(strategy, SerialWorkflowExecutionStrategy)
+
+    def test_action_threads_not_counted_as_workflows(self):
+        executor = WorkflowExecutor(walkoff.config.Config, 1, None, AppInstanceRepo)
+        workflow = self.make_diamond(is_join=False)
+        workflow_context = WorkflowExecutionContext(workflow, AppInstanceRepo(), uuid4())
+        observed = []
+
+        def observe_executor(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.ActionStarted:
+                observed.append((executor.get_executing_count(), executor.get_current_workflow()))
+
+        WalkoffEvent.CommonWorkflowSignal.connect(observe_executor)
+        try:
+            with executor.track_thread(workflow_context):
+                strategy = executor.make_workflow_execution_strategy(workflow, LocalActionExecutionStrategy())
+                strategy.execute(workflow_context)
+        finally:
+            WalkoffEvent.CommonWorkflowSignal.value.signal.disconnect(observe_executor)
+        self.assertEqual(len(observed), 5)
+        for count, current_workflow in observed:
+            self.assertEqual(count, 1)
+            self.assertIs(current_workflow, workflow_context)
+        self.assertEqual(executor.get_executing_count(), 0)
+        self.assertDictEqual(executor.action_threads, {})
+
+    def test_unknown_execution_strategy_invalid(self):
+        workflow = Workflow('test', None, execution_strategy='invalid')
+        self.assertFalse(workflow.is_valid)
+
+    @staticmethod
+    def make_trigger():
+        return ConditionalExpression(
+            'and',
+            conditions=[Condition('HelloWorld', action_name='regMatch', arguments=[Argument('regex', value='aaa')])])
+
+    def test_trigger_in_branch_of_fan_out_invalid(self):
+        workflow = self.make_diamond(is_join=True)
+        workflow.actions[1].trigger = self.make_trigger()
+        workflow.validate()
+        self.assertFalse(workflow.is_valid)
+
+    def test_trigger_on_start_awaits_data(self):
+        workflow = self.make_diamond(is_join=True)
+        workflow.actions[0].trigger = self.make_trigger()
+        workflow.validate()
+        self.assertTrue(workflow.is_valid)
+        workflow_context = self.execute(workflow)
+        self.assertListEqual(self.started, ['start'])
+        self.assertIn(WalkoffEvent.TriggerActionAwaitingData, self.events)
+        self.assertNotIn(WalkoffEvent.WorkflowShutdown, self.events)
+        self.assertEqual(workflow_context.executing_action, workflow.actions[0])
+
+    def test_trigger_in_branch_of_serial_workflow_valid(self):
+        workflow = self.make_diamond(is_join=True)
+        workflow.execution_strategy = 'serial'
+        workflow.actions[1].trigger = self.make_trigger()
+        workflow.validate()
+        self.assertTrue(workflow.is_valid)
+
+    def test_unknown_event_level_invalid(self):
+        workflow = Workflow('test', None, event_level='invalid')
+        self.assertFalse(workflow.is_valid)
+
+    def test_event_level_valid(self):
+        workflow = Workflow('test', None, event_level='errors')
+        self.assertTrue(workflow.is_valid)
@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from tests.util.mock_objects import MockRedisCacheAdapter
+from walkoff.pipelinemetrics import PipelineMetrics, TimedCache, histogram_buckets, get_histograms, get_gauges, \
+    pipeline_metrics
+
+
+class MockCache(object):
+    def __init__(self):
+        self.calls = []
+
+    def get(self, key):
+        self.calls.append(key)
+        return 'value'
+
+
+class TestPipelineMetricsDisabled(TestCase):
+
+    def test_pipeline_metrics_disabled_in_tests(self):
+        self.assertFalse(pipeline_metrics.enabled)
+
+    def test_not_enabled_until_started(self):
+        metrics = PipelineMetrics()
+        self.assertFalse(metrics.enabled)
+        metrics.observe('walkoff_status_flush_seconds', 1)
+        metrics.set_gauge('walkoff_worker_threads', 1, 'worker', 'busy')
+        metrics.flush()
+
+    def test_start_disabled_with_no_flush_interval(self):
+        metrics = PipelineMetrics()
+        metrics.start(MockCache(), flush_interval=0)
+        self.assertFalse(metrics.enabled)
+
+    def test_timed_cache(self):
+        cache = MockCache()
+        timed_cache = TimedCache(cache, 'walkoff_accumulator_operation_seconds', 'external')
+        self.assertEqual(timed_cache.get('key'), 'value')
+        self.assertListEqual(cache.calls, ['key'])
+        self.assertListEqual(timed_cache.calls, ['key'])
+
+
+class TestPipelineMetrics(TestCase):
+
+    def setUp(self):
+        self.cache = MockRedisCacheAdapter()
+        self.metrics = PipelineMetrics()
+        self.metrics.cache = self.cache
+        self.metrics.flush_interval = 5
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_observe_and_flush(self):
+        self.metrics.observe('walkoff_action_execution_seconds', 0.002, 'HelloWorld', 'helloWorld', 'success')
+        self.metrics.observe('walkoff_action_execution_seconds', 0.3, 'HelloWorld', 'helloWorld', 'success')
+        self.metrics.observe('walkoff_action_execution_seconds', 1000, 'HelloWorld', 'helloWorld', 'success')
+        self.metrics.observe('walkoff_status_flush_seconds', 0.01)
+        self.metrics.flush()
+
+        histograms = get_histograms(self.cache)
+        action_histogram = histograms['walkoff_action_execution_seconds'][('HelloWorld', 'helloWorld', 'success')]
+        self.assertEqual(action_histogram['count'], 3)
+        self.assertAlmostEqual(action_histogram['sum'], 1000.302)
+        self.assertEqual(len(action_histogram['buckets']), len(histogram_buckets) + 1)
+        self.assertEqual(action_histogram['buckets'][histogram_buckets.index(0.0025)], 1)
+        self.assertEqual(action_histogram['buckets'][histogram_buckets.index(0.5)], 2)
+        self.assertEqual(action_histogram['buckets'][-1], 3)
+        self.assertEqual(histograms['walkoff_status_flush_seconds'][()]['count'], 1)
+        self.assertDictEqual(histograms['walkoff_results_receive_lag_seconds'], {})
+
+    def test_flushes_aggregate(self):
+        other_process = PipelineMetrics()
+        other_process.cache = self.cache
+        other_process.flush_interval = 5
+        self.metrics.observe('walkoff_request_queue_wait_seconds', 0.1, 'high')
+        other_process.observe('walkoff_request_queue_wait_seconds', 0.2, 'high')
+        self.metrics.flush()
+        other_process.flush()
+        self.metrics.flush()
+        histogram = get_histograms(self.cache)['walkoff_request_queue_wait_seconds'][('high',)]
+        self.assertEqual(histogram['count'], 2)
+        self.assertAlmostEqual(histogram['sum'], 0.3)
+
+    def test_gauges(self):
+        other_process = PipelineMetrics()
+        other_process.cache = self.cache
+        other_process.flush_interval = 5
+        other_process.process_id = 'other'
+
+        def record_threads():
+            self.metrics.set_gauge('walkoff_worker_threads', 3, 'worker-1', 'busy')
+
+        self.metrics.add_callback(record_threads)
+        other_process.set_gauge('walkoff_worker_threads', 2, 'worker-2', 'busy')
+        self.metrics.flush()
+        other_process.flush()
+        self.assertDictEqual(get_gauges(self.cache)['walkoff_worker_threads'],
+                             {('worker-1', 'busy'): 3, ('worker-2', 'busy'): 2})
+
+    def test_time(self):
+        with self.metrics.time('walkoff_status_flush_seconds'):
+            pass
+        self.metrics.flush()
+        self.assertEqual(get_histograms(self.cache)['walkoff_status_flush_seconds'][()]['count'], 1)
@@ -0,0 +1,91 @@
+from unittest import TestCase
+from uuid import uuid4
+
+from walkoff.worker.pure_results import PureResultCache
+
+
+class MockExecutable(object):
+    def __init__(self, app_name='HelloWorld', action_name='transform'):
+        self.id = uuid4()
+        self.app_name = app_name
+        self.action_name = action_name
+
+
+class MockTransform(MockExecutable):
+    pass
+
+
+class MockCondition(MockExecutable):
+    pass
+
+
+class CountingStrategy(object):
+    def __init__(self, fully_cached=False):
+        self.fully_cached = fully_cached
+        self.calls = 0
+
+    def execute(self, executable, accumulator, arguments, instance=None):
+        self.calls += 1
+        result = {'value': arguments['value'], 'calls': self.calls}
+        if self.fully_cached:
+            accumulator[executable.id] = result
+        return result
+
+
+class TestPureResultCache(TestCase):
+
+    def setUp(self):
+        self.cache = PureResultCache()
+        self.strategy = CountingStrategy()
+
+    def test_init(self):
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 0)
+
+    def test_make_key(self):
+        executable = MockTransform()
+        key = PureResultCache.make_key(executable, {'value': 1, 'arg': [1, 2]})
+        self.assertEqual(key[:3], ('mocktransform', 'HelloWorld', 'transform'))
+        self.assertEqual(key, PureResultCache.make_key(MockTransform(), {'arg': [1, 2], 'value': 1}))
+        self.assertNotEqual(key, PureResultCache.make_key(executable, {'value': 2, 'arg': [1, 2]}))
+        self.assertNotEqual(key, PureResultCache.make_key(MockCondition(action_name='transform'),
+                                                          {'value': 1, 'arg': [1, 2]}))
+
+    def test_make_key_unserializable(self):
+        self.assertIsNone(PureResultCache.make_key(MockTransform(), {'value': object()}))
+
+    def test_execute_memoized(self):
+        first = self.cache.execute(self.strategy, MockTransform(), {}, {'value': 1})
+        second = self.cache.execute(self.strategy, MockTransform(), {}, {'value': 1})
+        self.assertEqual(first, second)
+        self.assertEqual(self.strategy.calls, 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_execute_different_arguments(self):
+        self.cache.execute(self.strategy, MockTransform(), {}, {'value': 1})
+        self.cache.execute(self.strategy, MockTransform(), {}, {'value': 2})
+        self.assertEqual(self.strategy.calls, 2)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_execute_unserializable_not_memoized(self):
+        value = object()
+        self.cache.execute(self.strategy, MockTransform(), {}, {'value': value})
+        self.cache.execute(self.strategy, MockTransform(), {}, {'value': value})
+        self.assertEqual(self.strategy.calls, 2)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 0)
+
+    def test_execute_results_copied(self):
+        self.cache.execute(self.strategy, MockTransform(), {}, {'value': 1})['value'] = 5
+        self.cache.execute(self.strategy, MockTransform(), {}, {'value': 1})['value'] = 6
+        self.assertEqual(self.cache.execute(self.strategy, MockTransform(), {}, {'value': 1})['value'], 1)
+
+    def test_execute_fully_cached(self):
+        strategy = CountingStrategy(fully_cached=True)
+        self.cache.execute(strategy, MockTransform(), {}, {'value': 1})
+        executable = MockTransform()
+        accumulator = {}
+        result = self.cache.execute(strategy, executable, accumulator, {'value': 1})
+        self.assertEqual(accumulator[executable.id], result)
@@ -0,0 +1,83 @@
+import time
+from unittest import TestCase
+
+from mock import patch
+
+from tests.util.mock_objects import MockRedisCacheAdapter
+from walkoff.events import WalkoffEvent
+from walkoff.multiprocessedexecutor.protoconverter import ProtobufWorkflowResultsConverter
+from walkoff.multiprocessedexecutor.receivermetrics import record_receive_lags, get_receiver_metrics
+from walkoff.proto.build.data_pb2 import Message
+
+
+class TestReceiverMetrics(TestCase):
+
+    def setUp(self):
+        self.cache = MockRedisCacheAdapter()
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_receiver_metrics_empty(self):
+        self.assertDictEqual(
+            get_receiver_metrics(self.cache),
+            {'received': 0, 'wakeups': 0, 'average_batch_size': 0., 'average_lag_ms': 0., 'last_batch_max_lag_ms': 0})
+
+    def test_record_receive_lags_one_round_trip(self):
+        with patch.object(self.cache, 'incr_multiple') as incr_multiple, patch.object(self.cache, 'incr') as incr:
+            record_receive_lags(self.cache, 2, [0.01, 0.03])
+        incr.assert_not_called()
+        incr_multiple.assert_called_once_with(
+            {'results_receiver:wakeups': 1, 'results_receiver:received': 2, 'results_receiver:timed': 2,
+             'results_receiver:lag_ms': 40},
+            {'results_receiver:last_lag_ms': 30})
+
+    def test_record_receive_lags(self):
+        record_receive_lags(self.cache, 3, [0.01, 0.02, 0.03])
+        record_receive_lags(self.cache, 1, [0.1])
+        metrics = get_receiver_metrics(self.cache)
+        self.assertEqual(metrics['received'], 4)
+        self.assertEqual(metrics['wakeups'], 2)
+        self.assertAlmostEqual(metrics['average_batch_size'], 2.)
+        self.assertAlmostEqual(metrics['average_lag_ms'], 40, delta=1)
+        self.assertEqual(metrics['last_batch_max_lag_ms'], 100)
+
+    def test_record_receive_lags_nothing_received(self):
+        record_receive_lags(self.cache, 2, [0.05, 0.05])
+        record_receive_lags(self.cache, 0, [])
+        metrics = get_receiver_metrics(self.cache)
+        self.assertEqual(metrics['received'], 2)
+        self.assertEqual(metrics['wakeups'], 2)
+        self.assertAlmostEqual(metrics['average_batch_size'], 1.)
+        self.assertEqual(metrics['last_batch_max_lag_ms'], 50)
+
+    def test_record_receive_lags_untimed_results(self):
+        record_receive_lags(self.cache, 3, [0.02])
+        metrics = get_receiver_metrics(self.cache)
+        self.assertEqual(metrics['received'], 3)
+        self.assertAlmostEqual(metrics['average_lag_ms'], 20, delta=1)
+
+    def test_record_receive_lags_clock_skew(self):
+        record_receive_lags(self.cache, 1, [-0.5])
+        self.assertEqual(get_receiver_metrics(self.cache)['last_batch_max_lag_ms'], 0)
+
+
+class TestResultsSentAt(TestCase):
+
+    def test_results_record_sent_at(self):
+        before = time.time()
+        message_bytes = ProtobufWorkflowResultsConverter.event_to_protobuf(
+            {'id': 'worker'}, None, event=WalkoffEvent.WorkerReady)
+        event, _, _, sent_at = ProtobufWorkflowResultsConverter.to_timed_event_callback(message_bytes)
+        self.assertEqual(event, WalkoffEvent.WorkerReady)
+        self.assertGreaterEqual(sent_at, before)
+        self.assertLessEqual(sent_at, time.time())
+
+    def test_results_without_sent_at(self):
+        message = Message()
+        message.ParseFromString(ProtobufWorkflowResultsConverter.event_to_protobuf(
+            {'id': 'worker'}, None, event=WalkoffEvent.WorkerReady))
+        message.ClearField('sent_at')
+        message_bytes = message.SerializeToString()
+        self.assertIsNone(ProtobufWorkflowResultsConverter.to_timed_event_callback(message_bytes)[3])
+        self.assertEqual(len(ProtobufWorkflowResultsConverter.to_event_callback(message_bytes)), 3)
@@ -43,6 +43,24 @@ class TestRedisCacheAdapter(TestCase):
         self.cache.delete('alice')
         self.assertIsNone(self.cache.get('alice'))
 
+    def test_unlink(self):
+        self.cache.set_multiple({'alice': 'a', 'bob': 'b'})
+        self.assertEqual(self.cache.unlink('alice', 'bob', 'carol'), 2)
+        self.assertIsNone(self.cache.get('alice'))
+        self.assertEqual(self.cache.unlink(), 0)
+
+    def test_expire(self):
+        self.cache.set('alice', 'something')
+        self.assertEqual(self.cache.cache.pttl('alice'), -1)
+        self.cache.expire('alice', 10000)
+        self.assertGreater(self.cache.cache.pttl('alice'), 0)
+
+    def test_set_multiple_with_expire(self):
+        self.cache.set_multiple({'alice': 'a', 'bob': 'b'}, expire=10000)
+        self.assertEqual(self.cache.get('bob'), 'b')
+        self.assertGreater(self.cache.cache.pttl('alice'), 0)
+        self.assertGreater(self.cache.cache.pttl('bob'), 0)
+
     def test_incr(self):
         self.cache.set('count', 1)
         self.assertEqual(self.cache.incr('count'), 2)
@@ -53,6 +71,13 @@ class TestRedisCacheAdapter(TestCase):
         self.assertEqual(self.cache.incr('uid', amount=10), 13)
         self.assertEqual(self.cache.get('uid'), '13')
 
+    def test_incr_multiple_keys(self):
+        self.cache.set('count', 1)
+        self.cache.incr_multiple({'count': 2, 'workflows': 10}, {'last': 5})
+        self.assertEqual(self.cache.get('count'), '3')
+        self.assertEqual(self.cache.get('workflows'), '10')
+        self.assertEqual(self.cache.get('last'), '5')
+
     def test_incr_key_dne(self):
         self.assertEqual(self.cache.incr('count'), 1)
         self.assertEqual(self.cache.get('count'), '1')
@@ -96,6 +121,71 @@ class TestRedisCacheAdapter(TestCase):
         self.assertEqual(self.cache.lpop('big'), '10')
         self.assertEqual(self.cache.rpop('big'), '12')
 
+    def test_rpop_multiple(self):
+        self.cache.lpush('queue', 1, 2, 3, 4)
+        self.assertListEqual(self.cache.rpop_multiple('queue', 3), ['1', '2', '3'])
+        self.assertEqual(self.cache.rpop('queue'), '4')
+
+    def test_rpop_multiple_more_than_available(self):
+        self.cache.lpush('queue', 1, 2)
+        self.assertListEqual(self.cache.rpop_multiple('queue', 5), ['1', '2'])
+        self.assertFalse(self.cache.exists('queue'))
+
+    def test_rpop_multiple_key_dne(self):
+        self.assertListEqual(self.cache.rpop_multiple('queue', 5), [])
+
+    def test_rpoplpush(self):
+        self.cache.lpush('source', 1, 2)
+        self.assertEqual(self.cache.rpoplpush('source', 'destination'), '1')
+        self.assertEqual(self.cache.rpop('destination'), '1')
+        self.assertEqual(self.cache.llen('source'), 1)
+
+    def test_rpoplpush_empty(self):
+        self.assertIsNone(self.cache.rpoplpush('source', 'destination'))
+
+    def test_brpoplpush(self):
+        self.cache.lpush('source', 1)
+        self.assertEqual(self.cache.brpoplpush('source', 'destination', timeout=1), '1')
+        self.assertEqual(self.cache.llen('destination'), 1)
+
+    def test_brpoplpush_timeout(self):
+        self.assertIsNone(self.cache.brpoplpush('source', 'destination', timeout=1))
+
+    def test_rpoplpush_multiple(self):
+        self.cache.lpush('source', 1, 2, 3)
+        self.assertListEqual(self.cache.rpoplpush_multiple('source', 'destination', 5), ['1', '2', '3'])
+        self.assertEqual(self.cache.llen('destination'), 3)
+        self.assertEqual(self.cache.llen('source'), 0)
+
+    def test_lrem(self):
+        self.cache.rpush('queue', 1, 2, 1)
+        self.assertEqual(self.cache.lrem('queue', 1, count=-1), 1)
+        self.assertEqual(self.cache.llen('queue'), 2)
+        self.assertEqual(self.cache.lindex('queue', -1), '2')
+
+    def test_lindex_out_of_range(self):
+        self.assertIsNone(self.cache.lindex('queue', -1))
+
+    def test_brpop(self):
+        self.cache.rpush('big', 10, 11, 12)
+        self.assertTupleEqual(self.cache.brpop('big', timeout=1), ('big', '12'))
+
+    def test_brpop_multiple_keys(self):
+        self.cache.rpush('low', 1)
+        self.cache.rpush('high', 2)
+        self.assertTupleEqual(self.cache.brpop(['high', 'low'], timeout=1), ('high', '2'))
+        self.assertTupleEqual(self.cache.brpop(['high', 'low'], timeout=1), ('low', '1'))
+
+    def test_brpop_timeout(self):
+        self.assertIsNone(self.cache.brpop('queue', timeout=1))
+
+    def test_blpop(self):
+        self.cache.rpush('big', 10, 11, 12)
+        self.assertTupleEqual(self.cache.blpop('big', timeout=1), ('big', '10'))
+
+    def test_blpop_timeout(self):
+        self.assertIsNone(self.cache.blpop('queue', timeout=1))
+
     def test_scan_no_pattern(self):
         keys = ('a', 'b', 'c', 'd')
         for i, key in enumerate(keys):
@@ -116,6 +206,33 @@ class TestRedisCacheAdapter(TestCase):
         self.cache.set(key, 42)
         self.assertTrue(self.cache.exists(key))
 
+    def test_hset_hget(self):
+        self.assertEqual(self.cache.hset('hash', 'a', b'1'), 1)
+        self.assertEqual(self.cache.hget('hash', 'a'), b'1')
+        self.assertEqual(self.cache.hset('hash', 'a', b'2'), 0)
+        self.assertEqual(self.cache.hget('hash', 'a'), b'2')
+
+    def test_hget_dne(self):
+        self.assertIsNone(self.cache.hget('hash', 'a'))
+
+    def test_hset_multiple(self):
+        self.cache.hset_multiple('hash', {'a': b'1', 'b': b'2'})
+        self.assertDictEqual(self.cache.hgetall('hash'), {'a': b'1', 'b': b'2'})
+        self.assertEqual(self.cache.hlen('hash'), 2)
+        self.assertSetEqual(set(self.cache.hkeys('hash')), {'a', 'b'})
+        self.assertSetEqual(set(self.cache.hvals('hash')), {b'1', b'2'})
+
+    def test_hset_multiple_with_expire(self):
+        self.cache.hset_multiple('hash', {'a': b'1'}, expire=10000)
+        self.assertGreater(self.cache.cache.pttl('hash'), 0)
+
+    def test_hdel_hexists(self):
+        self.cache.hset('hash', 'a', b'1')
+        self.assertTrue(self.cache.hexists('hash', 'a'))
+        self.assertEqual(self.cache.hdel('hash', 'a', 'b'), 1)
+        self.assertFalse(self.cache.hexists('hash', 'a'))
+        self.assertEqual(self.cache.hlen('hash'), 0)
+
     def test_subscribe(self):
         sub = self.cache.subscribe('channel1')
         self.assertEqual(sub.channel, 'channel1')
@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from tests.util.mock_objects import MockRedisCacheAdapter
+from walkoff.multiprocessedexecutor.requestqueue import LaneScheduler, lane_key, get_workflow_priority, \
+    record_wait_times, get_queue_metrics, request_queue_key
+
+
+class TestRequestQueueLanes(TestCase):
+
+    def setUp(self):
+        self.cache = MockRedisCacheAdapter()
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_get_workflow_priority(self):
+        for priority in ('high', 'normal', 'low'):
+            self.assertEqual(get_workflow_priority(priority), priority)
+
+    def test_get_workflow_priority_default(self):
+        self.assertEqual(get_workflow_priority(None), 'normal')
+        self.assertEqual(get_workflow_priority(''), 'normal')
+        self.assertEqual(get_workflow_priority('invalid'), 'normal')
+
+    def test_lane_key(self):
+        self.assertEqual(lane_key('normal'), request_queue_key)
+        self.assertEqual(lane_key(None), request_queue_key)
+        self.assertEqual(lane_key('high'), 'request_queue:high')
+        self.assertEqual(lane_key('low'), 'request_queue:low')
+
+    def test_strict_scheduling(self):
+        scheduler = LaneScheduler('strict')
+        for _ in range(3):
+            self.assertListEqual(scheduler.next_order(), ['request_queue:high', 'request_queue', 'request_queue:low'])
+
+    def test_invalid_scheduling(self):
+        scheduler = LaneScheduler('invalid', {'high': 1})
+        self.assertEqual(scheduler.scheduling, 'weighted')
+
+    def test_weighted_scheduling_no_weights(self):
+        self.assertEqual(LaneScheduler('weighted', {}).scheduling, 'strict')
+
+    def test_weighted_scheduling_proportions(self):
+        scheduler = LaneScheduler('weighted', {'high': 6, 'normal': 3, 'low': 1})
+        firsts = [scheduler.next_order()[0] for _ in range(100)]
+        self.assertEqual(firsts.count('request_queue:high'), 60)
+        self.assertEqual(firsts.count('request_queue'), 30)
+        self.assertEqual(firsts.count('request_queue:low'), 10)
+
+    def test_weighted_scheduling_smooth(self):
+        scheduler = LaneScheduler('weighted', {'high': 1, 'normal': 1, 'low': 1})
+        firsts = [scheduler.next_order()[0] for _ in range(3)]
+        self.assertListEqual(firsts, ['request_queue:high', 'request_queue', 'request_queue:low'])
+
+    def test_weighted_scheduling_remaining_lanes_in_priority_order(self):
+        scheduler = LaneScheduler('weighted', {'low': 1})
+        self.assertListEqual(scheduler.next_order(), ['request_queue:low', 'request_queue:high', 'request_queue'])
+
+    def test_queue_metrics_empty(self):
+        metrics = get_queue_metrics(self.cache)
+        for priority in ('high', 'normal', 'low'):
+            self.assertDictEqual(metrics[priority], {'depth': 0, 'received': 0, 'average_wait_ms': 0.})
+
+    def test_queue_metrics(self):
+        self.cache.lpush(lane_key('low'), 'a', 'b')
+        record_wait_times(self.cache, [('high', 0.1), ('high', 0.3), ('low', 1)])
+        metrics = get_queue_metrics(self.cache)
+        self.assertEqual(metrics['high']['received'], 2)
+        self.assertAlmostEqual(metrics['high']['average_wait_ms'], 200, delta=1)
+        self.assertEqual(metrics['low']['depth'], 2)
+        self.assertEqual(metrics['low']['received'], 1)
+        self.assertEqual(metrics['normal']['received'], 0)
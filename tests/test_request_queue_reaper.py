@@ -0,0 +1,107 @@
+from unittest import TestCase
+from uuid import uuid4
+
+from nacl.public import PrivateKey, Box
+
+from tests.util.mock_objects import MockRedisCacheAdapter
+from walkoff.multiprocessedexecutor.requestqueue import RequestQueueReaper, in_flight_key, heartbeat_key, \
+    redeliveries_key, request_queue_key, lane_key
+from walkoff.proto.build.data_pb2 import ExecuteWorkflowMessage
+
+
+class TestRequestQueueReaper(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.box = Box(PrivateKey.generate(), PrivateKey.generate().public_key)
+
+    def setUp(self):
+        self.cache = MockRedisCacheAdapter()
+        self.aborted = []
+        self.reaper = RequestQueueReaper(self.cache, self.box, self.abort, max_redeliveries=2, interval=1)
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def abort(self, workflow_id, execution_id):
+        self.aborted.append((workflow_id, execution_id))
+
+    def push_in_flight(self, worker_id, priority=None):
+        message = ExecuteWorkflowMessage()
+        message.workflow_id = str(uuid4())
+        message.workflow_execution_id = str(uuid4())
+        if priority:
+            message.priority = priority
+        self.cache.lpush(in_flight_key(worker_id), self.box.encrypt(message.SerializeToString()))
+        return message
+
+    def test_init(self):
+        self.assertIs(self.reaper.cache, self.cache)
+        self.assertEqual(self.reaper.max_redeliveries, 2)
+        self.assertEqual(self.reaper.interval, 1)
+
+    def test_reap_no_workers(self):
+        self.assertTupleEqual(self.reaper.reap(), (0, 0))
+
+    def test_reap_live_worker(self):
+        self.push_in_flight('alive')
+        self.cache.set(heartbeat_key('alive'), 1, expire=10000)
+        self.assertTupleEqual(self.reaper.reap(), (0, 0))
+        self.assertEqual(self.cache.llen(in_flight_key('alive')), 1)
+
+    def test_reap_dead_worker(self):
+        self.push_in_flight('dead')
+        self.push_in_flight('dead')
+        self.assertTupleEqual(self.reaper.reap(), (2, 0))
+        self.assertFalse(self.cache.exists(in_flight_key('dead')))
+        self.assertEqual(self.cache.llen(request_queue_key), 2)
+        self.assertListEqual(self.aborted, [])
+
+    def test_reap_redelivers_to_priority_lane(self):
+        self.push_in_flight('dead', priority='high')
+        self.push_in_flight('dead', priority='low')
+        self.assertTupleEqual(self.reaper.reap(), (2, 0))
+        self.assertEqual(self.cache.llen(lane_key('high')), 1)
+        self.assertEqual(self.cache.llen(lane_key('low')), 1)
+        self.assertEqual(self.cache.llen(request_queue_key), 0)
+
+    def test_reap_redelivers_oldest_first(self):
+        first = self.push_in_flight('dead')
+        self.push_in_flight('dead')
+        self.reaper.reap()
+        message = ExecuteWorkflowMessage()
+        message.ParseFromString(self.box.decrypt(self.cache.cache.rpop(request_queue_key)))
+        self.assertEqual(message.workflow_execution_id, first.workflow_execution_id)
+
+    def test_reap_counts_redeliveries(self):
+        message = self.push_in_flight('dead')
+        self.reaper.reap()
+        self.assertEqual(self.cache.get(redeliveries_key(message.workflow_execution_id)), '1')
+
+    def test_reap_aborts_after_max_redeliveries(self):
+        message = self.push_in_flight('dead')
+        self.cache.set(redeliveries_key(message.workflow_execution_id), 2)
+        self.assertTupleEqual(self.reaper.reap(), (0, 1))
+        self.assertListEqual(self.aborted, [(message.workflow_id, message.workflow_execution_id)])
+        self.assertEqual(self.cache.llen(request_queue_key), 0)
+        self.assertFalse(self.cache.exists(in_flight_key('dead')))
+        self.assertFalse(self.cache.exists(redeliveries_key(message.workflow_execution_id)))
+
+    def test_reap_drops_invalid_messages(self):
+        self.cache.lpush(in_flight_key('dead'), b'invalid')
+        self.assertTupleEqual(self.reaper.reap(), (0, 0))
+        self.assertFalse(self.cache.exists(in_flight_key('dead')))
+
+    def test_reap_locked(self):
+        self.push_in_flight('dead')
+        lock = self.cache.lock('request_queue:reaper', timeout=5)
+        lock.acquire()
+        try:
+            self.assertTupleEqual(self.reaper.reap(), (0, 0))
+        finally:
+            lock.release()
+        self.assertEqual(self.cache.llen(in_flight_key('dead')), 1)
+
+    def test_shutdown(self):
+        self.reaper.shutdown()
+        self.reaper.run()
@@ -0,0 +1,103 @@
+from unittest import TestCase
+from uuid import uuid4
+
+import walkoff.appgateway
+from tests.util import execution_db_help, initialize_test_config
+from walkoff.appgateway.appinstancerepo import AppInstanceRepo
+from walkoff.events import WalkoffEvent
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.condition import Condition
+from walkoff.executiondb.conditionalexpression import ConditionalExpression
+from walkoff.executiondb.workflow import Workflow
+from walkoff.worker.action_exec_strategy import LocalActionExecutionStrategy
+from walkoff.worker.result_liveness import get_live_results, get_action_references
+from walkoff.worker.workflow_exec_context import WorkflowExecutionContext, WorkflowIndex
+from walkoff.worker.workflow_exec_strategy import SerialWorkflowExecutionStrategy
+
+
+class TestResultLiveness(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        walkoff.appgateway.clear_cache()
+        execution_db_help.tear_down_execution_db()
+
+    def setUp(self):
+        self.results = None
+
+        def log_event(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.WorkflowShutdown:
+                self.results = kwargs['data']
+
+        self.log_event = log_event
+        WalkoffEvent.CommonWorkflowSignal.connect(self.log_event)
+
+    def tearDown(self):
+        WalkoffEvent.CommonWorkflowSignal.value.signal.disconnect(self.log_event)
+
+    @staticmethod
+    def make_action(name, reference=None):
+        argument = Argument('call', reference=reference) if reference else Argument('call', value=name)
+        return Action('HelloWorld', 'repeatBackToMe', name, id=uuid4(), arguments=[argument])
+
+    def make_chain(self, keep_all_results=False):
+        start = self.make_action('start')
+        middle = self.make_action('middle', reference=start.id)
+        end = self.make_action('end')
+        branches = [Branch(start.id, middle.id, id=uuid4()), Branch(middle.id, end.id, id=uuid4())]
+        return Workflow('chain', start.id, actions=[start, middle, end], branches=branches,
+                        keep_all_results=keep_all_results)
+
+    def test_action_references(self):
+        referenced = [uuid4() for _ in range(4)]
+        condition = ConditionalExpression(
+            conditions=[Condition('HelloWorld', 'regMatch', arguments=[Argument('regex', reference=referenced[2])])])
+        action = Action('HelloWorld', 'repeatBackToMe', 'action', id=uuid4(),
+                        arguments=[Argument('call', reference=referenced[0])],
+                        device_id=Argument('__device__', reference=referenced[1]))
+        branch = Branch(action.id, uuid4(), condition=condition)
+        self.assertSetEqual(get_action_references(action, [branch]), set(referenced[:3]))
+
+    def test_live_results_follow_branches(self):
+        workflow = self.make_chain()
+        start, middle, end = workflow.actions
+        live = get_live_results(WorkflowIndex(workflow).actions, WorkflowIndex(workflow).branches)
+        self.assertSetEqual(live[start.id], {start.id})
+        self.assertSetEqual(live[middle.id], {start.id})
+        self.assertSetEqual(live[end.id], set())
+
+    def test_live_results_in_loop(self):
+        workflow = self.make_chain()
+        start, middle, end = workflow.actions
+        workflow.branches.append(Branch(end.id, start.id, id=uuid4()))
+        live = get_live_results(WorkflowIndex(workflow).actions, WorkflowIndex(workflow).branches)
+        self.assertSetEqual(live[end.id], {start.id})
+
+    def test_keep_all_results(self):
+        self.assertIsNone(WorkflowIndex(self.make_chain(keep_all_results=True)).live_results)
+
+    def execute(self, workflow):
+        workflow_context = WorkflowExecutionContext(workflow, AppInstanceRepo(), uuid4())
+        SerialWorkflowExecutionStrategy(LocalActionExecutionStrategy()).execute(workflow_context)
+
+    def test_dead_results_freed(self):
+        workflow = self.make_chain()
+        start, middle, end = workflow.actions
+        self.execute(workflow)
+        self.assertNotIn(str(start.id), self.results)
+        self.assertNotIn(str(middle.id), self.results)
+        self.assertEqual(self.results[str(end.id)], 'REPEATING: end')
+
+    def test_all_results_kept(self):
+        workflow = self.make_chain(keep_all_results=True)
+        start, middle, end = workflow.actions
+        self.execute(workflow)
+        self.assertEqual(self.results[str(start.id)], 'REPEATING: start')
+        self.assertEqual(self.results[str(middle.id)], 'REPEATING: REPEATING: start')
@@ -0,0 +1,152 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from uuid import uuid4
+
+import walkoff.config
+from walkoff.appgateway.actionresult import ActionResult
+from walkoff.appgateway.resultstore import FilesystemBlobStore, ResultStore, ResultHandle, is_result_handle, \
+    make_result_store, resolve_result, result_handle_key
+from walkoff.appgateway.serialization import Serializer, JsonFormat, MsgpackFormat
+from walkoff.executiondb.argument import Argument
+
+
+class TestResultStore(TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.store = ResultStore(FilesystemBlobStore(self.path), threshold=1024)
+        self.execution_id = uuid4()
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_blob_store_put_read(self):
+        blob_store = FilesystemBlobStore(self.path)
+        blob_store.put('a/b', b'some data')
+        self.assertEqual(blob_store.read('a/b', bytes), b'some data')
+
+    def test_blob_store_delete(self):
+        blob_store = FilesystemBlobStore(self.path)
+        blob_store.put('a/b', b'some data')
+        blob_store.put('a/c', b'more data')
+        blob_store.delete('a')
+        with self.assertRaises(IOError):
+            blob_store.read('a/b', bytes)
+
+    def test_small_results_not_offloaded(self):
+        for value in (None, 42, 'result', ['1.2.3.4'] * 10, {'a': 1}):
+            self.assertEqual(self.store.offload(self.execution_id, uuid4(), value), value)
+
+    def test_large_result_offloaded(self):
+        value = ['1.2.3.4'] * 1000
+        handle = self.store.offload(self.execution_id, uuid4(), value)
+        self.assertTrue(is_result_handle(handle))
+        self.assertGreater(handle.size, 1024)
+        self.assertListEqual(self.store.resolve(handle), value)
+
+    def test_handle_json(self):
+        handle = self.store.offload(self.execution_id, uuid4(), 'x' * 2000)
+        self.assertDictEqual(handle.as_json(), {result_handle_key: handle.name, 'size': handle.size})
+        self.assertDictEqual(ActionResult(handle, 'Success').as_json(),
+                             {'result': handle.as_json(), 'status': 'Success'})
+
+    def test_handle_serialized(self):
+        handle = self.store.offload(self.execution_id, uuid4(), 'x' * 2000)
+        for value_format in (JsonFormat, MsgpackFormat):
+            serializer = Serializer(value_format)
+            self.assertEqual(serializer.loads(serializer.dumps(handle)), handle)
+
+    def test_forged_handle_not_resolved(self):
+        self.store.offload(self.execution_id, uuid4(), 'x' * 2000)
+        forged_handles = ({result_handle_key: '../../etc/passwd'},
+                          ResultHandle(str(self.execution_id), str(uuid4()), 10).as_json())
+        for forged in forged_handles:
+            self.assertFalse(is_result_handle(forged))
+            self.assertDictEqual(self.store.resolve(forged), forged)
+
+    def test_blob_names_outside_store_rejected(self):
+        blob_store = FilesystemBlobStore(self.path)
+        for name in ('../x', 'a/../../x', 'a/./b', '/x', 'a//b', ''):
+            with self.assertRaises(ValueError):
+                blob_store.put(name, b'data')
+            with self.assertRaises(ValueError):
+                blob_store.read(name, bytes)
+
+    def test_blob_symlinked_outside_execution_rejected(self):
+        handle = self.store.offload(self.execution_id, uuid4(), 'x' * 2000)
+        other_execution_id = uuid4()
+        os.makedirs(os.path.join(self.path, str(other_execution_id)))
+        os.symlink(os.path.join(self.path, handle.name), os.path.join(self.path, str(other_execution_id), 'link'))
+        with self.assertRaises(ValueError):
+            self.store.resolve(ResultHandle(str(other_execution_id), 'link', handle.size))
+
+    def test_unframed_blob_not_read(self):
+        handle = ResultHandle(str(self.execution_id), str(uuid4()), 10)
+        self.store.blob_store.put(handle.name, b'not framed')
+        with self.assertRaises(ValueError):
+            self.store.resolve(handle)
+
+    def test_offload_with_serializer(self):
+        store = ResultStore(FilesystemBlobStore(self.path), threshold=10,
+                            serializer=Serializer(JsonFormat, compression_threshold=100))
+        handle = store.offload(self.execution_id, uuid4(), {'iocs': ['evil.example.com'] * 100})
+        self.assertDictEqual(store.resolve(handle), {'iocs': ['evil.example.com'] * 100})
+
+    def test_resolve_not_handle(self):
+        self.assertDictEqual(self.store.resolve({'a': 1}), {'a': 1})
+
+    def test_delete_execution(self):
+        handle = self.store.offload(self.execution_id, uuid4(), 'x' * 2000)
+        other_handle = self.store.offload(uuid4(), uuid4(), 'y' * 2000)
+        self.store.delete_execution(self.execution_id)
+        with self.assertRaises(IOError):
+            self.store.resolve(handle)
+        self.assertEqual(self.store.resolve(other_handle), 'y' * 2000)
+
+    def test_delete(self):
+        key, other_key = uuid4(), uuid4()
+        handle = self.store.offload(self.execution_id, key, 'x' * 2000)
+        other_handle = self.store.offload(self.execution_id, other_key, 'y' * 2000)
+        self.store.delete(self.execution_id, [key, uuid4()])
+        with self.assertRaises(IOError):
+            self.store.resolve(handle)
+        self.assertEqual(self.store.resolve(other_handle), 'y' * 2000)
+
+    def test_no_threshold(self):
+        store = ResultStore(FilesystemBlobStore(self.path))
+        self.assertEqual(store.offload(self.execution_id, uuid4(), 'x' * 10000), 'x' * 10000)
+
+
+class TestResultStoreReferences(TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.original_path = walkoff.config.Config.RESULT_STORE_PATH
+        walkoff.config.Config.RESULT_STORE_PATH = self.path
+        self.store = ResultStore(make_result_store().blob_store, threshold=100)
+
+    def tearDown(self):
+        walkoff.config.Config.RESULT_STORE_PATH = self.original_path
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_resolve_result(self):
+        handle = self.store.offload(uuid4(), uuid4(), 'x' * 1000)
+        self.assertIsInstance(handle, ResultHandle)
+        self.assertEqual(resolve_result(handle), 'x' * 1000)
+        self.assertEqual(resolve_result('x'), 'x')
+
+    def test_argument_resolves_reference(self):
+        action_id = uuid4()
+        value = {'iocs': ['1.2.3.4'] * 100}
+        accumulator = {action_id: self.store.offload(uuid4(), action_id, value)}
+        self.assertDictEqual(Argument('test', reference=action_id).get_value(accumulator), value)
+        self.assertListEqual(Argument('test', reference=action_id, selection=['iocs']).get_value(accumulator),
+                             value['iocs'])
+
+    def test_argument_does_not_resolve_forged_reference(self):
+        action_id = uuid4()
+        handle = self.store.offload(uuid4(), uuid4(), 'x' * 1000)
+        accumulator = {action_id: handle.as_json()}
+        self.assertDictEqual(Argument('test', reference=action_id).get_value(accumulator), handle.as_json())
@@ -256,3 +256,31 @@ class TestScheduledTask(ServerTestCase):
                     'task_trigger': {'type': 'unspecified',
                                      'args': {}}}
         self.assertJsonIsCorrect(task, expected)
+
+    def test_as_json_with_priority(self):
+        task = ScheduledTask(name='test', priority='high')
+        expected = {'id': None,
+                    'name': 'test',
+                    'description': '',
+                    'status': 'running',
+                    'workflows': set(),
+                    'task_trigger': {'type': 'unspecified',
+                                     'args': {}},
+                    'priority': 'high'}
+        self.assertJsonIsCorrect(task, expected)
+
+    def test_init_with_priority_schedules_with_priority(self):
+        task = ScheduledTask(name='test', workflows=['a'], task_trigger=self.date_trigger, priority='low')
+        self.assertEqual(task.priority, 'low')
+        for job in current_app.running_context.scheduler.scheduler.get_jobs():
+            self.assertDictEqual(job.kwargs, {'priority': 'low'})
+
+    def test_update_priority(self):
+        task = ScheduledTask(name='test', workflows=['a', 'b'], task_trigger=self.date_trigger)
+        for job in current_app.running_context.scheduler.scheduler.get_jobs():
+            self.assertDictEqual(job.kwargs, {})
+        task.update({'priority': 'high'})
+        self.assertEqual(task.priority, 'high')
+        self.assertSchedulerWorkflowsRunningEqual({'a', 'b'})
+        for job in current_app.running_context.scheduler.scheduler.get_jobs():
+            self.assertDictEqual(job.kwargs, {'priority': 'high'})
@@ -0,0 +1,65 @@
+import pickle
+from unittest import TestCase
+from uuid import uuid4
+
+from tests.config import TestConfig as Config
+from walkoff.appgateway.serialization import Serializer, PickleFormat, MsgpackFormat, JsonFormat, make_serializer
+
+
+class TestSerializer(TestCase):
+
+    def assertRoundTrips(self, serializer, value):
+        self.assertEqual(serializer.loads(serializer.dumps(value)), value)
+
+    def test_formats_round_trip(self):
+        value = {'iocs': ['1.2.3.4', 'evil.example.com'], 'count': 2, 'nested': {'ratio': 0.5, 'seen': None}}
+        for value_format in (PickleFormat, MsgpackFormat, JsonFormat):
+            self.assertRoundTrips(Serializer(value_format), value)
+
+    def test_unsupported_values_pickled(self):
+        value = {'id': uuid4()}
+        for value_format in (MsgpackFormat, JsonFormat):
+            serializer = Serializer(value_format)
+            data = serializer.dumps(value)
+            self.assertEqual(data[1:2], PickleFormat.code)
+            self.assertEqual(serializer.loads(data), value)
+
+    def test_compression_threshold(self):
+        serializer = Serializer(JsonFormat, compression_threshold=1024)
+        small = ['a'] * 10
+        large = ['1.2.3.4'] * 10000
+        self.assertEqual(serializer.dumps(small)[2:3], b'-')
+        large_data = serializer.dumps(large)
+        self.assertEqual(large_data[2:3], b'z')
+        self.assertLess(len(large_data), len(JsonFormat.dumps(large)))
+        self.assertEqual(serializer.loads(large_data), large)
+
+    def test_no_compression_by_default(self):
+        self.assertEqual(Serializer().dumps('a' * 100000)[2:3], b'-')
+
+    def test_reads_values_of_other_configurations(self):
+        data = Serializer(MsgpackFormat, compression_threshold=10).dumps(['x'] * 100)
+        self.assertEqual(Serializer(JsonFormat).loads(data), ['x'] * 100)
+
+    def test_reads_plain_pickles(self):
+        self.assertDictEqual(Serializer().loads(pickle.dumps({'a': 1})), {'a': 1})
+
+    def test_reads_decoded_values(self):
+        data = Serializer(JsonFormat).dumps({'a': 1})
+        self.assertDictEqual(Serializer().loads(data.decode('utf-8')), {'a': 1})
+
+    def test_make_serializer(self):
+        class MockConfig(Config):
+            ACCUMULATOR_SERIALIZER = 'msgpack'
+            ACCUMULATOR_COMPRESSION_THRESHOLD = 0
+
+        serializer = make_serializer(MockConfig)
+        self.assertIs(serializer.value_format, MsgpackFormat)
+        self.assertIsNone(serializer.compression_threshold)
+
+    def test_make_serializer_invalid(self):
+        class MockConfig(Config):
+            ACCUMULATOR_SERIALIZER = 'invalid'
+
+        with self.assertRaises(ValueError):
+            make_serializer(MockConfig)
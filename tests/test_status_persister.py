@@ -0,0 +1,175 @@
+from unittest import TestCase
+from uuid import uuid4
+
+from mock import patch
+
+from tests.util import execution_db_help, initialize_test_config
+from walkoff.executiondb import ExecutionDatabase, WorkflowStatusEnum, ActionStatusEnum
+from walkoff.executiondb.metrics import AppMetric, WorkflowMetric
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+from walkoff.server.statuspersister import StatusPersister, StatusTransition
+from walkoff.server.workflowresults import _workflow_pending, _workflow_started, _workflow_ended, _action_started, \
+    _action_execution_success
+
+
+class TestStatusPersister(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        cls.execution_db = execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_execution_db()
+
+    def setUp(self):
+        self.execution_db = ExecutionDatabase.instance
+        self.workflow = {'execution_id': str(uuid4()), 'id': str(uuid4()), 'name': 'workflow'}
+
+    def tearDown(self):
+        execution_db_help.cleanup_execution_db()
+
+    def get_workflow_status(self):
+        self.execution_db.session.expire_all()
+        return self.execution_db.session.query(WorkflowStatus).filter_by(
+            execution_id=self.workflow['execution_id']).first()
+
+    def pending(self):
+        return StatusTransition(_workflow_pending, self.workflow, data={'user': 'admin'},
+                                workflow_execution_id=self.workflow['execution_id'])
+
+    def started(self):
+        return StatusTransition(_workflow_started, self.workflow, workflow_execution_id=self.workflow['execution_id'])
+
+    def ended(self):
+        return StatusTransition(_workflow_ended, self.workflow, workflow_execution_id=self.workflow['execution_id'])
+
+    def action_transitions(self):
+        action = {'execution_id': str(uuid4()), 'id': str(uuid4()), 'name': 'action', 'app_name': 'HelloWorld',
+                  'action_name': 'helloWorld', 'arguments': []}
+        return [StatusTransition(_action_started, action, data={'workflow': self.workflow},
+                                 workflow_execution_id=self.workflow['execution_id'],
+                                 action_execution_id=action['execution_id']),
+                StatusTransition(_action_execution_success, action, data={'data': {'result': 'hello'}},
+                                 action_execution_id=action['execution_id'])]
+
+    def test_init(self):
+        persister = StatusPersister(flush_size=10, flush_interval=1)
+        self.assertEqual(persister.flush_size, 10)
+        self.assertEqual(persister.flush_interval, 1)
+        self.assertEqual(len(persister), 0)
+
+    def test_record_buffers(self):
+        persister = StatusPersister(flush_size=10, flush_interval=60)
+        persister.record(self.execution_db, self.pending())
+        self.assertEqual(len(persister), 1)
+        self.assertIsNone(self.get_workflow_status())
+        self.assertEqual(persister.flush(self.execution_db), 1)
+        self.assertEqual(len(persister), 0)
+        workflow_status = self.get_workflow_status()
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.pending)
+        self.assertEqual(workflow_status.user, 'admin')
+
+    def test_record_flush(self):
+        persister = StatusPersister(flush_size=10, flush_interval=60)
+        persister.record(self.execution_db, self.pending(), flush=True)
+        self.assertEqual(len(persister), 0)
+        self.assertIsNotNone(self.get_workflow_status())
+
+    def test_record_flush_size(self):
+        persister = StatusPersister(flush_size=2, flush_interval=60)
+        persister.record(self.execution_db, self.pending())
+        self.assertIsNone(self.get_workflow_status())
+        persister.record(self.execution_db, self.started())
+        self.assertEqual(len(persister), 0)
+        self.assertEqual(self.get_workflow_status().status, WorkflowStatusEnum.running)
+
+    def test_record_flush_size_one(self):
+        persister = StatusPersister(flush_size=1, flush_interval=60)
+        persister.record(self.execution_db, self.pending())
+        self.assertIsNotNone(self.get_workflow_status())
+
+    def test_flush_if_due(self):
+        persister = StatusPersister(flush_size=10, flush_interval=60)
+        persister.record(self.execution_db, self.pending())
+        self.assertEqual(persister.flush_if_due(self.execution_db), 0)
+        persister.flush_interval = 0
+        self.assertEqual(persister.flush_if_due(self.execution_db), 1)
+        self.assertIsNotNone(self.get_workflow_status())
+
+    def test_flush_empty(self):
+        persister = StatusPersister()
+        self.assertEqual(persister.flush(self.execution_db), 0)
+        self.assertEqual(persister.flush_if_due(self.execution_db), 0)
+
+    def test_transitions_of_execution_applied_in_order(self):
+        persister = StatusPersister(flush_size=100, flush_interval=60)
+        transitions = [self.pending(), self.started()] + self.action_transitions() + [self.ended()]
+        for transition in transitions:
+            persister.record(self.execution_db, transition)
+        self.assertEqual(persister.flush(self.execution_db), 5)
+
+        workflow_status = self.get_workflow_status()
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.completed)
+        self.assertEqual(workflow_status.started_at, transitions[1].timestamp)
+        self.assertEqual(workflow_status.completed_at, transitions[4].timestamp)
+        action_status = self.execution_db.session.query(ActionStatus).first()
+        self.assertEqual(action_status.status, ActionStatusEnum.success)
+        self.assertEqual(action_status.result, '"hello"')
+        self.assertEqual(action_status.started_at, transitions[2].timestamp)
+        self.assertEqual(action_status.completed_at, transitions[3].timestamp)
+        self.assertEqual(self.execution_db.session.query(AppMetric).filter_by(app='HelloWorld').first().count, 1)
+        self.assertIsNotNone(self.execution_db.session.query(WorkflowMetric).filter_by(
+            workflow_id=self.workflow['id']).first())
+
+    def test_transitions_across_flushes(self):
+        persister = StatusPersister(flush_size=100, flush_interval=60)
+        persister.record(self.execution_db, self.pending(), flush=True)
+        started, succeeded = self.action_transitions()
+        persister.record(self.execution_db, self.started())
+        persister.record(self.execution_db, started)
+        persister.flush(self.execution_db)
+        persister.record(self.execution_db, succeeded)
+        persister.record(self.execution_db, self.ended(), flush=True)
+        self.assertEqual(self.get_workflow_status().status, WorkflowStatusEnum.completed)
+        self.assertEqual(self.execution_db.session.query(ActionStatus).first().status, ActionStatusEnum.success)
+
+    def test_transition_of_missing_execution_skipped(self):
+        persister = StatusPersister(flush_size=100, flush_interval=60)
+        persister.record(self.execution_db, self.started())
+        persister.record(self.execution_db, self.pending())
+        self.assertEqual(persister.flush(self.execution_db), 2)
+        self.assertEqual(self.get_workflow_status().status, WorkflowStatusEnum.pending)
+
+    def poison(self):
+        def add_invalid_status(batch, transition):
+            batch.add_workflow_status(WorkflowStatus(None, None, None))
+
+        return StatusTransition(add_invalid_status, {}, workflow_execution_id=str(uuid4()))
+
+    def test_failed_transition_does_not_drop_batch(self):
+        persister = StatusPersister(flush_size=100, flush_interval=60)
+        persister.record(self.execution_db, self.poison())
+        persister.record(self.execution_db, self.pending())
+        persister.record(self.execution_db, self.started())
+        self.assertEqual(persister.flush(self.execution_db), 2)
+        self.assertEqual(self.get_workflow_status().status, WorkflowStatusEnum.running)
+        self.assertEqual(len(persister), 1)
+
+    def test_failed_transitions_retried_in_order(self):
+        persister = StatusPersister(flush_size=100, flush_interval=60)
+        persister.record(self.execution_db, self.pending())
+        with patch.object(self.execution_db.session, 'commit', side_effect=Exception):
+            self.assertEqual(persister.flush(self.execution_db), 0)
+        self.assertEqual(len(persister), 1)
+        persister.record(self.execution_db, self.started())
+        self.assertEqual(persister.flush(self.execution_db), 2)
+        self.assertEqual(len(persister), 0)
+        self.assertEqual(self.get_workflow_status().status, WorkflowStatusEnum.running)
+
+    def test_failed_transition_dropped_after_retry_timeout(self):
+        persister = StatusPersister(flush_size=100, flush_interval=60, retry_timeout=0)
+        persister.record(self.execution_db, self.poison())
+        self.assertEqual(persister.flush(self.execution_db), 0)
+        self.assertEqual(len(persister), 0)
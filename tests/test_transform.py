@@ -96,6 +96,19 @@ class TestTransform(unittest.TestCase):
             15.7
         )
 
+    def test_init_pure(self):
+        transform = Transform('HelloWorld', action_name='mod1_filter2', arguments=[Argument('arg1', value='1')])
+        self.assertTrue(transform._pure)
+        self.assertFalse(Transform('HelloWorld', action_name='Top Transform')._pure)
+
+    def test_execute_pure_memoized(self):
+        strategy = LocalActionExecutionStrategy()
+        for data, expected in ((5.4, 15.7), ('5.4', 15.7), (1, 11.3)):
+            transform = Transform('HelloWorld', action_name='mod1_filter2', arguments=[Argument('arg1', value='10.3')])
+            self.assertAlmostEqual(transform.execute(strategy, data, {}), expected)
+        self.assertEqual(strategy.pure_results.hits, 1)
+        self.assertEqual(strategy.pure_results.misses, 2)
+
     def test_execute_with_complex_args(self):
         original_filter = Transform(
             'HelloWorld',
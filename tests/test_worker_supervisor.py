@@ -0,0 +1,149 @@
+import signal
+from unittest import TestCase
+
+from mock import patch
+
+from tests.util.mock_objects import MockRedisCacheAdapter
+from walkoff.multiprocessedexecutor.requestqueue import lane_key
+from walkoff.worker.supervisor import WorkerSupervisor, get_worker_pool_metrics
+
+
+class MockProcess(object):
+    def __init__(self, pid):
+        self.pid = pid
+        self.alive = True
+        self.exitcode = None
+
+    def is_alive(self):
+        return self.alive
+
+    def join(self, timeout=None):
+        pass
+
+
+class TestWorkerSupervisor(TestCase):
+
+    def setUp(self):
+        self.cache = MockRedisCacheAdapter()
+        self.spawned = []
+        self.supervisor = WorkerSupervisor(self.cache, 'config.json', 1, 4, 2, interval=1, scale_up_utilization=0.5,
+                                           scale_down_utilization=0.25, scale_down_checks=2,
+                                           spawn_worker=self.spawn_worker)
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def spawn_worker(self, worker_id, config_path, busy_threads):
+        process = MockProcess(1000 + worker_id)
+        self.spawned.append((worker_id, config_path))
+        return process
+
+    def set_busy_threads(self, *busy_threads):
+        for (_, value), busy in zip(self.supervisor.workers.values(), busy_threads):
+            value.value = busy
+
+    def queue_requests(self, count):
+        for i in range(count):
+            self.cache.lpush(lane_key('normal'), 'request{}'.format(i))
+
+    def test_init_bounds(self):
+        supervisor = WorkerSupervisor(self.cache, 'config.json', 0, 0, 0)
+        self.assertEqual(supervisor.min_workers, 1)
+        self.assertEqual(supervisor.max_workers, 1)
+        self.assertEqual(supervisor.threads_per_worker, 1)
+
+    def test_check_starts_min_workers(self):
+        self.assertEqual(self.supervisor.check(), 1)
+        self.assertListEqual(self.spawned, [(0, 'config.json')])
+        self.assertEqual(get_worker_pool_metrics(self.cache)['workers'], 1)
+
+    def test_check_no_change_while_idle_at_min(self):
+        self.supervisor.scale_up(1)
+        self.assertEqual(self.supervisor.check(), 0)
+        self.assertEqual(len(self.supervisor.workers), 1)
+
+    def test_check_no_scale_up_with_free_threads(self):
+        self.supervisor.scale_up(1)
+        self.queue_requests(4)
+        self.assertEqual(self.supervisor.check(), 0)
+
+    def test_check_scales_up_to_queue_depth(self):
+        self.supervisor.scale_up(1)
+        self.set_busy_threads(2)
+        self.queue_requests(3)
+        self.assertEqual(self.supervisor.check(), 2)
+        self.assertEqual(len(self.supervisor.workers), 3)
+        metrics = get_worker_pool_metrics(self.cache)
+        self.assertEqual(metrics['workers'], 3)
+        self.assertEqual(metrics['scale_ups'], 3)
+        self.assertEqual(metrics['queue_depth'], 3)
+        self.assertEqual(metrics['busy_threads'], 2)
+
+    def test_check_scales_up_to_max(self):
+        self.supervisor.scale_up(1)
+        self.set_busy_threads(2)
+        self.queue_requests(20)
+        self.assertEqual(self.supervisor.check(), 3)
+        self.assertEqual(len(self.supervisor.workers), 4)
+
+    def test_check_counts_all_lanes(self):
+        self.supervisor.scale_up(1)
+        self.set_busy_threads(2)
+        self.cache.lpush(lane_key('high'), 'a')
+        self.cache.lpush(lane_key('low'), 'b', 'c')
+        self.assertEqual(self.supervisor.check(), 2)
+
+    @patch('os.kill')
+    def test_check_drains_after_idle_checks(self, mock_kill):
+        self.supervisor.scale_up(3)
+        self.set_busy_threads(1, 0, 0)
+        self.assertEqual(self.supervisor.check(), 0)
+        mock_kill.assert_not_called()
+        self.assertEqual(self.supervisor.check(), -1)
+        mock_kill.assert_called_once_with(1001, signal.SIGTERM)
+        self.assertEqual(len(self.supervisor.workers), 2)
+        self.assertIn(1, self.supervisor.draining)
+        metrics = get_worker_pool_metrics(self.cache)
+        self.assertEqual(metrics['draining'], 1)
+        self.assertEqual(metrics['scale_downs'], 1)
+
+    @patch('os.kill')
+    def test_check_busy_resets_idle_checks(self, mock_kill):
+        self.supervisor.scale_up(2)
+        self.assertEqual(self.supervisor.check(), 0)
+        self.set_busy_threads(2, 2)
+        self.assertEqual(self.supervisor.check(), 0)
+        self.set_busy_threads(0, 0)
+        self.assertEqual(self.supervisor.check(), 0)
+        mock_kill.assert_not_called()
+
+    @patch('os.kill')
+    def test_check_never_drains_below_min(self, mock_kill):
+        self.supervisor.scale_up(1)
+        for _ in range(5):
+            self.assertEqual(self.supervisor.check(), 0)
+        mock_kill.assert_not_called()
+
+    @patch('os.kill')
+    def test_drained_workers_are_reaped(self, mock_kill):
+        self.supervisor.scale_up(2)
+        self.supervisor.scale_down(1)
+        process = list(self.supervisor.draining.values())[0]
+        self.assertIn(process, self.supervisor.processes)
+        process.alive = False
+        self.supervisor.check()
+        self.assertDictEqual(self.supervisor.draining, {})
+        self.assertEqual(len(self.supervisor.processes), 1)
+
+    def test_dead_workers_are_replaced(self):
+        self.supervisor.scale_up(1)
+        self.supervisor.workers[0][0].alive = False
+        self.assertEqual(self.supervisor.check(), 1)
+        self.assertListEqual(list(self.supervisor.workers.keys()), [1])
+
+    def test_utilization(self):
+        self.assertEqual(self.supervisor.utilization, 1.)
+        self.supervisor.scale_up(2)
+        self.set_busy_threads(1, 2)
+        self.assertEqual(self.supervisor.busy_threads, 3)
+        self.assertEqual(self.supervisor.utilization, 0.75)
@@ -1,4 +1,5 @@
 import json
+import time
 from unittest import TestCase
 from uuid import uuid4
 
@@ -57,6 +58,24 @@ class TestWorkflowCommunicationSender(TestCase):
         self.assertEqual(expected_message.workflow_control_message.type, WorkflowControl.PAUSE)
         self.assertEqual(expected_message.workflow_control_message.workflow_execution_id, uid)
 
+    def test_create_workflow_request_message_priority(self):
+        workflow_id = str(uuid4())
+        execution_id = str(uuid4())
+        before = time.time()
+        message = ExecuteWorkflowMessage()
+        message.ParseFromString(ProtobufWorkflowResultsConverter.create_workflow_request_message(
+            workflow_id, execution_id, priority='high'))
+        self.assertEqual(message.workflow_id, workflow_id)
+        self.assertEqual(message.priority, 'high')
+        self.assertGreaterEqual(message.enqueued_at, before)
+        self.assertLessEqual(message.enqueued_at, time.time())
+
+    def test_create_workflow_request_message_no_priority(self):
+        message = ExecuteWorkflowMessage()
+        message.ParseFromString(ProtobufWorkflowResultsConverter.create_workflow_request_message(
+            str(uuid4()), str(uuid4())))
+        self.assertEqual(message.priority, '')
+
     @patch.object(Socket, 'send')
     def test_abort_workflow(self, mock_send):
         uid = str(uuid4())
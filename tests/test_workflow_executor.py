@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+from concurrent.futures import ThreadPoolExecutor
+
+import walkoff.config
+from walkoff.appgateway.appinstancerepo import AppInstanceRepo
+from walkoff.worker.workflow_exec_strategy import WorkflowExecutor
+
+
+class TestWorkflowExecutor(TestCase):
+
+    def setUp(self):
+        self.executor = WorkflowExecutor(walkoff.config.Config, 3, None, AppInstanceRepo)
+
+    def test_acquire_slots_takes_all_free_slots(self):
+        self.assertEqual(self.executor.acquire_slots(), 3)
+
+    def test_acquire_slots_timeout(self):
+        self.executor.acquire_slots()
+        self.assertEqual(self.executor.acquire_slots(timeout=0.01), 0)
+
+    def test_release_slots(self):
+        self.executor.acquire_slots()
+        self.executor.release_slots(2)
+        self.assertEqual(self.executor.acquire_slots(timeout=0.01), 2)
+        self.executor.release_slots()
+        self.assertEqual(self.executor.acquire_slots(timeout=0.01), 1)
+
+    def test_release_too_many_slots(self):
+        with self.assertRaises(ValueError):
+            self.executor.release_slots()
+
+    def test_completed_workflow_releases_slot(self):
+        self.assertEqual(self.executor.acquire_slots(), 3)
+        threadpool = ThreadPoolExecutor(max_workers=1)
+        future = threadpool.submit(lambda: None)
+        future.add_done_callback(lambda _: self.executor.release_slots())
+        self.assertEqual(self.executor.acquire_slots(timeout=5), 1)
+        threadpool.shutdown()
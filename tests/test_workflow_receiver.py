@@ -1,16 +1,19 @@
 import os.path
+import time
 from unittest import TestCase
 from uuid import uuid4
 
 import nacl.bindings.crypto_box
 from mock import patch
 from nacl.public import PrivateKey, Box
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
 from zmq import auth
 
 import walkoff.cache
 import walkoff.config
 from tests.util import initialize_test_config, execution_db_help
 from tests.util.mock_objects import MockRedisCacheAdapter
+from walkoff.multiprocessedexecutor.requestqueue import LaneScheduler, get_queue_metrics
 from walkoff.proto.build.data_pb2 import ExecuteWorkflowMessage
 from walkoff.worker.zmq_workflow_receivers import WorkflowReceiver
 
@@ -33,6 +36,7 @@ class TestWorkflowReceiver(TestCase):
         execution_db_help.setup_dbs()
 
     def tearDown(self):
+        MockRedisCacheAdapter().clear()
         execution_db_help.cleanup_execution_db()
         execution_db_help.tear_down_execution_db()
 
@@ -46,8 +50,21 @@ class TestWorkflowReceiver(TestCase):
         self.assertFalse(receiver._exit)
 
     @patch.object(walkoff.cache, 'make_cache', return_value=MockRedisCacheAdapter())
-    def get_receiver(self, mock_create_cache):
-        return WorkflowReceiver(self.key, self.server_key, walkoff.config.Config.CACHE)
+    def test_init_dispatch_mode_default(self, mock_make_cache):
+        receiver = WorkflowReceiver(self.key, self.server_key, walkoff.config.Config.CACHE)
+        self.assertEqual(receiver.dispatch_mode, walkoff.config.Config.WORKFLOW_DISPATCH_MODE)
+        self.assertEqual(receiver.dispatch_timeout, walkoff.config.Config.WORKFLOW_DISPATCH_TIMEOUT)
+
+    @patch.object(walkoff.cache, 'make_cache', return_value=MockRedisCacheAdapter())
+    def test_init_dispatch_mode_invalid(self, mock_make_cache):
+        receiver = WorkflowReceiver(self.key, self.server_key, walkoff.config.Config.CACHE, dispatch_mode='invalid')
+        self.assertEqual(receiver.dispatch_mode, 'blocking')
+        self.assertTrue(receiver.is_blocking)
+
+    @patch.object(walkoff.cache, 'make_cache', return_value=MockRedisCacheAdapter())
+    def get_receiver(self, mock_create_cache, dispatch_mode=None, reliable=False):
+        return WorkflowReceiver(self.key, self.server_key, walkoff.config.Config.CACHE, dispatch_mode=dispatch_mode,
+                                dispatch_timeout=1, reliable=reliable, worker_id='test-worker')
 
     def test_shutdown(self):
         receiver = self.get_receiver()
@@ -62,8 +79,217 @@ class TestWorkflowReceiver(TestCase):
         workflow = next(workflow_generator)
         self.assertIsNone(workflow)
 
-    def check_workflow_message(self, message, expected):
-        receiver = self.get_receiver()
+    def test_receive_workflow_no_message_polling(self):
+        receiver = self.get_receiver(dispatch_mode='polling')
+        with patch.object(receiver.cache, 'brpop') as mock_brpop:
+            workflow_generator = receiver.receive_workflows()
+            workflow = next(workflow_generator)
+            self.assertIsNone(workflow)
+            mock_brpop.assert_not_called()
+
+    def test_receive_workflow_blocking_waits_for_message(self):
+        receiver = self.get_receiver(dispatch_mode='blocking')
+        with patch.object(receiver.cache, 'rpop') as mock_rpop:
+            workflow_generator = receiver.receive_workflows()
+            workflow = next(workflow_generator)
+            self.assertIsNone(workflow)
+            mock_rpop.assert_not_called()
+
+    def test_receive_workflow_blocking_uses_timeout(self):
+        receiver = self.get_receiver(dispatch_mode='blocking')
+        workflow_id = str(uuid4())
+        execution_id = str(uuid4())
+        message = ExecuteWorkflowMessage()
+        message.workflow_id = workflow_id
+        message.workflow_execution_id = execution_id
+        receiver.cache.lpush('request_queue', self.box.encrypt(message.SerializeToString()))
+        with patch.object(receiver.cache, 'brpop', wraps=receiver.cache.brpop) as mock_brpop:
+            workflow = next(receiver.receive_workflows())
+            mock_brpop.assert_called_once_with(['request_queue:high', 'request_queue', 'request_queue:low'],
+                                               timeout=1)
+        self.assertTupleEqual(workflow, (workflow_id, execution_id, '', [], False, [], ''))
+
+    @patch('walkoff.worker.zmq_workflow_receivers.time.sleep')
+    def test_receive_workflow_blocking_cache_timeout(self, mock_sleep):
+        receiver = self.get_receiver(dispatch_mode='blocking')
+        with patch.object(receiver.cache, 'brpop', side_effect=RedisTimeoutError):
+            workflow = next(receiver.receive_workflows())
+            self.assertIsNone(workflow)
+        mock_sleep.assert_called_once_with(0.5)
+
+    @patch('walkoff.worker.zmq_workflow_receivers.time.sleep')
+    def test_receive_workflow_batch_cache_error_backs_off(self, mock_sleep):
+        receiver = self.get_receiver(dispatch_mode='blocking')
+        with patch.object(receiver.cache, 'brpop', side_effect=RedisConnectionError):
+            for _ in range(8):
+                self.assertListEqual(receiver.receive_workflow_batch(1), [])
+        self.assertListEqual([call[0][0] for call in mock_sleep.call_args_list], [0.5, 1, 2, 4, 8, 16, 30, 30])
+        receiver.receive_workflow_batch(1)
+        self.assertEqual(receiver._error_backoff, 0)
+
+    def test_receive_workflow_polling_basic_workflow(self):
+        workflow_id = str(uuid4())
+        execution_id = str(uuid4())
+        message = ExecuteWorkflowMessage()
+        message.workflow_id = workflow_id
+        message.workflow_execution_id = execution_id
+        message.resume = True
+        self.check_workflow_message(message, (workflow_id, execution_id, '', [], True, [], ''),
+                                    dispatch_mode='polling')
+
+    def make_encrypted_messages(self, count):
+        messages = []
+        for _ in range(count):
+            message = ExecuteWorkflowMessage()
+            message.workflow_id = str(uuid4())
+            message.workflow_execution_id = str(uuid4())
+            messages.append((message, self.box.encrypt(message.SerializeToString())))
+        return messages
+
+    def check_receive_workflow_batch(self, dispatch_mode):
+        receiver = self.get_receiver(dispatch_mode=dispatch_mode)
+        messages = self.make_encrypted_messages(4)
+        for _, encrypted_message in messages:
+            receiver.cache.lpush('request_queue', encrypted_message)
+        workflows = receiver.receive_workflow_batch(3)
+        self.assertListEqual([workflow[1] for workflow in workflows],
+                             [message.workflow_execution_id for message, _ in messages[:3]])
+        self.assertEqual(len(receiver.receive_workflow_batch(3)), 1)
+
+    def test_receive_workflow_batch_blocking(self):
+        self.check_receive_workflow_batch('blocking')
+
+    def test_receive_workflow_batch_polling(self):
+        self.check_receive_workflow_batch('polling')
+
+    def test_receive_workflow_batch_no_messages(self):
+        receiver = self.get_receiver(dispatch_mode='polling')
+        self.assertListEqual(receiver.receive_workflow_batch(3), [])
+
+    def test_receive_workflow_batch_drops_invalid_messages(self):
+        receiver = self.get_receiver(dispatch_mode='polling')
+        messages = self.make_encrypted_messages(2)
+        receiver.cache.lpush('request_queue', messages[0][1], b'invalid', messages[1][1])
+        workflows = receiver.receive_workflow_batch(3)
+        self.assertListEqual([workflow[1] for workflow in workflows],
+                             [message.workflow_execution_id for message, _ in messages])
+
+    def test_receive_workflow_batch_zero_count(self):
+        receiver = self.get_receiver(dispatch_mode='polling')
+        receiver.cache.lpush('request_queue', self.make_encrypted_messages(1)[0][1])
+        self.assertListEqual(receiver.receive_workflow_batch(0), [])
+
+    def check_receive_workflow_reliable(self, dispatch_mode):
+        receiver = self.get_receiver(dispatch_mode=dispatch_mode, reliable=True)
+        messages = self.make_encrypted_messages(2)
+        for _, encrypted_message in messages:
+            receiver.cache.lpush('request_queue', encrypted_message)
+        workflows = receiver.receive_workflow_batch(2)
+        self.assertEqual(len(workflows), 2)
+        self.assertEqual(receiver.cache.llen('request_queue'), 0)
+        self.assertEqual(receiver.cache.llen('request_queue:in_flight:test-worker'), 2)
+        receiver.acknowledge(workflows[0][1])
+        self.assertEqual(receiver.cache.llen('request_queue:in_flight:test-worker'), 1)
+        receiver.acknowledge(workflows[1][1])
+        self.assertFalse(receiver.cache.exists('request_queue:in_flight:test-worker'))
+
+    def test_receive_workflow_reliable_blocking(self):
+        self.check_receive_workflow_reliable('blocking')
+
+    def test_receive_workflow_reliable_polling(self):
+        self.check_receive_workflow_reliable('polling')
+
+    def test_receive_workflow_reliable_generator(self):
+        receiver = self.get_receiver(reliable=True)
+        receiver.cache.lpush('request_queue', self.make_encrypted_messages(1)[0][1])
+        workflow = next(receiver.receive_workflows())
+        self.assertEqual(receiver.cache.llen('request_queue:in_flight:test-worker'), 1)
+        receiver.acknowledge(workflow[1])
+        self.assertEqual(receiver.cache.llen('request_queue:in_flight:test-worker'), 0)
+
+    def test_receive_workflow_reliable_drops_invalid_messages(self):
+        receiver = self.get_receiver(dispatch_mode='polling', reliable=True)
+        receiver.cache.lpush('request_queue', b'invalid')
+        self.assertListEqual(receiver.receive_workflow_batch(1), [])
+        self.assertEqual(receiver.cache.llen('request_queue:in_flight:test-worker'), 0)
+
+    def test_acknowledge_clears_redeliveries(self):
+        receiver = self.get_receiver(reliable=True)
+        receiver.cache.lpush('request_queue', self.make_encrypted_messages(1)[0][1])
+        workflow = receiver.receive_workflow_batch(1)[0]
+        receiver.cache.incr('request_queue:redeliveries:{}'.format(workflow[1]))
+        receiver.acknowledge(workflow[1])
+        self.assertFalse(receiver.cache.exists('request_queue:redeliveries:{}'.format(workflow[1])))
+
+    def test_acknowledge_unknown_execution(self):
+        receiver = self.get_receiver(reliable=True)
+        receiver.acknowledge(str(uuid4()))
+
+    def test_send_heartbeat(self):
+        receiver = self.get_receiver(reliable=True)
+        receiver.send_heartbeat()
+        self.assertTrue(receiver.cache.exists('request_queue:heartbeat:test-worker'))
+        self.assertGreater(receiver.cache.cache.pttl('request_queue:heartbeat:test-worker'), 0)
+
+    def make_encrypted_message(self, priority=None, enqueued_at=None):
+        message = ExecuteWorkflowMessage()
+        message.workflow_id = str(uuid4())
+        message.workflow_execution_id = str(uuid4())
+        if priority:
+            message.priority = priority
+        if enqueued_at:
+            message.enqueued_at = enqueued_at
+        return message.workflow_execution_id, self.box.encrypt(message.SerializeToString())
+
+    def check_receive_workflow_strict_priority(self, dispatch_mode, reliable=False):
+        receiver = self.get_receiver(dispatch_mode=dispatch_mode, reliable=reliable)
+        receiver.lane_scheduler = LaneScheduler('strict')
+        low_id, low_message = self.make_encrypted_message('low')
+        normal_id, normal_message = self.make_encrypted_message()
+        high_id, high_message = self.make_encrypted_message('high')
+        receiver.cache.lpush('request_queue:low', low_message)
+        receiver.cache.lpush('request_queue', normal_message)
+        receiver.cache.lpush('request_queue:high', high_message)
+        self.assertEqual(receiver.receive_workflow_batch(1)[0][1], high_id)
+        self.assertListEqual([workflow[1] for workflow in receiver.receive_workflow_batch(2)], [normal_id, low_id])
+
+    def test_receive_workflow_strict_priority_blocking(self):
+        self.check_receive_workflow_strict_priority('blocking')
+
+    def test_receive_workflow_strict_priority_polling(self):
+        self.check_receive_workflow_strict_priority('polling')
+
+    def test_receive_workflow_strict_priority_reliable(self):
+        self.check_receive_workflow_strict_priority('blocking', reliable=True)
+
+    def test_receive_workflow_weighted_priority(self):
+        receiver = self.get_receiver(dispatch_mode='polling')
+        receiver.lane_scheduler = LaneScheduler('weighted', {'high': 1, 'normal': 1, 'low': 1})
+        for priority in ('high', 'high', 'high', 'low'):
+            receiver.cache.lpush('request_queue:{}'.format(priority), self.make_encrypted_message(priority)[1])
+        self.assertEqual(len(receiver.receive_workflow_batch(1)), 1)
+        self.assertEqual(receiver.cache.llen('request_queue:high'), 2)
+        self.assertEqual(len(receiver.receive_workflow_batch(1)), 1)
+        self.assertEqual(receiver.cache.llen('request_queue:high'), 1)
+        self.assertEqual(len(receiver.receive_workflow_batch(1)), 1)
+        self.assertEqual(receiver.cache.llen('request_queue:low'), 0)
+
+    def test_receive_workflow_records_wait_times(self):
+        receiver = self.get_receiver(dispatch_mode='polling')
+        enqueued_at = time.time() - 2
+        receiver.cache.lpush('request_queue:high', self.make_encrypted_message('high', enqueued_at)[1])
+        receiver.cache.lpush('request_queue', self.make_encrypted_message(enqueued_at=enqueued_at)[1])
+        receiver.cache.lpush('request_queue', self.make_encrypted_message()[1])
+        self.assertEqual(len(receiver.receive_workflow_batch(3)), 3)
+        metrics = get_queue_metrics(receiver.cache)
+        self.assertEqual(metrics['high']['received'], 1)
+        self.assertEqual(metrics['normal']['received'], 1)
+        self.assertEqual(metrics['low']['received'], 0)
+        self.assertGreaterEqual(metrics['high']['average_wait_ms'], 2000)
+        self.assertGreaterEqual(metrics['normal']['average_wait_ms'], 2000)
+
+    def check_workflow_message(self, message, expected, dispatch_mode=None):
+        receiver = self.get_receiver(dispatch_mode=dispatch_mode)
         encrypted_message = self.box.encrypt(message.SerializeToString())
         workflow_generator = receiver.receive_workflows()
         receiver.cache.lpush('request_queue', encrypted_message)
@@ -336,6 +336,35 @@ class TestWorkflowStatus(ServerTestCase):
         self.assertEqual(workflow_status.status, WorkflowStatusEnum.aborted)
         self.assertEqual(actions[-1].status, ActionStatusEnum.aborted)
 
+    def test_started_status_written_immediately(self):
+        workflow_status = self.make_generic_workflow_status()
+        execution_db = current_app.running_context.execution_db
+        execution_db.session.add(workflow_status)
+        execution_db.session.commit()
+        sender = {'execution_id': str(workflow_status.execution_id), 'id': str(workflow_status.workflow_id),
+                  'name': workflow_status.name}
+        WalkoffEvent.WorkflowExecutionStart.send(sender)
+        self.assertEqual(len(current_app.running_context.status_persister), 0)
+        execution_db.session.expire_all()
+        workflow_status = execution_db.session.query(WorkflowStatus).filter_by(
+            execution_id=sender['execution_id']).first()
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.running)
+
+    def test_pending_status_already_written_not_rewritten(self):
+        workflow_status = self.make_generic_workflow_status()
+        workflow_status.running()
+        execution_db = current_app.running_context.execution_db
+        execution_db.session.add(workflow_status)
+        execution_db.session.commit()
+        sender = {'execution_id': str(workflow_status.execution_id), 'id': str(workflow_status.workflow_id),
+                  'name': workflow_status.name}
+        WalkoffEvent.WorkflowExecutionPending.send(sender, data={'status_written': True})
+        current_app.running_context.status_persister.flush(execution_db)
+        execution_db.session.expire_all()
+        workflow_status = execution_db.session.query(WorkflowStatus).filter_by(
+            execution_id=workflow_status.execution_id).first()
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.running)
+
     def test_workflowqueue_pagination(self):
         for i in range(40):
             workflow_status = WorkflowStatus(uuid4(), uuid4(), 'test')
@@ -73,3 +73,39 @@ class TestZmqCommunicationServer(ServerTestCase):
 
         self.post_with_status_check('/api/workflowqueue', headers=self.headers, status_code=INVALID_INPUT_ERROR,
                                     content_type="application/json", data=json.dumps(data))
+
+    def test_execute_workflows(self):
+        workflow = execution_db_help.load_workflow('test', 'helloWorldWorkflow')
+
+        results = []
+        pending = []
+
+        @WalkoffEvent.ActionExecutionSuccess.connect
+        def y(sender, **kwargs):
+            results.append(kwargs['data']['data']['result'])
+
+        @WalkoffEvent.WorkflowExecutionPending.connect
+        def z(sender, **kwargs):
+            pending.append(sender['execution_id'])
+
+        data = {"workflow_id": str(workflow.id),
+                "argument_sets": [[{"name": "call", "value": "first"}], [{"name": "call", "value": "second"}]]}
+
+        response = self.post_with_status_check('/api/workflowqueue/bulk', headers=self.headers,
+                                               status_code=SUCCESS_ASYNC, content_type="application/json",
+                                               data=json.dumps(data))
+
+        current_app.running_context.executor.wait_and_reset(2)
+
+        self.assertEqual(len(response['ids']), 2)
+        self.assertEqual(len(set(response['ids'])), 2)
+        self.assertSetEqual(set(results), {'REPEATING: first', 'REPEATING: second'})
+        self.assertListEqual(pending, response['ids'])
+
+    def test_execute_workflows_invalid_arguments(self):
+        workflow = execution_db_help.load_workflow('test', 'helloWorldWorkflow')
+        data = {"workflow_id": str(workflow.id),
+                "argument_sets": [[{"name": "call", "value": "first"}], [{"name": "call"}]]}
+
+        self.post_with_status_check('/api/workflowqueue/bulk', headers=self.headers, status_code=INVALID_INPUT_ERROR,
+                                    content_type="application/json", data=json.dumps(data))
@@ -28,7 +28,7 @@ def json_select(json_in, element):
     return json_in[element]
 
 
-@transform
+@transform(pure=True)
 def filter2(value, arg1):
     return value + arg1
 
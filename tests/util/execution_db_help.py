@@ -10,7 +10,7 @@ from walkoff.executiondb.branch import Branch
 from walkoff.executiondb.condition import Condition
 from walkoff.executiondb.conditionalexpression import ConditionalExpression
 from walkoff.executiondb.device import Device, DeviceField
-from walkoff.executiondb.metrics import AppMetric, WorkflowMetric, ActionMetric, ActionStatusMetric
+from walkoff.executiondb.metrics import AppMetric, WorkflowMetric, ActionMetric, ActionStatusMetric, LatencyHistogram
 from walkoff.executiondb.playbook import Playbook
 from walkoff.executiondb.schemas import PlaybookSchema
 from walkoff.executiondb.transform import Transform
@@ -29,7 +29,7 @@ def cleanup_execution_db():
     execution_db.session.rollback()
     classes = [Playbook, Workflow, Action, Branch, Argument, ConditionalExpression, Condition, Transform,
                WorkflowStatus, ActionStatus, AppMetric, WorkflowMetric, WorkflowStatus, ActionMetric,
-               ActionStatusMetric, Device, DeviceField]
+               ActionStatusMetric, LatencyHistogram, Device, DeviceField]
     for ee in classes:
         execution_db.session.query(ee).delete()
 
@@ -13,7 +13,9 @@ import walkoff.config
 from tests.util.jsonplaybookloader import JsonPlaybookLoader
 from walkoff.executiondb.playbook import Playbook
 from walkoff.helpers import compose_api
+from walkoff.pipelinemetrics import pipeline_metrics
 from walkoff.server.app import create_app
+from walkoff.server.pipelinecollector import register_pipeline_metrics
 
 logger = logging.getLogger('walkoff')
 
@@ -30,6 +32,7 @@ def run(args, app, host, port):
 
     app.running_context.inject_app(app)
     app.running_context.executor.initialize_threading(app, pids)
+    pipeline_metrics.start(app.running_context.cache, walkoff.config.Config.PIPELINE_METRICS_FLUSH_INTERVAL)
     # The order of these imports matter for initialization (should probably be fixed)
 
     server = setup_server(app, host, port)
@@ -108,6 +111,7 @@ if __name__ == "__main__":
 
     if not walkoff.config.Config.SEPARATE_PROMETHEUS:
         metrics = PrometheusMetrics(app, path='/prometheus_metrics')
+        register_pipeline_metrics(app.running_context.cache)
 
     import_workflows(app)
     try:
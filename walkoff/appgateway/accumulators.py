@@ -1,5 +1,10 @@
+import threading
+from collections import Counter
+
+from walkoff.appgateway.serialization import Serializer, make_serializer
 from walkoff.cache import make_cache
-import pickle
+from walkoff.pipelinemetrics import pipeline_metrics, TimedCache
+
 
 class InMemoryAccumulator(dict):
     """This accumulator is identical to a dictionary, but the copy and __cmp__ properties are disabled.
@@ -20,21 +25,23 @@ class ExternallyCachedAccumulator(object):
     """
     _cache_separator = ':'
 
-    def __init__(self, cache, workflow_execution_id, key_prefix='accumulator'):
+    def __init__(self, cache, workflow_execution_id, key_prefix='accumulator', serializer=None, expire=None):
         self._cache = cache
         self._key_prefix = key_prefix
+        self._serializer = serializer if serializer is not None else Serializer()
+        self._expire = expire
+        self.bytes_written = Counter()
 
         self._key = ""
         self._scan_key = ""
         self.set_key(workflow_execution_id)
 
     def __setitem__(self, key, value):
-        pickled_value = pickle.dumps(value)
-        self._cache.set(self.format_key(key), pickled_value)
+        self._cache.set(self.format_key(key), self._dumps(key, value), expire=self._expire)
 
     def __getitem__(self, item):
         if self._cache.exists(self.format_key(item)):
-            return pickle.loads(self._cache.get(self.format_key(item)))
+            return self._serializer.loads(self._cache.get(self.format_key(item)))
         else:
             raise KeyError
 
@@ -54,42 +61,58 @@ class ExternallyCachedAccumulator(object):
     def extract_key(self, key):
         return key.split(self._cache_separator)[-1]
 
+    def _dumps(self, key, value):
+        data = self._serializer.dumps(value)
+        self.bytes_written[str(key)] += len(data)
+        return data
+
     def set_key(self, workflow_execution_id):
         self._key = '{0}{1}{2}{1}'.format(self._key_prefix, self._cache_separator, workflow_execution_id)
         self._key += '{}'
         self._scan_key = self._key.format('*')
 
     def clear(self):
-        for key in self.keys():
-            self._cache.delete(key)
+        self._cache.unlink(*self.keys())
+
+    def discard(self, *keys):
+        """Deletes a number of entries if they exist"""
+        self._cache.unlink(*(self.format_key(key) for key in keys))
+
+    def touch(self):
+        """Restarts the expiration of every entry"""
+        if self._expire:
+            self._cache.expire_multiple(list(self.keys()), self._expire)
+
+    def persist(self):
+        """Removes the expiration of every entry"""
+        if self._expire:
+            self._cache.persist_multiple(list(self.keys()))
 
     def has_key(self, key):
         return self._cache.exists(self._key.format(key))
 
     def update(self, *args, **kwargs):
+        mapping = {}
         for arg in args:
-            for key, val in arg.items():
-                pickled_val = pickle.dumps(val)
-                self._cache.set(self._key.format(key), pickled_val)
-        for key, val in kwargs.items():
-            pickled_val = pickle.dumps(val)
-            self._cache.set(self._key.format(key), pickled_val)
+            mapping.update({self._key.format(key): self._dumps(key, val) for key, val in arg.items()})
+        mapping.update({self._key.format(key): self._dumps(key, val) for key, val in kwargs.items()})
+        self._cache.set_multiple(mapping, expire=self._expire)
 
     def keys(self):
         return self._cache.scan(self._scan_key)
 
     def values(self):
-        return (pickle.loads(self._cache.get(key)) for key in self._cache.scan(self._scan_key))
+        return (self._serializer.loads(self._cache.get(key)) for key in self._cache.scan(self._scan_key))
 
     def items(self):
-        return ((key, pickle.loads(self._cache.get(key))) for key in self._cache.scan(self._scan_key))
+        return ((key, self._serializer.loads(self._cache.get(key))) for key in self._cache.scan(self._scan_key))
 
     def pop(self, *args):
         if len(args) > 2:
             raise TypeError('Cannot use more than 2 arguments')
         key = self._key.format(args[0])
         if self._cache.exists(key):
-            ret = pickle.loads(self._cache.get(key))
+            ret = self._serializer.loads(self._cache.get(key))
             self._cache.delete(key)
             return ret
         elif len(args) == 2:
@@ -104,18 +127,411 @@ class ExternallyCachedAccumulator(object):
         return self.keys()
 
 
+class ExternallyCachedHashAccumulator(object):
+    """This accumulator acts as a dictionary with the values stored in a single hash in an external cache (e.g. Redis)
+
+    Each entry is a field of the hash of its workflow execution, so reads, writes, and lengths each take a single round
+    trip and never scan the cache.
+    """
+    _cache_separator = ':'
+
+    def __init__(self, cache, workflow_execution_id, key_prefix='accumulator', serializer=None, expire=None):
+        self._cache = cache
+        self._key_prefix = key_prefix
+        self._serializer = serializer if serializer is not None else Serializer()
+        self._expire = expire
+        self.bytes_written = Counter()
+
+        self._key = ""
+        self.set_key(workflow_execution_id)
+
+    def __setitem__(self, key, value):
+        self._cache.hset_multiple(self._key, {str(key): self._dumps(key, value)}, expire=self._expire)
+
+    def __getitem__(self, item):
+        value = self._cache.hget(self._key, str(item))
+        if value is None:
+            raise KeyError(item)
+        return self._serializer.loads(value)
+
+    def __len__(self):
+        return self._cache.hlen(self._key)
+
+    def __delitem__(self, key):
+        if not self._cache.hdel(self._key, str(key)):
+            raise KeyError(key)
+
+    def _dumps(self, key, value):
+        data = self._serializer.dumps(value)
+        self.bytes_written[str(key)] += len(data)
+        return data
+
+    def set_key(self, workflow_execution_id):
+        self._key = '{0}{1}{2}'.format(self._key_prefix, self._cache_separator, workflow_execution_id)
+
+    def clear(self):
+        self._cache.unlink(self._key)
+
+    def discard(self, *keys):
+        """Deletes a number of entries if they exist"""
+        if keys:
+            self._cache.hdel(self._key, *(str(key) for key in keys))
+
+    def touch(self):
+        """Restarts the expiration of every entry"""
+        if self._expire:
+            self._cache.expire(self._key, self._expire)
+
+    def persist(self):
+        """Removes the expiration of every entry"""
+        if self._expire:
+            self._cache.persist(self._key)
+
+    def has_key(self, key):
+        return self._cache.hexists(self._key, str(key))
+
+    def update(self, *args, **kwargs):
+        mapping = {}
+        for arg in args:
+            mapping.update({str(key): self._dumps(key, val) for key, val in arg.items()})
+        mapping.update({key: self._dumps(key, val) for key, val in kwargs.items()})
+        self._cache.hset_multiple(self._key, mapping, expire=self._expire)
+
+    def keys(self):
+        return iter(self._cache.hkeys(self._key))
+
+    def values(self):
+        return (self._serializer.loads(value) for value in self._cache.hvals(self._key))
+
+    def items(self):
+        return ((key, self._serializer.loads(value)) for key, value in self._cache.hgetall(self._key).items())
+
+    def pop(self, *args):
+        if len(args) > 2:
+            raise TypeError('Cannot use more than 2 arguments')
+        key = str(args[0])
+        value = self._cache.hget(self._key, key)
+        if value is not None:
+            self._cache.hdel(self._key, key)
+            return self._serializer.loads(value)
+        elif len(args) == 2:
+            return args[1]
+        else:
+            raise KeyError(args[0])
+
+    def __contains__(self, item):
+        return self._cache.hexists(self._key, str(item))
+
+    def __iter__(self):
+        return self.keys()
+
+
+class TieredAccumulator(object):
+    """This accumulator keeps the entries of an execution in memory in front of an externally cached accumulator
+
+    Reads are served from memory, and fall back to the cache for entries written elsewhere, such as those of a resumed
+    execution. Writes are kept in memory until they are written to the cache in one batch by `flush`.
+    """
+
+    def __init__(self, backing):
+        self._backing = backing
+        self._local = {}
+        self._dirty = set()
+        self._deleted = set()
+        self._flushing = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        key = str(key)
+        with self._lock:
+            self._local[key] = value
+            self._dirty.add(key)
+            self._deleted.discard(key)
+
+    def __getitem__(self, item):
+        key = str(item)
+        with self._lock:
+            if key in self._local:
+                return self._local[key]
+            if key in self._deleted:
+                raise KeyError(item)
+        value = self._backing[key]
+        with self._lock:
+            return self._local.setdefault(key, value)
+
+    def __len__(self):
+        self.flush()
+        return len(self._backing)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        key = str(key)
+        with self._lock:
+            self._local.pop(key, None)
+            self._dirty.discard(key)
+            self._deleted.add(key)
+
+    def clear(self):
+        with self._lock:
+            self._local.clear()
+            self._dirty.clear()
+            self._deleted.clear()
+        self._backing.clear()
+
+    def discard(self, *keys):
+        """Deletes a number of entries if they exist. They are deleted from the cache by the next flush"""
+        keys = [str(key) for key in keys]
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+            self._dirty.difference_update(keys)
+            self._deleted.update(keys)
+
+    def has_key(self, key):
+        return key in self
+
+    def update(self, *args, **kwargs):
+        entries = {}
+        for arg in args:
+            entries.update({str(key): val for key, val in arg.items()})
+        entries.update(kwargs)
+        with self._lock:
+            self._local.update(entries)
+            self._dirty.update(entries)
+            self._deleted.difference_update(entries)
+
+    @property
+    def bytes_written(self):
+        """(Counter): The number of bytes written to the cache for each key"""
+        return self._backing.bytes_written
+
+    def flush(self):
+        """Writes the entries which have changed since the last flush to the cache
+
+        Flushes are written one at a time, so an older flush never overwrites a newer one. If the cache cannot be
+        written, the entries are kept to be written by the next flush.
+        """
+        with self._flush_lock:
+            with self._lock:
+                updates = {key: self._local[key] for key in self._dirty}
+                deleted = self._deleted
+                self._dirty = set()
+                self._deleted = set()
+                self._flushing = set(updates) | deleted
+            try:
+                if updates:
+                    self._backing.update(updates)
+                if deleted:
+                    self._backing.discard(*deleted)
+            except Exception:
+                with self._lock:
+                    for key, value in updates.items():
+                        if key not in self._dirty and key not in self._deleted:
+                            self._local.setdefault(key, value)
+                            self._dirty.add(key)
+                    self._deleted.update(key for key in deleted if key not in self._dirty)
+                raise
+            finally:
+                with self._lock:
+                    self._flushing = set()
+
+    def touch(self):
+        """Restarts the expiration of every entry in the cache"""
+        self._backing.touch()
+
+    def persist(self):
+        """Removes the expiration of every entry in the cache"""
+        self._backing.persist()
+
+    def evict(self, key):
+        """Drops an entry from memory, so that it is next read from the cache. Entries which have not been flushed are
+            kept
+
+        Args:
+            key: The key of the entry
+        """
+        key = str(key)
+        with self._lock:
+            if key not in self._dirty and key not in self._flushing:
+                self._local.pop(key, None)
+
+    def keys(self):
+        self.flush()
+        return self._backing.keys()
+
+    def values(self):
+        self.flush()
+        return self._backing.values()
+
+    def items(self):
+        self.flush()
+        return self._backing.items()
+
+    def pop(self, *args):
+        if len(args) > 2:
+            raise TypeError('Cannot use more than 2 arguments')
+        try:
+            value = self[args[0]]
+        except KeyError:
+            if len(args) == 2:
+                return args[1]
+            raise
+        del self[args[0]]
+        return value
+
+    def __contains__(self, item):
+        key = str(item)
+        with self._lock:
+            if key in self._local:
+                return True
+            if key in self._deleted:
+                return False
+        return key in self._backing
+
+    def __iter__(self):
+        return iter(self.keys())
+
+
+def flush_accumulator(accumulator):
+    """Writes the entries an accumulator keeps in memory to its cache. Accumulators which write through to their cache,
+        or have none, are left as they are
+
+    Args:
+        accumulator: The accumulator to flush
+    """
+    if isinstance(accumulator, TieredAccumulator):
+        accumulator.flush()
+
+
+def touch_accumulator(accumulator):
+    """Restarts the expiration of the entries an accumulator keeps in its cache. Accumulators with no cache are left as
+        they are
+
+    Args:
+        accumulator: The accumulator to touch
+    """
+    if isinstance(accumulator, (ExternallyCachedAccumulator, ExternallyCachedHashAccumulator, TieredAccumulator)):
+        accumulator.touch()
+
+
+def persist_accumulator(accumulator):
+    """Removes the expiration of the entries an accumulator keeps in its cache, so they are kept while the workflow is
+        paused or awaiting a trigger. Accumulators with no cache are left as they are
+
+    Args:
+        accumulator: The accumulator to persist
+    """
+    if isinstance(accumulator, (ExternallyCachedAccumulator, ExternallyCachedHashAccumulator, TieredAccumulator)):
+        accumulator.persist()
+
+
+def discard_entries(accumulator, keys):
+    """Deletes a number of entries from an accumulator if they exist, in as few round trips as the accumulator allows
+
+    Args:
+        accumulator: The accumulator
+        keys (list): The keys of the entries to delete
+    """
+    if isinstance(accumulator, dict):
+        for key in keys:
+            accumulator.pop(key, None)
+    elif keys:
+        accumulator.discard(*keys)
+
+
+def delete_accumulators(cache, workflow_execution_id, key_prefix='accumulator', keyed=True):
+    """Deletes the entries of a workflow execution from the cache, in either layout
+
+    The hash of the 'external_hash' layout is deleted by name. The keys of the 'external' layout can only be found by
+    scanning the cache, so they are only deleted if keyed is True.
+
+    Args:
+        cache (RedisCacheAdapter): The cache
+        workflow_execution_id (UUID|str): The execution ID of the workflow
+        key_prefix (str, optional): The prefix of the keys of the accumulators. Defaults to 'accumulator'
+        keyed (bool, optional): Delete the entries of the 'external' layout? Defaults to True
+    """
+    ExternallyCachedHashAccumulator(cache, workflow_execution_id, key_prefix=key_prefix).clear()
+    if keyed:
+        ExternallyCachedAccumulator(cache, workflow_execution_id, key_prefix=key_prefix).clear()
+
+
+def uses_keyed_accumulator(config):
+    """Checks if a configuration keeps the entries of accumulators in the 'external' layout, one key per entry
+
+    Args:
+        config (Config): The configuration
+
+    Returns:
+        (bool): Are entries kept one key per entry?
+    """
+    return (config.ACCUMULATOR_TYPE == 'external'
+            or (config.ACCUMULATOR_TYPE == 'tiered' and config.TIERED_ACCUMULATOR_BACKEND == 'external'))
+
+
+def get_execution_state_expiration(config):
+    """Gets the expiration of the keys an execution keeps in the cache
+
+    Args:
+        config (Config): The configuration
+
+    Returns:
+        (int): The expiration in milliseconds, or None if the keys never expire
+    """
+    return config.EXECUTION_STATE_TTL * 1000 if config.EXECUTION_STATE_TTL else None
+
+
 def make_in_memory_accumulator(config, workflow_execution_id, **kwargs):
     return InMemoryAccumulator()
 
 
-def make_external_accumulator(config, workflow_execution_id, **kwargs):
+def make_accumulator_cache(config, accumulator_type):
+    """Makes the cache an external accumulator keeps its results in
+
+    Args:
+        config (Config): The configuration
+        accumulator_type (str): The type of the accumulator
+
+    Returns:
+        (RedisCacheAdapter|TimedCache): The cache, which records the latency of each operation if the pipeline metrics
+            are being recorded
+    """
     cache = make_cache(config.CACHE)
-    return ExternallyCachedAccumulator(cache, workflow_execution_id)
+    if pipeline_metrics.enabled:
+        cache = TimedCache(cache, 'walkoff_accumulator_operation_seconds', accumulator_type)
+    return cache
+
+
+def make_external_accumulator(config, workflow_execution_id, **kwargs):
+    cache = make_accumulator_cache(config, 'external')
+    return ExternallyCachedAccumulator(cache, workflow_execution_id, serializer=make_serializer(config),
+                                       expire=get_execution_state_expiration(config))
+
+
+def make_external_hash_accumulator(config, workflow_execution_id, **kwargs):
+    cache = make_accumulator_cache(config, 'external_hash')
+    return ExternallyCachedHashAccumulator(cache, workflow_execution_id, serializer=make_serializer(config),
+                                           expire=get_execution_state_expiration(config))
+
+
+def make_tiered_accumulator(config, workflow_execution_id, **kwargs):
+    backing_type = config.TIERED_ACCUMULATOR_BACKEND
+    if backing_type not in tiered_accumulator_backends:
+        raise ValueError('Unknown tiered accumulator backend {0}. Must be one of {1}'.format(
+            backing_type, ', '.join(tiered_accumulator_backends)))
+    backing = accumulator_lookup[backing_type](config, workflow_execution_id, **kwargs)
+    return TieredAccumulator(backing)
+
 
+tiered_accumulator_backends = ('external', 'external_hash')
 
 accumulator_lookup = {
     'memory': make_in_memory_accumulator,
-    'external': make_external_accumulator
+    'external': make_external_accumulator,
+    'external_hash': make_external_hash_accumulator,
+    'tiered': make_tiered_accumulator
 }
 
 
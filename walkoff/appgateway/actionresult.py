@@ -1,6 +1,7 @@
 import json
 
 from walkoff.appgateway.apiutil import get_app_action_default_return, get_app_action_return_is_failure
+from walkoff.appgateway.resultstore import result_as_json
 from walkoff.helpers import format_exception_message
 
 
@@ -21,9 +22,10 @@ class ActionResult(object):
         Returns:
             (dict): Dict containing the result and the status
         """
+        result = result_as_json(self.result)
         try:
-            json.dumps(self.result)
-            return {"result": self.result, "status": self.status}
+            json.dumps(result)
+            return {"result": result, "status": self.status}
         except TypeError:
             return {"result": str(self.result), "status": self.status}
 
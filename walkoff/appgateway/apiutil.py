@@ -149,6 +149,23 @@ def get_condition_api(app, condition):
             raise UnknownCondition(app, condition)
 
 
+def get_api_is_pure(app, api_type, name):
+    """Determines if a condition or transform is marked as pure in the API of its app
+
+    Args:
+        app (str): The name of the App
+        api_type (str): The type of the API, 'conditions' or 'transforms'
+        name (str): The name of the condition or transform
+
+    Returns:
+        (bool): Is it marked as pure?
+    """
+    try:
+        return bool(walkoff.config.app_apis[app][api_type][name].get('pure', False))
+    except KeyError:
+        return False
+
+
 def get_transform_api(app, transform):
     """Gets the transform API
 
@@ -4,6 +4,20 @@ from walkoff.appgateway import get_app
 
 logger = logging.getLogger(__name__)
 
+app_fields_key_prefix = 'app_fields'
+
+
+def app_fields_key(workflow_execution_id):
+    """Gets the key of the hash the fields of every app instance of a workflow execution are kept in
+
+    Args:
+        workflow_execution_id (UUID|str): The execution ID of the workflow
+
+    Returns:
+        (str): The key of the hash
+    """
+    return '{0}:{1}'.format(app_fields_key_prefix, workflow_execution_id)
+
 
 class AppInstance(object):
     def __init__(self, instance=None):
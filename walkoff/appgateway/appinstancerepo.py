@@ -1,6 +1,9 @@
 import logging
 
-from walkoff.appgateway.appinstance import AppInstance
+import walkoff.config
+from walkoff.appgateway.accumulators import get_execution_state_expiration
+from walkoff.appgateway.appinstance import AppInstance, app_fields_key
+from walkoff.cache import make_cache
 from walkoff.events import WalkoffEvent
 from walkoff.helpers import format_exception_message
 
@@ -20,6 +23,7 @@ class AppInstanceRepo(object):
 
     def __init__(self, instances=None):
         self._instances = instances or {}
+        self._cache = None
 
     def setup_app_instance(self, action, workflow_ctx):
         """Sets up an AppInstance for a device in an action
@@ -76,6 +80,31 @@ class AppInstanceRepo(object):
         """
         self._instances = instances
 
+    def persist_fields(self, workflow_execution_id):
+        """Removes the expiration of the fields of the app instances of a workflow execution, so they are kept while
+            the workflow is paused or awaiting a trigger
+
+        Args:
+            workflow_execution_id (UUID|str): The execution ID of the workflow
+        """
+        if get_execution_state_expiration(walkoff.config.Config):
+            self._get_cache().persist(app_fields_key(workflow_execution_id))
+
+    def touch_fields(self, workflow_execution_id):
+        """Restarts the expiration of the fields of the app instances of a workflow execution
+
+        Args:
+            workflow_execution_id (UUID|str): The execution ID of the workflow
+        """
+        expire = get_execution_state_expiration(walkoff.config.Config)
+        if expire:
+            self._get_cache().expire(app_fields_key(workflow_execution_id), expire)
+
+    def _get_cache(self):
+        if self._cache is None:
+            self._cache = make_cache(walkoff.config.Config.CACHE)
+        return self._cache
+
     def shutdown_instances(self):
         """Calls the shutdown() method on all of the AppInstance objects"""
         for instance_name, instance in self._instances.items():
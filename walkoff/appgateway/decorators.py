@@ -56,27 +56,57 @@ def action(func):
     return wrapper
 
 
-def condition(func):
-    """Decorator used to tag a method or function as a condition
+def condition(func=None, pure=False):
+    """Decorator used to tag a method or function as a condition. Can be used as @condition or
+        @condition(pure=True)
 
     Args:
         func (func): Function to tag
+        pure (bool, optional): Does the condition always return the same result for the same arguments, without
+            modifying them? The results of pure conditions are memoized within a workflow execution. Defaults to False
 
     Returns:
         (func): Tagged function
     """
-    WalkoffTag.condition.tag(func)
-    return func
 
+    def decorator(func_):
+        WalkoffTag.condition.tag(func_)
+        if pure:
+            tag(func_, 'pure')
+        return func_
 
-def transform(func):
-    """Decorator used to tag a method or function as a transform
+    return decorator(func) if func is not None else decorator
+
+
+def transform(func=None, pure=False):
+    """Decorator used to tag a method or function as a transform. Can be used as @transform or
+        @transform(pure=True)
 
     Args:
         func (func): Function to tag
+        pure (bool, optional): Does the transform always return the same result for the same arguments, without
+            modifying them? The results of pure transforms are memoized within a workflow execution. Defaults to False
 
     Returns:
         (func): Tagged function
     """
-    WalkoffTag.transform.tag(func)
-    return func
+
+    def decorator(func_):
+        WalkoffTag.transform.tag(func_)
+        if pure:
+            tag(func_, 'pure')
+        return func_
+
+    return decorator(func) if func is not None else decorator
+
+
+def is_pure(func):
+    """Determines if a condition or transform was tagged as pure
+
+    Args:
+        func (func): The function to inspect
+
+    Returns:
+        (bool): Was the function tagged as pure?
+    """
+    return getattr(func, 'pure', False)
@@ -0,0 +1,302 @@
+import logging
+import mmap
+import os
+import shutil
+import tempfile
+
+from walkoff.appgateway.serialization import Serializer
+
+logger = logging.getLogger(__name__)
+
+result_handle_key = '__walkoff_result__'
+"""(str): The key under which the JSON form of a result handle names the result. The JSON form is only displayed, and
+    is never resolved
+"""
+
+
+class ResultHandle(object):
+    __slots__ = ['execution_id', 'key', 'size']
+
+    def __init__(self, execution_id, key, size):
+        """Initializes a ResultHandle, which takes the place of a result held in a result store
+
+        Handles are only made by the result store, so results which happen to look like a handle are never resolved.
+        Handles cannot be written by the JSON or msgpack serializers, so they are always pickled.
+
+        Args:
+            execution_id (str): The execution ID of the workflow which produced the result
+            key (str): The key of the result in the accumulator
+            size (int): The size of the result in bytes
+        """
+        self.execution_id = execution_id
+        self.key = key
+        self.size = size
+
+    @property
+    def name(self):
+        """(str): The name of the blob the result is kept in"""
+        return '{}/{}'.format(self.execution_id, self.key)
+
+    def as_json(self):
+        """Gets the JSON form of the handle, which is sent in events in place of the result
+
+        Returns:
+            (dict): The name and size of the result
+        """
+        return {result_handle_key: self.name, 'size': self.size}
+
+    def __getstate__(self):
+        return self.execution_id, self.key, self.size
+
+    def __setstate__(self, state):
+        self.execution_id, self.key, self.size = state
+
+    def __eq__(self, other):
+        return isinstance(other, ResultHandle) and self.name == other.name and self.size == other.size
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'ResultHandle({}, {} bytes)'.format(self.name, self.size)
+
+
+def is_result_handle(value):
+    """Checks if a value is a handle to a result held in a result store
+
+    Args:
+        value: The value to check
+
+    Returns:
+        (bool): Is the value a result handle?
+    """
+    return isinstance(value, ResultHandle)
+
+
+def result_as_json(value):
+    """Gets a result in a form which can be sent in events
+
+    Args:
+        value: A result handle, or a result
+
+    Returns:
+        The JSON form of the handle, or the value if it is not a handle
+    """
+    return value.as_json() if isinstance(value, ResultHandle) else value
+
+
+class FilesystemBlobStore(object):
+    def __init__(self, path):
+        """Initializes a FilesystemBlobStore, which keeps blobs as files under a directory. Blobs are read through
+            memory maps
+
+        Args:
+            path (str): The directory to keep the blobs in
+        """
+        self.path = os.path.abspath(path)
+
+    def put(self, name, data):
+        """Writes a blob. The blob is written to a temporary file first, so it is never read partially written
+
+        Args:
+            name (str): The name of the blob, which may contain '/'-separated directories
+            data (bytes): The contents of the blob
+        """
+        path = self._get_path(name)
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+        descriptor, temp_path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(descriptor, 'wb') as blob_file:
+            blob_file.write(data)
+        os.rename(temp_path, path)
+
+    def read(self, name, reader):
+        """Reads a blob
+
+        Args:
+            name (str): The name of the blob
+            reader (func(memoryview)): Reads the contents of the blob. The memoryview is only valid during the call
+
+        Returns:
+            The value returned by the reader
+        """
+        with open(self._get_path(name), 'rb') as blob_file:
+            blob = mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                view = memoryview(blob)
+                try:
+                    return reader(view)
+                finally:
+                    view.release()
+            finally:
+                blob.close()
+
+    def delete(self, prefix):
+        """Deletes a blob, or every blob under a directory. Blobs which do not exist are ignored
+
+        Args:
+            prefix (str): The name of the blob, or the directory of the blobs to delete
+        """
+        path = self._get_path(prefix)
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _get_path(self, name):
+        """Gets the path of a blob, which must be under the directory named by the first part of its name
+
+        Raises:
+            ValueError: If the name is not a valid blob name, or the blob would be outside of its directory
+        """
+        parts = name.split('/')
+        if any(part in ('', '.', '..') or os.sep in part or (os.altsep and os.altsep in part) for part in parts):
+            raise ValueError('Invalid blob name {}'.format(name))
+        root = os.path.realpath(self.path)
+        directory = os.path.realpath(os.path.join(self.path, parts[0])) if len(parts) > 1 else root
+        path = os.path.join(self.path, *parts)
+        real_path = os.path.realpath(path)
+        if not (_is_within(directory, root) and _is_within(real_path, directory)):
+            raise ValueError('Blob {} is outside of the blob store'.format(name))
+        return path
+
+
+def _is_within(path, directory):
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+class ResultStore(object):
+    def __init__(self, blob_store, threshold=None, serializer=None):
+        """Initializes a ResultStore, which keeps large action results out of the accumulator and events
+
+        Results are written to the blob store once, and a ResultHandle is passed around in their place. Handles are
+        resolved back into results by `resolve`. Blobs are only read if they were written by the serializer.
+
+        Args:
+            blob_store (FilesystemBlobStore): The store to write results to
+            threshold (int, optional): Results larger than this many bytes are written to the blob store. Defaults to
+                None, which keeps every result in the accumulator
+            serializer (Serializer, optional): The serializer to write results with. Defaults to pickle without
+                compression
+        """
+        self.blob_store = blob_store
+        self.threshold = threshold
+        self.serializer = serializer if serializer is not None else Serializer()
+
+    def offload(self, execution_id, key, value):
+        """Writes a result to the blob store if it is larger than the threshold
+
+        Args:
+            execution_id (UUID|str): The execution ID of the workflow which produced the result
+            key (UUID|str): The key of the result in the accumulator
+            value: The result
+
+        Returns:
+            A handle to the result if it was written to the blob store, otherwise the result
+        """
+        if self.threshold is None or value is None or isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, (str, bytes)) and len(value) <= self.threshold:
+            return value
+        data = self.serializer.dumps(value)
+        if len(data) <= self.threshold:
+            return value
+        handle = ResultHandle(str(execution_id), str(key), len(data))
+        self.blob_store.put(handle.name, data)
+        logger.debug('Wrote result {} ({} bytes) to the result store'.format(handle.name, len(data)))
+        return handle
+
+    def resolve(self, value):
+        """Reads the result a handle refers to
+
+        Args:
+            value: A result handle, or a result
+
+        Returns:
+            The result the handle refers to, or the value if it is not a handle
+        """
+        if not is_result_handle(value):
+            return value
+        return self.blob_store.read(value.name, self._load)
+
+    def _load(self, data):
+        return self.serializer.loads(data, allow_unframed=False)
+
+    def delete(self, execution_id, keys):
+        """Deletes results written by a workflow execution
+
+        Args:
+            execution_id (UUID|str): The execution ID of the workflow which produced the results
+            keys (list[UUID|str]): The keys of the results in the accumulator
+        """
+        if self.threshold is None:
+            return
+        for key in keys:
+            self.blob_store.delete('{}/{}'.format(execution_id, key))
+
+    def delete_execution(self, execution_id):
+        """Deletes every result written by a workflow execution
+
+        Args:
+            execution_id (UUID|str): The execution ID of the workflow
+        """
+        self.blob_store.delete(str(execution_id))
+
+
+def make_filesystem_blob_store(config):
+    return FilesystemBlobStore(config.RESULT_STORE_PATH)
+
+
+blob_store_lookup = {
+    'filesystem': make_filesystem_blob_store
+}
+
+_result_stores = {}
+
+
+def make_result_store(config=None, blob_store_map=blob_store_lookup):
+    """Gets the result store described by a configuration. Result stores are shared by every caller with the same
+        configuration
+
+    Args:
+        config (Config, optional): The configuration. Defaults to walkoff.config.Config
+        blob_store_map (dict{str: func}): A mapping from the type of blob store to a function which makes it
+
+    Returns:
+        (ResultStore): The result store
+    """
+    if not config:
+        from walkoff.config import Config
+        config = Config
+    store_type = config.RESULT_STORE_TYPE
+    threshold = config.RESULT_STORE_THRESHOLD or None
+    store_key = (store_type, config.RESULT_STORE_PATH, threshold)
+    if store_key not in _result_stores:
+        try:
+            blob_store = blob_store_map[store_type](config)
+        except KeyError:
+            raise ValueError('Unknown result store type {}'.format(store_type))
+        _result_stores[store_key] = ResultStore(blob_store, threshold=threshold)
+    return _result_stores[store_key]
+
+
+def resolve_result(value):
+    """Reads the result a handle refers to from the configured result store
+
+    Args:
+        value: A result handle, or a result
+
+    Returns:
+        The result the handle refers to, or the value if it is not a handle
+    """
+    if not is_result_handle(value):
+        return value
+    return make_result_store().resolve(value)
@@ -0,0 +1,134 @@
+import json
+import pickle
+import zlib
+
+import msgpack
+
+_header_marker = b'\x00'
+_compressed = b'z'
+_uncompressed = b'-'
+
+
+class PickleFormat(object):
+    """Serializes values with the highest pickle protocol available. Every picklable value is supported"""
+    code = b'p'
+
+    @staticmethod
+    def dumps(value):
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def loads(data):
+        return pickle.loads(data)
+
+
+class MsgpackFormat(object):
+    """Serializes values with msgpack. Only JSON-like values are supported, and tuples are loaded as lists"""
+    code = b'm'
+
+    @staticmethod
+    def dumps(value):
+        return msgpack.packb(value, use_bin_type=True)
+
+    @staticmethod
+    def loads(data):
+        return msgpack.unpackb(data, raw=False)
+
+
+class JsonFormat(object):
+    """Serializes values as JSON. Only JSON values are supported, and tuples are loaded as lists"""
+    code = b'j'
+
+    @staticmethod
+    def dumps(value):
+        return json.dumps(value).encode('utf-8')
+
+    @staticmethod
+    def loads(data):
+        return json.loads(bytes(data).decode('utf-8'))
+
+
+serialization_formats = {
+    'pickle': PickleFormat,
+    'msgpack': MsgpackFormat,
+    'json': JsonFormat
+}
+
+_formats_by_code = {value_format.code: value_format for value_format in serialization_formats.values()}
+
+
+class Serializer(object):
+    def __init__(self, value_format=PickleFormat, compression_threshold=None, compression_level=6):
+        """Initializes a Serializer, which converts the values of an accumulator to and from the bytes stored in a cache
+
+        Serialized values start with a header naming the format and compression they were written with, so values
+        written with one configuration can be read with any other. Values the format cannot represent are pickled.
+        Values without a header are read as plain pickles.
+
+        Args:
+            value_format (PickleFormat|MsgpackFormat|JsonFormat, optional): The format to serialize values with.
+                Defaults to PickleFormat
+            compression_threshold (int, optional): Values which serialize to more than this many bytes are compressed
+                with zlib. Defaults to None, which never compresses values
+            compression_level (int, optional): The zlib compression level. Defaults to 6
+        """
+        self.value_format = value_format
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+
+    def dumps(self, value):
+        """Serializes a value
+
+        Args:
+            value: The value to serialize
+
+        Returns:
+            (bytes): The serialized value
+        """
+        value_format = self.value_format
+        try:
+            data = value_format.dumps(value)
+        except (TypeError, ValueError):
+            value_format = PickleFormat
+            data = value_format.dumps(value)
+        if self.compression_threshold is not None and len(data) > self.compression_threshold:
+            return _header_marker + value_format.code + _compressed + zlib.compress(data, self.compression_level)
+        return _header_marker + value_format.code + _uncompressed + data
+
+    @staticmethod
+    def loads(data, allow_unframed=True):
+        """Deserializes a value
+
+        Args:
+            data (bytes|memoryview): The serialized value
+            allow_unframed (bool, optional): Unpickle values without a header, which were written before values were
+                written with one? Defaults to True
+
+        Returns:
+            The value
+
+        Raises:
+            ValueError: If the value has no header and unframed values are not allowed
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            # The cache decodes responses which happen to be valid UTF-8
+            data = data.encode('utf-8')
+        header = bytes(data[:3])
+        if header[:1] != _header_marker:
+            if not allow_unframed:
+                raise ValueError('Value was not written by a Serializer')
+            return pickle.loads(data)
+        value_format = _formats_by_code[header[1:2]]
+        payload = data[3:]
+        if header[2:3] == _compressed:
+            payload = zlib.decompress(payload)
+        return value_format.loads(payload)
+
+
+def make_serializer(config, format_map=serialization_formats):
+    format_name = config.ACCUMULATOR_SERIALIZER
+    try:
+        value_format = format_map[format_name]
+    except KeyError:
+        raise ValueError('Unknown accumulator serializer {}'.format(format_name))
+    return Serializer(value_format, compression_threshold=config.ACCUMULATOR_COMPRESSION_THRESHOLD or None)
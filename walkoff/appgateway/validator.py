@@ -27,6 +27,11 @@ TYPE_MAP = {
 
 reserved_return_codes = ['UnhandledException', 'InvalidInput']
 
+annotation_keywords = {'name', 'description', 'title', 'type', 'required', 'default', 'example', 'placeholder'}
+"""(set(str)): Keywords of a parameter API which do not constrain its values. A primitive parameter with only these
+    keywords accepts every value which converts to its type, so it is not validated against its schema
+"""
+
 
 def make_type(value, type_literal):
     type_func = TYPE_MAP.get(type_literal)
@@ -328,95 +333,245 @@ def validate_primitive_parameter(value, param, parameter_type, message_prefix, h
         return converted_value
 
 
-def validate_parameter(value, param, message_prefix):
-    param = deepcopy(param)
-    primitive_type = 'primitive' if 'type' in param else 'object'
-    converted_value = None
-    if value is not None:
-        if primitive_type == 'primitive':
-            primitive_type = param['type']
-            if primitive_type in TYPE_MAP:
-                converted_value = validate_primitive_parameter(value, param, primitive_type, message_prefix)
-            elif primitive_type == 'array':
-                try:
-                    converted_value = convert_array(param, value, message_prefix)
-                    if 'items' in param and param['items']['type'] in ('user', 'role'):
-                        handle_user_roles_validation(param['items'])
-
-                    Draft4Validator(
-                        param, format_checker=draft4_format_checker).validate(converted_value)
-                except ValidationError as exception:
-                    message = '{0} has invalid input. Input {1} does not conform to ' \
-                              'validators: {2}'.format(message_prefix, value, format_exception_message(exception))
-                    logger.error(message)
-                    raise InvalidArgument(message)
-            else:
-                raise InvalidArgument('In {0}: Unknown parameter type {1}'.format(message_prefix, primitive_type))
-        else:
-            try:
-                converted_value = convert_json(param, value, message_prefix)
-                Draft4Validator(
-                    param['schema'], format_checker=draft4_format_checker).validate(converted_value)
-            except ValidationError as exception:
-                message = '{0} has invalid input. Input {1} does not conform to ' \
-                          'validators: {2}'.format(message_prefix, value, format_exception_message(exception))
+class ParameterValidator(object):
+    def __init__(self, param):
+        """Initializes a ParameterValidator, which converts and validates the values of a parameter of an app action,
+            condition, or transform. The jsonschema validator of the parameter is built once
+
+        Args:
+            param (dict): The API of the parameter
+        """
+        self.param = deepcopy(param)
+        self.name = self.param.get('name')
+        self.required = self.param.get('required')
+        self.has_default = 'default' in self.param
+        self.type = self.param.get('type')
+        self._validator = None
+        if self.type in TYPE_MAP:
+            schema = deepcopy(self.param)
+            if schema['type'] in ('user', 'role'):
+                handle_user_roles_validation(schema)
+            schema.pop('required', None)
+            if not set(schema) <= annotation_keywords:
+                self._validator = Draft4Validator(schema, format_checker=draft4_format_checker)
+        elif self.type == 'array':
+            schema = deepcopy(self.param)
+            if 'items' in schema and schema['items'].get('type') in ('user', 'role'):
+                handle_user_roles_validation(schema['items'])
+            self._validator = Draft4Validator(schema, format_checker=draft4_format_checker)
+        elif self.type is None and 'schema' in self.param:
+            self._validator = Draft4Validator(self.param['schema'], format_checker=draft4_format_checker)
+
+    def validate(self, value, message_prefix):
+        """Converts a value to the type of the parameter and validates it
+
+        Args:
+            value: The value
+            message_prefix (str): The prefix of the messages of any errors
+
+        Returns:
+            The converted value, or None if the value is None
+
+        Raises:
+            InvalidArgument: If the value is invalid, or is None and the parameter is required
+        """
+        if value is None:
+            if self.required:
+                message = "In {0}: Missing {1} parameter '{2}'".format(
+                    message_prefix, 'primitive' if self.type is not None else 'object', self.name)
                 logger.error(message)
                 raise InvalidArgument(message)
-    elif param.get('required'):
-        message = "In {0}: Missing {1} parameter '{2}'".format(message_prefix, primitive_type, param['name'])
+            return None
+        if self.type in TYPE_MAP:
+            return self._validate_primitive(value, message_prefix)
+        elif self.type == 'array':
+            try:
+                converted_value = convert_array(self.param, value, message_prefix)
+                self._validator.validate(converted_value)
+            except ValidationError as exception:
+                self._raise_invalid(value, message_prefix, exception)
+            return converted_value
+        elif self.type is None:
+            try:
+                converted_value = convert_json(self.param, value, message_prefix)
+                self._validator.validate(converted_value)
+            except ValidationError as exception:
+                self._raise_invalid(value, message_prefix, exception)
+            return converted_value
+        else:
+            raise InvalidArgument('In {0}: Unknown parameter type {1}'.format(message_prefix, self.type))
+
+    def _validate_primitive(self, value, message_prefix):
+        try:
+            converted_value = convert_primitive_type(value, self.type)
+        except (ValueError, TypeError):
+            message = '{0} has invalid input. ' \
+                      'Input {1} could not be converted to type {2}'.format(message_prefix, value, self.type)
+            logger.error(message)
+            raise InvalidArgument(message)
+        if self._validator is None:
+            return converted_value
+        try:
+            self._validator.validate(converted_value)
+        except ValidationError as exception:
+            message = '{0} has invalid input. ' \
+                      'Input {1} with type {2} does not conform to ' \
+                      'validators: {3}'.format(message_prefix, value, self.type, format_exception_message(exception))
+            logger.error(message)
+            raise InvalidArgument(message)
+        return converted_value
+
+    @staticmethod
+    def _raise_invalid(value, message_prefix, exception):
+        message = '{0} has invalid input. Input {1} does not conform to ' \
+                  'validators: {2}'.format(message_prefix, value, format_exception_message(exception))
         logger.error(message)
         raise InvalidArgument(message)
 
-    return converted_value
-
 
-def validate_parameters(api, arguments, message_prefix, accumulator=None):
-    api_dict = {}
-    for param in api:
-        api_dict[param['name']] = param
-    converted = {}
-    seen_params = set()
-    arg_names = [argument.name for argument in arguments] if arguments else []
-    arguments_set = set(arg_names)
-    errors = []
-    for param_name, param_api in api_dict.items():
-        try:
-            argument = get_argument_by_name(arguments, param_name)
-            if argument:
+class ApiValidator(object):
+    def __init__(self, api):
+        """Initializes an ApiValidator, which validates the arguments of an app action, condition, or transform
+            against its parameters. Each parameter is compiled into a ParameterValidator once
+
+        Args:
+            api (list[dict]): The APIs of the parameters
+        """
+        self.api = api
+        self.parameters = {}
+        for param in api:
+            self.parameters[param['name']] = ParameterValidator(param)
+
+    def validate(self, arguments, message_prefix, accumulator=None):
+        """Validates a set of arguments
+
+        Args:
+            arguments (list[Argument]): The arguments
+            message_prefix (str): The prefix of the messages of any errors
+            accumulator (dict, optional): The accumulated results of previous Actions, used to resolve references.
+                Defaults to None, in which case references are not validated
+
+        Returns:
+            (dict): The converted value of each parameter, by name
+
+        Raises:
+            InvalidArgument: If any of the arguments are invalid
+        """
+        arguments_by_name = {}
+        for argument in arguments or []:
+            arguments_by_name.setdefault(argument.name, argument)
+        arguments_set = set(arguments_by_name)
+        converted = {}
+        seen_params = set()
+        errors = []
+        for param_name, parameter in self.parameters.items():
+            try:
+                argument = arguments_by_name.get(param_name)
+                if argument:
+                    arg_val = argument.get_value(accumulator)
+                    if accumulator or not argument.is_ref:
+                        converted[param_name] = parameter.validate(arg_val, message_prefix)
+                elif parameter.has_default:
+                    converted[param_name] = self._get_default(parameter, message_prefix)
+                    arguments_set.add(param_name)
+                elif 'required' in parameter.param:
+                    message = 'For {0}: Parameter {1} is not specified and has no default'.format(message_prefix,
+                                                                                                  param_name)
+                    logger.error(message)
+                    raise InvalidArgument(message)
+                else:
+                    converted[param_name] = None
+                    arguments_set.add(param_name)
+                seen_params.add(param_name)
+            except InvalidArgument as e:
+                errors.append(e.message)
+        if seen_params != arguments_set:
+            message = 'For {0}: Too many arguments. Extra arguments: {1}'.format(message_prefix,
+                                                                                 arguments_set - seen_params)
+            logger.error(message)
+            errors.append(message)
+        if errors:
+            raise InvalidArgument('Invalid arguments', errors=errors)
+        return converted
+
+    def validate_references(self, arguments, message_prefix, literals, accumulator=None):
+        """Validates the referenced arguments of a set of arguments whose other arguments have already been validated
+
+        Args:
+            arguments (list[Argument]): The arguments
+            message_prefix (str): The prefix of the messages of any errors
+            literals (dict): The converted value of each parameter which is not given by a referenced argument, as
+                returned by validate() without an accumulator. It is copied, not modified
+            accumulator (dict, optional): The accumulated results of previous Actions, used to resolve references.
+                Defaults to None, in which case references are not validated
+
+        Returns:
+            (dict): The converted value of each parameter, by name
+
+        Raises:
+            InvalidArgument: If any of the referenced arguments are invalid
+        """
+        converted = deepcopy(literals)
+        referenced = {}
+        for argument in arguments or []:
+            referenced.setdefault(argument.name, argument)
+        errors = []
+        for param_name, argument in referenced.items():
+            if not argument.is_ref or param_name not in self.parameters:
+                continue
+            try:
                 arg_val = argument.get_value(accumulator)
-                if accumulator or not argument.is_ref:
-                    converted[param_name] = validate_parameter(arg_val, param_api, message_prefix)
-            elif 'default' in param_api:
-                try:
-                    default_param = validate_parameter(param_api['default'], param_api, message_prefix)
-                except InvalidArgument as e:
-                    default_param = param_api['default']
-                    logger.warning(
-                        'For {0}: Default input {1} (value {2}) does not conform to schema. (Error: {3})'
-                        'Using anyways'.format(message_prefix, param_name, param_api['default'],
-                                               format_exception_message(e)))
-
-                converted[param_name] = default_param
-                arguments_set.add(param_name)
-            elif 'required' in param_api:
-                message = 'For {0}: Parameter {1} is not specified and has no default'.format(message_prefix,
-                                                                                              param_name)
-                logger.error(message)
-                raise InvalidArgument(message)
-            else:
-                converted[param_name] = None
-                arguments_set.add(param_name)
-            seen_params.add(param_name)
+                if accumulator:
+                    converted[param_name] = self.parameters[param_name].validate(arg_val, message_prefix)
+            except InvalidArgument as e:
+                errors.append(e.message)
+        if errors:
+            raise InvalidArgument('Invalid arguments', errors=errors)
+        return converted
+
+    @staticmethod
+    def _get_default(parameter, message_prefix):
+        default = parameter.param['default']
+        try:
+            return parameter.validate(default, message_prefix)
         except InvalidArgument as e:
-            errors.append(e.message)
-    if seen_params != arguments_set:
-        message = 'For {0}: Too many arguments. Extra arguments: {1}'.format(message_prefix,
-                                                                             arguments_set - seen_params)
-        logger.error(message)
-        errors.append(message)
-    if errors:
-        raise InvalidArgument('Invalid arguments', errors=errors)
-    return converted
+            logger.warning(
+                'For {0}: Default input {1} (value {2}) does not conform to schema. (Error: {3})'
+                'Using anyways'.format(message_prefix, parameter.name, default, format_exception_message(e)))
+            return deepcopy(default)
+
+
+_api_validators = {}
+
+
+def get_api_validator(key, api):
+    """Gets the compiled validator of an API, compiling it if it has not been compiled or the API has been reloaded
+
+    Args:
+        key (tuple): Identifies the app action, condition, or transform the API belongs to
+        api (list[dict]): The APIs of its parameters
+
+    Returns:
+        (ApiValidator): The validator
+    """
+    validator = _api_validators.get(key)
+    if validator is None or validator.api is not api:
+        validator = ApiValidator(api)
+        _api_validators[key] = validator
+    return validator
+
+
+def clear_api_validators():
+    """Drops every compiled validator. Called when the app APIs are reloaded"""
+    _api_validators.clear()
+
+
+def validate_parameter(value, param, message_prefix):
+    return ParameterValidator(param).validate(value, message_prefix)
+
+
+def validate_parameters(api, arguments, message_prefix, accumulator=None):
+    return ApiValidator(api).validate(arguments, message_prefix, accumulator)
 
 
 def get_argument_by_name(arguments, name):
@@ -426,17 +581,26 @@ def get_argument_by_name(arguments, name):
     return None
 
 
-def validate_app_action_parameters(api, arguments, app, action, accumulator=None):
+def validate_app_action_parameters(api, arguments, app, action, accumulator=None, literals=None):
     message_prefix = 'app {0} action {1}'.format(app, action)
-    return validate_parameters(api, arguments, message_prefix, accumulator)
+    validator = get_api_validator(('action', app, action), api)
+    if literals is None:
+        return validator.validate(arguments, message_prefix, accumulator)
+    return validator.validate_references(arguments, message_prefix, literals, accumulator)
 
 
-def validate_condition_parameters(api, arguments, condition, accumulator=None):
-    return validate_parameters(api, arguments, 'condition {0}'.format(condition), accumulator)
+def validate_condition_parameters(api, arguments, condition, accumulator=None, app=None):
+    message_prefix = 'condition {0}'.format(condition)
+    if app is None:
+        return validate_parameters(api, arguments, message_prefix, accumulator)
+    return get_api_validator(('condition', app, condition), api).validate(arguments, message_prefix, accumulator)
 
 
-def validate_transform_parameters(api, arguments, transform, accumulator=None):
-    return validate_parameters(api, arguments, 'transform {0}'.format(transform), accumulator)
+def validate_transform_parameters(api, arguments, transform, accumulator=None, app=None):
+    message_prefix = 'transform {0}'.format(transform)
+    if app is None:
+        return validate_parameters(api, arguments, message_prefix, accumulator)
+    return get_api_validator(('transform', app, transform), api).validate(arguments, message_prefix, accumulator)
 
 
 def validate_device_field(field_api, value, message_prefix):
@@ -85,6 +85,24 @@ class RedisCacheAdapter(object):
         """
         return self._decode_response(self.cache.get(key))
 
+    def set_multiple(self, mapping, expire=None):
+        """Sets the values of a number of keys in a single round trip
+
+        Args:
+            mapping (dict): A mapping of the keys to set to their values
+            expire (int, optional): The expiration for the values in milliseconds. Defaults to None, which never
+                expires them
+        """
+        if not mapping:
+            return
+        if expire is None:
+            self.cache.mset(mapping)
+            return
+        with self.cache.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, px=expire)
+            pipe.execute()
+
     def add(self, key, value, expire=None, **opts):
         """Add a key and a value to the cache if the key is not already in the cache
 
@@ -105,6 +123,69 @@ class RedisCacheAdapter(object):
         """
         return self.cache.delete(key)
 
+    def unlink(self, *keys):
+        """Deletes a number of keys in a single round trip. Their memory is reclaimed in the background by the cache
+
+        Args:
+            *keys: The keys to delete
+
+        Returns:
+            (int): The number of keys which were deleted
+        """
+        if not keys:
+            return 0
+        return self.cache.unlink(*keys)
+
+    def expire(self, key, expire):
+        """Sets the expiration of a key
+
+        Args:
+            key: The key
+            expire (int): The expiration in milliseconds
+
+        Returns:
+            (bool): Was the expiration set? False if the key does not exist
+        """
+        return bool(self.cache.pexpire(key, expire))
+
+    def expire_multiple(self, keys, expire):
+        """Sets the expiration of a number of keys in a single round trip
+
+        Args:
+            keys (list): The keys
+            expire (int): The expiration in milliseconds
+        """
+        if not keys:
+            return
+        with self.cache.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.pexpire(key, expire)
+            pipe.execute()
+
+    def persist(self, key):
+        """Removes the expiration of a key, so that it is kept until it is deleted
+
+        Args:
+            key: The key
+
+        Returns:
+            (bool): Was the expiration removed? False if the key does not exist or has no expiration
+        """
+        return bool(self.cache.persist(key))
+
+    def persist_multiple(self, keys):
+        """Removes the expiration of a number of keys in a single round trip
+
+        Args:
+            keys (list): The keys
+        """
+        if not keys:
+            return
+        with self.cache.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.persist(key)
+            pipe.execute()
+
     def incr(self, key, amount=1):
         """Increments a key by an amount.
 
@@ -121,6 +202,22 @@ class RedisCacheAdapter(object):
         """
         return int(self.cache.incr(key, amount))
 
+    def incr_multiple(self, mapping, values=None):
+        """Increments a number of keys by amounts, and sets a number of others, in a single round trip
+
+        Args:
+            mapping (dict): The amount to increment each key by
+            values (dict, optional): The value to set each key to. Defaults to None
+        """
+        if not mapping and not values:
+            return
+        with self.cache.pipeline(transaction=False) as pipe:
+            for key, amount in mapping.items():
+                pipe.incr(key, amount)
+            for key, value in (values or {}).items():
+                pipe.set(key, value)
+            pipe.execute()
+
     def decr(self, key, amount=1):
         """Decrements a key by an amount.
 
@@ -163,6 +260,111 @@ class RedisCacheAdapter(object):
         """
         return self._decode_response(self.cache.rpop(key))
 
+    def rpop_multiple(self, key, count):
+        """Pops up to a number of values from the right of a deque in a single round trip.
+
+        The values are read and removed atomically, so no other client can pop the same values.
+
+        Args:
+            key: The key of the deque to pop the values from
+            count (int): The maximum number of values to pop
+
+        Returns:
+            (list): The popped values, with the rightmost value first. Empty if the deque is empty or does not exist
+        """
+        if count < 1:
+            return []
+        with self.cache.pipeline() as pipe:
+            pipe.lrange(key, -count, -1)
+            pipe.ltrim(key, 0, -count - 1)
+            values, _ = pipe.execute()
+        return [self._decode_response(value) for value in reversed(values)]
+
+    def rpoplpush(self, source, destination):
+        """Atomically pops a value from the right of one deque and pushes it to the left of another
+
+        Args:
+            source: The key of the deque to pop the value from
+            destination: The key of the deque to push the value to
+
+        Returns:
+            The value which was moved, or None if the source deque is empty
+        """
+        return self._decode_response(self.cache.rpoplpush(source, destination))
+
+    def brpoplpush(self, source, destination, timeout=0):
+        """Atomically pops a value from the right of one deque and pushes it to the left of another, blocking until a
+            value is available
+
+        Args:
+            source: The key of the deque to pop the value from
+            destination: The key of the deque to push the value to
+            timeout (int, optional): The maximum number of seconds to block for. A timeout of 0 blocks indefinitely.
+                Defaults to 0
+
+        Returns:
+            The value which was moved, or None if the timeout expired before any value was available
+        """
+        return self._decode_response(self.cache.brpoplpush(source, destination, timeout=timeout))
+
+    def rpoplpush_multiple(self, source, destination, count):
+        """Moves up to a number of values from the right of one deque to the left of another in a single round trip.
+
+        Each value is moved atomically.
+
+        Args:
+            source: The key of the deque to pop the values from
+            destination: The key of the deque to push the values to
+            count (int): The maximum number of values to move
+
+        Returns:
+            (list): The moved values, in the order they were popped
+        """
+        if count < 1:
+            return []
+        with self.cache.pipeline(transaction=False) as pipe:
+            for _ in range(count):
+                pipe.rpoplpush(source, destination)
+            values = pipe.execute()
+        return [self._decode_response(value) for value in values if value is not None]
+
+    def lrem(self, key, value, count=0):
+        """Removes occurrences of a value from a deque
+
+        Args:
+            key: The key of the deque
+            value: The value to remove
+            count (int, optional): The number of occurrences to remove. Positive values remove from the left, negative
+                values from the right, and 0 removes all occurrences. Defaults to 0
+
+        Returns:
+            (int): The number of values removed
+        """
+        return self.cache.lrem(key, count, value)
+
+    def lindex(self, key, index):
+        """Gets the value at an index of a deque without removing it
+
+        Args:
+            key: The key of the deque
+            index (int): The index of the value. Negative indices count from the right
+
+        Returns:
+            The value at the index, or None if the index is out of range
+        """
+        return self._decode_response(self.cache.lindex(key, index))
+
+    def llen(self, key):
+        """Gets the length of a deque
+
+        Args:
+            key: The key of the deque
+
+        Returns:
+            (int): The length of the deque, or 0 if the key does not exist
+        """
+        return self.cache.llen(key)
+
     def lpush(self, key, *values):
         """Pushes a value to the left of a deque.
 
@@ -189,6 +391,174 @@ class RedisCacheAdapter(object):
         """
         return self._decode_response(self.cache.lpop(key))
 
+    def brpop(self, keys, timeout=0):
+        """Pops a value from the right of the first non-empty deque, blocking until a value is available.
+
+        Args:
+            keys (str|list[str]): The key or keys of the deques to pop from. Keys are checked in the order given
+            timeout (int, optional): The maximum number of seconds to block for. A timeout of 0 blocks indefinitely.
+                Defaults to 0
+
+        Returns:
+            (tuple): A tuple of the key the value was popped from and the rightmost value of that deque, or None if
+                the timeout expired before any value was available
+        """
+        return self._decode_blocking_pop_response(self.cache.brpop(keys, timeout=timeout))
+
+    def blpop(self, keys, timeout=0):
+        """Pops a value from the left of the first non-empty deque, blocking until a value is available.
+
+        Args:
+            keys (str|list[str]): The key or keys of the deques to pop from. Keys are checked in the order given
+            timeout (int, optional): The maximum number of seconds to block for. A timeout of 0 blocks indefinitely.
+                Defaults to 0
+
+        Returns:
+            (tuple): A tuple of the key the value was popped from and the leftmost value of that deque, or None if
+                the timeout expired before any value was available
+        """
+        return self._decode_blocking_pop_response(self.cache.blpop(keys, timeout=timeout))
+
+    def hget(self, key, field):
+        """Gets the value of a field of a hash
+
+        Args:
+            key: The key of the hash
+            field: The field to get
+
+        Returns:
+            The value of the field, as it was stored, or None if the field or hash does not exist
+        """
+        return self.cache.hget(key, field)
+
+    def hset(self, key, field, value):
+        """Sets the value of a field of a hash
+
+        This operation also creates a hash for a given key if one was not already created
+
+        Args:
+            key: The key of the hash
+            field: The field to set
+            value: The value to set the field to
+
+        Returns:
+            (int): 1 if the field is new, 0 if its value was replaced
+        """
+        return self.cache.hset(key, field, value)
+
+    def hset_multiple(self, key, mapping, expire=None):
+        """Sets the values of a number of fields of a hash in a single round trip
+
+        Args:
+            key: The key of the hash
+            mapping (dict): A mapping of the fields to set to their values
+            expire (int, optional): The expiration for the whole hash in milliseconds. Defaults to None, which leaves
+                the expiration of the hash as it is
+        """
+        if not mapping:
+            return
+        with self.cache.pipeline(transaction=False) as pipe:
+            for field, value in mapping.items():
+                pipe.hset(key, field, value)
+            if expire is not None:
+                pipe.pexpire(key, expire)
+            pipe.execute()
+
+    def hincrbyfloat_multiple(self, key, mapping, expire=None):
+        """Increments a number of fields of a hash in a single round trip
+
+        Fields which do not exist are set to the amount they are incremented by
+
+        Args:
+            key: The key of the hash
+            mapping (dict): A mapping of the fields to increment to the amounts to increment them by
+            expire (int, optional): The expiration for the whole hash in milliseconds. Defaults to None, which leaves
+                the expiration of the hash as it is
+        """
+        if not mapping:
+            return
+        with self.cache.pipeline(transaction=False) as pipe:
+            for field, amount in mapping.items():
+                pipe.hincrbyfloat(key, field, amount)
+            if expire is not None:
+                pipe.pexpire(key, expire)
+            pipe.execute()
+
+    def hdel(self, key, *fields):
+        """Deletes fields of a hash
+
+        Args:
+            key: The key of the hash
+            *fields: The fields to delete
+
+        Returns:
+            (int): The number of fields which were deleted
+        """
+        return self.cache.hdel(key, *fields)
+
+    def hexists(self, key, field):
+        """Checks to see if a field of a hash exists
+
+        Args:
+            key: The key of the hash
+            field: The field to check
+
+        Returns:
+            (bool): Does the field exist?
+        """
+        return bool(self.cache.hexists(key, field))
+
+    def hlen(self, key):
+        """Gets the number of fields in a hash
+
+        Args:
+            key: The key of the hash
+
+        Returns:
+            (int): The number of fields in the hash, or 0 if the hash does not exist
+        """
+        return self.cache.hlen(key)
+
+    def hkeys(self, key):
+        """Gets the fields of a hash
+
+        Args:
+            key: The key of the hash
+
+        Returns:
+            (list[str]): The fields of the hash
+        """
+        return [self._decode_response(field) for field in self.cache.hkeys(key)]
+
+    def hvals(self, key):
+        """Gets the values of the fields of a hash
+
+        Args:
+            key: The key of the hash
+
+        Returns:
+            (list): The values of the fields, as they were stored
+        """
+        return self.cache.hvals(key)
+
+    def hgetall(self, key):
+        """Gets every field of a hash and its value
+
+        Args:
+            key: The key of the hash
+
+        Returns:
+            (dict): A mapping of the fields of the hash to their values, as they were stored
+        """
+        return {self._decode_response(field): value for field, value in self.cache.hgetall(key).items()}
+
+    @classmethod
+    def _decode_blocking_pop_response(cls, response):
+        if response is None:
+            return response
+        key, value = response
+        return cls._decode_response(key), cls._decode_response(value)
+
     @staticmethod
     def _decode_response(response):
         if response is None:
@@ -16,6 +16,10 @@ from walkoff.helpers import format_db_path
 logger = logging.getLogger(__name__)
 
 app_apis = {}
+app_apis_version = 0
+"""(int): The number of times the app APIs have been loaded. Anything validated against an app API, such as cached
+    execution plans, is out of date once it changes
+"""
 
 
 def load_app_apis(apps_path=None):
@@ -26,7 +30,7 @@ def load_app_apis(apps_path=None):
             apps_path variable in Config object
     """
     from walkoff.helpers import list_apps, format_exception_message
-    global app_apis
+    global app_apis, app_apis_version
     if apps_path is None:
         apps_path = Config.APPS_PATH
     try:
@@ -36,6 +40,9 @@ def load_app_apis(apps_path=None):
         logger.fatal('Could not load JSON schema for apps. Shutting down...: ' + str(e))
         sys.exit(1)
     else:
+        from walkoff.appgateway.validator import clear_api_validators
+        clear_api_validators()
+        app_apis_version += 1
         for app in list_apps(apps_path):
             try:
                 url = join(apps_path, app, 'api.yaml')
@@ -94,6 +101,51 @@ class Config(object):
     NUMBER_PROCESSES = 4
     NUMBER_THREADS_PER_PROCESS = 3
 
+    # The worker pool run by start_workers.py. In 'fixed' mode NUMBER_PROCESSES workers are started. In 'elastic' mode
+    # between MIN_WORKER_PROCESSES and MAX_WORKER_PROCESSES workers are run, and the pool is resized every
+    # WORKER_SCALE_INTERVAL seconds. Workers are added while requests are queued and at least
+    # WORKER_SCALE_UP_UTILIZATION of the worker threads are busy. A worker is drained after WORKER_SCALE_DOWN_CHECKS
+    # consecutive checks find the queue empty and at most WORKER_SCALE_DOWN_UTILIZATION of the worker threads busy.
+    WORKER_POOL_MODE = 'fixed'
+    MIN_WORKER_PROCESSES = 1
+    MAX_WORKER_PROCESSES = 8
+    WORKER_SCALE_INTERVAL = 5
+    WORKER_SCALE_UP_UTILIZATION = 0.8
+    WORKER_SCALE_DOWN_UTILIZATION = 0.25
+    WORKER_SCALE_DOWN_CHECKS = 3
+
+    # How workers take workflow execution requests off of the request queue. In 'blocking' mode each worker waits on
+    # the queue for up to WORKFLOW_DISPATCH_TIMEOUT seconds and wakes as soon as a request arrives. In 'polling' mode
+    # workers pop from the queue every 100 ms. If a timeout is set in the CACHE configuration, it must be larger than
+    # WORKFLOW_DISPATCH_TIMEOUT.
+    WORKFLOW_DISPATCH_MODE = 'blocking'
+    WORKFLOW_DISPATCH_TIMEOUT = 5
+
+    # At-least-once delivery of workflow execution requests. When enabled, workers move each request to their own
+    # in-flight list until the workflow finishes, and refresh a heartbeat every WORKER_HEARTBEAT_INTERVAL seconds. If a
+    # worker's heartbeat is not refreshed for WORKFLOW_VISIBILITY_TIMEOUT seconds, the server returns its requests to
+    # the queue, up to WORKFLOW_MAX_REDELIVERIES times, after which the workflow is aborted.
+    RELIABLE_WORKFLOW_QUEUE = False
+    WORKER_HEARTBEAT_INTERVAL = 5
+    WORKFLOW_VISIBILITY_TIMEOUT = 30
+    WORKFLOW_MAX_REDELIVERIES = 3
+
+    # Workflow execution requests are queued in 'high', 'normal', and 'low' priority lanes. With 'strict' scheduling a
+    # lane is only read once every higher lane is empty. With 'weighted' scheduling each lane is read first in
+    # proportion to its weight in WORKFLOW_QUEUE_WEIGHTS, so lower lanes are never starved.
+    WORKFLOW_QUEUE_SCHEDULING = 'weighted'
+    WORKFLOW_QUEUE_WEIGHTS = {'high': 6, 'normal': 3, 'low': 1}
+
+    # The number of execution requests pushed onto the request queue in a single command by a bulk execution
+    BULK_EXECUTION_BATCH_SIZE = 500
+
+    # The number of workflows each worker thread keeps loaded between executions. Cached workflows are reloaded after
+    # they are edited through the server. Set to 0 to load every workflow from the execution database when it executes.
+    WORKFLOW_PLAN_CACHE_SIZE = 128
+
+    # The maximum number of actions of a single 'parallel' workflow which may execute at the same time
+    WORKFLOW_PARALLEL_ACTIONS = 4
+
     # Database types
     WALKOFF_DB_TYPE = 'sqlite'
     EXECUTION_DB_TYPE = 'sqlite'
@@ -153,7 +205,36 @@ class Config(object):
     SERVER_PRIVATE_KEY = ''
     CLIENT_PUBLIC_KEY = ''
     CLIENT_PRIVATE_KEY = ''
+
+    # Where the results of the actions of an execution are kept. 'memory' keeps them in the worker, 'external' keeps
+    # each result under its own key in the cache, and 'external_hash' keeps the results of each execution in one hash
+    # in the cache. 'tiered' keeps the results in the worker and writes them to the TIERED_ACCUMULATOR_BACKEND
+    # accumulator, either 'external' or 'external_hash', before each action executes and when the workflow pauses,
+    # awaits a trigger, or completes. Executions paused under one layout must be resumed before switching to another.
     ACCUMULATOR_TYPE = 'external'
+    TIERED_ACCUMULATOR_BACKEND = 'external_hash'
+
+    # How results are written to the cache by the 'external' and 'external_hash' accumulators: 'pickle', 'msgpack', or
+    # 'json'. Results msgpack or JSON cannot represent are pickled. Results larger than
+    # ACCUMULATOR_COMPRESSION_THRESHOLD bytes are compressed. Set the threshold to 0 to never compress results.
+    ACCUMULATOR_SERIALIZER = 'pickle'
+    ACCUMULATOR_COMPRESSION_THRESHOLD = 65536
+
+    # Action results larger than RESULT_STORE_THRESHOLD bytes are written once to a result store, and only a handle to
+    # them is kept in the accumulator and sent in events. Actions referencing the result read it from the store. The
+    # 'filesystem' store keeps results under RESULT_STORE_PATH, which must be shared by the server and every worker.
+    # Set the threshold to 0 to keep every result in the accumulator.
+    RESULT_STORE_TYPE = 'filesystem'
+    RESULT_STORE_PATH = join(DATA_PATH, 'results')
+    RESULT_STORE_THRESHOLD = 0
+
+    # The keys an execution keeps in the cache, its accumulator and the fields of its app instances, expire
+    # EXECUTION_STATE_TTL seconds after they are last written, so the keys of executions whose worker died are not
+    # kept forever. The keys of executions which are paused or awaiting a trigger never expire, and get their
+    # expiration back when the execution resumes. Set to 0 to never expire them. Every EXECUTION_STATE_REAPER_INTERVAL
+    # seconds the server deletes the keys of executions which were aborted.
+    EXECUTION_STATE_TTL = 604800
+    EXECUTION_STATE_REAPER_INTERVAL = 60
 
     SECRET_KEY = "SHORTSTOPKEY"
 
@@ -164,6 +245,35 @@ class Config(object):
     WORKFLOW_RESULTS_PROTOCOL = 'protobuf'
     WORKFLOW_RESULTS_KAFKA_CONFIG = {'bootstrap.servers': 'localhost:9092', 'group.id': 'results'}
     WORKFLOW_RESULTS_KAFKA_TOPIC = 'results'
+    # The results receiver waits up to WORKFLOW_RESULTS_POLL_TIMEOUT seconds for results, then takes every waiting
+    # result, at most WORKFLOW_RESULTS_BATCH_SIZE at a time
+    WORKFLOW_RESULTS_POLL_TIMEOUT = 0.5
+    WORKFLOW_RESULTS_BATCH_SIZE = 500
+    # Workflow and action status transitions received by the server are written to the execution database in one
+    # transaction once WORKFLOW_STATUS_FLUSH_SIZE of them are buffered, or WORKFLOW_STATUS_FLUSH_INTERVAL seconds after
+    # the first of them was received. Transitions which end or suspend a workflow are written immediately. Set the size
+    # to 1 to write every transition as it is received.
+    WORKFLOW_STATUS_FLUSH_SIZE = 100
+    WORKFLOW_STATUS_FLUSH_INTERVAL = 0.25
+    # Workers emit the events of the branches, conditional expressions, conditions, and transforms of workflows at
+    # WORKFLOW_EVENT_LEVEL. 'all' emits every event, 'errors' emits only the errors of conditions and transforms, and
+    # 'none' emits none of them. WORKFLOW_EVENT_TYPE_LEVELS overrides the level of the event types 'branch',
+    # 'conditonalexpression', 'condition', and 'transform', and the event level of a workflow overrides both. Events
+    # which interfaces handle are always emitted. The workflow results streams only report the events which are
+    # emitted, so lower levels send fewer events at the cost of the events the streams show.
+    WORKFLOW_EVENT_LEVEL = 'all'
+    WORKFLOW_EVENT_TYPE_LEVELS = {}
+    # The execution times of actions and workflows are aggregated into latency histograms in memory, which are written
+    # to the execution database every METRICS_FLUSH_INTERVAL seconds with one row per METRICS_HISTOGRAM_INTERVAL
+    # seconds. The app and workflow metrics report the count, mean, percentiles, and maximum execution time over each of
+    # METRICS_LATENCY_WINDOWS seconds. Histograms older than the longest window are deleted.
+    METRICS_FLUSH_INTERVAL = 10
+    METRICS_HISTOGRAM_INTERVAL = 60
+    METRICS_LATENCY_WINDOWS = [300, 3600, 86400]
+    # The server and workers write the metrics of the workflow execution pipeline (request queue waits, worker threads,
+    # action execution times, accumulator cache operations, results receiver lag, and status writes) to the cache every
+    # PIPELINE_METRICS_FLUSH_INTERVAL seconds. They are exported at /prometheus_metrics. Set to 0 to not record them.
+    PIPELINE_METRICS_FLUSH_INTERVAL = 5
 
     WORKFLOW_COMMUNICATION_HANDLER = 'zmq'
     WORKFLOW_COMMUNICATION_PROTOCOL = 'protobuf'
@@ -1,7 +1,7 @@
 import logging
 import uuid
 
-from sqlalchemy import Column, ForeignKey, String, orm, event
+from sqlalchemy import Column, ForeignKey, String, Boolean, orm, event
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
@@ -23,6 +23,7 @@ class Action(ExecutionElement, Execution_Base):
     app_name = Column(String(80), nullable=False)
     action_name = Column(String(80), nullable=False)
     name = Column(String(80), nullable=False)
+    is_join = Column(Boolean, nullable=False, default=False)
     device_id = relationship('Argument', uselist=False, cascade='all, delete-orphan',
                              foreign_keys=[Argument.action_device_id], passive_deletes=True)
     arguments = relationship('Argument', cascade='all, delete, delete-orphan', foreign_keys=[Argument.action_id],
@@ -32,7 +33,7 @@ class Action(ExecutionElement, Execution_Base):
     children = ('arguments', 'trigger')
 
     def __init__(self, app_name, action_name, name, device_id=None, id=None, arguments=None, trigger=None,
-                 position=None, errors=None):
+                 position=None, is_join=False, errors=None):
         """Initializes a new Action object. A Workflow has one or more actions that it executes.
         Args:
             app_name (str): The name of the app associated with the Action
@@ -49,6 +50,8 @@ class Action(ExecutionElement, Execution_Base):
             trigger (ConditionalExpression, optional): A ConditionalExpression which causes an Action to wait until the
                 data is sent fulfilling the condition. Defaults to None.
             position (Position, optional): Position object for the Action. Defaults to None.
+            is_join (bool, optional): Does the Action wait for all of its inbound Branches to be taken before it is
+                executed in a parallel Workflow? Defaults to False.
         """
         ExecutionElement.__init__(self, id, errors)
 
@@ -64,9 +67,11 @@ class Action(ExecutionElement, Execution_Base):
             self.arguments = arguments
 
         self.position = position
+        self.is_join = is_join
 
         self._run = None
         self._arguments_api = None
+        self._literal_arguments = None
         self._last_status = None
         self._execution_id = 'default'
         self._resolved_device_id = -1
@@ -85,6 +90,11 @@ class Action(ExecutionElement, Execution_Base):
             except UnknownAppAction:
                 errors.append('Unknown app action {}'.format(self.action_name))
             self.errors = errors
+        self._literal_arguments = None
+        self.reset_execution_state()
+
+    def reset_execution_state(self):
+        """Clears the state left on the Action by a previous execution"""
         self._last_status = None
         self._execution_id = 'default'
         self._resolved_device_id = -1
@@ -92,13 +102,17 @@ class Action(ExecutionElement, Execution_Base):
     def validate(self):
         """Validates the object"""
         errors = []
+        self._literal_arguments = None
         try:
             self._run, self._arguments_api = get_app_action_api(self.app_name, self.action_name)
             get_app_action(self.app_name, self._run)
             if is_app_action_bound(self.app_name, self._run) and not self.device_id:
                 message = 'App action is bound but no device ID was provided.'.format(self.name)
                 errors.append(message)
-            validate_app_action_parameters(self._arguments_api, self.arguments, self.app_name, self.action_name)
+            literals = validate_app_action_parameters(self._arguments_api, self.arguments, self.app_name,
+                                                      self.action_name)
+            if not errors:
+                self._literal_arguments = literals
         except UnknownApp:
             errors.append('Unknown app {}'.format(self.app_name))
         except UnknownAppAction:
@@ -107,6 +121,19 @@ class Action(ExecutionElement, Execution_Base):
             errors.extend(e.errors)
         self.errors = errors
 
+    def prepare_literal_arguments(self):
+        """Validates and converts the Arguments of the Action which are not references, so that only the referenced
+            Arguments are validated each time the Action is executed
+        """
+        self._literal_arguments = None
+        if self.errors:
+            return
+        try:
+            self._literal_arguments = validate_app_action_parameters(self._arguments_api, self.arguments,
+                                                                     self.app_name, self.action_name)
+        except InvalidArgument:
+            pass
+
     def get_execution_id(self):
         """Gets the execution ID of the Action
 
@@ -146,13 +173,18 @@ class Action(ExecutionElement, Execution_Base):
         if self.trigger and not resume:
             WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.TriggerActionAwaitingData)
             logger.debug('Trigger Action {} is awaiting data'.format(self.name))
-            return ActionResult("trigger", "trigger")
-
-        arguments = arguments if arguments else self.arguments
+            return ActionResult("trigger", "trigger").status
 
         try:
-            args = validate_app_action_parameters(self._arguments_api, arguments, self.app_name, self.action_name,
-                                                  accumulator=accumulator)
+            if arguments:
+                args = validate_app_action_parameters(self._arguments_api, arguments, self.app_name,
+                                                      self.action_name, accumulator=accumulator)
+            else:
+                if self._literal_arguments is None:
+                    self.prepare_literal_arguments()
+                args = validate_app_action_parameters(self._arguments_api, self.arguments, self.app_name,
+                                                      self.action_name, accumulator=accumulator,
+                                                      literals=self._literal_arguments)
         except InvalidArgument as e:
             result = ActionResult.from_exception(e, 'InvalidArguments')
             accumulator[self.id] = result.result
@@ -1,15 +1,66 @@
 import logging
 
+from six import string_types
 from sqlalchemy import Column, Integer, ForeignKey, String, orm, event
 from sqlalchemy_utils import UUIDType, JSONType, ScalarListType
 
 from walkoff.appgateway.apiutil import InvalidArgument
+from walkoff.appgateway.resultstore import resolve_result
 from walkoff.executiondb import Execution_Base
 from walkoff.executiondb.validatable import Validatable
 
 logger = logging.getLogger(__name__)
 
 
+def compile_selector(selector):
+    """Resolves the key and list index a selector of an Argument's selection uses
+
+    Args:
+        selector (str|int): The selector
+
+    Returns:
+        (tuple(str|int, int)): The key to use on dicts and the index to use on lists, which is None if the selector
+            cannot index a list
+
+    Raises:
+        ValueError: If the selector is neither a string nor an integer
+    """
+    if isinstance(selector, bool) or not isinstance(selector, string_types + (int,)):
+        raise ValueError('Selector {} is not a string or an integer'.format(selector))
+    try:
+        return selector, int(selector)
+    except ValueError:
+        return selector, None
+
+
+def compile_selection(selection):
+    """Compiles the selection of an Argument into a function which selects a field from a result
+
+    Args:
+        selection (list[str|int]): The selection
+
+    Returns:
+        (func): A function which takes a result and returns the selected field. It raises a KeyError, IndexError, or
+            ValueError if the selection is invalid for the result
+
+    Raises:
+        ValueError: If a selector is neither a string nor an integer
+    """
+    steps = tuple(compile_selector(selector) for selector in selection or [])
+
+    def select(input_):
+        for key, index in steps:
+            if isinstance(input_, dict):
+                input_ = input_[key]
+            elif index is not None and isinstance(input_, list):
+                input_ = input_[index]
+            else:
+                raise ValueError
+        return input_
+
+    return select
+
+
 class Argument(Execution_Base, Validatable):
     __tablename__ = 'argument'
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -39,12 +90,16 @@ class Argument(Execution_Base, Validatable):
         self._is_reference = True if value is None else False
         self.reference = reference
         self.selection = selection
+        self._selection_source = None
+        self._selector = None
         self.validate()
 
     @orm.reconstructor
     def init_on_load(self):
         """Loads all necessary fields upon Argument being loaded from database"""
         self._is_reference = True if self.value is None else False
+        self._selection_source = None
+        self._selector = None
 
     def validate(self):
         """Validates the object"""
@@ -57,6 +112,12 @@ class Argument(Execution_Base, Validatable):
             message = 'Input {} must have either value or reference. Input has both. Using "value"'.format(self.name)
             logger.warning(message)
             self.reference = None
+        try:
+            self._compile_selection()
+        except ValueError as e:
+            message = 'Selection {0} of input {1} is invalid. {2}'.format(self.selection, self.name, e)
+            logger.error(message)
+            self.errors.append(message)
 
     def update_value_reference(self, value, reference):
         """Helper function to ensure that either reference or value is selected and the other is None
@@ -97,7 +158,7 @@ class Argument(Execution_Base, Validatable):
             return self.value
 
         if accumulator:
-            action_output = self._get_action_from_reference(accumulator)
+            action_output = resolve_result(self._get_action_from_reference(accumulator))
             if not self.selection:
                 return action_output
 
@@ -114,25 +175,21 @@ class Argument(Execution_Base, Validatable):
             logger.info(message)
             raise InvalidArgument(message)
 
+    def _compile_selection(self):
+        self._selector = None
+        self._selection_source = self.selection
+        self._selector = compile_selection(self.selection)
+
     def _select(self, input_):
         try:
-            for selection in self.selection:
-                input_ = Argument._get_next_selection(input_, selection)
-            return input_
+            if self._selector is None or self._selection_source is not self.selection:
+                self._compile_selection()
+            return self._selector(input_)
 
         except (KeyError, ValueError, IndexError):
             raise InvalidArgument('Selector {0} is invalid for reference {1}'.format(
                 self.selection, self.reference))
 
-    @staticmethod
-    def _get_next_selection(input_, selection):
-        if isinstance(input_, dict):
-            return input_[selection]
-        elif isinstance(input_, list):
-            return input_[int(selection)]
-        else:
-            raise ValueError
-
     @classmethod
     def create_device_argument(cls, value=None, reference=None, selection=None):
         return cls(name='__device__', value=value, reference=reference, selection=selection)
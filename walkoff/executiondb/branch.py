@@ -4,6 +4,7 @@ from sqlalchemy import Column, Integer, ForeignKey, String, event, orm
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
+from walkoff.appgateway.resultstore import resolve_result
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import Execution_Base
 from walkoff.executiondb.executionelement import ExecutionElement
@@ -51,6 +52,10 @@ class Branch(ExecutionElement, Execution_Base):
     @orm.reconstructor
     def init_on_load(self):
         """Loads all necessary fields upon Branch being loaded from database"""
+        self.reset_counter()
+
+    def reset_counter(self):
+        """Resets the number of times the Branch has been executed"""
         self._counter = 0
 
     def validate(self):
@@ -74,7 +79,8 @@ class Branch(ExecutionElement, Execution_Base):
         accumulator[self.id] = self._counter
         if current_action is not None and status == self.status:
             data_in = accumulator[current_action.id]
-            if self.condition is None or self.condition.execute(action_execution_strategy, data_in=data_in,
+            if self.condition is None or self.condition.execute(action_execution_strategy,
+                                                                data_in=resolve_result(data_in),
                                                                 accumulator=accumulator):
                 WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.BranchTaken)
                 logger.debug('Branch is valid for input {0}'.format(data_in))
@@ -6,8 +6,9 @@ from sqlalchemy_utils import UUIDType
 
 from walkoff import executiondb
 from walkoff.appgateway import get_condition
-from walkoff.appgateway.apiutil import split_api_params, get_condition_api, UnknownApp, InvalidArgument, \
-    UnknownCondition
+from walkoff.appgateway.apiutil import split_api_params, get_condition_api, get_api_is_pure, UnknownApp, \
+    InvalidArgument, UnknownCondition
+from walkoff.appgateway.decorators import is_pure
 from walkoff.appgateway.validator import validate_condition_parameters
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb.argument import Argument
@@ -58,17 +59,19 @@ class Condition(ExecutionElement, executiondb.Execution_Base):
         self._data_param_name = None
         self._api = None
         self._condition_executable = None
+        self._pure = False
 
         self.validate()
 
     @orm.reconstructor
     def init_on_load(self):
         """Loads all necessary fields upon Condition being loaded from database"""
+        self._pure = False
         if not self.errors:
             errors = []
             try:
                 self._data_param_name, run, self._api = get_condition_api(self.app_name, self.action_name)
-                get_condition(self.app_name, run)
+                self._set_pure(get_condition(self.app_name, run))
             except UnknownApp:
                 errors.append('Unknown app {}'.format(self.app_name))
             except UnknownCondition:
@@ -78,9 +81,11 @@ class Condition(ExecutionElement, executiondb.Execution_Base):
     def validate(self):
         """Validates the object"""
         errors = []
+        self._pure = False
         try:
             self._data_param_name, run, self._api = get_condition_api(self.app_name, self.action_name)
             self._condition_executable = get_condition(self.app_name, run)
+            self._set_pure(self._condition_executable)
             tmp_api = split_api_params(self._api, self._data_param_name)
             validate_condition_parameters(tmp_api, self.arguments, self.action_name)
         except UnknownApp:
@@ -91,6 +96,10 @@ class Condition(ExecutionElement, executiondb.Execution_Base):
             errors.extend(e.errors)
         self.errors = errors
 
+    def _set_pure(self, condition_executable):
+        self._pure = (get_api_is_pure(self.app_name, 'conditions', self.action_name)
+                      or is_pure(condition_executable))
+
     def execute(self, action_execution_strategy, data_in, accumulator):
         """Executes the Condition object, determining if the Condition evaluates to True or False.
 
@@ -108,7 +117,8 @@ class Condition(ExecutionElement, executiondb.Execution_Base):
             data = transform.execute(action_execution_strategy, data, accumulator)
         try:
             arguments = self.__update_arguments_with_data(data)
-            args = validate_condition_parameters(self._api, arguments, self.action_name, accumulator=accumulator)
+            args = validate_condition_parameters(self._api, arguments, self.action_name, accumulator=accumulator,
+                                                 app=self.app_name)
         except InvalidArgument as e:
             logger.error('Condition {0} has invalid input {1} which was converted to {2}. Error: {3}. '
                          'Returning False'.format(self.action_name, data_in, data, format_exception_message(e)))
@@ -117,7 +127,11 @@ class Condition(ExecutionElement, executiondb.Execution_Base):
 
         try:
             logger.debug('Arguments passed to condition {} are valid'.format(self.id))
-            ret = action_execution_strategy.execute(self, accumulator, args)
+            if self._pure:
+                ret = action_execution_strategy.pure_results.execute(action_execution_strategy, self, accumulator,
+                                                                     args)
+            else:
+                ret = action_execution_strategy.execute(self, accumulator, args)
             WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionSuccess)
             if self.is_negated:
                 return not ret
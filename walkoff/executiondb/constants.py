@@ -0,0 +1,19 @@
+workflow_priorities = ('high', 'normal', 'low')
+"""(tuple(str)): The priorities of workflow execution requests, highest first
+"""
+
+default_workflow_priority = 'normal'
+
+workflow_execution_strategies = ('serial', 'parallel')
+"""(tuple(str)): The ways a Workflow can be executed. 'serial' Workflows follow the first Branch taken from each Action,
+    and 'parallel' Workflows follow every Branch taken, executing Actions concurrently
+"""
+
+default_workflow_execution_strategy = 'serial'
+
+event_levels = ('none', 'errors', 'all')
+"""(tuple(str)): The levels the fine-grained events of a Workflow can be emitted at. 'all' emits every event, 'errors'
+    emits only the errors of Conditions and Transforms, and 'none' emits none of them
+"""
+
+default_event_level = 'all'
@@ -1,6 +1,6 @@
 from datetime import timedelta
 
-from sqlalchemy import Column, Integer, ForeignKey, String, Float
+from sqlalchemy import Column, Integer, ForeignKey, String, Float, DateTime, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
@@ -42,9 +42,12 @@ class AppMetric(Execution_Base):
                 return action
         return None
 
-    def as_json(self):
+    def as_json(self, latencies=None):
         """Gets the JSON representation of the AppMetric
 
+        Args:
+            latencies (LatencySummaries, optional): The latencies of the actions over each window. Defaults to None
+
         Returns:
             (dict): The JSON representation of the AppMetric
         """
@@ -52,7 +55,11 @@ class AppMetric(Execution_Base):
                "count": self.count}
         actions_list = []
         for action in self.actions:
-            actions_list.append(action.as_json())
+            action_latencies = None
+            if latencies is not None:
+                action_latencies = {status: latencies.get(self.app, action.action_id, status)
+                                    for status in ('success', 'error')}
+            actions_list.append(action.as_json(action_latencies))
         ret["actions"] = actions_list
         return ret
 
@@ -94,18 +101,23 @@ class ActionMetric(Execution_Base):
                 return action_status
         return None
 
-    def as_json(self):
+    def as_json(self, latencies=None):
         """Gets the JSON representation of the ActionMetric object
 
+        Args:
+            latencies (dict{str: list[dict]}, optional): The latencies of the Action over each window, by status.
+                Defaults to None
+
         Returns:
             (dict): The JSON representation of the object
         """
         ret = {"name": self.action_name}
         for action_status in self.action_statuses:
+            latency = latencies.get(action_status.status) if latencies is not None else None
             if action_status.status == "success":
-                ret["success_metrics"] = action_status.as_json()
+                ret["success_metrics"] = action_status.as_json(latency)
             else:
-                ret["error_metrics"] = action_status.as_json()
+                ret["error_metrics"] = action_status.as_json(latency)
         return ret
 
 
@@ -140,16 +152,21 @@ class ActionStatusMetric(Execution_Base):
             execution_time (float): The execution time for this execution instance of the Action
         """
         self.count += 1
-        self.avg_time = (self.avg_time + execution_time) / 2
+        self.avg_time += (execution_time - self.avg_time) / self.count
 
-    def as_json(self):
+    def as_json(self, latency=None):
         """Gets the JSON representation of the object
 
+        Args:
+            latency (list[dict], optional): The latency of the Action over each window. Defaults to None
+
         Returns:
             (dict): The JSON representation of the object
         """
         ret = {"count": self.count,
                "avg_time": str(timedelta(seconds=self.avg_time))}
+        if latency is not None:
+            ret["latency"] = latency
         return ret
 
 
@@ -184,15 +201,61 @@ class WorkflowMetric(Execution_Base):
             execution_time (float): The execution time for this execution instance of the Workflow
         """
         self.count += 1
-        self.avg_time = (self.avg_time + execution_time) / 2
+        self.avg_time += (execution_time - self.avg_time) / self.count
 
-    def as_json(self):
+    def as_json(self, latency=None):
         """Gets the JSON representation of the object
 
+        Args:
+            latency (list[dict], optional): The latency of the Workflow over each window. Defaults to None
+
         Returns:
             (dict): The JSON representation of the object
         """
         ret = {"name": self.workflow_name,
                "count": self.count,
                "avg_time": str(timedelta(seconds=self.avg_time))}
+        if latency is not None:
+            ret["latency"] = latency
         return ret
+
+
+class LatencyHistogram(Execution_Base):
+    """ORM for the LatencyHistogram, which stores the histogram of the execution times of an Action or Workflow over an
+        interval
+
+    Attributes:
+        id (int): The ID of the LatencyHistogram
+        metric (str): The kind of execution timed, either 'action' or 'workflow'
+        app_name (str): The name of the App of the Action. None for Workflows
+        entity_id (UUID): The ID of the Action or Workflow
+        status (str): The status of the Action executions, either 'success' or 'error'. None for Workflows
+        interval_start (datetime): The start of the interval the executions completed in
+        count (int): The number of executions
+        total (float): The sum of the execution times
+        max (float): The longest execution time
+        buckets (str): The JSON-encoded counts of executions in each bucket of the histogram, by bucket index
+    """
+    __tablename__ = 'latency_histogram'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    metric = Column(String(10), nullable=False)
+    app_name = Column(String(255))
+    entity_id = Column(UUIDType(binary=False), nullable=False)
+    status = Column(String(10))
+    interval_start = Column(DateTime, nullable=False, index=True)
+    count = Column(Integer)
+    total = Column(Float)
+    max = Column(Float)
+    buckets = Column(Text)
+
+    def __init__(self, metric, app_name, entity_id, status, interval_start):
+        self.metric = metric
+        self.app_name = app_name
+        self.entity_id = entity_id
+        self.status = status
+        self.interval_start = interval_start
+        self.count = 0
+        self.total = 0.
+        self.max = 0.
+        self.buckets = '{}'
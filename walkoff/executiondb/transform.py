@@ -6,8 +6,9 @@ from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
 from walkoff.appgateway import get_transform
-from walkoff.appgateway.apiutil import split_api_params, get_transform_api, UnknownApp, InvalidArgument, \
-    UnknownTransform
+from walkoff.appgateway.apiutil import split_api_params, get_transform_api, get_api_is_pure, UnknownApp, \
+    InvalidArgument, UnknownTransform
+from walkoff.appgateway.decorators import is_pure
 from walkoff.appgateway.validator import validate_transform_parameters
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import Execution_Base
@@ -43,6 +44,7 @@ class Transform(ExecutionElement, Execution_Base):
 
         self._data_param_name = None
         self._api = None
+        self._pure = False
 
         self.arguments = []
         if arguments:
@@ -52,9 +54,10 @@ class Transform(ExecutionElement, Execution_Base):
     def validate(self):
         """Validates the object"""
         errors = []
+        self._pure = False
         try:
             self._data_param_name, run, self._api = get_transform_api(self.app_name, self.action_name)
-            get_transform(self.app_name, run)
+            self._set_pure(get_transform(self.app_name, run))
             tmp_api = split_api_params(self._api, self._data_param_name)
             validate_transform_parameters(tmp_api, self.arguments, self.action_name)
         except UnknownApp:
@@ -68,17 +71,21 @@ class Transform(ExecutionElement, Execution_Base):
     @orm.reconstructor
     def init_on_load(self):
         """Loads all necessary fields upon Condition being loaded from database"""
+        self._pure = False
         if not self.errors:
             errors = []
             try:
                 self._data_param_name, run, self._api = get_transform_api(self.app_name, self.action_name)
-                get_transform(self.app_name, run)
+                self._set_pure(get_transform(self.app_name, run))
             except UnknownApp:
                 errors.append('Unknown app {}'.format(self.app_name))
             except UnknownTransform:
                 errors.append('Unknown transform {}'.format(self.action_name))
             self.errors = errors
 
+    def _set_pure(self, transform_executable):
+        self._pure = get_api_is_pure(self.app_name, 'transforms', self.action_name) or is_pure(transform_executable)
+
     def execute(self, action_execution_strategy, data_in, accumulator):
         """Executes the transform.
 
@@ -90,10 +97,12 @@ class Transform(ExecutionElement, Execution_Base):
         Returns:
             (obj): The transformed data
         """
-        original_data_in = deepcopy(data_in)
+        # Pure transforms do not modify their input, so it does not need to be copied in case they fail
+        original_data_in = data_in if self._pure else deepcopy(data_in)
         try:
             arguments = self.__update_arguments_with_data(data_in)
-            args = validate_transform_parameters(self._api, arguments, self.action_name, accumulator=accumulator)
+            args = validate_transform_parameters(self._api, arguments, self.action_name, accumulator=accumulator,
+                                                 app=self.app_name)
         except InvalidArgument as e:
             WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.TransformError)
             logger.error('Transform {0} has invalid input {1}. Error: {2}. '
@@ -101,7 +110,11 @@ class Transform(ExecutionElement, Execution_Base):
             return original_data_in
 
         try:
-            result = action_execution_strategy.execute(self, accumulator, args)
+            if self._pure:
+                result = action_execution_strategy.pure_results.execute(action_execution_strategy, self, accumulator,
+                                                                        args)
+            else:
+                result = action_execution_strategy.execute(self, accumulator, args)
             WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.TransformSuccess)
             return result
 
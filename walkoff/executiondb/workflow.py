@@ -6,6 +6,8 @@ from sqlalchemy_utils import UUIDType
 
 from walkoff.executiondb import Execution_Base
 from walkoff.executiondb.action import Action
+from walkoff.executiondb.constants import workflow_priorities, default_workflow_priority, \
+    workflow_execution_strategies, default_workflow_execution_strategy, event_levels
 from walkoff.executiondb.executionelement import ExecutionElement
 
 logger = logging.getLogger(__name__)
@@ -19,11 +21,16 @@ class Workflow(ExecutionElement, Execution_Base):
     branches = relationship('Branch', cascade='all, delete-orphan', passive_deletes=True)
     start = Column(UUIDType(binary=False))
     is_valid = Column(Boolean, default=False)
+    priority = Column(String(10), nullable=False, default=default_workflow_priority)
+    execution_strategy = Column(String(10), nullable=False, default=default_workflow_execution_strategy)
+    keep_all_results = Column(Boolean, nullable=False, default=False)
+    event_level = Column(String(10))
     children = ('actions', 'branches')
     environment_variables = relationship('EnvironmentVariable', cascade='all, delete-orphan', passive_deletes=True)
     __table_args__ = (UniqueConstraint('playbook_id', 'name', name='_playbook_workflow'),)
 
-    def __init__(self, name, start, id=None, actions=None, branches=None, environment_variables=None, errors=None):
+    def __init__(self, name, start, id=None, actions=None, branches=None, environment_variables=None, priority=None,
+                 execution_strategy=None, keep_all_results=False, event_level=None, errors=None):
         """Initializes a Workflow object. A Workflow falls under a Playbook, and has many associated Actions
             within it that get executed.
 
@@ -36,6 +43,17 @@ class Workflow(ExecutionElement, Execution_Base):
             branches (list[Branch], optional): A list of Branch objects for the Workflow object. Defaults to None.
             environment_variables (list[EnvironmentVariable], optional): A list of environment variables for the
                 Workflow. Defaults to None.
+            priority (str, optional): The priority lane the Workflow is queued in when it is executed, either 'high',
+                'normal', or 'low'. Defaults to 'normal'.
+            execution_strategy (str, optional): How the Workflow is executed, either 'serial' or 'parallel'. Defaults
+                to 'serial'. Only the start Action of a 'parallel' Workflow may have a trigger, because the state of an
+                execution awaiting a trigger only records the Action it resumes from.
+            keep_all_results (bool, optional): Does the Workflow keep the result of every Action until it completes?
+                Otherwise results are freed once no Action which may still execute reads them, and only the results
+                which were not freed are reported when the Workflow completes. Defaults to False.
+            event_level (str, optional): The level the events of the Branches, Conditions, and Transforms of the
+                Workflow are emitted at, either 'all', 'errors', or 'none'. Defaults to None, which emits them at the
+                level in the configuration.
         """
         ExecutionElement.__init__(self, id, errors)
         self.name = name
@@ -44,6 +62,11 @@ class Workflow(ExecutionElement, Execution_Base):
         self.environment_variables = environment_variables if environment_variables else []
 
         self.start = start
+        self.priority = priority if priority is not None else default_workflow_priority
+        self.execution_strategy = (execution_strategy if execution_strategy is not None
+                                   else default_workflow_execution_strategy)
+        self.keep_all_results = keep_all_results
+        self.event_level = event_level
 
         self.validate()
 
@@ -60,6 +83,17 @@ class Workflow(ExecutionElement, Execution_Base):
                 errors.append('Branch source ID {} not found in workflow actions'.format(branch.source_id))
             if branch.destination_id not in action_ids:
                 errors.append('Branch destination ID {} not found in workflow actions'.format(branch.destination_id))
+        if self.priority is not None and self.priority not in workflow_priorities:
+            errors.append('Unknown workflow priority {}'.format(self.priority))
+        if self.execution_strategy is not None and self.execution_strategy not in workflow_execution_strategies:
+            errors.append('Unknown workflow execution strategy {}'.format(self.execution_strategy))
+        if self.execution_strategy == 'parallel':
+            for action in self.actions:
+                if action.trigger is not None and action.id != self.start:
+                    errors.append('Action {} of a parallel workflow has a trigger, but is not the start action'.format(
+                        action.id))
+        if self.event_level is not None and self.event_level not in event_levels:
+            errors.append('Unknown workflow event level {}'.format(self.event_level))
         self.errors = errors
         self.is_valid = self._is_valid
 
@@ -40,9 +40,13 @@ class WorkflowStatus(Execution_Base):
         self.status = WorkflowStatusEnum.pending
         self.user = user
 
-    def running(self):
-        """Sets the status to running"""
-        self.started_at = datetime.utcnow()
+    def running(self, timestamp=None):
+        """Sets the status to running
+
+        Args:
+            timestamp (datetime, optional): The time the workflow started. Defaults to now
+        """
+        self.started_at = timestamp or datetime.utcnow()
         self.status = WorkflowStatusEnum.running
 
     def paused(self):
@@ -55,14 +59,22 @@ class WorkflowStatus(Execution_Base):
         if self._action_statuses:
             self._action_statuses[-1].awaiting_data()
 
-    def completed(self):
-        """Sets the status to completed"""
-        self.completed_at = datetime.utcnow()
+    def completed(self, timestamp=None):
+        """Sets the status to completed
+
+        Args:
+            timestamp (datetime, optional): The time the workflow completed. Defaults to now
+        """
+        self.completed_at = timestamp or datetime.utcnow()
         self.status = WorkflowStatusEnum.completed
 
-    def aborted(self):
-        """Sets the status to aborted"""
-        self.completed_at = datetime.utcnow()
+    def aborted(self, timestamp=None):
+        """Sets the status to aborted
+
+        Args:
+            timestamp (datetime, optional): The time the workflow was aborted. Defaults to now
+        """
+        self.completed_at = timestamp or datetime.utcnow()
         self.status = WorkflowStatusEnum.aborted
         if self._action_statuses:
             self._action_statuses[-1].aborted()
@@ -154,17 +166,27 @@ class ActionStatus(Execution_Base):
         """Sets status to awaiting data"""
         self.status = ActionStatusEnum.awaiting_data
 
-    def completed_success(self, data):
-        """Sets status to completed successfully"""
+    def completed_success(self, data, timestamp=None):
+        """Sets status to completed successfully
+
+        Args:
+            data (dict): The data of the event, containing the result
+            timestamp (datetime, optional): The time the action completed. Defaults to now
+        """
         self.status = ActionStatusEnum.success
         self.result = json.dumps(data['result'])
-        self.completed_at = datetime.utcnow()
+        self.completed_at = timestamp or datetime.utcnow()
+
+    def completed_failure(self, data, timestamp=None):
+        """Sets status to completed unsuccessfully
 
-    def completed_failure(self, data):
-        """Sets status to completed unsuccessfully"""
+        Args:
+            data (dict): The data of the event, containing the result
+            timestamp (datetime, optional): The time the action completed. Defaults to now
+        """
         self.status = ActionStatusEnum.failure
         self.result = json.dumps(data['result'])
-        self.completed_at = datetime.utcnow()
+        self.completed_at = timestamp or datetime.utcnow()
 
     def as_json(self, summary=False):
         """Gets the JSON representation of the object
@@ -0,0 +1,103 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from walkoff.appgateway.accumulators import delete_accumulators, uses_keyed_accumulator
+from walkoff.appgateway.appinstance import app_fields_key
+from walkoff.appgateway.resultstore import make_result_store
+from walkoff.executiondb import WorkflowStatusEnum
+from walkoff.executiondb.workflowresults import WorkflowStatus
+
+logger = logging.getLogger(__name__)
+
+reaper_lock_key = 'execution_state:reaper'
+reaper_watermark_key = 'execution_state:reaper:last_reaped'
+watermark_format = '%Y-%m-%dT%H:%M:%S.%f'
+
+
+def delete_execution_state(cache, execution_id, config=None):
+    """Deletes everything a workflow execution keeps in the cache and the result store
+
+    Keys are deleted by name. Only the keys of the 'external' accumulator layout, whose names are not known, are found
+    by scanning the cache.
+
+    Args:
+        cache (RedisCacheAdapter): The cache
+        execution_id (UUID|str): The execution ID of the workflow
+        config (Config, optional): The configuration. Defaults to walkoff.config.Config
+    """
+    if not config:
+        from walkoff.config import Config
+        config = Config
+    delete_accumulators(cache, execution_id, keyed=uses_keyed_accumulator(config))
+    cache.unlink(app_fields_key(execution_id))
+    make_result_store().delete_execution(execution_id)
+
+
+class ExecutionStateReaper(object):
+    def __init__(self, cache, execution_db, interval=60):
+        """Initializes an ExecutionStateReaper, which deletes the state kept by aborted workflow executions
+
+        Workflows which finish normally delete their own state when they shut down. Workflows which are aborted while
+        paused or awaiting data are never resumed by a worker, so their accumulator, app instance fields, and offloaded
+        results are deleted by the reaper instead.
+
+        The time of the last sweep is kept in the cache, so a restarted server only sweeps the executions aborted since
+        the last sweep of any server. Each sweep overlaps the last by the interval, so aborts which are written late
+        are not missed.
+
+        Args:
+            cache (RedisCacheAdapter): The cache holding the execution state
+            execution_db (ExecutionDatabase): The execution database
+            interval (int, optional): The number of seconds between sweeps. Defaults to 60
+        """
+        self.cache = cache
+        self.execution_db = execution_db
+        self.interval = interval
+        self._exit = threading.Event()
+
+    def run(self):
+        """Sweeps aborted executions every interval until shut down"""
+        logger.info('Starting execution state reaper')
+        while not self._exit.wait(self.interval):
+            try:
+                self.reap()
+            except Exception:
+                logger.exception('Execution state reaper encountered an error')
+
+    def shutdown(self):
+        """Stops the reaper"""
+        self._exit.set()
+
+    @property
+    def last_reaped(self):
+        """(datetime): The time of the last sweep of any reaper, or None if no reaper has swept"""
+        last_reaped = self.cache.get(reaper_watermark_key)
+        return datetime.strptime(last_reaped, watermark_format) if last_reaped is not None else None
+
+    def reap(self):
+        """Deletes the state of every execution aborted since the last sweep
+
+        Returns:
+            (int): The number of executions whose state was deleted
+        """
+        lock = self.cache.lock(reaper_lock_key, timeout=max(self.interval, 1))
+        if not lock.acquire(blocking=False):
+            return 0
+        try:
+            swept_at = datetime.utcnow()
+            query = self.execution_db.session.query(WorkflowStatus.execution_id).filter(
+                WorkflowStatus.status == WorkflowStatusEnum.aborted)
+            last_reaped = self.last_reaped
+            if last_reaped is not None:
+                query = query.filter(WorkflowStatus.completed_at >= last_reaped - timedelta(seconds=self.interval))
+            execution_ids = [execution_id for execution_id, in query]
+            self.execution_db.session.remove()
+            for execution_id in execution_ids:
+                delete_execution_state(self.cache, execution_id)
+            self.cache.set(reaper_watermark_key, swept_at.strftime(watermark_format))
+        finally:
+            lock.release()
+        if execution_ids:
+            logger.debug('Deleted the state of {} aborted workflow executions'.format(len(execution_ids)))
+        return len(execution_ids)
@@ -1,12 +1,14 @@
 import logging
+import time
 
-import gevent
-from confluent_kafka import Consumer, KafkaError
+from confluent_kafka import Consumer, KafkaError, TIMESTAMP_NOT_AVAILABLE
 from flask import Flask
 
+import walkoff.cache
 import walkoff.config
 from walkoff.events import WalkoffEvent
 from walkoff.multiprocessedexecutor.protoconverter import ProtobufWorkflowResultsConverter
+from walkoff.multiprocessedexecutor.receivermetrics import record_receive_lags
 from walkoff.server import context
 
 logger = logging.getLogger(__name__)
@@ -32,37 +34,92 @@ class KafkaWorkflowResultsReceiver(object):
             self.current_app.running_context = context.Context(init_all=False)
         else:
             self.current_app = current_app
+        self.cache = getattr(self.current_app.running_context, 'cache', None)
+        if self.cache is None:
+            self.cache = walkoff.cache.make_cache(walkoff.config.Config.CACHE)
 
     def receive_results(self):
         """Constantly receives data from the Kafka Consumer and handles it accordingly"""
         logger.info('Starting Kafka workflow results receiver')
         self.receiver.subscribe(['{}.*'.format(self.topic)])
+        timeout = self._get_poll_timeout()
         while not self.thread_exit:
-            raw_message = self.receiver.poll(1.0)
-            if raw_message is None:
-                gevent.sleep(0.1)
-                continue
-            if raw_message.error():
-                if raw_message.error().code() == KafkaError._PARTITION_EOF:
-                    gevent.sleep(0.1)
-                    continue
-                else:
-                    logger.error('Received an error in Kafka receiver: {}'.format(raw_message.error()))
-                    gevent.sleep(0.1)
-                    continue
-            with self.current_app.app_context():
-                self._send_callback(raw_message.value())
+            raw_messages = self.receiver.consume(num_messages=walkoff.config.Config.WORKFLOW_RESULTS_BATCH_SIZE,
+                                                 timeout=timeout)
+            if raw_messages:
+                self._receive_batch(raw_messages)
+            self._flush_statuses()
+        self._flush_statuses(force=True)
         self.receiver.close()
         return
 
+    def _receive_batch(self, raw_messages):
+        """Handles a batch of messages taken from the Kafka Consumer and records how long they took to arrive
+
+        Args:
+            raw_messages (list[Message]): The messages
+        """
+        received = 0
+        lags = []
+        with self.current_app.app_context():
+            for raw_message in raw_messages:
+                if raw_message.error():
+                    if raw_message.error().code() != KafkaError._PARTITION_EOF:
+                        logger.error('Received an error in Kafka receiver: {}'.format(raw_message.error()))
+                    continue
+                received_at = time.time()
+                received += 1
+                sent_at = self._send_callback(raw_message.value())
+                if sent_at is None:
+                    timestamp_type, timestamp = raw_message.timestamp()
+                    if timestamp_type != TIMESTAMP_NOT_AVAILABLE:
+                        sent_at = timestamp / 1000.
+                if sent_at is not None:
+                    lags.append(received_at - sent_at)
+        try:
+            record_receive_lags(self.cache, received, lags)
+        except Exception:
+            logger.exception('Could not record the lag of received workflow results')
+
+    @staticmethod
+    def _get_poll_timeout():
+        """Gets how long to wait for results, so buffered status transitions are written when they are due"""
+        timeout = walkoff.config.Config.WORKFLOW_RESULTS_POLL_TIMEOUT
+        if walkoff.config.Config.WORKFLOW_STATUS_FLUSH_INTERVAL > 0:
+            timeout = min(timeout, walkoff.config.Config.WORKFLOW_STATUS_FLUSH_INTERVAL)
+        return timeout
+
+    def _flush_statuses(self, force=False):
+        """Writes the buffered status transitions and latency histograms if they are due
+
+        Args:
+            force (bool, optional): Write them even if they are not due? Defaults to False
+        """
+        running_context = self.current_app.running_context
+        if force:
+            running_context.status_persister.flush(running_context.execution_db)
+            running_context.latency_histograms.flush(running_context.execution_db)
+        else:
+            running_context.status_persister.flush_if_due(running_context.execution_db)
+            running_context.latency_histograms.flush_if_due(running_context.execution_db)
+
     def _send_callback(self, message_bytes):
-        event, sender, data = self.message_converter.to_event_callback(message_bytes)
+        """Triggers the callback of a received result
+
+        Args:
+            message_bytes (str): The result
+
+        Returns:
+            (float): The time the result was sent, or None if it is not known
+        """
+        event, sender, data, sent_at = self.message_converter.to_timed_event_callback(message_bytes)
 
         if sender is not None and event is not None:
             with self.current_app.app_context():
                 event.send(sender, data=data)
             if event in [WalkoffEvent.WorkflowShutdown, WalkoffEvent.WorkflowAborted]:
                 self._increment_execution_count()
+        return sent_at
 
     def _increment_execution_count(self):
         self.workflows_executed += 1
@@ -18,6 +18,8 @@ from walkoff.executiondb import WorkflowStatusEnum
 from walkoff.executiondb.saved_workflow import SavedWorkflow
 from walkoff.executiondb.workflow import Workflow
 from walkoff.executiondb.workflowresults import WorkflowStatus
+from walkoff.multiprocessedexecutor.executionstate import ExecutionStateReaper
+from walkoff.multiprocessedexecutor.requestqueue import RequestQueueReaper, lane_key, get_workflow_priority
 from walkoff.multiprocessedexecutor.threadauthenticator import ThreadAuthenticator
 from walkoff.senders_receivers_helpers import make_results_receiver, make_results_sender, make_communication_sender
 from walkoff.worker.action_exec_strategy import make_execution_strategy
@@ -27,8 +29,14 @@ logger = logging.getLogger(__name__)
 
 
 class MultiprocessedExecutor(object):
-    def __init__(self, cache, config):
+    def __init__(self, cache, config, status_persister=None):
         """Initializes a multiprocessed executor, which will handle the execution of workflows.
+
+        Args:
+            cache (RedisCacheAdapter): The cache
+            config (Config): The configuration
+            status_persister (StatusPersister, optional): The persister buffering the status transitions received by
+                the server. Its transitions are written before the status of a workflow is checked. Defaults to None
         """
         self.threading_is_initialized = False
         self.id = "controller"
@@ -41,10 +49,16 @@ class MultiprocessedExecutor(object):
         self.zmq_workflow_comm = None
         self.receiver = None
         self.receiver_thread = None
+        self.reaper = None
+        self.reaper_thread = None
+        self.execution_state_reaper = None
+        self.execution_state_reaper_thread = None
+        self.app = None
         self.cache = cache
         self.config = config
         self.execution_db = ExecutionDatabase.instance
         self.results_sender = None
+        self.status_persister = status_persister
 
         key = PrivateKey(walkoff.config.Config.SERVER_PRIVATE_KEY[:nacl.bindings.crypto_box_SECRETKEYBYTES])
         worker_key = PrivateKey(
@@ -86,6 +100,20 @@ class MultiprocessedExecutor(object):
             self.receiver_thread = threading.Thread(target=self.receiver.receive_results)
             self.receiver_thread.start()
 
+        if walkoff.config.Config.RELIABLE_WORKFLOW_QUEUE:
+            self.app = app
+            self.reaper = RequestQueueReaper(self.cache, self.__box, self._abort_orphaned_workflow,
+                                             max_redeliveries=walkoff.config.Config.WORKFLOW_MAX_REDELIVERIES,
+                                             interval=walkoff.config.Config.WORKER_HEARTBEAT_INTERVAL)
+            self.reaper_thread = threading.Thread(target=self.reaper.run)
+            self.reaper_thread.start()
+
+        if walkoff.config.Config.EXECUTION_STATE_REAPER_INTERVAL:
+            self.execution_state_reaper = ExecutionStateReaper(
+                self.cache, self.execution_db, interval=walkoff.config.Config.EXECUTION_STATE_REAPER_INTERVAL)
+            self.execution_state_reaper_thread = threading.Thread(target=self.execution_state_reaper.run)
+            self.execution_state_reaper_thread.start()
+
         self.threading_is_initialized = True
         logger.debug('Controller threading initialized')
 
@@ -116,6 +144,12 @@ class MultiprocessedExecutor(object):
         if self.receiver_thread:
             self.receiver.thread_exit = True
             self.receiver_thread.join(timeout=1)
+        if self.reaper_thread:
+            self.reaper.shutdown()
+            self.reaper_thread.join(timeout=1)
+        if self.execution_state_reaper_thread:
+            self.execution_state_reaper.shutdown()
+            self.execution_state_reaper_thread.join(timeout=1)
         self.threading_is_initialized = False
         logger.debug('Controller thread pool shutdown')
 
@@ -132,13 +166,17 @@ class MultiprocessedExecutor(object):
         """Once the threadpool has been shutdown, clear out all of the data structures used in the pool"""
         self.pids = []
         self.receiver_thread = None
+        self.reaper = None
+        self.reaper_thread = None
+        self.execution_state_reaper = None
+        self.execution_state_reaper_thread = None
         self.workflows_executed = 0
         self.threading_is_initialized = False
         self.zmq_workflow_comm = None
         self.receiver = None
 
     def execute_workflow(self, workflow_id, execution_id_in=None, start=None, start_arguments=None, resume=False,
-                         environment_variables=None, user=None):
+                         environment_variables=None, user=None, priority=None):
         """Executes a workflow
 
         Args:
@@ -152,6 +190,8 @@ class MultiprocessedExecutor(object):
                 the workflow. These will not be persistent.
             user (str, Optional): The username of the user who requested that this workflow be executed. Defaults
                 to None.
+            priority (str, optional): The priority lane to queue the workflow in, either 'high', 'normal', or 'low'.
+                Defaults to the priority of the workflow.
 
         Returns:
             (UUID): The execution ID of the Workflow.
@@ -177,18 +217,86 @@ class MultiprocessedExecutor(object):
             data['user'] = user
         self._log_and_send_event(WalkoffEvent.WorkflowExecutionPending, sender=workflow_data, workflow=workflow,
                                  data=data)
+        priority = get_workflow_priority(priority or workflow.priority)
         self.__add_workflow_to_queue(workflow.id, execution_id, start, start_arguments, resume, environment_variables,
-                                     user)
+                                     user, priority)
 
         self._log_and_send_event(WalkoffEvent.SchedulerJobExecuted, data=data)
         return execution_id
 
+    def execute_workflows(self, workflow_id, argument_sets, start=None, environment_variables=None, user=None,
+                          priority=None):
+        """Executes a workflow once for each of a number of sets of starting arguments
+
+        The workflow is loaded once, the statuses of every execution are inserted in one statement, and the requests
+        are pushed onto the request queue in batches. A WorkflowExecutionPending event is sent for each execution once
+        its status is inserted, marked with status_written so that the status is not written again.
+
+        Args:
+            workflow_id (UUID): The ID of the Workflow to be executed.
+            argument_sets (list[list[Argument]]): The arguments to the starting action of each execution.
+            start (UUID, optional): The ID of the first, or starting action. Defaults to None.
+            environment_variables (list[EnvironmentVariable]): Optional list of environment variables to pass into
+                every execution. These will not be persistent.
+            user (str, Optional): The username of the user who requested these executions. Defaults to None.
+            priority (str, optional): The priority lane to queue the executions in, either 'high', 'normal', or 'low'.
+                Defaults to the priority of the workflow.
+
+        Returns:
+            (list[str]): The execution IDs of the Workflow, in the order of the argument sets, or None if the Workflow
+                does not exist
+        """
+        workflow = self.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+        if not workflow:
+            logger.error('Attempted to execute workflow {} which does not exist'.format(workflow_id))
+            return None
+
+        logger.info('User {0} executing workflow {1} (id={2}) {3} times'.format(
+            user, workflow.name, workflow.id, len(argument_sets)))
+
+        execution_ids = [str(uuid.uuid4()) for _ in argument_sets]
+        self.execution_db.session.bulk_insert_mappings(
+            WorkflowStatus,
+            [{'execution_id': execution_id, 'workflow_id': workflow.id, 'name': workflow.name,
+              'status': WorkflowStatusEnum.pending, 'user': user}
+             for execution_id in execution_ids])
+        self.execution_db.session.commit()
+
+        data = {'user': user} if user else {}
+        pending_data = dict(data, status_written=True)
+        for execution_id in execution_ids:
+            workflow_data = {'execution_id': execution_id, 'id': str(workflow.id), 'name': workflow.name}
+            self._log_and_send_event(WalkoffEvent.WorkflowExecutionPending, sender=workflow_data, workflow=workflow,
+                                     data=pending_data)
+
+        priority = get_workflow_priority(priority or workflow.priority)
+        batch_size = walkoff.config.Config.BULK_EXECUTION_BATCH_SIZE
+        for batch_start in range(0, len(execution_ids), batch_size):
+            messages = [
+                self.__box.encrypt(self.results_sender.create_workflow_request_message(
+                    workflow.id, execution_id, start, start_arguments, False, environment_variables, user, priority))
+                for execution_id, start_arguments in zip(execution_ids[batch_start:batch_start + batch_size],
+                                                         argument_sets[batch_start:batch_start + batch_size])]
+            self.cache.lpush(lane_key(priority), *messages)
+
+        for _ in execution_ids:
+            self._log_and_send_event(WalkoffEvent.SchedulerJobExecuted, data=data)
+        return execution_ids
+
     def __add_workflow_to_queue(self, workflow_id, workflow_execution_id, start=None, start_arguments=None,
-                                resume=False, environment_variables=None, user=None):
+                                resume=False, environment_variables=None, user=None, priority=None):
         message = self.results_sender.create_workflow_request_message(workflow_id, workflow_execution_id, start,
                                                                       start_arguments, resume, environment_variables,
-                                                                      user)
-        self.cache.lpush("request_queue", self.__box.encrypt(message))
+                                                                      user, priority)
+        self.cache.lpush(lane_key(priority), self.__box.encrypt(message))
+
+    def _abort_orphaned_workflow(self, workflow_id, execution_id):
+        with self.app.app_context():
+            workflow = self.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+            if workflow is not None:
+                self._log_and_send_event(WalkoffEvent.WorkflowAborted,
+                                         sender={'execution_id': execution_id, 'id': workflow_id,
+                                                 'name': workflow.name}, workflow=workflow)
 
     def pause_workflow(self, execution_id, user=None):
         """Pauses a workflow that is currently executing.
@@ -200,6 +308,7 @@ class MultiprocessedExecutor(object):
             (bool): True if Workflow successfully paused, False otherwise
         """
         logger.info('User {0} pausing workflow {1}'.format(user, execution_id))
+        self._flush_statuses()
         workflow_status = self.execution_db.session.query(WorkflowStatus).filter_by(execution_id=execution_id).first()
         if workflow_status and workflow_status.status == WorkflowStatusEnum.running:
             self.zmq_workflow_comm.pause_workflow(execution_id)
@@ -220,6 +329,7 @@ class MultiprocessedExecutor(object):
             (bool): True if workflow successfully resumed, False otherwise
         """
         logger.info('User {0} resuming workflow {1}'.format(user, execution_id))
+        self._flush_statuses()
         workflow_status = self.execution_db.session.query(WorkflowStatus).filter_by(execution_id=execution_id).first()
 
         if workflow_status and workflow_status.status == WorkflowStatusEnum.paused:
@@ -251,6 +361,7 @@ class MultiprocessedExecutor(object):
             (bool): True if successfully aborted workflow, False otherwise
         """
         logger.info('User {0} aborting workflow {1}'.format(user, execution_id))
+        self._flush_statuses()
         workflow_status = self.execution_db.session.query(WorkflowStatus).filter_by(execution_id=execution_id).first()
 
         if workflow_status:
@@ -348,6 +459,16 @@ class MultiprocessedExecutor(object):
             logger.error("Workflow execution id {} does not exist in WorkflowStatus table.").format(execution_id)
             return 0
 
+    def _flush_statuses(self):
+        """Writes the status transitions buffered by this process before the status of a workflow is read
+
+        With a separate receiver, the transitions are buffered by the receiver process instead. The transitions which
+        start, pause, suspend, and end workflows, which are the ones read here, are written as soon as they are
+        received in either case.
+        """
+        if self.status_persister is not None:
+            self.status_persister.flush(self.execution_db)
+
     def _log_and_send_event(self, event, sender=None, data=None, workflow=None):
         sender = sender or self
         self.results_sender.handle_event(workflow, sender, event=event, data=data)
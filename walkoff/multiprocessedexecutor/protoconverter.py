@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 from collections import namedtuple
 
 from enum import Enum
@@ -65,6 +66,7 @@ class ProtobufWorkflowResultsConverter(object):
         elif event == WalkoffEvent.WorkerReady:
             packet.type = Message.WORKERPACKET
             packet.worker_packet.id = sender['id']
+        packet.sent_at = time.time()
         packet_bytes = packet.SerializeToString()
         return packet_bytes
 
@@ -241,7 +243,20 @@ class ProtobufWorkflowResultsConverter(object):
     def to_event_callback(message_bytes):
         """Converts a message to an event callback message
         """
+        event, sender, data, _ = ProtobufWorkflowResultsConverter.to_timed_event_callback(message_bytes)
+        return event, sender, data
 
+    @staticmethod
+    def to_timed_event_callback(message_bytes):
+        """Converts a message to an event callback message and the time it was sent
+
+        Args:
+            message_bytes (str): The message
+
+        Returns:
+            (tuple): The event, sender, and data of the callback, and the time the message was sent in seconds since
+                the epoch, or None if the sender did not record it
+        """
         message_outer = Message()
         message_outer.ParseFromString(message_bytes)
         callback_name = message_outer.event_name
@@ -262,13 +277,14 @@ class ProtobufWorkflowResultsConverter(object):
             sender = MessageToDict(message.sender, preserving_proto_field_name=True)
         elif hasattr(message, "workflow"):
             sender = MessageToDict(message.workflow, preserving_proto_field_name=True)
+        sent_at = message_outer.sent_at if message_outer.HasField('sent_at') else None
         event = WalkoffEvent.get_event_from_name(callback_name)
         if event is not None:
             data = ProtobufWorkflowResultsConverter._format_callback_data(event, message, sender)
-            return event, sender, data
+            return event, sender, data, sent_at
         else:
             logger.error('Unknown callback {} sent'.format(callback_name))
-            return None, None, None
+            return None, None, None, sent_at
 
     @staticmethod
     def _format_callback_data(event, message, sender=None):
@@ -306,13 +322,14 @@ class ProtobufWorkflowResultsConverter(object):
 
     @staticmethod
     def create_workflow_request_message(workflow_id, workflow_execution_id, start=None, start_arguments=None,
-                                        resume=False, environment_variables=None, user=None):
+                                        resume=False, environment_variables=None, user=None, priority=None):
         """Creates a workflow request message to be placed on the redis queue
         """
         message = ExecuteWorkflowMessage()
         message.workflow_id = str(workflow_id)
         message.workflow_execution_id = workflow_execution_id
         message.resume = resume
+        message.enqueued_at = time.time()
 
         if start:
             message.start = str(start)
@@ -322,6 +339,8 @@ class ProtobufWorkflowResultsConverter(object):
             ProtobufWorkflowResultsConverter.add_env_vars_to_proto(message, environment_variables)
         if user:
             message.user = user
+        if priority:
+            message.priority = priority
         return message.SerializeToString()
 
 
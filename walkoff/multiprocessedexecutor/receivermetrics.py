@@ -0,0 +1,52 @@
+from walkoff.pipelinemetrics import pipeline_metrics
+
+received_key = 'results_receiver:received'
+wakeups_key = 'results_receiver:wakeups'
+timed_key = 'results_receiver:timed'
+lag_key = 'results_receiver:lag_ms'
+last_lag_key = 'results_receiver:last_lag_ms'
+
+
+def record_receive_lags(cache, received, lags):
+    """Records a batch of workflow results taken by the results receiver when it woke up, in one round trip to the
+        cache
+
+    Args:
+        cache (RedisCacheAdapter): The cache
+        received (int): The number of results received
+        lags (list[float]): The number of seconds between each result which recorded when it was sent being sent and
+            being received
+    """
+    increments = {wakeups_key: 1}
+    values = {}
+    if received:
+        increments[received_key] = received
+    for lag in lags:
+        pipeline_metrics.observe('walkoff_results_receive_lag_seconds', lag)
+    if lags:
+        lags_ms = [max(int(lag * 1000), 0) for lag in lags]
+        increments[timed_key] = len(lags_ms)
+        increments[lag_key] = sum(lags_ms)
+        values[last_lag_key] = max(lags_ms)
+    cache.incr_multiple(increments, values)
+
+
+def get_receiver_metrics(cache):
+    """Gets how many results the results receiver received and how long they took to arrive
+
+    Args:
+        cache (RedisCacheAdapter): The cache
+
+    Returns:
+        (dict): The metrics of the results receiver
+    """
+    received = int(cache.get(received_key) or 0)
+    wakeups = int(cache.get(wakeups_key) or 0)
+    timed = int(cache.get(timed_key) or 0)
+    lag = int(cache.get(lag_key) or 0)
+    return {
+        'received': received,
+        'wakeups': wakeups,
+        'average_batch_size': float(received) / wakeups if wakeups else 0.,
+        'average_lag_ms': float(lag) / timed if timed else 0.,
+        'last_batch_max_lag_ms': int(cache.get(last_lag_key) or 0)}
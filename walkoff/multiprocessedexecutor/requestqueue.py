@@ -0,0 +1,288 @@
+import logging
+import os
+import socket
+import threading
+
+from google.protobuf.message import DecodeError
+from nacl.exceptions import CryptoError
+
+from walkoff.executiondb.constants import workflow_priorities, default_workflow_priority
+from walkoff.pipelinemetrics import pipeline_metrics
+from walkoff.proto.build.data_pb2 import ExecuteWorkflowMessage
+
+logger = logging.getLogger(__name__)
+
+request_queue_key = 'request_queue'
+"""(str): The key of the list which normal priority workflow execution requests are pushed to
+"""
+
+in_flight_key_prefix = 'request_queue:in_flight'
+heartbeat_key_prefix = 'request_queue:heartbeat'
+redeliveries_key_prefix = 'request_queue:redeliveries'
+reaper_lock_key = 'request_queue:reaper'
+wait_count_key_prefix = 'request_queue:wait_count'
+wait_time_key_prefix = 'request_queue:wait_ms'
+
+
+def get_workflow_priority(priority):
+    """Gets the priority lane a workflow execution request belongs in
+
+    Args:
+        priority (str): The requested priority. May be None
+
+    Returns:
+        (str): The priority, or the default priority if it is not set or is not a known priority
+    """
+    if priority in workflow_priorities:
+        return priority
+    if priority:
+        logger.warning('Unknown workflow priority {0}. Using {1} priority'.format(priority, default_workflow_priority))
+    return default_workflow_priority
+
+
+def lane_key(priority):
+    """Gets the key of the list which workflow execution requests of a priority are pushed to
+
+    The normal priority lane is the original request queue, so requests queued before priorities existed are still
+    received.
+
+    Args:
+        priority (str): The priority of the request
+
+    Returns:
+        (str): The key of the lane
+    """
+    priority = get_workflow_priority(priority)
+    if priority == default_workflow_priority:
+        return request_queue_key
+    return '{0}:{1}'.format(request_queue_key, priority)
+
+
+def record_wait_times(cache, wait_times):
+    """Records how long received workflow execution requests waited in their lanes, in one round trip to the cache
+
+    Args:
+        cache (RedisCacheAdapter): The cache holding the request queue
+        wait_times (list[tuple(str, float)]): The priority of each request and the number of seconds it waited
+    """
+    increments = {}
+    for priority, wait_time in wait_times:
+        pipeline_metrics.observe('walkoff_request_queue_wait_seconds', wait_time, priority)
+        count_key = '{0}:{1}'.format(wait_count_key_prefix, priority)
+        time_key = '{0}:{1}'.format(wait_time_key_prefix, priority)
+        increments[count_key] = increments.get(count_key, 0) + 1
+        increments[time_key] = increments.get(time_key, 0) + max(int(wait_time * 1000), 0)
+    cache.incr_multiple(increments)
+
+
+def get_queue_depth(cache):
+    """Gets the number of workflow execution requests waiting in all of the priority lanes
+
+    Args:
+        cache (RedisCacheAdapter): The cache holding the request queue
+
+    Returns:
+        (int): The number of waiting requests
+    """
+    return sum(cache.llen(lane_key(priority)) for priority in workflow_priorities)
+
+
+def get_queue_metrics(cache):
+    """Gets the depth of each priority lane and the average time received requests waited in it
+
+    Args:
+        cache (RedisCacheAdapter): The cache holding the request queue
+
+    Returns:
+        (dict): The metrics of each lane, keyed by priority
+    """
+    metrics = {}
+    for priority in workflow_priorities:
+        count = int(cache.get('{0}:{1}'.format(wait_count_key_prefix, priority)) or 0)
+        total = int(cache.get('{0}:{1}'.format(wait_time_key_prefix, priority)) or 0)
+        metrics[priority] = {
+            'depth': cache.llen(lane_key(priority)),
+            'received': count,
+            'average_wait_ms': float(total) / count if count else 0.}
+    return metrics
+
+
+class LaneScheduler(object):
+    def __init__(self, scheduling='weighted', weights=None):
+        """Initializes a LaneScheduler, which decides the order in which the priority lanes are read
+
+        Args:
+            scheduling (str, optional): Either 'strict', in which lanes are always read highest priority first, or
+                'weighted', in which each lane is read first in proportion to its weight. Defaults to 'weighted'
+            weights (dict, optional): The weight of each priority for 'weighted' scheduling. Priorities without a
+                weight are never read first
+        """
+        if scheduling not in ('strict', 'weighted'):
+            logger.error('Unknown workflow queue scheduling {}. Using weighted scheduling'.format(scheduling))
+            scheduling = 'weighted'
+        self.scheduling = scheduling
+        self.weights = {priority: max((weights or {}).get(priority, 0), 0) for priority in workflow_priorities}
+        self._current_weights = {priority: 0 for priority in workflow_priorities}
+        if self.scheduling == 'weighted' and not any(self.weights.values()):
+            logger.error('No workflow queue weights are set. Using strict scheduling')
+            self.scheduling = 'strict'
+
+    def next_order(self):
+        """Gets the order in which to read the lanes for the next receive
+
+        Weighted scheduling uses smooth weighted round robin to pick the first lane, so that over any run of receives
+        each lane is read first in proportion to its weight. The remaining lanes follow in priority order.
+
+        Returns:
+            (list[str]): The keys of the lanes in the order to read them
+        """
+        if self.scheduling == 'strict':
+            return [lane_key(priority) for priority in workflow_priorities]
+        total = 0
+        for priority, weight in self.weights.items():
+            self._current_weights[priority] += weight
+            total += weight
+        first = max(workflow_priorities, key=lambda priority: self._current_weights[priority])
+        self._current_weights[first] -= total
+        return [lane_key(first)] + [lane_key(priority) for priority in workflow_priorities if priority != first]
+
+
+def make_worker_queue_id():
+    """Makes an ID for a worker process which is unique across hosts
+
+    Returns:
+        (str): The ID of this process
+    """
+    return '{0}-{1}'.format(socket.gethostname(), os.getpid())
+
+
+def in_flight_key(worker_id):
+    """Gets the key of the list holding the requests a worker has taken but not yet finished
+
+    Args:
+        worker_id (str): The queue ID of the worker
+
+    Returns:
+        (str): The key of the in-flight list
+    """
+    return '{0}:{1}'.format(in_flight_key_prefix, worker_id)
+
+
+def heartbeat_key(worker_id):
+    """Gets the key which a worker refreshes while it is alive
+
+    Args:
+        worker_id (str): The queue ID of the worker
+
+    Returns:
+        (str): The key of the heartbeat
+    """
+    return '{0}:{1}'.format(heartbeat_key_prefix, worker_id)
+
+
+def redeliveries_key(execution_id):
+    """Gets the key counting how many times a workflow execution request has been redelivered
+
+    Args:
+        execution_id (str): The execution ID of the workflow
+
+    Returns:
+        (str): The key of the counter
+    """
+    return '{0}:{1}'.format(redeliveries_key_prefix, execution_id)
+
+
+class RequestQueueReaper(object):
+    def __init__(self, cache, box, abort_callback, max_redeliveries=3, interval=5):
+        """Initializes a RequestQueueReaper, which returns the requests held by dead workers to the request queue
+
+        A worker is considered dead once its heartbeat key has expired. Each request in its in-flight list is pushed
+        back onto the request queue, unless it has already been redelivered more than max_redeliveries times, in which
+        case the abort_callback is called for it instead.
+
+        Args:
+            cache (RedisCacheAdapter): The cache holding the request queue
+            box (Box): The NaCl Box used to encrypt the requests
+            abort_callback (func(str, str)): Called with the workflow ID and execution ID of each request which will
+                not be redelivered
+            max_redeliveries (int, optional): The maximum number of times to redeliver a request. Defaults to 3
+            interval (int, optional): The number of seconds between checks for dead workers. Defaults to 5
+        """
+        self.cache = cache
+        self.box = box
+        self.abort_callback = abort_callback
+        self.max_redeliveries = max_redeliveries
+        self.interval = interval
+        self._exit = threading.Event()
+
+    def run(self):
+        """Checks for dead workers every interval until shut down"""
+        logger.info('Starting request queue reaper')
+        while not self._exit.wait(self.interval):
+            try:
+                self.reap()
+            except Exception:
+                logger.exception('Request queue reaper encountered an error')
+
+    def shutdown(self):
+        """Stops the reaper"""
+        self._exit.set()
+
+    def reap(self):
+        """Returns the requests of all dead workers to the request queue
+
+        Returns:
+            (tuple(int, int)): The number of requests redelivered and the number of requests aborted
+        """
+        lock = self.cache.lock(reaper_lock_key, timeout=max(self.interval, 1))
+        if not lock.acquire(blocking=False):
+            return 0, 0
+        redelivered = aborted = 0
+        try:
+            prefix_length = len(in_flight_key_prefix) + 1
+            for key in list(self.cache.scan('{}:*'.format(in_flight_key_prefix))):
+                worker_id = key[prefix_length:]
+                if self.cache.exists(heartbeat_key(worker_id)):
+                    continue
+                logger.warning('Worker {} stopped sending heartbeats. Reclaiming its workflows'.format(worker_id))
+                worker_redelivered, worker_aborted = self._reclaim(key)
+                redelivered += worker_redelivered
+                aborted += worker_aborted
+        finally:
+            lock.release()
+        return redelivered, aborted
+
+    def _reclaim(self, key):
+        redelivered = aborted = 0
+        while True:
+            message = self.cache.lindex(key, -1)
+            if message is None:
+                break
+            request = self._decode(message)
+            if request is None:
+                self.cache.lrem(key, message, count=-1)
+                continue
+            redeliveries = self.cache.incr(redeliveries_key(request.workflow_execution_id))
+            if redeliveries > self.max_redeliveries:
+                logger.error('Workflow execution {0} was orphaned {1} times. Aborting it'.format(
+                    request.workflow_execution_id, redeliveries))
+                self.cache.lrem(key, message, count=-1)
+                self.cache.delete(redeliveries_key(request.workflow_execution_id))
+                self.abort_callback(request.workflow_id, request.workflow_execution_id)
+                aborted += 1
+            else:
+                logger.info('Redelivering orphaned workflow execution {}'.format(request.workflow_execution_id))
+                self.cache.rpoplpush(key, lane_key(request.priority))
+                redelivered += 1
+        return redelivered, aborted
+
+    def _decode(self, message):
+        if not isinstance(message, bytes):
+            message = message.encode('utf-8')
+        try:
+            request = ExecuteWorkflowMessage()
+            request.ParseFromString(self.box.decrypt(message))
+        except (CryptoError, DecodeError):
+            logger.error('Request queue reaper could not decode an orphaned workflow message. Dropping it')
+            return None
+        return request
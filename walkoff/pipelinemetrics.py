@@ -0,0 +1,285 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from bisect import bisect_left
+
+logger = logging.getLogger(__name__)
+
+histogram_key_prefix = 'pipeline_metrics:histogram'
+gauge_key_prefix = 'pipeline_metrics:gauges'
+
+histogram_buckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1., 2.5, 5., 10., 30., 60., 300.)
+"""(tuple(float)): The upper bounds, in seconds, of the buckets of the histograms of the pipeline. Latencies above the
+    last bound fall in the +Inf bucket
+"""
+
+histograms = {
+    'walkoff_request_queue_wait_seconds': (
+        'Seconds workflow execution requests waited in the request queue before a worker started them',
+        ('priority',)),
+    'walkoff_action_execution_seconds': ('Execution time of app actions', ('app', 'action', 'status')),
+    'walkoff_accumulator_operation_seconds': (
+        'Latency of the cache operations of accumulators', ('accumulator', 'operation')),
+    'walkoff_results_receive_lag_seconds': (
+        'Seconds between a worker sending a workflow result and the server receiving it', ()),
+    'walkoff_status_flush_seconds': (
+        'Time taken to write a batch of status transitions to the execution database', ())
+}
+"""(dict{str: tuple(str, tuple(str))}): The description and label names of each histogram, by name
+"""
+
+gauges = {
+    'walkoff_worker_threads': ('Workflow slots of each worker process', ('worker', 'state'))
+}
+"""(dict{str: tuple(str, tuple(str))}): The description and label names of each gauge, by name
+"""
+
+
+def histogram_key(name):
+    """Gets the key of the hash a histogram is kept in
+
+    Args:
+        name (str): The name of the histogram
+
+    Returns:
+        (str): The key of the histogram
+    """
+    return '{0}:{1}'.format(histogram_key_prefix, name)
+
+
+class PipelineMetrics(object):
+    def __init__(self):
+        """Initializes a PipelineMetrics, which records the metrics of the workflow execution pipeline in a process
+
+        Observations are held in memory and added to the metrics in the cache periodically, so the metrics of every
+        server and worker process are aggregated in the cache no matter where the processes run. Nothing is recorded
+        until the metrics are started.
+        """
+        self.cache = None
+        self.flush_interval = None
+        self.process_id = '{0}:{1}'.format(socket.gethostname(), os.getpid())
+        self._histograms = {}
+        self._gauges = {}
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def enabled(self):
+        """(bool): Are observations being recorded?"""
+        return self.cache is not None
+
+    def start(self, cache, flush_interval=5):
+        """Starts recording observations, and writes them to the cache every flush_interval seconds
+
+        Args:
+            cache (RedisCacheAdapter): The cache
+            flush_interval (float, optional): The number of seconds observations are held in memory. Set to 0 to not
+                record observations at all. Defaults to 5
+        """
+        if not flush_interval or self._thread is not None:
+            return
+        self.process_id = '{0}:{1}'.format(socket.gethostname(), os.getpid())
+        self.flush_interval = flush_interval
+        self.cache = cache
+        self._thread = threading.Thread(target=self._flush_periodically)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def add_callback(self, callback):
+        """Adds a function called before each flush, which sets the gauges of the process
+
+        Args:
+            callback (func): The function. It is called with no arguments
+        """
+        self._callbacks.append(callback)
+
+    def observe(self, name, seconds, *labels):
+        """Records an observation of a histogram
+
+        Args:
+            name (str): The name of the histogram
+            seconds (float): The observed latency in seconds
+            *labels (str): The values of the labels of the histogram
+        """
+        if not self.enabled:
+            return
+        seconds = max(seconds, 0.)
+        key = (name, tuple(str(label) for label in labels))
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = [[0] * (len(histogram_buckets) + 1), 0., 0]
+            buckets, _, _ = histogram = self._histograms[key]
+            buckets[bisect_left(histogram_buckets, seconds)] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+
+    def time(self, name, *labels):
+        """Gets a context manager which records the time taken by its block as an observation of a histogram
+
+        Args:
+            name (str): The name of the histogram
+            *labels (str): The values of the labels of the histogram
+
+        Returns:
+            (Timer): The context manager
+        """
+        return Timer(self, name, labels)
+
+    def set_gauge(self, name, value, *labels):
+        """Sets a gauge of this process
+
+        Args:
+            name (str): The name of the gauge
+            value (float): The value of the gauge
+            *labels (str): The values of the labels of the gauge
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[(name, tuple(str(label) for label in labels))] = value
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Could not write the pipeline metrics to the cache')
+
+    def flush(self):
+        """Adds the observations held in memory to the metrics in the cache, and writes the gauges of this process"""
+        if not self.enabled:
+            return
+        for callback in self._callbacks:
+            callback()
+        with self._lock:
+            held, self._histograms = self._histograms, {}
+            gauge_values = dict(self._gauges)
+        increments = {}
+        for (name, labels), (buckets, total, count) in held.items():
+            mapping = increments.setdefault(name, {})
+            for index, bucket_count in enumerate(buckets):
+                if bucket_count:
+                    mapping[_field(labels, index)] = bucket_count
+            mapping[_field(labels, 'sum')] = total
+            mapping[_field(labels, 'count')] = count
+        for name, mapping in increments.items():
+            self.cache.hincrbyfloat_multiple(histogram_key(name), mapping)
+        if gauge_values:
+            mapping = {_field((name,) + labels): value for (name, labels), value in gauge_values.items()}
+            self.cache.hset_multiple('{0}:{1}'.format(gauge_key_prefix, self.process_id), mapping,
+                                     expire=int(self.flush_interval * 3000))
+
+
+class Timer(object):
+    def __init__(self, metrics, name, labels):
+        """Initializes a Timer, a context manager which observes the time taken by its block in a histogram
+
+        Args:
+            metrics (PipelineMetrics): The metrics the histogram is recorded in
+            name (str): The name of the histogram
+            labels (tuple(str)): The values of the labels of the histogram
+        """
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.metrics.observe(self.name, time.time() - self._start, *self.labels)
+
+
+class TimedCache(object):
+    def __init__(self, cache, name, *labels):
+        """Initializes a TimedCache, which records the latency of each operation on a cache
+
+        Operations which return iterators are timed until the iterator is returned, not until it is exhausted.
+
+        Args:
+            cache (RedisCacheAdapter): The cache
+            name (str): The name of the histogram the latencies are observed in. Its last label is the operation
+            *labels (str): The values of the other labels of the histogram
+        """
+        self.cache = cache
+        self.name = name
+        self.labels = labels
+
+    def __getattr__(self, item):
+        attribute = getattr(self.cache, item)
+        if not callable(attribute):
+            return attribute
+
+        def timed(*args, **kwargs):
+            with pipeline_metrics.time(self.name, *(self.labels + (item,))):
+                return attribute(*args, **kwargs)
+
+        return timed
+
+
+def _field(labels, suffix=None):
+    return json.dumps(list(labels) + [suffix] if suffix is not None else list(labels))
+
+
+def get_histograms(cache):
+    """Gets the histograms of the pipeline aggregated from every process
+
+    Args:
+        cache (RedisCacheAdapter): The cache
+
+    Returns:
+        (dict{str: dict{tuple: dict}}): The cumulative count of each bucket, the sum, and the count of each histogram,
+            by the values of its labels, by the name of the histogram
+    """
+    aggregated = {}
+    for name in histograms:
+        by_labels = {}
+        for field, value in cache.hgetall(histogram_key(name)).items():
+            values = json.loads(field)
+            labels, suffix = tuple(values[:-1]), values[-1]
+            histogram = by_labels.setdefault(labels, {'buckets': [0] * (len(histogram_buckets) + 1),
+                                                      'sum': 0., 'count': 0})
+            if suffix == 'sum':
+                histogram['sum'] = float(value)
+            elif suffix == 'count':
+                histogram['count'] = int(float(value))
+            else:
+                histogram['buckets'][suffix] = int(float(value))
+        for histogram in by_labels.values():
+            cumulative = 0
+            for index, count in enumerate(histogram['buckets']):
+                cumulative += count
+                histogram['buckets'][index] = cumulative
+        aggregated[name] = by_labels
+    return aggregated
+
+
+def get_gauges(cache):
+    """Gets the gauges of the pipeline of every live process
+
+    Gauges of processes which stopped writing them expire after three of their flush intervals
+
+    Args:
+        cache (RedisCacheAdapter): The cache
+
+    Returns:
+        (dict{str: dict{tuple: float}}): The value of each gauge, by the values of its labels, by the name of the gauge
+    """
+    aggregated = {name: {} for name in gauges}
+    for key in cache.scan('{}:*'.format(gauge_key_prefix)):
+        for field, value in cache.hgetall(key).items():
+            values = json.loads(field)
+            name, labels = values[0], tuple(values[1:])
+            if name in aggregated:
+                aggregated[name][labels] = aggregated[name].get(labels, 0.) + float(value)
+    return aggregated
+
+
+pipeline_metrics = PipelineMetrics()
@@ -79,7 +79,7 @@ class Scheduler(object):
         self.id = 'controller'
         self.app = None
 
-    def schedule_workflows(self, task_id, executable, workflow_ids, trigger):
+    def schedule_workflows(self, task_id, executable, workflow_ids, trigger, priority=None):
         """
         Schedules a workflow for execution
 
@@ -88,14 +88,17 @@ class Scheduler(object):
             executable (func): A callable to execute must take in one argument -- a workflow id
             workflow_ids (iterable(str)): An iterable of workflow ids
             trigger (Trigger): The trigger to use for this scheduled task
+            priority (str, optional): The priority to execute the workflows with. If given, it is passed to the
+                executable as the priority keyword argument. Defaults to None
         """
 
-        def execute(id_):
+        def execute(id_, **kwargs):
             with self.app.app_context():
-                executable(id_)
+                executable(id_, **kwargs)
 
+        kwargs = {'priority': priority} if priority else {}
         for workflow_id in workflow_ids:
-            self.scheduler.add_job(execute, args=(workflow_id,),
+            self.scheduler.add_job(execute, args=(workflow_id,), kwargs=kwargs,
                                    id=construct_task_id(task_id, workflow_id),
                                    trigger=trigger, replace_existing=True)
 
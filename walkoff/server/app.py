@@ -15,6 +15,7 @@ from walkoff.extensions import db, jwt
 from walkoff.helpers import import_submodules
 from walkoff.server import context
 from walkoff.server.blueprints import custominterface, workflowresults, notifications, console, root
+from walkoff.worker.event_filter import publish_subscribed_events
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +72,11 @@ def __register_all_app_blueprints(flaskapp, main_app=False):
         else:
             __register_app_blueprints(flaskapp, interface_name, interface_blueprints)
 
+    try:
+        publish_subscribed_events(flaskapp.running_context.cache, interfaces.dispatcher.get_subscribed_events())
+    except Exception:
+        logger.exception('Could not publish the events interfaces handle to the workers')
+
 
 def register_swagger_blueprint(flaskapp):
     # register swagger API docs location
@@ -7,6 +7,8 @@ import walkoff.cache
 import walkoff.config
 import walkoff.executiondb
 import walkoff.scheduler
+from walkoff.server.latencyhistograms import LatencyHistograms
+from walkoff.server.statuspersister import StatusPersister
 
 logger = logging.getLogger(__name__)
 
@@ -31,11 +33,19 @@ class Context(object):
                              "correct and try again. Error Message: {}".format(str(e)))
             os._exit(1)
 
+        self.latency_histograms = LatencyHistograms(walkoff.config.Config.METRICS_HISTOGRAM_INTERVAL,
+                                                    walkoff.config.Config.METRICS_FLUSH_INTERVAL,
+                                                    max(walkoff.config.Config.METRICS_LATENCY_WINDOWS or [0]))
+        self.status_persister = StatusPersister(walkoff.config.Config.WORKFLOW_STATUS_FLUSH_SIZE,
+                                                walkoff.config.Config.WORKFLOW_STATUS_FLUSH_INTERVAL,
+                                                latency_histograms=self.latency_histograms)
+
         if init_all:
             self.cache = walkoff.cache.make_cache(walkoff.config.Config.CACHE)
             if executor:
                 import walkoff.multiprocessedexecutor.multiprocessedexecutor as executor
-                self.executor = executor.MultiprocessedExecutor(self.cache, walkoff.config.Config)
+                self.executor = executor.MultiprocessedExecutor(self.cache, walkoff.config.Config,
+                                                                status_persister=self.status_persister)
                 self.scheduler = walkoff.scheduler.Scheduler()
 
     def inject_app(self, app):
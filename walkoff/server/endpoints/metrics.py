@@ -1,9 +1,14 @@
 from flask import current_app
 from flask_jwt_extended import jwt_required
 
+import walkoff.config
 from walkoff.executiondb.metrics import AppMetric, WorkflowMetric
+from walkoff.multiprocessedexecutor.receivermetrics import get_receiver_metrics
+from walkoff.multiprocessedexecutor.requestqueue import get_queue_metrics
 from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
+from walkoff.server.latencyhistograms import get_latency_summaries
 from walkoff.server.returncodes import *
+from walkoff.worker.supervisor import get_worker_pool_metrics
 
 
 def read_app_metrics():
@@ -24,11 +29,43 @@ def read_workflow_metrics():
     return __func()
 
 
+def read_queue_metrics():
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('metrics', ['read']))
+    def __func():
+        return get_queue_metrics(current_app.running_context.cache), SUCCESS
+
+    return __func()
+
+
+def read_worker_pool_metrics():
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('metrics', ['read']))
+    def __func():
+        return get_worker_pool_metrics(current_app.running_context.cache), SUCCESS
+
+    return __func()
+
+
+def read_results_receiver_metrics():
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('metrics', ['read']))
+    def __func():
+        return get_receiver_metrics(current_app.running_context.cache), SUCCESS
+
+    return __func()
+
+
 def _convert_action_time_averages():
-    app_metrics = current_app.running_context.execution_db.session.query(AppMetric).all()
-    return {"apps": [app_metric.as_json() for app_metric in app_metrics]}
+    session = current_app.running_context.execution_db.session
+    latencies = get_latency_summaries(session, 'action', walkoff.config.Config.METRICS_LATENCY_WINDOWS)
+    app_metrics = session.query(AppMetric).all()
+    return {"apps": [app_metric.as_json(latencies) for app_metric in app_metrics]}
 
 
 def _convert_workflow_time_averages():
-    workflow_metrics = current_app.running_context.execution_db.session.query(WorkflowMetric).all()
-    return {"workflows": [workflow.as_json() for workflow in workflow_metrics]}
+    session = current_app.running_context.execution_db.session
+    latencies = get_latency_summaries(session, 'workflow', walkoff.config.Config.METRICS_LATENCY_WINDOWS)
+    workflow_metrics = session.query(WorkflowMetric).all()
+    return {"workflows": [workflow.as_json(latencies.get(None, workflow.workflow_id, None))
+                          for workflow in workflow_metrics]}
@@ -18,6 +18,7 @@ from walkoff.security import permissions_accepted_for_resources, ResourcePermiss
 from walkoff.server.decorators import with_resource_factory, validate_resource_exists_factory, is_valid_uid
 from walkoff.server.problem import Problem
 from walkoff.server.returncodes import *
+from walkoff.worker.execution_plan import publish_plan_invalidation
 
 playbook_schema = PlaybookSchema()
 workflow_schema = WorkflowSchema()
@@ -177,8 +178,10 @@ def delete_playbook(playbook_id):
     @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['delete']))
     @with_playbook('delete', playbook_id)
     def __func(playbook):
+        workflow_ids = [workflow.id for workflow in playbook.workflows]
         current_app.running_context.execution_db.session.delete(playbook)
         current_app.running_context.execution_db.session.commit()
+        publish_plan_invalidation(current_app.running_context.cache, workflow_ids)
         current_app.logger.info('Deleted playbook {0} '.format(playbook_id))
         return None, NO_CONTENT
 
@@ -315,6 +318,7 @@ def update_workflow():
             current_app.logger.error('Could not update workflow {}. Unique constraint failed'.format(workflow_id))
             return unique_constraint_problem('workflow', 'update', workflow_id)
 
+        publish_plan_invalidation(current_app.running_context.cache, [workflow_id])
         current_app.logger.info('Updated workflow {0}'.format(workflow_id))
         return workflow_schema.dump(workflow), SUCCESS
 
@@ -337,6 +341,7 @@ def delete_workflow(workflow_id):
             current_app.running_context.execution_db.session.delete(playbook)
 
         current_app.running_context.execution_db.session.commit()
+        publish_plan_invalidation(current_app.running_context.cache, [workflow_id])
 
         current_app.logger.info('Deleted workflow {0}'.format(workflow_id))
         return None, NO_CONTENT
@@ -75,6 +75,13 @@ def get_workflow_status(execution_id):
     return __func()
 
 
+def make_arguments(args):
+    arguments = [Argument(**arg) for arg in args]
+    errors = ['Errors in argument {}: {}'.format(argument.name, argument.errors)
+              for argument in arguments if argument.errors]
+    return arguments, errors
+
+
 def execute_workflow():
     data = request.get_json()
     workflow_id = data['workflow_id']
@@ -95,11 +102,7 @@ def execute_workflow():
 
         arguments = []
         if args:
-            errors = []
-            arguments = [Argument(**arg) for arg in args]
-            for argument in arguments:
-                if argument.errors:
-                    errors.append('Errors in argument {}: {}'.format(argument.name, argument.errors))
+            arguments, errors = make_arguments(args)
             if errors:
                 current_app.logger.error('Could not execute workflow. Invalid Argument construction')
                 return Problem(
@@ -111,13 +114,53 @@ def execute_workflow():
                                                                              start_arguments=arguments,
                                                                              environment_variables=env_var_objs,
                                                                              user=get_jwt_claims().get('username',
-                                                                                                       None))
+                                                                                                       None),
+                                                                             priority=data.get('priority', None))
         current_app.logger.info('Executed workflow {0}'.format(workflow_id))
         return {'id': execution_id}, SUCCESS_ASYNC
 
     return __func()
 
 
+def execute_workflows():
+    data = request.get_json()
+    workflow_id = data['workflow_id']
+
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['execute']))
+    @with_workflow('execute', workflow_id)
+    def __func(workflow):
+        if not workflow.is_valid:
+            return Problem(INVALID_INPUT_ERROR, 'Cannot execute workflow', 'Workflow is invalid')
+        start = data['start'] if 'start' in data else None
+        env_vars = data['environment_variables'] if 'environment_variables' in data else None
+
+        env_var_objs = []
+        if env_vars:
+            env_var_objs = [EnvironmentVariable(**env_var) for env_var in env_vars]
+
+        argument_sets = []
+        errors = []
+        for i, args in enumerate(data['argument_sets']):
+            arguments, argument_errors = make_arguments(args)
+            argument_sets.append(arguments)
+            errors.extend('Execution {}: {}'.format(i, error) for error in argument_errors)
+        if errors:
+            current_app.logger.error('Could not execute workflow. Invalid Argument construction')
+            return Problem(
+                INVALID_INPUT_ERROR,
+                'Cannot execute workflow.',
+                'Some arguments are invalid. Reason: {}'.format(errors))
+
+        execution_ids = current_app.running_context.executor.execute_workflows(
+            workflow_id, argument_sets, start=start, environment_variables=env_var_objs,
+            user=get_jwt_claims().get('username', None), priority=data.get('priority', None))
+        current_app.logger.info('Executed workflow {0} {1} times'.format(workflow_id, len(execution_ids)))
+        return {'ids': execution_ids}, SUCCESS_ASYNC
+
+    return __func()
+
+
 def control_workflow():
     data = request.get_json()
     execution_id = data['execution_id']
@@ -0,0 +1,291 @@
+import json
+import logging
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from walkoff.executiondb.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+bucket_bounds = tuple(0.001 * 2 ** (index / 4.) for index in range(121))
+"""(tuple(float)): The upper bounds, in seconds, of the buckets of a Histogram. Bounds grow by a factor of 2^(1/4) from
+    one millisecond to about twelve days, so a percentile is at most 19% above the latency it estimates. Latencies above
+    the last bound fall in an overflow bucket
+"""
+
+epoch = datetime(1970, 1, 1)
+
+percentiles = (('p50', 0.5), ('p95', 0.95), ('p99', 0.99))
+
+
+class Histogram(object):
+    def __init__(self, buckets=None, count=0, total=0., max=0.):
+        """Initializes a Histogram, which counts latencies in buckets with fixed bounds
+
+        Args:
+            buckets (dict{int: int}, optional): The number of latencies in each bucket, by bucket index. Defaults to
+                None
+            count (int, optional): The number of latencies. Defaults to 0
+            total (float, optional): The sum of the latencies in seconds. Defaults to 0
+            max (float, optional): The largest latency in seconds. Defaults to 0
+        """
+        self.buckets = buckets if buckets is not None else {}
+        self.count = count
+        self.total = total
+        self.max = max
+
+    @classmethod
+    def from_row(cls, row):
+        """Creates a Histogram from a LatencyHistogram
+
+        Args:
+            row (LatencyHistogram): The LatencyHistogram
+
+        Returns:
+            (Histogram): The Histogram
+        """
+        buckets = {int(index): count for index, count in json.loads(row.buckets or '{}').items()}
+        return cls(buckets, row.count or 0, row.total or 0., row.max or 0.)
+
+    def record(self, seconds):
+        """Records a latency
+
+        Args:
+            seconds (float): The latency in seconds
+        """
+        seconds = max(seconds, 0.)
+        index = bisect_left(bucket_bounds, seconds)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other):
+        """Adds the latencies of another Histogram to this one
+
+        Args:
+            other (Histogram): The other Histogram
+        """
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def write_to(self, row):
+        """Adds the latencies of this Histogram to a LatencyHistogram
+
+        Args:
+            row (LatencyHistogram): The LatencyHistogram
+        """
+        histogram = Histogram.from_row(row)
+        histogram.merge(self)
+        row.buckets = json.dumps(histogram.buckets)
+        row.count = histogram.count
+        row.total = histogram.total
+        row.max = histogram.max
+
+    def percentile(self, fraction):
+        """Gets a percentile of the latencies
+
+        The percentile is the upper bound of the bucket holding it, or the largest latency if that is smaller
+
+        Args:
+            fraction (float): The fraction of latencies at or below the percentile, between 0 and 1
+
+        Returns:
+            (float): The percentile in seconds, or 0 if there are no latencies
+        """
+        if not self.count:
+            return 0.
+        rank = max(int(math.ceil(fraction * self.count)), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                if index < len(bucket_bounds):
+                    return min(bucket_bounds[index], self.max)
+                break
+        return self.max
+
+    def summary(self):
+        """Gets the count, mean, percentiles, and maximum of the latencies
+
+        Returns:
+            (dict): The summary, with latencies in milliseconds
+        """
+        summary = {'count': self.count,
+                   'mean_ms': self.total / self.count * 1000 if self.count else 0.,
+                   'max_ms': self.max * 1000}
+        for name, fraction in percentiles:
+            summary['{}_ms'.format(name)] = self.percentile(fraction) * 1000
+        return summary
+
+
+class LatencySummaries(object):
+    def __init__(self, windows, histograms):
+        """Initializes a LatencySummaries, the latencies of actions or workflows over a number of windows
+
+        Args:
+            windows (list[int]): The lengths of the windows in seconds
+            histograms (dict{tuple: dict{int: Histogram}}): The Histogram of each window, by the app name, entity ID,
+                and status the latencies were recorded for
+        """
+        self.windows = windows
+        self._histograms = histograms
+
+    def get(self, app_name, entity_id, status):
+        """Gets the summaries of the latencies of an action or workflow
+
+        Args:
+            app_name (str): The name of the app of the action. None for workflows
+            entity_id (UUID|str): The ID of the action or workflow
+            status (str): The status of the action executions. None for workflows
+
+        Returns:
+            (list[dict]): The summary of each window, with the length of the window in seconds
+        """
+        histograms = self._histograms.get((app_name, str(entity_id), status), {})
+        summaries = []
+        for window in self.windows:
+            summary = histograms.get(window, Histogram()).summary()
+            summary['window'] = window
+            summaries.append(summary)
+        return summaries
+
+
+def get_latency_summaries(session, metric, windows, now=None):
+    """Gets the latencies of every action or workflow over a number of windows
+
+    Windows are rounded to the intervals the histograms were recorded over, so a window includes every interval which
+    started within it.
+
+    Args:
+        session (Session): The session of the execution database
+        metric (str): The kind of latencies to get, either 'action' or 'workflow'
+        windows (list[int]): The lengths of the windows in seconds
+        now (datetime, optional): The end of the windows. Defaults to now
+
+    Returns:
+        (LatencySummaries): The latencies
+    """
+    windows = sorted(windows)
+    now = now or datetime.utcnow()
+    histograms = defaultdict(dict)
+    if windows:
+        oldest = now - timedelta(seconds=windows[-1])
+        rows = session.query(LatencyHistogram).filter(
+            LatencyHistogram.metric == metric, LatencyHistogram.interval_start >= oldest).all()
+        for row in rows:
+            row_histogram = Histogram.from_row(row)
+            key = (row.app_name, str(row.entity_id), row.status)
+            for window in windows:
+                if row.interval_start >= now - timedelta(seconds=window):
+                    histograms[key].setdefault(window, Histogram()).merge(row_histogram)
+    return LatencySummaries(windows, histograms)
+
+
+class LatencyHistograms(object):
+    def __init__(self, interval=60, flush_interval=10, retention=86400):
+        """Initializes a LatencyHistograms, which aggregates the latencies of actions and workflows into Histograms in
+            memory and writes them to the execution database periodically
+
+        Each Histogram is written to the LatencyHistogram of its action or workflow, status, and interval, so a row
+        holds every latency which completed in an interval however many flushes recorded it.
+
+        Args:
+            interval (int, optional): The length in seconds of the interval each row aggregates. Defaults to 60
+            flush_interval (float, optional): The number of seconds latencies may be held in memory. Defaults to 10
+            retention (int, optional): The number of seconds rows are kept. Defaults to 86400
+        """
+        self.interval = interval
+        self.flush_interval = flush_interval
+        self.retention = retention
+        self._histograms = {}
+        self._last_flush = time.time()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._histograms)
+
+    def record(self, metric, app_name, entity_id, status, seconds, timestamp):
+        """Records a latency
+
+        Args:
+            metric (str): The kind of latency, either 'action' or 'workflow'
+            app_name (str): The name of the app of the action. None for workflows
+            entity_id (UUID|str): The ID of the action or workflow
+            status (str): The status of the action execution. None for workflows
+            seconds (float): The latency in seconds
+            timestamp (datetime): When the execution completed
+        """
+        key = (metric, app_name, str(entity_id), status, self._get_interval_start(timestamp))
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram()
+            self._histograms[key].record(seconds)
+
+    def _get_interval_start(self, timestamp):
+        seconds = int((timestamp - epoch).total_seconds())
+        return epoch + timedelta(seconds=seconds - seconds % int(self.interval))
+
+    def flush_if_due(self, execution_db):
+        """Writes the latencies if they have been held for the flush interval
+
+        Args:
+            execution_db (ExecutionDatabase): The execution database
+
+        Returns:
+            (int): The number of histograms written
+        """
+        with self._lock:
+            if time.time() - self._last_flush >= self.flush_interval:
+                return self.flush(execution_db)
+        return 0
+
+    def flush(self, execution_db):
+        """Writes every latency held in memory in one transaction, and deletes the rows older than the retention. If
+            the transaction fails, the latencies are kept to be written by the next flush
+
+        Args:
+            execution_db (ExecutionDatabase): The execution database
+
+        Returns:
+            (int): The number of histograms written
+        """
+        with self._lock:
+            self._last_flush = time.time()
+            histograms, self._histograms = self._histograms, {}
+            if not histograms:
+                return 0
+            session = execution_db.session
+            try:
+                interval_starts = {key[-1] for key in histograms}
+                rows = {(row.metric, row.app_name, str(row.entity_id), row.status, row.interval_start): row
+                        for row in session.query(LatencyHistogram).filter(
+                            LatencyHistogram.interval_start.in_(interval_starts)).all()}
+                for key, histogram in histograms.items():
+                    row = rows.get(key)
+                    if row is None:
+                        row = LatencyHistogram(*key)
+                        session.add(row)
+                    histogram.write_to(row)
+                expired = datetime.utcnow() - timedelta(seconds=self.retention)
+                session.query(LatencyHistogram).filter(LatencyHistogram.interval_start < expired).delete(
+                    synchronize_session=False)
+                session.commit()
+            except Exception:
+                logger.exception('Could not write {} latency histograms. Retrying them with the next flush'.format(
+                    len(histograms)))
+                session.rollback()
+                for key, histogram in histograms.items():
+                    if key in self._histograms:
+                        histogram.merge(self._histograms[key])
+                    self._histograms[key] = histogram
+                return 0
+        logger.debug('Wrote {} latency histograms'.format(len(histograms)))
+        return len(histograms)
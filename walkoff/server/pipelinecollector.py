@@ -0,0 +1,71 @@
+from prometheus_client.core import GaugeMetricFamily, HistogramMetricFamily, REGISTRY
+from prometheus_client.utils import floatToGoString
+
+from walkoff.executiondb.constants import workflow_priorities
+from walkoff.multiprocessedexecutor.requestqueue import lane_key
+from walkoff.pipelinemetrics import histograms, gauges, histogram_buckets, get_histograms, get_gauges
+
+bucket_labels = [floatToGoString(bound) for bound in histogram_buckets] + ['+Inf']
+
+
+class PipelineMetricsCollector(object):
+    def __init__(self, cache):
+        """Initializes a PipelineMetricsCollector, which exports the metrics of the workflow execution pipeline that
+            every server and worker process writes to the cache
+
+        Args:
+            cache (RedisCacheAdapter): The cache
+        """
+        self.cache = cache
+
+    def describe(self):
+        """Describes the metrics of the pipeline without reading them, so the collector can be registered before the
+            cache is reachable
+
+        Returns:
+            (list): No metric families
+        """
+        return []
+
+    def collect(self):
+        """Reads the metrics of the pipeline from the cache
+
+        Returns:
+            (generator): The families of the metrics
+        """
+        queue_depth = GaugeMetricFamily('walkoff_request_queue_depth',
+                                        'Number of workflow execution requests waiting in each priority lane',
+                                        labels=['priority'])
+        for priority in workflow_priorities:
+            queue_depth.add_metric([priority], self.cache.llen(lane_key(priority)))
+        yield queue_depth
+
+        for name, values in get_histograms(self.cache).items():
+            description, label_names = histograms[name]
+            family = HistogramMetricFamily(name, description, labels=list(label_names))
+            for labels, histogram in values.items():
+                family.add_metric(list(labels), list(zip(bucket_labels, histogram['buckets'])), histogram['sum'])
+            yield family
+
+        for name, values in get_gauges(self.cache).items():
+            description, label_names = gauges[name]
+            family = GaugeMetricFamily(name, description, labels=list(label_names))
+            for labels, value in values.items():
+                family.add_metric(list(labels), value)
+            yield family
+
+
+def register_pipeline_metrics(cache, registry=REGISTRY):
+    """Exports the metrics of the workflow execution pipeline with the other Prometheus metrics of this process
+
+    Args:
+        cache (RedisCacheAdapter): The cache the metrics are written to
+        registry (CollectorRegistry, optional): The registry to export the metrics from. Defaults to the default
+            registry, which is served at /prometheus_metrics
+
+    Returns:
+        (PipelineMetricsCollector): The registered collector
+    """
+    collector = PipelineMetricsCollector(cache)
+    registry.register(collector)
+    return collector
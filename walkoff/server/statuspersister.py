@@ -0,0 +1,269 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from walkoff.executiondb.metrics import AppMetric
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+from walkoff.pipelinemetrics import pipeline_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class StatusTransition(object):
+    def __init__(self, apply, sender, data=None, workflow_execution_id=None, action_execution_id=None):
+        """Initializes a StatusTransition, a change to the status of a workflow or action execution waiting to be
+            written to the execution database
+
+        Args:
+            apply (func): The function which applies the transition. It is called with the StatusBatch being flushed
+                and the transition
+            sender (dict): The sender of the event which caused the transition
+            data (dict, optional): The data of the event. Defaults to None
+            workflow_execution_id (str, optional): The execution ID of the WorkflowStatus the transition reads or
+                writes. Defaults to None
+            action_execution_id (str, optional): The execution ID of the ActionStatus the transition reads or writes.
+                Defaults to None
+        """
+        self.apply = apply
+        self.sender = sender
+        self.data = data if data is not None else {}
+        self.workflow_execution_id = str(workflow_execution_id) if workflow_execution_id is not None else None
+        self.action_execution_id = str(action_execution_id) if action_execution_id is not None else None
+        self.timestamp = datetime.utcnow()
+
+
+class StatusBatch(object):
+    def __init__(self, session, transitions):
+        """Initializes a StatusBatch, which holds the rows a number of StatusTransitions are applied to
+
+        The WorkflowStatuses and ActionStatuses the transitions name are loaded with one query each, and every
+        transition of the same row is applied to the same object, so the row is written once when the batch is
+        committed.
+
+        Args:
+            session (Session): The session of the execution database
+            transitions (list[StatusTransition]): The transitions
+        """
+        self.session = session
+        self._workflow_statuses = self._load(WorkflowStatus, {transition.workflow_execution_id
+                                                              for transition in transitions})
+        self._action_statuses = self._load(ActionStatus, {transition.action_execution_id
+                                                          for transition in transitions})
+        self._app_metrics = {}
+        self.latencies = []
+
+    def _load(self, model, execution_ids):
+        execution_ids.discard(None)
+        if not execution_ids:
+            return {}
+        rows = self.session.query(model).filter(model.execution_id.in_(execution_ids)).all()
+        return {str(row.execution_id): row for row in rows}
+
+    def get_workflow_status(self, execution_id):
+        """Gets a WorkflowStatus of the batch
+
+        Args:
+            execution_id (UUID|str): The execution ID of the workflow
+
+        Returns:
+            (WorkflowStatus): The WorkflowStatus, or None if it does not exist
+        """
+        return self._workflow_statuses.get(str(execution_id))
+
+    def add_workflow_status(self, workflow_status):
+        """Adds a new WorkflowStatus to the batch
+
+        Args:
+            workflow_status (WorkflowStatus): The WorkflowStatus
+        """
+        self.session.add(workflow_status)
+        self._workflow_statuses[str(workflow_status.execution_id)] = workflow_status
+
+    def get_action_status(self, execution_id):
+        """Gets an ActionStatus of the batch
+
+        Args:
+            execution_id (UUID|str): The execution ID of the action
+
+        Returns:
+            (ActionStatus): The ActionStatus, or None if it does not exist
+        """
+        return self._action_statuses.get(str(execution_id))
+
+    def add_action_status(self, action_status):
+        """Adds a new ActionStatus to the batch
+
+        Args:
+            action_status (ActionStatus): The ActionStatus
+        """
+        self.session.add(action_status)
+        self._action_statuses[str(action_status.execution_id)] = action_status
+
+    def get_app_metric(self, app_name):
+        """Gets the AppMetric of an app, creating it if it does not exist
+
+        Args:
+            app_name (str): The name of the app
+
+        Returns:
+            (AppMetric): The AppMetric
+        """
+        if app_name not in self._app_metrics:
+            app_metric = self.session.query(AppMetric).filter_by(app=app_name).first()
+            if app_metric is None:
+                app_metric = AppMetric(app_name)
+                self.session.add(app_metric)
+            self._app_metrics[app_name] = app_metric
+        return self._app_metrics[app_name]
+
+    def record_latency(self, metric, app_name, entity_id, status, seconds, timestamp):
+        """Records the latency of an action or workflow execution, which is added to the latency histograms once the
+            batch is committed
+
+        Args:
+            metric (str): The kind of latency, either 'action' or 'workflow'
+            app_name (str): The name of the app of the action. None for workflows
+            entity_id (UUID|str): The ID of the action or workflow
+            status (str): The status of the action execution. None for workflows
+            seconds (float): The latency in seconds
+            timestamp (datetime): When the execution completed
+        """
+        self.latencies.append((metric, app_name, entity_id, status, seconds, timestamp))
+
+
+class StatusPersister(object):
+    def __init__(self, flush_size=100, flush_interval=0.25, latency_histograms=None, retry_timeout=600):
+        """Initializes a StatusPersister, which buffers the status transitions of workflow and action executions and
+            writes them to the execution database in batches
+
+        Transitions are applied in the order they were recorded, so the transitions of an execution are written in
+        the order its events were received. The buffer is written in one transaction when it holds flush_size
+        transitions, when it is flushed flush_interval seconds after its first transition was recorded, or when a
+        transition is recorded which must be visible immediately.
+
+        If a batch cannot be written, its transitions are written one at a time. Transitions which still cannot be
+        written are kept and retried with the next batch, along with the later transitions of the same executions so
+        they are still written in order.
+
+        Args:
+            flush_size (int, optional): The number of transitions to buffer before they are written. Set to 1 or less
+                to write each transition as it is recorded. Defaults to 100
+            flush_interval (float, optional): The number of seconds a transition may be buffered. Defaults to 0.25
+            latency_histograms (LatencyHistograms, optional): The histograms the latencies of the executions completed
+                by each batch are recorded to once it is written. Defaults to None
+            retry_timeout (float, optional): The number of seconds after a transition was recorded it is retried for
+                before it is dropped. Defaults to 600
+        """
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.latency_histograms = latency_histograms
+        self.retry_timeout = retry_timeout
+        self._transitions = []
+        self._failed = []
+        self._first_recorded_at = None
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._failed) + len(self._transitions)
+
+    def record(self, execution_db, transition, flush=False):
+        """Records a status transition
+
+        Args:
+            execution_db (ExecutionDatabase): The execution database
+            transition (StatusTransition): The transition
+            flush (bool, optional): Write the transition, and every transition before it, immediately? Defaults to
+                False
+        """
+        with self._lock:
+            if not self._transitions and not self._failed:
+                self._first_recorded_at = time.time()
+            self._transitions.append(transition)
+            if flush or len(self._transitions) >= self.flush_size:
+                self.flush(execution_db)
+
+    def flush_if_due(self, execution_db):
+        """Writes the buffered transitions if the oldest of them has been buffered for the flush interval
+
+        Args:
+            execution_db (ExecutionDatabase): The execution database
+
+        Returns:
+            (int): The number of transitions written
+        """
+        with self._lock:
+            if (self._transitions or self._failed) and time.time() - self._first_recorded_at >= self.flush_interval:
+                return self.flush(execution_db)
+        return 0
+
+    def flush(self, execution_db):
+        """Writes every buffered transition in one transaction. If the transaction fails, the transitions are written
+            one at a time, and those which cannot be written are kept to be retried
+
+        Args:
+            execution_db (ExecutionDatabase): The execution database
+
+        Returns:
+            (int): The number of transitions written
+        """
+        with self._lock:
+            transitions, self._transitions, self._failed = self._failed + self._transitions, [], []
+            if not transitions:
+                return 0
+            session = execution_db.session
+            with pipeline_metrics.time('walkoff_status_flush_seconds'):
+                try:
+                    self._write(session, transitions)
+                    written = len(transitions)
+                except Exception:
+                    logger.exception('Could not write {} status transitions. Writing them one at a time'.format(
+                        len(transitions)))
+                    written = self._write_each(session, transitions)
+        logger.debug('Wrote {} status transitions'.format(written))
+        return written
+
+    def _write(self, session, transitions):
+        try:
+            session.expire_all()
+            batch = StatusBatch(session, transitions)
+            for transition in transitions:
+                try:
+                    transition.apply(batch, transition)
+                except Exception:
+                    logger.exception('Could not apply the status transition of execution {}'.format(
+                        transition.action_execution_id or transition.workflow_execution_id))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        if self.latency_histograms is not None:
+            for latency in batch.latencies:
+                self.latency_histograms.record(*latency)
+
+    def _write_each(self, session, transitions):
+        failed_execution_ids = set()
+        written = 0
+        for transition in transitions:
+            execution_ids = {transition.workflow_execution_id, transition.action_execution_id} - {None}
+            if not execution_ids & failed_execution_ids:
+                try:
+                    self._write(session, [transition])
+                    written += 1
+                    continue
+                except Exception:
+                    pass
+            failed_execution_ids |= execution_ids
+            self._retry(transition)
+        if self._failed:
+            self._first_recorded_at = time.time()
+            logger.error('Could not write {} status transitions. Retrying them with the next batch'.format(
+                len(self._failed)))
+        return written
+
+    def _retry(self, transition):
+        if datetime.utcnow() - transition.timestamp > timedelta(seconds=self.retry_timeout):
+            logger.error('Dropping the status transition of execution {} after retrying it for {} seconds'.format(
+                transition.action_execution_id or transition.workflow_execution_id, self.retry_timeout))
+        else:
+            self._failed.append(transition)
@@ -4,172 +4,171 @@ from flask import current_app
 
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import WorkflowStatusEnum, ActionStatusEnum
-from walkoff.executiondb.metrics import AppMetric, ActionMetric, ActionStatusMetric, WorkflowMetric
+from walkoff.executiondb.metrics import ActionMetric, ActionStatusMetric, WorkflowMetric
 from walkoff.executiondb.saved_workflow import SavedWorkflow
 from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+from walkoff.pipelinemetrics import pipeline_metrics
+from walkoff.server.statuspersister import StatusTransition
+
+
+def __record(apply, sender, data=None, flush=False, workflow_execution_id=None, action_execution_id=None):
+    transition = StatusTransition(apply, sender, data=data, workflow_execution_id=workflow_execution_id,
+                                  action_execution_id=action_execution_id)
+    current_app.running_context.status_persister.record(
+        current_app.running_context.execution_db, transition, flush=flush)
 
 
 @WalkoffEvent.WorkflowExecutionPending.connect
 def __workflow_pending(sender, **kwargs):
-    current_app.running_context.execution_db.session.expire_all()
-    workflow_status = current_app.running_context.execution_db.session.query(WorkflowStatus).filter_by(
-        execution_id=str(sender['execution_id'])).first()
+    if (kwargs.get('data') or {}).get('status_written'):
+        return
+    __record(_workflow_pending, sender, data=kwargs.get('data'), flush=True,
+             workflow_execution_id=sender['execution_id'])
+
+
+def _workflow_pending(batch, transition):
+    sender = transition.sender
+    workflow_status = batch.get_workflow_status(sender['execution_id'])
     if workflow_status:
         workflow_status.status = WorkflowStatusEnum.pending
     else:
-        user = kwargs['data']['user'] if ('data' in kwargs and 'user' in kwargs['data']) else None
+        user = transition.data.get('user')
         workflow_status = WorkflowStatus(str(sender['execution_id']), sender['id'], sender['name'], user=user)
-        current_app.running_context.execution_db.session.add(workflow_status)
-    current_app.running_context.execution_db.session.commit()
+        batch.add_workflow_status(workflow_status)
 
 
 @WalkoffEvent.WorkflowExecutionStart.connect
 def __workflow_started_callback(sender, **kwargs):
-    current_app.running_context.execution_db.session.expire_all()
-    workflow_status = current_app.running_context.execution_db.session.query(WorkflowStatus).filter_by(
-        execution_id=sender['execution_id']).first()
-    workflow_status.running()
-    current_app.running_context.execution_db.session.commit()
+    __record(_workflow_started, sender, flush=True, workflow_execution_id=sender['execution_id'])
+
+
+def _workflow_started(batch, transition):
+    batch.get_workflow_status(transition.workflow_execution_id).running(transition.timestamp)
 
 
 @WalkoffEvent.WorkflowPaused.connect
 def __workflow_paused_callback(sender, **kwargs):
-    current_app.running_context.execution_db.session.expire_all()
-    workflow_status = current_app.running_context.execution_db.session.query(WorkflowStatus).filter_by(
-        execution_id=sender['execution_id']).first()
-    workflow_status.paused()
-    current_app.running_context.execution_db.session.commit()
+    __record(_workflow_paused, sender, flush=True, workflow_execution_id=sender['execution_id'])
+
+
+def _workflow_paused(batch, transition):
+    batch.get_workflow_status(transition.workflow_execution_id).paused()
 
 
 @WalkoffEvent.TriggerActionAwaitingData.connect
 def __workflow_awaiting_data_callback(sender, **kwargs):
-    workflow_execution_id = kwargs['data']['workflow']['execution_id']
-    current_app.running_context.execution_db.session.expire_all()
-    workflow_status = current_app.running_context.execution_db.session.query(WorkflowStatus).filter_by(
-        execution_id=workflow_execution_id).first()
-    workflow_status.awaiting_data()
-    current_app.running_context.execution_db.session.commit()
+    __record(_workflow_awaiting_data, sender, flush=True,
+             workflow_execution_id=kwargs['data']['workflow']['execution_id'])
+
+
+def _workflow_awaiting_data(batch, transition):
+    batch.get_workflow_status(transition.workflow_execution_id).awaiting_data()
 
 
 @WalkoffEvent.WorkflowShutdown.connect
 def __workflow_ended_callback(sender, **kwargs):
-    current_app.running_context.execution_db.session.expire_all()
-    workflow_status = current_app.running_context.execution_db.session.query(WorkflowStatus).filter_by(
-        execution_id=sender['execution_id']).first()
-    workflow_status.completed()
-    current_app.running_context.execution_db.session.commit()
-
-    saved_state = current_app.running_context.execution_db.session.query(SavedWorkflow).filter_by(
-        workflow_execution_id=sender['execution_id']).first()
-    if saved_state:
-        current_app.running_context.execution_db.session.delete(saved_state)
+    __record(_workflow_ended, sender, flush=True, workflow_execution_id=sender['execution_id'])
+
+
+def _workflow_ended(batch, transition):
+    sender = transition.sender
+    workflow_status = batch.get_workflow_status(transition.workflow_execution_id)
+    workflow_status.completed(transition.timestamp)
+
+    _delete_saved_state(batch, sender['execution_id'])
 
     # Update metrics
     execution_time = (workflow_status.completed_at - workflow_status.started_at).total_seconds()
 
-    workflow_metric = current_app.running_context.execution_db.session.query(WorkflowMetric).filter_by(
-        workflow_id=sender['id']).first()
+    batch.record_latency('workflow', None, sender['id'], None, execution_time, workflow_status.completed_at)
+
+    workflow_metric = batch.session.query(WorkflowMetric).filter_by(workflow_id=sender['id']).first()
     if workflow_metric is None:
         workflow_metric = WorkflowMetric(sender['id'], sender['name'], execution_time)
-        current_app.running_context.execution_db.session.add(workflow_metric)
+        batch.session.add(workflow_metric)
     else:
         workflow_metric.update(execution_time)
 
-    current_app.running_context.execution_db.session.commit()
-
 
 @WalkoffEvent.WorkflowAborted.connect
 def __workflow_aborted(sender, **kwargs):
-    current_app.running_context.execution_db.session.expire_all()
-    workflow_status = current_app.running_context.execution_db.session.query(WorkflowStatus).filter_by(
-        execution_id=sender['execution_id']).first()
-    workflow_status.aborted()
+    __record(_workflow_aborted, sender, flush=True, workflow_execution_id=sender['execution_id'])
 
-    saved_state = current_app.running_context.execution_db.session.query(SavedWorkflow).filter_by(
-        workflow_execution_id=sender['execution_id']).first()
-    if saved_state:
-        current_app.running_context.execution_db.session.delete(saved_state)
 
-    current_app.running_context.execution_db.session.commit()
+def _workflow_aborted(batch, transition):
+    batch.get_workflow_status(transition.workflow_execution_id).aborted(transition.timestamp)
+    _delete_saved_state(batch, transition.sender['execution_id'])
+
+
+def _delete_saved_state(batch, workflow_execution_id):
+    saved_state = batch.session.query(SavedWorkflow).filter_by(workflow_execution_id=workflow_execution_id).first()
+    if saved_state:
+        batch.session.delete(saved_state)
 
 
 @WalkoffEvent.ActionStarted.connect
 def __action_start_callback(sender, **kwargs):
-    workflow_execution_id = kwargs['data']['workflow']['execution_id']
-    current_app.running_context.execution_db.session.expire_all()
-    action_status = current_app.running_context.execution_db.session.query(ActionStatus).filter_by(
-        execution_id=sender['execution_id']).first()
+    __record(_action_started, sender, workflow_execution_id=kwargs['data']['workflow']['execution_id'],
+             action_execution_id=sender['execution_id'])
+
+
+def _action_started(batch, transition):
+    sender = transition.sender
+    action_status = batch.get_action_status(transition.action_execution_id)
     if action_status:
         action_status.status = ActionStatusEnum.executing
     else:
-        workflow_status = current_app.running_context.execution_db.session.query(WorkflowStatus).filter_by(
-            execution_id=workflow_execution_id).first()
+        workflow_status = batch.get_workflow_status(transition.workflow_execution_id)
         arguments = sender['arguments'] if 'arguments' in sender else []
         action_status = ActionStatus(sender['execution_id'], sender['id'], sender['name'], sender['app_name'],
                                      sender['action_name'], json.dumps(arguments))
+        action_status.started_at = transition.timestamp
         workflow_status.add_action_status(action_status)
-        current_app.running_context.execution_db.session.add(action_status)
-
-    current_app.running_context.execution_db.session.commit()
+        batch.add_action_status(action_status)
 
 
 @WalkoffEvent.ActionExecutionSuccess.connect
 def __action_execution_success_callback(sender, **kwargs):
-    current_app.running_context.execution_db.session.expire_all()
-    action_status = current_app.running_context.execution_db.session.query(ActionStatus).filter_by(
-        execution_id=sender['execution_id']).first()
-    action_status.completed_success(kwargs['data']['data'])
+    __record(_action_execution_success, sender, data=kwargs['data'], action_execution_id=sender['execution_id'])
 
-    # Update metrics
-    __update_success_action_tracker(action_status)
 
-    current_app.running_context.execution_db.session.commit()
+def _action_execution_success(batch, transition):
+    action_status = batch.get_action_status(transition.action_execution_id)
+    action_status.completed_success(transition.data['data'], transition.timestamp)
+
+    # Update metrics
+    __update_action_tracker(batch, 'success', action_status)
 
 
 @WalkoffEvent.ActionExecutionError.connect
 def __action_execution_error_callback(sender, **kwargs):
-    current_app.running_context.execution_db.session.expire_all()
-    action_status = current_app.running_context.execution_db.session.query(ActionStatus).filter_by(
-        execution_id=sender['execution_id']).first()
-
-    action_status.completed_failure(kwargs['data']['data'])
-
-    # Update metrics
-    __update_error_action_tracker(action_status)
-    current_app.running_context.execution_db.session.commit()
+    __record(_action_execution_failure, sender, data=kwargs['data'], action_execution_id=sender['execution_id'])
 
 
 @WalkoffEvent.ActionArgumentsInvalid.connect
 def __action_args_invalid_callback(sender, **kwargs):
-    current_app.running_context.execution_db.session.expire_all()
-    action_status = current_app.running_context.execution_db.session.query(ActionStatus).filter_by(
-        execution_id=sender['execution_id']).first()
-
-    action_status.completed_failure(kwargs['data']['data'])
-
-    # Update metrics
-    __update_error_action_tracker(action_status)
-    current_app.running_context.execution_db.session.commit()
+    __record(_action_execution_failure, sender, data=kwargs['data'], action_execution_id=sender['execution_id'])
 
 
-def __update_success_action_tracker(action_status):
-    __update_action_tracker('success', action_status)
+def _action_execution_failure(batch, transition):
+    action_status = batch.get_action_status(transition.action_execution_id)
+    action_status.completed_failure(transition.data['data'], transition.timestamp)
 
-
-def __update_error_action_tracker(action_status):
-    __update_action_tracker('error', action_status)
+    # Update metrics
+    __update_action_tracker(batch, 'error', action_status)
 
 
-def __update_action_tracker(status, action_status):
-    app_metric = current_app.running_context.execution_db.session.query(AppMetric).filter_by(
-        app=action_status.app_name).first()
-    if app_metric is None:
-        app_metric = AppMetric(action_status.app_name)
-        current_app.running_context.execution_db.session.add(app_metric)
+def __update_action_tracker(batch, status, action_status):
+    app_metric = batch.get_app_metric(action_status.app_name)
 
     app_metric.count += 1
 
     execution_time = (action_status.completed_at - action_status.started_at).total_seconds()
+    batch.record_latency('action', action_status.app_name, action_status.action_id, status, execution_time,
+                         action_status.completed_at)
+    pipeline_metrics.observe('walkoff_action_execution_seconds', execution_time, action_status.app_name,
+                             action_status.action_name, status)
+
     action_metric = app_metric.get_action_by_id(action_status.action_id)
     if action_metric is None:
         action_status_metric = ActionStatusMetric(status, execution_time)
@@ -182,5 +181,3 @@ def __update_action_tracker(status, action_status):
             action_metric.action_statuses.append(action_status_metric)
         else:
             action_status_metric.update(execution_time)
-
-    current_app.running_context.execution_db.session.commit()
@@ -35,6 +35,7 @@ class ScheduledTask(db.Model, TrackModificationsMixIn):
         trigger_type (str): The type of trigger to use for the scheduler. Either "date", "interval", "cron", or
             "unspecified"
         trigger_args (str): The arguments for the scheduler trigger
+        priority (str): The priority the workflows are executed with. If None, each workflow's own priority is used
 
     Args:
         name (str): The name of the task
@@ -43,6 +44,8 @@ class ScheduledTask(db.Model, TrackModificationsMixIn):
         task_trigger (dict): A dict containing two fields: "type", which contains the type of trigger to use for the
             scheduler ("date", "interval", "cron", or "unspecified"), and "args", which contains the arguments for the
             scheduler trigger
+        priority (str, optional): The priority the workflows are executed with, either "high", "normal", or "low".
+            Defaults to None, which uses each workflow's own priority
     """
     __tablename__ = 'scheduled_task'
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
@@ -53,10 +56,12 @@ class ScheduledTask(db.Model, TrackModificationsMixIn):
                                 passive_deletes=True)
     trigger_type = db.Column(db.Enum('date', 'interval', 'cron', 'unspecified', name='trigger_types'))
     trigger_args = db.Column(db.String(255))
+    priority = db.Column(db.String(10))
 
-    def __init__(self, name, description='', status='running', workflows=None, task_trigger=None):
+    def __init__(self, name, description='', status='running', workflows=None, task_trigger=None, priority=None):
         self.name = name
         self.description = description
+        self.priority = priority
         if workflows is not None:
             for workflow in set(workflows):
                 self.workflows.append(ScheduledWorkflow(workflow_id=workflow))
@@ -89,6 +94,10 @@ class ScheduledTask(db.Model, TrackModificationsMixIn):
             self.description = json_in['description']
         if 'workflows' in json_in and json_in['workflows']:
             self._modify_workflows(json_in, trigger=trigger)
+        if 'priority' in json_in and json_in['priority'] != self.priority:
+            self.priority = json_in['priority']
+            if self.status == 'running' and self.trigger_type != 'unspecified':
+                self._start_workflows()
         if 'status' in json_in and json_in['status'] != self.status:
             self._update_status(json_in)
 
@@ -119,7 +128,8 @@ class ScheduledTask(db.Model, TrackModificationsMixIn):
         trigger = trigger if trigger is not None else construct_trigger(self._reconstruct_scheduler_args())
         current_app.running_context.scheduler.schedule_workflows(self.id,
                                                                  current_app.running_context.executor.execute_workflow,
-                                                                 self._get_workflow_ids_as_list(), trigger)
+                                                                 self._get_workflow_ids_as_list(), trigger,
+                                                                 priority=self.priority)
 
     def _stop_workflows(self):
         from flask import current_app
@@ -138,7 +148,7 @@ class ScheduledTask(db.Model, TrackModificationsMixIn):
             if new:
                 current_app.running_context.scheduler.schedule_workflows(self.id,
                                                                          current_app.running_context.executor.execute_workflow,
-                                                                         new, trigger)
+                                                                         new, trigger, priority=self.priority)
             if removed:
                 current_app.running_context.scheduler.unschedule_workflows(self.id, removed)
 
@@ -165,9 +175,12 @@ class ScheduledTask(db.Model, TrackModificationsMixIn):
         Returns:
             (dict): The JSON representation of this ScheduledTask
         """
-        return {'id': self.id,
-                'name': self.name,
-                'description': self.description,
-                'status': self.status,
-                'workflows': self._get_workflow_ids_as_list(),
-                'task_trigger': self._reconstruct_scheduler_args()}
+        task_json = {'id': self.id,
+                     'name': self.name,
+                     'description': self.description,
+                     'status': self.status,
+                     'workflows': self._get_workflow_ids_as_list(),
+                     'task_trigger': self._reconstruct_scheduler_args()}
+        if self.priority:
+            task_json['priority'] = self.priority
+        return task_json
@@ -5,9 +5,12 @@ from uuid import uuid4
 import requests
 
 from walkoff.appgateway import get_app_action, get_condition, get_transform
+from walkoff.appgateway.accumulators import TieredAccumulator, flush_accumulator
 from walkoff.appgateway.actionresult import ActionResult
+from walkoff.appgateway.resultstore import make_result_store
 from walkoff.appgateway.apiutil import get_app_action_api, get_condition_api, get_transform_api
 from walkoff.helpers import ExecutionError
+from walkoff.worker.pure_results import PureResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -58,8 +61,11 @@ class LocalActionExecutionStrategy(object):
         'transform': _ActionLookupKey(get_transform_api, get_transform)
     }
 
-    def __init__(self, fully_cached=False):
+    def __init__(self, fully_cached=False, result_store=None, execution_id=None):
         self.fully_cached = fully_cached
+        self.result_store = result_store
+        self.execution_id = execution_id
+        self.pure_results = PureResultCache()
 
     def _get_execution_func(self, context):
         key = self._executable_lookup[context.type]
@@ -98,6 +104,8 @@ class LocalActionExecutionStrategy(object):
         except Exception as e:
             raise ExecutionError(e)
         if context.is_action():
+            if self.result_store is not None:
+                result.result = self.result_store.offload(self.execution_id, context.id, result.result)
             accumulator[context.id] = result.result
         elif self.fully_cached:
             accumulator[context.id] = result
@@ -108,6 +116,7 @@ class RemoteActionExecutionStrategy(object):
 
     def __init__(self, workflow_context):
         self.workflow_context = workflow_context
+        self.pure_results = PureResultCache()
 
     @staticmethod
     def format_url(app_name, worfklow_exec_id, executable_exec_id):
@@ -142,12 +151,15 @@ class RemoteActionExecutionStrategy(object):
             'arguments': arguments
         }
         url = RemoteActionExecutionStrategy.format_url(app_name, self.workflow_context.execution_id, execution_id)
+        flush_accumulator(accumulator)
         response = requests.post(url, json=request_json)
         data = response.json()
         if response.status_code == 200:
             if context.is_action():
                 result = ActionResult(None, data['status'])
             else:
+                if isinstance(accumulator, TieredAccumulator):
+                    accumulator.evict(context.id)
                 result = accumulator[str(context.id)]
             if data['status'] == 'UnhandledException' and not context.is_action():
                 raise ExecutionError(message=result)
@@ -169,7 +181,9 @@ class RemoteActionExecutionStrategy(object):
 
 
 def make_local_execution_strategy(config, workflow_context, **kwargs):
-    return LocalActionExecutionStrategy(fully_cached=kwargs.get('fully_cached', False))
+    result_store = make_result_store(config) if config.RESULT_STORE_THRESHOLD else None
+    return LocalActionExecutionStrategy(fully_cached=kwargs.get('fully_cached', False), result_store=result_store,
+                                        execution_id=workflow_context.execution_id)
 
 
 def make_remote_execution_strategy(config, workflow_context, **kwargs):
@@ -0,0 +1,146 @@
+import logging
+import threading
+
+from walkoff.events import WalkoffEvent, EventType
+from walkoff.executiondb.constants import event_levels, default_event_level
+
+logger = logging.getLogger(__name__)
+
+subscribed_events_key = 'workflow_events:subscribed'
+subscribed_events_channel = 'workflow_events'
+
+filtered_event_types = frozenset({EventType.branch, EventType.conditonalexpression, EventType.condition,
+                                  EventType.transform})
+"""(frozenset(EventType)): The types of events whose emission depends on their level. Workflow and Action events are
+    always emitted, because the server tracks the status of executions with them
+"""
+
+error_events = frozenset({WalkoffEvent.ConditionError, WalkoffEvent.TransformError})
+
+
+def is_emitted_at_level(event, level):
+    """Is a fine-grained event emitted at a level?
+
+    Args:
+        event (WalkoffEvent): The event
+        level (str): The level
+
+    Returns:
+        (bool)
+    """
+    if level == 'all':
+        return True
+    return level == 'errors' and event in error_events
+
+
+def publish_subscribed_events(cache, events):
+    """Records that events have subscribers on the server, so that workers emit them at every level
+
+    Args:
+        cache (RedisCacheAdapter): The cache
+        events (iterable(WalkoffEvent)): The events with subscribers
+    """
+    names = {event.name: 1 for event in events if event.event_type in filtered_event_types}
+    if names:
+        cache.hset_multiple(subscribed_events_key, names)
+        cache.publish(subscribed_events_channel, 'updated')
+
+
+def get_subscribed_events(cache):
+    """Gets the fine-grained events which have subscribers on the server
+
+    Args:
+        cache (RedisCacheAdapter): The cache
+
+    Returns:
+        (set(WalkoffEvent)): The events
+    """
+    events = set()
+    for name in cache.hkeys(subscribed_events_key):
+        if isinstance(name, bytes):
+            name = name.decode('utf-8')
+        event = WalkoffEvent.get_event_from_name(name)
+        if event is not None:
+            events.add(event)
+    return events
+
+
+class EventFilter(object):
+    def __init__(self, level=default_event_level, type_levels=None, subscribed_events=None):
+        """Initializes an EventFilter, which decides which events a worker sends to the server
+
+        The level of a fine-grained event is the event level of its Workflow if it has one, otherwise the level of its
+        type in type_levels, otherwise level. Events with subscribers on the server are always emitted.
+
+        Args:
+            level (str, optional): The level fine-grained events are emitted at. Defaults to 'all'
+            type_levels (dict{str: str}, optional): The levels of types of events, by the name of their EventType.
+                Defaults to None
+            subscribed_events (iterable(WalkoffEvent), optional): The events with subscribers on the server. Defaults
+                to None
+        """
+        self.level = self._get_level(level, 'events')
+        self.type_levels = {}
+        for event_type, type_level in (type_levels or {}).items():
+            if event_type not in EventType.__members__:
+                logger.warning('Unknown event type {}. Ignoring its event level'.format(event_type))
+            else:
+                self.type_levels[EventType[event_type]] = self._get_level(type_level, '{} events'.format(event_type))
+        self.subscribed_events = frozenset(subscribed_events or ())
+        self._emitted = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_level(level, events):
+        if level not in event_levels:
+            logger.warning('Unknown event level {} for {}. Using {}'.format(level, events, default_event_level))
+            return default_event_level
+        return level
+
+    def is_emitted(self, event, workflow=None):
+        """Is an event emitted?
+
+        Args:
+            event (WalkoffEvent): The event
+            workflow (Workflow, optional): The Workflow whose execution sent the event. Defaults to None
+
+        Returns:
+            (bool)
+        """
+        if event.event_type not in filtered_event_types:
+            return True
+        workflow_level = getattr(workflow, 'event_level', None)
+        key = (event, workflow_level)
+        emitted_events, subscribed_events = self._emitted, self.subscribed_events
+        emitted = emitted_events.get(key)
+        if emitted is None:
+            emitted = emitted_events[key] = self._is_emitted(event, workflow_level, subscribed_events)
+        return emitted
+
+    def _is_emitted(self, event, workflow_level, subscribed_events):
+        if event in subscribed_events:
+            return True
+        level = workflow_level or self.type_levels.get(event.event_type, self.level)
+        return is_emitted_at_level(event, level)
+
+    def update_subscribed_events(self, events):
+        """Replaces the events with subscribers on the server
+
+        Args:
+            events (iterable(WalkoffEvent)): The events
+        """
+        with self._lock:
+            self.subscribed_events = frozenset(events)
+            self._emitted = {}
+
+    def receive_subscriptions(self, cache, subscription):
+        """Updates the events with subscribers on the server as they are published
+
+        Args:
+            cache (RedisCacheAdapter): The cache
+            subscription (RedisSubscription): A subscription to the subscribed events channel
+        """
+        for _ in subscription.listen():
+            self.update_subscribed_events(get_subscribed_events(cache))
+            logger.debug('Updated the events with subscribers to {}'.format(
+                sorted(event.name for event in self.subscribed_events)))
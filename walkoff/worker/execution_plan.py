@@ -0,0 +1,160 @@
+import logging
+import threading
+from collections import OrderedDict
+
+from sqlalchemy import inspect
+
+import walkoff.config
+from walkoff.executiondb.workflow import Workflow
+from walkoff.worker.workflow_exec_context import WorkflowIndex
+
+logger = logging.getLogger(__name__)
+
+workflow_plans_channel = 'workflow_plans'
+"""(str): The channel on which edited workflows are announced so that workers drop their cached execution plans
+"""
+
+invalidate_all_message = '*'
+"""(str): The message published to the workflow plans channel to drop every cached execution plan
+"""
+
+
+def publish_plan_invalidation(cache, workflow_ids=None):
+    """Tells the workers to drop their cached execution plans for some workflows
+
+    Args:
+        cache (RedisCacheAdapter): The cache the workers are subscribed to
+        workflow_ids (list[UUID|str], optional): The IDs of the workflows which were edited or deleted. Defaults to
+            None, which drops every cached execution plan
+    """
+    if workflow_ids is None:
+        cache.publish(workflow_plans_channel, invalidate_all_message)
+    else:
+        for workflow_id in workflow_ids:
+            cache.publish(workflow_plans_channel, str(workflow_id))
+
+
+def load_execution_graph(element):
+    """Loads every relationship an execution element cascades to, so that it can be used after it is expunged from
+        its session
+
+    Args:
+        element (ExecutionElement): The execution element to load
+    """
+    for relationship in inspect(element).mapper.relationships:
+        if not relationship.cascade.expunge:
+            continue
+        related = getattr(element, relationship.key)
+        for child in (related if relationship.uselist else [related]):
+            if child is not None:
+                load_execution_graph(child)
+
+
+class ExecutionPlan(object):
+    """A fully loaded Workflow, detached from the database session it was loaded with, and its index. The literal
+        Arguments of its Actions are converted once, when the plan is built"""
+    __slots__ = ['workflow', 'version', 'index']
+
+    def __init__(self, workflow, version=None):
+        self.workflow = workflow
+        self.version = version
+        self.index = WorkflowIndex(workflow)
+        for action in workflow.actions:
+            action.prepare_literal_arguments()
+
+    def reset(self):
+        """Clears the state left on the Workflow by a previous execution"""
+        for action in self.workflow.actions:
+            action.reset_execution_state()
+        for branch in self.workflow.branches:
+            branch.reset_counter()
+
+
+class ExecutionPlanCache(object):
+    def __init__(self, execution_db, max_plans=128):
+        """Initializes an ExecutionPlanCache, which saves a worker from loading a Workflow from the execution database
+            every time it is executed
+
+        The Actions and Branches of a Workflow keep the state of the execution they are part of, so each thread keeps
+        its own plans. Plans are versioned, and a plan is reloaded once its Workflow has been invalidated or the app
+        APIs its Arguments were validated against have been reloaded.
+
+        Args:
+            execution_db (ExecutionDatabase): The execution database to load Workflows from
+            max_plans (int, optional): The number of plans each thread keeps. The least recently used plan is dropped
+                once this is exceeded. Defaults to 128
+        """
+        self.execution_db = execution_db
+        self.max_plans = max_plans
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._versions = {}
+
+    def get(self, workflow_id):
+        """Gets the execution plan of a Workflow, loading it from the execution database if it is not cached
+
+        Args:
+            workflow_id (UUID|str): The ID of the Workflow
+
+        Returns:
+            (ExecutionPlan): The execution plan, ready to be executed, or None if the Workflow does not exist
+        """
+        workflow_id = str(workflow_id)
+        version = self._get_version(workflow_id)
+        plans = self._get_thread_plans()
+        plan = plans.pop(workflow_id, None)
+        if plan is None or plan.version != version:
+            plan = self._load(workflow_id, version)
+            if plan is None:
+                return None
+        else:
+            plan.reset()
+        plans[workflow_id] = plan
+        while len(plans) > self.max_plans:
+            plans.popitem(last=False)
+        return plan
+
+    def invalidate(self, workflow_id=None):
+        """Marks the cached execution plans of a Workflow as out of date
+
+        Args:
+            workflow_id (UUID|str, optional): The ID of the Workflow. Defaults to None, which marks every plan
+        """
+        with self._lock:
+            if workflow_id is None:
+                self._generation += 1
+                self._versions.clear()
+            else:
+                workflow_id = str(workflow_id)
+                self._versions[workflow_id] = self._versions.get(workflow_id, 0) + 1
+
+    def receive_invalidations(self, subscription):
+        """Invalidates execution plans as Workflows are edited
+
+        Args:
+            subscription (RedisSubscription): A subscription to the workflow plans channel
+        """
+        for message in subscription.listen():
+            if isinstance(message, bytes):
+                message = message.decode('utf-8')
+            logger.debug('Invalidating execution plan of workflow {}'.format(message))
+            self.invalidate(None if message == invalidate_all_message else message)
+
+    def _get_version(self, workflow_id):
+        with self._lock:
+            return self._generation, walkoff.config.app_apis_version, self._versions.get(workflow_id, 0)
+
+    def _get_thread_plans(self):
+        plans = getattr(self._local, 'plans', None)
+        if plans is None:
+            plans = self._local.plans = OrderedDict()
+        return plans
+
+    def _load(self, workflow_id, version):
+        workflow = self.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+        if workflow is None:
+            return None
+        load_execution_graph(workflow)
+        self.execution_db.session.expunge(workflow)
+        return ExecutionPlan(workflow, version)
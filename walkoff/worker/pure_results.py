@@ -0,0 +1,82 @@
+import hashlib
+import json
+import threading
+from copy import deepcopy
+from numbers import Number
+
+from six import string_types
+
+
+def copy_result(result):
+    """Copies the result of a condition or transform, unless it is immutable
+
+    Args:
+        result (any): The result
+
+    Returns:
+        (any): The copy
+    """
+    if result is None or isinstance(result, string_types + (Number, bool)):
+        return result
+    return deepcopy(result)
+
+
+class PureResultCache(object):
+    def __init__(self):
+        """Initializes a PureResultCache, which memoizes the results of pure Conditions and Transforms within a workflow
+            execution
+
+        Results are keyed by the type, app, and name of the Condition or Transform, and a fingerprint of its converted
+        arguments, including the data it is given. Conditions and Transforms whose arguments cannot be serialized to
+        JSON are executed every time.
+        """
+        self.hits = 0
+        self.misses = 0
+        self._results = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(executable, arguments):
+        """Makes the key the result of executing a Condition or Transform with some arguments is memoized under
+
+        Args:
+            executable (Condition|Transform): The Condition or Transform
+            arguments (dict): The converted arguments
+
+        Returns:
+            (tuple): The key, or None if the arguments cannot be fingerprinted
+        """
+        try:
+            serialized = json.dumps(arguments, sort_keys=True, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return None
+        fingerprint = hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+        return executable.__class__.__name__.lower(), executable.app_name, executable.action_name, fingerprint
+
+    def execute(self, action_execution_strategy, executable, accumulator, arguments):
+        """Executes a pure Condition or Transform, or returns its memoized result
+
+        Args:
+            action_execution_strategy: The strategy used to execute the Condition or Transform
+            executable (Condition|Transform): The Condition or Transform
+            accumulator (dict): The accumulated results of previous Actions
+            arguments (dict): The converted arguments
+
+        Returns:
+            (any): The result
+        """
+        key = self.make_key(executable, arguments)
+        if key is None:
+            return action_execution_strategy.execute(executable, accumulator, arguments)
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                result = copy_result(self._results[key])
+                if getattr(action_execution_strategy, 'fully_cached', False):
+                    accumulator[executable.id] = result
+                return result
+        result = action_execution_strategy.execute(executable, accumulator, arguments)
+        with self._lock:
+            self.misses += 1
+            self._results[key] = copy_result(result)
+        return result
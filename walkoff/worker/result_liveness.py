@@ -0,0 +1,82 @@
+def get_argument_references(arguments):
+    """Gets the IDs of the Actions whose results a number of Arguments reference
+
+    Args:
+        arguments (list[Argument]): The Arguments. May contain None
+
+    Returns:
+        (set(UUID)): The referenced IDs
+    """
+    return {argument.reference for argument in arguments
+            if argument is not None and argument.value is None and argument.reference}
+
+
+def get_expression_references(expression):
+    """Gets the IDs of the Actions whose results the Conditions and Transforms of a ConditionalExpression reference
+
+    Args:
+        expression (ConditionalExpression): The expression. May be None
+
+    Returns:
+        (set(UUID)): The referenced IDs
+    """
+    references = set()
+    expressions = [expression] if expression is not None else []
+    while expressions:
+        expression = expressions.pop()
+        expressions.extend(expression.child_expressions)
+        for condition in expression.conditions:
+            references |= get_argument_references(condition.arguments)
+            for transform in condition.transforms:
+                references |= get_argument_references(transform.arguments)
+    return references
+
+
+def get_action_references(action, branches):
+    """Gets the IDs of the Actions whose results executing an Action and its outbound Branches reads
+
+    Args:
+        action (Action): The Action
+        branches (list[Branch]): The outbound Branches of the Action
+
+    Returns:
+        (set(UUID)): The referenced IDs
+    """
+    references = get_argument_references(action.arguments)
+    references |= get_argument_references([action.device_id])
+    references |= get_expression_references(action.trigger)
+    for branch in branches:
+        references |= get_expression_references(branch.condition)
+    return references
+
+
+def get_live_results(actions, branches):
+    """Finds the results which may still be read once execution reaches each Action of a Workflow
+
+    A result is live at an Action if that Action, or any Action reachable from it through Branches, references it in
+    its Arguments, device, trigger, or the Conditions and Transforms of its outbound Branches. Results of Actions which
+    are not live at any Action about to be executed can never be read again.
+
+    Args:
+        actions (dict{UUID: Action}): The Actions of the Workflow, by ID
+        branches (dict{UUID: list[Branch]}): The outbound Branches of each Action, by the ID of the Action
+
+    Returns:
+        (dict{UUID: frozenset(UUID)}): The IDs of the Actions whose results are live at each Action
+    """
+    action_ids = {str(action_id): action_id for action_id in actions}
+    references = {}
+    for action_id, action in actions.items():
+        referenced = (str(reference) for reference in get_action_references(action, branches.get(action_id, [])))
+        references[action_id] = {action_ids[reference] for reference in referenced if reference in action_ids}
+    live = {}
+    for action_id in actions:
+        reachable = {action_id}
+        frontier = [action_id]
+        while frontier:
+            for branch in branches.get(frontier.pop(), []):
+                if branch.destination_id in actions and branch.destination_id not in reachable:
+                    reachable.add(branch.destination_id)
+                    frontier.append(branch.destination_id)
+        live[action_id] = frozenset(set().union(*(references[reachable_id] for reachable_id in reachable)))
+    return live
@@ -0,0 +1,210 @@
+import logging
+import math
+import multiprocessing
+import os
+import signal
+import threading
+
+from walkoff.multiprocessedexecutor.requestqueue import get_queue_depth
+
+logger = logging.getLogger(__name__)
+
+worker_pool_key_prefix = 'worker_pool'
+worker_pool_metrics = ('workers', 'draining', 'busy_threads', 'queue_depth', 'scale_ups', 'scale_downs')
+
+
+def worker_pool_key(metric):
+    """Gets the key of a worker pool metric
+
+    Args:
+        metric (str): The name of the metric
+
+    Returns:
+        (str): The key of the metric
+    """
+    return '{0}:{1}'.format(worker_pool_key_prefix, metric)
+
+
+def get_worker_pool_metrics(cache):
+    """Gets the size and scale events of an elastic worker pool
+
+    Args:
+        cache (RedisCacheAdapter): The cache the worker supervisor records its metrics in
+
+    Returns:
+        (dict): The number of running and draining workers, the number of busy worker threads, the depth of the request
+            queue at the last check, and the number of workers added and drained
+    """
+    return {metric: int(cache.get(worker_pool_key(metric)) or 0) for metric in worker_pool_metrics}
+
+
+def spawn_worker_process(worker_id, config_path, busy_threads):
+    """Starts a Worker in a new process
+
+    Args:
+        worker_id (int): The ID of the worker
+        config_path (str): The path to the configuration file to be loaded by the worker
+        busy_threads (multiprocessing.Value): Shared counter the worker keeps its number of executing workflows in
+
+    Returns:
+        (multiprocessing.Process): The process of the worker
+    """
+    from walkoff.worker.worker import Worker
+    process = multiprocessing.Process(target=Worker, args=(worker_id, config_path, busy_threads))
+    process.start()
+    return process
+
+
+class WorkerSupervisor(object):
+    def __init__(self, cache, config_path, min_workers, max_workers, threads_per_worker, interval=5,
+                 scale_up_utilization=0.8, scale_down_utilization=0.25, scale_down_checks=3,
+                 spawn_worker=spawn_worker_process):
+        """Initializes a WorkerSupervisor, which resizes a pool of worker processes to fit the workflow request queue
+
+        Args:
+            cache (RedisCacheAdapter): The cache holding the request queue. Metrics are recorded in it
+            config_path (str): The path to the configuration file to be loaded by the workers
+            min_workers (int): The minimum number of workers to run
+            max_workers (int): The maximum number of workers to run
+            threads_per_worker (int): The number of workflows each worker can execute at once
+            interval (int, optional): The number of seconds between checks. Defaults to 5
+            scale_up_utilization (float, optional): The fraction of worker threads which must be busy, while requests
+                are queued, for workers to be added. Defaults to 0.8
+            scale_down_utilization (float, optional): The fraction of worker threads which may be busy, while the queue
+                is empty, for a worker to be drained. Defaults to 0.25
+            scale_down_checks (int, optional): The number of consecutive checks which must allow a worker to be
+                drained before one is. Defaults to 3
+            spawn_worker (func(int, str, multiprocessing.Value), optional): Starts a worker process. Defaults to
+                spawn_worker_process
+        """
+        self.cache = cache
+        self.config_path = config_path
+        self.min_workers = max(min_workers, 1)
+        self.max_workers = max(max_workers, self.min_workers)
+        self.threads_per_worker = max(threads_per_worker, 1)
+        self.interval = interval
+        self.scale_up_utilization = scale_up_utilization
+        self.scale_down_utilization = scale_down_utilization
+        self.scale_down_checks = scale_down_checks
+        self.spawn_worker = spawn_worker
+        self.workers = {}
+        self.draining = {}
+        self._next_worker_id = 0
+        self._idle_checks = 0
+        self._exit = threading.Event()
+
+    @property
+    def processes(self):
+        """(list[multiprocessing.Process]): The processes of all running and draining workers"""
+        return [process for process, _ in self.workers.values()] + list(self.draining.values())
+
+    @property
+    def busy_threads(self):
+        """(int): The number of workflows being executed by the running workers"""
+        return sum(busy_threads.value for _, busy_threads in self.workers.values())
+
+    @property
+    def utilization(self):
+        """(float): The fraction of the running workers' threads which are executing workflows"""
+        capacity = len(self.workers) * self.threads_per_worker
+        return float(self.busy_threads) / capacity if capacity else 1.
+
+    def run(self):
+        """Starts the minimum number of workers, then resizes the pool every interval until shut down"""
+        logger.info('Starting worker supervisor with {0} to {1} workers'.format(self.min_workers, self.max_workers))
+        self.scale_up(self.min_workers)
+        self._record_metrics(0)
+        while not self._exit.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception('Worker supervisor encountered an error')
+
+    def shutdown(self):
+        """Stops resizing the pool. The worker processes are left running"""
+        self._exit.set()
+
+    def check(self):
+        """Resizes the pool to fit the request queue
+
+        Returns:
+            (int): The number of workers added, or the negative of the number of workers drained
+        """
+        self._reap_workers()
+        queue_depth = get_queue_depth(self.cache)
+        utilization = self.utilization
+        change = 0
+        if len(self.workers) < self.min_workers:
+            change = self.scale_up(self.min_workers - len(self.workers))
+        elif queue_depth and utilization >= self.scale_up_utilization:
+            self._idle_checks = 0
+            wanted = int(math.ceil(float(queue_depth) / self.threads_per_worker))
+            change = self.scale_up(min(wanted, self.max_workers - len(self.workers)))
+        elif not queue_depth and utilization <= self.scale_down_utilization and len(self.workers) > self.min_workers:
+            self._idle_checks += 1
+            if self._idle_checks >= self.scale_down_checks:
+                self._idle_checks = 0
+                change = -self.scale_down(1)
+        else:
+            self._idle_checks = 0
+        self._record_metrics(queue_depth)
+        return change
+
+    def scale_up(self, count):
+        """Starts new workers
+
+        Args:
+            count (int): The number of workers to start
+
+        Returns:
+            (int): The number of workers started
+        """
+        for _ in range(count):
+            worker_id = self._next_worker_id
+            self._next_worker_id += 1
+            busy_threads = multiprocessing.Value('i', 0)
+            self.workers[worker_id] = (self.spawn_worker(worker_id, self.config_path, busy_threads), busy_threads)
+        if count > 0:
+            logger.info('Started {0} workers. {1} workers running'.format(count, len(self.workers)))
+            self.cache.incr(worker_pool_key('scale_ups'), count)
+        return max(count, 0)
+
+    def scale_down(self, count):
+        """Drains the least busy workers. Draining workers stop taking requests and exit once their workflows finish
+
+        Args:
+            count (int): The number of workers to drain
+
+        Returns:
+            (int): The number of workers drained
+        """
+        count = min(count, len(self.workers) - self.min_workers)
+        least_busy = sorted(self.workers, key=lambda worker_id: self.workers[worker_id][1].value)[:count]
+        for worker_id in least_busy:
+            process, _ = self.workers.pop(worker_id)
+            logger.info('Draining worker {0} (pid={1})'.format(worker_id, process.pid))
+            try:
+                os.kill(process.pid, signal.SIGTERM)
+            except (OSError, TypeError):
+                logger.warning('Could not signal worker {} to drain'.format(worker_id))
+            self.draining[worker_id] = process
+        if least_busy:
+            self.cache.incr(worker_pool_key('scale_downs'), len(least_busy))
+        return len(least_busy)
+
+    def _reap_workers(self):
+        for worker_id, process in list(self.draining.items()):
+            if not process.is_alive():
+                logger.info('Worker {} finished draining'.format(worker_id))
+                process.join(timeout=0)
+                self.draining.pop(worker_id)
+        for worker_id, (process, _) in list(self.workers.items()):
+            if not process.is_alive():
+                logger.error('Worker {0} exited unexpectedly with code {1}'.format(worker_id, process.exitcode))
+                self.workers.pop(worker_id)
+
+    def _record_metrics(self, queue_depth):
+        self.cache.set(worker_pool_key('workers'), len(self.workers))
+        self.cache.set(worker_pool_key('draining'), len(self.draining))
+        self.cache.set(worker_pool_key('busy_threads'), self.busy_threads)
+        self.cache.set(worker_pool_key('queue_depth'), queue_depth)
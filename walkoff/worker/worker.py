@@ -15,6 +15,9 @@ import walkoff.config
 from walkoff.appgateway.appinstancerepo import AppInstanceRepo
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import ExecutionDatabase
+from walkoff.pipelinemetrics import pipeline_metrics
+from walkoff.worker.event_filter import EventFilter, get_subscribed_events, subscribed_events_channel
+from walkoff.worker.execution_plan import ExecutionPlanCache, workflow_plans_channel
 from walkoff.senders_receivers_helpers import make_results_sender, make_communication_receiver
 from walkoff.worker.workflow_exec_strategy import WorkflowExecutor
 from walkoff.worker.zmq_workflow_receivers import WorkerCommunicationMessageType, WorkflowCommunicationMessageType, \
@@ -24,17 +27,23 @@ logger = logging.getLogger(__name__)
 
 
 class Worker(object):
-    def __init__(self, id_, config_path):
+    def __init__(self, id_, config_path, busy_threads=None):
         """Initialize a Worker object, which will be managing the execution of Workflows
 
         Args:
             id_ (str): The ID of the worker
             config_path (str): The path to the configuration file to be loaded
+            busy_threads (multiprocessing.Value, optional): Shared counter to keep the number of executing workflows
+                in, so that a supervisor can see how busy this worker is. Defaults to None
         """
         self.id_ = id_
         self._lock = Lock()
+        self.busy_threads = busy_threads
+        self.admitted_workflows = 0
+        self.draining = False
         signal.signal(signal.SIGINT, self.exit_handler)
         signal.signal(signal.SIGABRT, self.exit_handler)
+        signal.signal(signal.SIGTERM, self.drain_handler)
 
         if walkoff.config.Config.SEPARATE_WORKERS or os.name == 'nt':
             walkoff.config.initialize(config_path=config_path)
@@ -46,6 +55,7 @@ class Worker(object):
         logger.info('Spawning worker {}'.format(id_))
 
         self.cache = walkoff.cache.make_cache(walkoff.config.Config.CACHE)
+        pipeline_metrics.start(self.cache, walkoff.config.Config.PIPELINE_METRICS_FLUSH_INTERVAL)
 
         self.execution_db = ExecutionDatabase(walkoff.config.Config.EXECUTION_DB_TYPE,
                                               walkoff.config.Config.EXECUTION_DB_PATH,
@@ -73,16 +83,44 @@ class Worker(object):
         data = {'socket_id': socket_id}
         self.workflow_communication_receiver = make_communication_receiver(**data)
 
+        self.plan_cache = None
+        self.plan_cache_thread = None
+        if walkoff.config.Config.WORKFLOW_PLAN_CACHE_SIZE:
+            self.plan_cache = ExecutionPlanCache(self.execution_db, walkoff.config.Config.WORKFLOW_PLAN_CACHE_SIZE)
+            plan_subscription = self.cache.subscribe(workflow_plans_channel)
+            self.plan_cache_thread = threading.Thread(target=self.plan_cache.receive_invalidations,
+                                                      args=(plan_subscription,))
+            self.plan_cache_thread.daemon = True
+            self.plan_cache_thread.start()
+
+        self.event_filter = EventFilter(walkoff.config.Config.WORKFLOW_EVENT_LEVEL,
+                                        walkoff.config.Config.WORKFLOW_EVENT_TYPE_LEVELS,
+                                        get_subscribed_events(self.cache))
+        events_subscription = self.cache.subscribe(subscribed_events_channel)
+        self.event_filter_thread = threading.Thread(target=self.event_filter.receive_subscriptions,
+                                                    args=(self.cache, events_subscription))
+        self.event_filter_thread.daemon = True
+        self.event_filter_thread.start()
+
         self.workflow_executor = WorkflowExecutor(
             walkoff.config.Config,
             self.capacity,
             self.execution_db,
-            AppInstanceRepo
+            AppInstanceRepo,
+            plan_cache=self.plan_cache
         )
+        pipeline_metrics.add_callback(self._record_thread_metrics)
 
         self.comm_thread = threading.Thread(target=self.receive_communications)
         self.comm_thread.start()
 
+        self.heartbeat_thread = None
+        if self.workflow_receiver.reliable:
+            self.workflow_receiver.send_heartbeat()
+            self.heartbeat_thread = threading.Thread(target=self.send_heartbeats)
+            self.heartbeat_thread.daemon = True
+            self.heartbeat_thread.start()
+
         self.workflows = {}
         self.threadpool = ThreadPoolExecutor(max_workers=self.capacity)
 
@@ -102,6 +140,23 @@ class Worker(object):
     def exit_handler(self, signum, frame):
         """Clean up upon receiving a SIGINT or SIGABT"""
         logger.info('Worker received exit signal {}'.format(signum))
+        self.shutdown()
+
+    def drain_handler(self, signum, frame):
+        """Stop taking workflow execution requests upon receiving a SIGTERM, and exit once the executing workflows
+            finish
+        """
+        logger.info('Worker received drain signal {}'.format(signum))
+        self.draining = True
+
+    def drain(self):
+        """Waits for the executing workflows to finish, then shuts down"""
+        logger.info('Worker {} draining'.format(self.id_))
+        self.threadpool.shutdown(wait=True)
+        self.shutdown()
+
+    def shutdown(self):
+        """Shuts down the worker and exits the process"""
         self.thread_exit = True
         self.workflow_receiver.shutdown()
         if self.threadpool:
@@ -110,17 +165,61 @@ class Worker(object):
         if self.comm_thread:
             self.comm_thread.join(timeout=2)
         self.workflow_results_sender.shutdown()
+        try:
+            pipeline_metrics.flush()
+        except Exception:
+            logger.exception('Could not write the pipeline metrics of worker {}'.format(self.id_))
         os._exit(0)
 
     def receive_workflows(self):
         """Receives requests to execute workflows, and sends them off to worker threads"""
-        workflow_generator = self.workflow_receiver.receive_workflows()
+        while not self.thread_exit and not self.draining:
+            slots = self.workflow_executor.acquire_slots(timeout=1)
+            if not slots:
+                continue
+            workflows = self.workflow_receiver.receive_workflow_batch(slots)
+            for workflow_data in workflows:
+                self._submit_workflow(workflow_data)
+            if len(workflows) < slots:
+                self.workflow_executor.release_slots(slots - len(workflows))
+            if not workflows and not self.workflow_receiver.is_blocking:
+                time.sleep(0.1)
+        if self.draining:
+            self.drain()
+
+    def _submit_workflow(self, workflow_data):
+        with self._lock:
+            self.admitted_workflows += 1
+        future = self.threadpool.submit(self.workflow_executor.execute, *workflow_data)
+        future.add_done_callback(self._release_slot)
+        if self.busy_threads is not None:
+            with self.busy_threads.get_lock():
+                self.busy_threads.value += 1
+            future.add_done_callback(self._release_busy_thread)
+        if self.workflow_receiver.reliable:
+            workflow_execution_id = workflow_data[1]
+            future.add_done_callback(lambda _: self.workflow_receiver.acknowledge(workflow_execution_id))
+
+    def _release_slot(self, _):
+        with self._lock:
+            self.admitted_workflows -= 1
+        self.workflow_executor.release_slots()
+
+    def _release_busy_thread(self, _):
+        with self.busy_threads.get_lock():
+            self.busy_threads.value -= 1
+
+    def _record_thread_metrics(self):
+        with self._lock:
+            busy = min(max(self.admitted_workflows, 0), self.capacity)
+        pipeline_metrics.set_gauge('walkoff_worker_threads', busy, self.id_, 'busy')
+        pipeline_metrics.set_gauge('walkoff_worker_threads', self.capacity - busy, self.id_, 'idle')
+
+    def send_heartbeats(self):
+        """Periodically marks this worker as alive so that its in-flight workflows are not redelivered"""
         while not self.thread_exit:
-            if not self.workflow_executor.is_at_capacity:
-                workflow_data = next(workflow_generator)
-                if workflow_data is not None:
-                    self.threadpool.submit(self.workflow_executor.execute, *workflow_data)
-            time.sleep(0.1)
+            time.sleep(walkoff.config.Config.WORKER_HEARTBEAT_INTERVAL)
+            self.workflow_receiver.send_heartbeat()
 
     def receive_communications(self):
         """Constantly receives data from the ZMQ socket and handles it accordingly"""
@@ -143,6 +242,9 @@ class Worker(object):
                 kwargs (dict): Any extra data to send.
         """
         workflow_context = self.workflow_executor.get_current_workflow()
+        if workflow_context is not None and not self.event_filter.is_emitted(kwargs['event'],
+                                                                             workflow_context.workflow):
+            return
         if workflow_context is None and kwargs['event'] != WalkoffEvent.WorkerReady:
             logger.error('Workflow context information does not exist for callback being sent.')
         else:
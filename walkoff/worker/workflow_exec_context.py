@@ -1,34 +1,66 @@
 import logging
+import threading
 
-from walkoff.appgateway.accumulators import make_accumulator
+from walkoff.appgateway.accumulators import make_accumulator, flush_accumulator, touch_accumulator, \
+    persist_accumulator, discard_entries
+from walkoff.appgateway.resultstore import make_result_store, result_as_json
 from walkoff.events import WalkoffEvent
+from walkoff.worker.result_liveness import get_live_results, get_argument_references
 
 logger = logging.getLogger(__name__)
 
 
+class WorkflowIndex(object):
+    """Lookups of the Actions and Branches of a Workflow, built once so that each step of an execution is constant
+       time regardless of the size of the Workflow. Also holds the results which are live at each Action, unless the
+       Workflow keeps all of its results
+    """
+    __slots__ = ['actions', 'branches', 'live_results']
+
+    def __init__(self, workflow):
+        self.actions = {action.id: action for action in workflow.actions}
+        self.branches = {}
+        for branch in workflow.branches:
+            self.branches.setdefault(branch.source_id, []).append(branch)
+        for branches in self.branches.values():
+            branches.sort(key=lambda branch_: branch_.priority)
+        self.live_results = None if workflow.keep_all_results else get_live_results(self.actions, self.branches)
+
+
 class WorkflowExecutionContext(object):
     """Holds a context for executing a Workflow. Much of this logic was previously held in the Workflow object itself.
        A context keeps track of a specific execution of a workflow.
     """
     __slots__ = ['workflow', 'name', 'id', 'workflow_start', 'execution_id', 'accumulator', 'app_instance_repo',
-                 'executing_action', 'is_paused', 'is_aborted', 'has_branches', 'last_status', 'user']
+                 '_executing', 'is_paused', 'is_aborted', 'has_branches', 'last_status', 'user', 'index', '_results']
 
-    def __init__(self, workflow, app_instance_repo, execution_id, resumed=False, user=None):
+    def __init__(self, workflow, app_instance_repo, execution_id, resumed=False, user=None, index=None):
         self.workflow = workflow
+        self.index = index if index is not None else WorkflowIndex(workflow)
         self.accumulator = None
         self.app_instance_repo = app_instance_repo
         self.execution_id = execution_id
         self.name = workflow.name
         self.id = workflow.id
         self.workflow_start = workflow.start
-        self.executing_action = None
+        self._executing = threading.local()
         self.is_paused = False
         self.is_aborted = False
         self.has_branches = bool(self.workflow.branches)
         self.last_status = None
+        self._results = set()
         self.init_accumulator(resumed)
         self.user = user
 
+    @property
+    def executing_action(self):
+        """The Action executing in the current thread. Actions of a workflow executed in parallel each have a thread"""
+        return getattr(self._executing, 'action', None)
+
+    @executing_action.setter
+    def executing_action(self, action):
+        self._executing.action = action
+
     def pause(self):
         self.is_paused = True
 
@@ -45,7 +77,7 @@ class WorkflowExecutionContext(object):
         return self.app_instance_repo.get_app_instance(device_id)()
 
     def get_action_by_id(self, action_id):
-        return next((action for action in self.workflow.actions if action.id == action_id), None)
+        return self.index.actions.get(action_id)
 
     def get_executing_action_id(self):
         return self.executing_action.id
@@ -54,7 +86,7 @@ class WorkflowExecutionContext(object):
         return self.executing_action
 
     def get_branches_by_action_id(self, action_id):
-        return sorted(self.workflow.get_branches_by_action_id(action_id), key=lambda branch_: branch_.priority)
+        return self.index.branches.get(action_id, [])
 
     def set_execution_id(self, execution_id):
         self.workflow.set_execution_id(execution_id)
@@ -65,6 +97,50 @@ class WorkflowExecutionContext(object):
     def update_multiple_accumulator(self, updated_keys):
         self.accumulator.update(updated_keys)
 
+    def flush_accumulator(self, persist=False):
+        """Writes the accumulator to its cache
+
+        Args:
+            persist (bool, optional): Keep the accumulator and the fields of the app instances without an expiration,
+                because the workflow is paused or awaiting a trigger? Defaults to False
+        """
+        flush_accumulator(self.accumulator)
+        if persist:
+            persist_accumulator(self.accumulator)
+            self.app_instance_repo.persist_fields(self.execution_id)
+
+    def add_result(self, action_id):
+        """Records that an Action has written its result to the accumulator, so it can be freed once it is dead
+
+        Args:
+            action_id (UUID): The ID of the Action
+        """
+        if self.index.live_results is not None:
+            self._results.add(action_id)
+
+    def free_dead_results(self, frontier, arguments=None):
+        """Deletes the results which no Action reachable from the Actions about to be executed reads
+
+        Args:
+            frontier (list[Action]): The Actions about to be executed
+            arguments (list[Argument], optional): Arguments to execute the Actions with in place of their own
+        """
+        if self.index.live_results is None or not self._results:
+            return
+        live = get_argument_references(arguments) if arguments else set()
+        for action in frontier:
+            live.add(action.id)
+            live |= self.index.live_results.get(action.id, frozenset())
+        live = {str(action_id) for action_id in live}
+        dead = [action_id for action_id in self._results if str(action_id) not in live]
+        if not dead:
+            return
+        self._results.difference_update(dead)
+        discard_entries(self.accumulator, dead)
+        make_result_store().delete(self.execution_id, dead)
+        logger.debug('Freed the results of {} actions of workflow {} (execution {})'.format(
+            len(dead), self.name, self.execution_id))
+
     def update_status(self, status):
         self.last_status = status
 
@@ -74,14 +150,31 @@ class WorkflowExecutionContext(object):
             self.accumulator.update({env_var.id: env_var.value for env_var in self.workflow.environment_variables})
         if not from_resumed:
             self.accumulator.update({branch.id: 0 for branch in self.workflow.branches})
+        else:
+            touch_accumulator(self.accumulator)
+            self.app_instance_repo.touch_fields(self.execution_id)
+            if self.index.live_results is not None:
+                self._results = set(self.index.actions)
 
     def shutdown(self):
         # Upon finishing shut down instances
         self.app_instance_repo.shutdown_instances()
-        accumulator = {str(key): value for key, value in self.accumulator.items()}
+        accumulator = {str(key): result_as_json(value) for key, value in self.accumulator.items()}
         self.send_event(WalkoffEvent.WorkflowShutdown, data=accumulator)
         logger.info('Workflow {0} completed. Result: {1}'.format(self.workflow.name, accumulator))
+        self.log_bytes_written()
         self.accumulator.clear()
+        make_result_store().delete_execution(self.execution_id)
+
+    def log_bytes_written(self):
+        """Logs the number of bytes the execution wrote to the cache, and which Actions wrote the most"""
+        bytes_written = getattr(self.accumulator, 'bytes_written', None)
+        if not bytes_written:
+            return
+        names = {str(action.id): action.name for action in self.workflow.actions}
+        largest = ['{} ({} bytes)'.format(names.get(key, key), count) for key, count in bytes_written.most_common(5)]
+        logger.info('Workflow {0} (execution {1}) wrote {2} bytes of results. Largest: {3}'.format(
+            self.workflow.name, self.execution_id, sum(bytes_written.values()), ', '.join(largest)))
 
     @property
     def restricted_context(self):
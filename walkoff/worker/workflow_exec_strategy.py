@@ -1,12 +1,17 @@
 import logging
 import threading
+from collections import deque
+from contextlib import contextmanager
 from uuid import UUID
 
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb.saved_workflow import SavedWorkflow
 from walkoff.executiondb.workflow import Workflow
 from walkoff.executiondb.workflowresults import WorkflowStatus, WorkflowStatusEnum
 from walkoff.worker.action_exec_strategy import make_execution_strategy
+from walkoff.worker.execution_plan import ExecutionPlan
 from walkoff.worker.workflow_exec_context import WorkflowExecutionContext
 
 logger = logging.getLogger(__name__)
@@ -43,10 +48,12 @@ class SerialWorkflowExecutionStrategy(object):
         actions = SerialWorkflowExecutionStrategy.action_iter(workflow_context, action_execution_strategy, start=start)
         for action in (action_ for action_ in actions if action_ is not None):
             workflow_context.executing_action = action
+            workflow_context.free_dead_results([action], arguments=start_arguments)
             logger.debug('Executing action {} of workflow {}'.format(action, workflow_context.name))
 
             if workflow_context.is_paused:
                 workflow_context.is_paused = False
+                workflow_context.flush_accumulator(persist=True)
                 workflow_context.send_event(WalkoffEvent.WorkflowPaused)
                 logger.debug('Paused workflow {} (id={})'.format(workflow_context.name, str(workflow_context.id)))
                 return
@@ -58,24 +65,44 @@ class SerialWorkflowExecutionStrategy(object):
                 return
 
             device_id = workflow_context.app_instance_repo.setup_app_instance(action, workflow_context)
-            if device_id:
-                result_status = action.execute(action_execution_strategy, workflow_context.accumulator,
-                                               instance=workflow_context.get_app_instance(device_id),
-                                               arguments=start_arguments, resume=resume)
-            else:
-                result_status = action.execute(action_execution_strategy, workflow_context.accumulator,
-                                               arguments=start_arguments, resume=resume)
+            result_status = SerialWorkflowExecutionStrategy.execute_action(
+                workflow_context, action, action_execution_strategy, device_id, start_arguments, resume)
 
             workflow_context.update_status(result_status)
+            workflow_context.add_result(action.id)
 
             if start_arguments:
                 start_arguments = None
 
             if result_status == "trigger":
+                workflow_context.flush_accumulator(persist=True)
                 return
 
         workflow_context.shutdown()
 
+    @staticmethod
+    def execute_action(workflow_context, action, action_execution_strategy, device_id, arguments, resume):
+        """Executes an Action of a Workflow
+
+        Args:
+            workflow_context (WorkflowExecutionContext): The context of the executing workflow
+            action (Action): The Action to execute
+            action_execution_strategy: The strategy with which to execute the action
+            device_id (tuple(str, int)): The app instance set up for the Action, or None if it has no device
+            arguments (list[Argument]): Arguments to execute the Action with in place of its own, or None
+            resume (bool): Is the Workflow being resumed at this Action?
+
+        Returns:
+            (str): The status the Action returned
+        """
+        workflow_context.flush_accumulator()
+        if device_id:
+            return action.execute(action_execution_strategy, workflow_context.accumulator,
+                                  instance=workflow_context.get_app_instance(device_id),
+                                  arguments=arguments, resume=resume)
+        return action.execute(action_execution_strategy, workflow_context.accumulator, arguments=arguments,
+                              resume=resume)
+
     @staticmethod
     def action_iter(workflow_context, action_execution_strategy, start):
         current_id = start
@@ -121,23 +148,231 @@ class SerialWorkflowExecutionStrategy(object):
             return None
 
 
+class ParallelWorkflowExecutionStrategy(SerialWorkflowExecutionStrategy):
+
+    def __init__(self, action_execution_strategy, max_actions=4, track_thread=None):
+        """Executes a Workflow by following every Branch taken from each Action, executing the Actions which are ready
+            on a bounded pool of threads
+
+        An Action marked as a join is executed once all of its inbound Branches have been taken. Branches are executed
+        and app instances are set up in the thread executing the Workflow, so the threads executing Actions only write
+        the results of their own Actions to the accumulator. The same Action, or two Actions using the same app
+        instance, are never executed at once.
+
+        A Workflow is only saved at a single Action, so a pause takes effect once the Workflow has narrowed down to a
+        single Action which is ready to execute, with no Actions executing and no join Actions part way through waiting
+        for their Branches. A Workflow which never narrows down completes without pausing.
+
+        Args:
+            action_execution_strategy: The strategy with which to execute the actions
+            max_actions (int, optional): The maximum number of Actions to execute at once. Defaults to 4
+            track_thread (func(WorkflowExecutionContext), optional): Makes a context manager which associates the
+                current thread with the executing workflow while an Action executes in it. Defaults to None
+        """
+        super(ParallelWorkflowExecutionStrategy, self).__init__(action_execution_strategy)
+        self.max_actions = max_actions
+        self.track_thread = track_thread
+
+    def do_execute(self, workflow_context, start, action_execution_strategy, start_arguments, resume):
+        start_action = workflow_context.get_action_by_id(start)
+        if start_action is None:
+            workflow_context.shutdown()
+            return
+
+        joins = ParallelWorkflowExecutionStrategy.get_join_branches(workflow_context)
+        taken_joins = {action_id: set() for action_id in joins}
+        ready = deque([(start_action, start_arguments, resume)])
+        running = {}
+        halt_event = None
+        pool = ThreadPoolExecutor(max_workers=self.max_actions)
+        try:
+            while ready or running:
+                if halt_event is None and ready:
+                    halt_event = self._check_halted(workflow_context, ready, running, taken_joins)
+                if halt_event is None:
+                    self._submit_ready(pool, workflow_context, action_execution_strategy, ready, running)
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    action, _ = running.pop(future)
+                    result_status = future.result()
+                    workflow_context.add_result(action.id)
+                    if halt_event is not None:
+                        continue
+                    if result_status == "trigger":
+                        workflow_context.executing_action = action
+                        halt_event = WalkoffEvent.TriggerActionAwaitingData
+                        continue
+                    for branch in self.get_branches(workflow_context, action_execution_strategy, action,
+                                                    result_status):
+                        destination = workflow_context.get_action_by_id(branch.destination_id)
+                        if destination is None:
+                            continue
+                        if destination.id in joins:
+                            taken_joins[destination.id].add(branch)
+                            if taken_joins[destination.id] != joins[destination.id]:
+                                continue
+                            taken_joins[destination.id] = set()
+                        ready.append((destination, None, False))
+                if halt_event is None and (ready or running):
+                    workflow_context.free_dead_results(
+                        [action for action, _, _ in ready] + [action for action, _ in running.values()])
+        finally:
+            pool.shutdown(wait=True)
+
+        if halt_event is not None:
+            workflow_context.flush_accumulator(persist=halt_event != WalkoffEvent.WorkflowAborted)
+        if halt_event == WalkoffEvent.WorkflowPaused:
+            workflow_context.send_event(WalkoffEvent.WorkflowPaused)
+            logger.debug('Paused workflow {} (id={})'.format(workflow_context.name, str(workflow_context.id)))
+        elif halt_event == WalkoffEvent.WorkflowAborted:
+            workflow_context.send_event(WalkoffEvent.WorkflowAborted)
+            logger.info('Aborted workflow {} (id={})'.format(workflow_context.name, str(workflow_context.id)))
+        elif halt_event is None:
+            for action_id, taken in taken_joins.items():
+                if taken:
+                    logger.warning('Join action {} of workflow {} (id={}) did not execute. Only {} of its {} '
+                                   'branches were taken'.format(action_id, workflow_context.name,
+                                                                str(workflow_context.id), len(taken),
+                                                                len(joins[action_id])))
+            workflow_context.shutdown()
+
+    @staticmethod
+    def _check_halted(workflow_context, ready, running, taken_joins):
+        if workflow_context.is_paused and len(ready) == 1 and not running and not any(taken_joins.values()):
+            workflow_context.is_paused = False
+            workflow_context.executing_action = ready[0][0]
+            return WalkoffEvent.WorkflowPaused
+        if workflow_context.is_aborted:
+            workflow_context.is_aborted = False
+            return WalkoffEvent.WorkflowAborted
+        return None
+
+    def _submit_ready(self, pool, workflow_context, action_execution_strategy, ready, running):
+        executing_actions = {action.id for action, _ in running.values()}
+        executing_devices = {device_id for _, device_id in running.values() if device_id is not None}
+        deferred = []
+        while ready and len(running) < self.max_actions:
+            action, arguments, resume = ready.popleft()
+            if action.id in executing_actions:
+                deferred.append((action, arguments, resume))
+                continue
+            device_id = workflow_context.app_instance_repo.setup_app_instance(action, workflow_context)
+            if device_id is not None and device_id in executing_devices:
+                deferred.append((action, arguments, resume))
+                continue
+            logger.debug('Executing action {} of workflow {}'.format(action, workflow_context.name))
+            future = pool.submit(self._execute_in_thread, workflow_context, action, action_execution_strategy,
+                                 device_id, arguments, resume)
+            running[future] = (action, device_id)
+            executing_actions.add(action.id)
+            if device_id is not None:
+                executing_devices.add(device_id)
+        ready.extendleft(reversed(deferred))
+
+    def _execute_in_thread(self, workflow_context, action, action_execution_strategy, device_id, arguments, resume):
+        if self.track_thread is None:
+            workflow_context.executing_action = action
+            return self.execute_action(workflow_context, action, action_execution_strategy, device_id, arguments,
+                                       resume)
+        with self.track_thread(workflow_context):
+            workflow_context.executing_action = action
+            return self.execute_action(workflow_context, action, action_execution_strategy, device_id, arguments,
+                                       resume)
+
+    @staticmethod
+    def get_join_branches(workflow_context):
+        """Gets the inbound Branches of each join Action of a Workflow
+
+        Args:
+            workflow_context (WorkflowExecutionContext): The context of the executing workflow
+
+        Returns:
+            (dict{UUID: set(Branch)}): The inbound Branches of each join Action, by the ID of the Action
+        """
+        joins = {}
+        for branches in workflow_context.index.branches.values():
+            for branch in branches:
+                destination = workflow_context.get_action_by_id(branch.destination_id)
+                if destination is not None and destination.is_join:
+                    joins.setdefault(destination.id, set()).add(branch)
+        return joins
+
+    @staticmethod
+    def get_branches(workflow_context, action_execution_strategy, action, status):
+        """Executes all of the Branches leaving an Action to determine which Actions should be executed next
+
+        Args:
+            workflow_context (WorkflowExecutionContext): The context of the executing workflow
+            action_execution_strategy: The strategy with which to execute the actions
+            action (Action): The Action which finished executing
+            status (str): The status the Action returned
+
+        Returns:
+            (list[Branch]): The Branches which were taken, in order of priority
+        """
+        workflow_context.update_status(status)
+        taken = []
+        for branch in workflow_context.get_branches_by_action_id(action.id):
+            destination_id = branch.execute(action_execution_strategy, status, action, workflow_context.accumulator)
+            if destination_id is not None:
+                logger.debug('Branch {} with destination {} chosen by workflow {} (id={})'.format(
+                    str(branch.id),
+                    str(destination_id),
+                    workflow_context.name,
+                    str(workflow_context.id))
+                )
+                taken.append(branch)
+        return taken
+
+
 class WorkflowExecutor(object):
     workflow_execution_strategies = {
-        'serial': SerialWorkflowExecutionStrategy
+        'serial': SerialWorkflowExecutionStrategy,
+        'parallel': ParallelWorkflowExecutionStrategy
     }
 
-    def __init__(self, config, max_workflows, execution_db, app_instance_repo_class, executing_workflow_repo=dict):
+    def __init__(self, config, max_workflows, execution_db, app_instance_repo_class, executing_workflow_repo=dict,
+                 plan_cache=None):
         self.max_workflows = max_workflows
         self.execution_db = execution_db
         self.config = config
         self._app_instance_repo_class = app_instance_repo_class
         self.executing_workflows = executing_workflow_repo()
+        self.action_threads = {}
         self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_workflows)
+        self.plan_cache = plan_cache
 
-    @property
-    def is_at_capacity(self):
-        with self._lock:
-            return len(self.executing_workflows) >= self.max_workflows
+    def acquire_slots(self, timeout=None):
+        """Blocks until a workflow slot is free, then takes every free slot
+
+        Each slot taken must be given back with release_slots, either once the workflow admitted into it finishes or
+        straight away if no workflow is admitted into it.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait for a slot. Defaults to None, which waits
+                forever
+
+        Returns:
+            (int): The number of slots taken, which is 0 if the timeout expired
+        """
+        if not self._slots.acquire(timeout=timeout):
+            return 0
+        slots = 1
+        while slots < self.max_workflows and self._slots.acquire(blocking=False):
+            slots += 1
+        return slots
+
+    def release_slots(self, slots=1):
+        """Gives back workflow slots, waking anything waiting in acquire_slots
+
+        Args:
+            slots (int, optional): The number of slots to give back. Defaults to 1
+        """
+        for _ in range(slots):
+            self._slots.release()
 
     def pause(self, workflow_execution_id):
         workflow_context = self.get_workflow_by_execution_id(workflow_execution_id)
@@ -152,11 +387,11 @@ class WorkflowExecutor(object):
             logger.error('Attempted to abort workflow with execution id {}, but it wasn\'t executing'.format(
                 workflow_execution_id))
 
-    def make_new_context(self, workflow, workflow_execution_id, user=None):
+    def make_new_context(self, workflow, workflow_execution_id, user=None, index=None):
         app_instance_repo = self._app_instance_repo_class()
-        return WorkflowExecutionContext(workflow, app_instance_repo, workflow_execution_id, user)
+        return WorkflowExecutionContext(workflow, app_instance_repo, workflow_execution_id, user=user, index=index)
 
-    def make_resumed_context(self, workflow, workflow_execution_id, user=None):
+    def make_resumed_context(self, workflow, workflow_execution_id, user=None, index=None):
         saved_state = self.execution_db.session.query(SavedWorkflow).filter_by(
             workflow_execution_id=workflow_execution_id).first()
         if saved_state is None:
@@ -165,7 +400,7 @@ class WorkflowExecutor(object):
             return None
 
         workflow_context = WorkflowExecutionContext(workflow, self._app_instance_repo_class(saved_state.app_instances),
-                                                    workflow_execution_id, resumed=True, user=user)
+                                                    workflow_execution_id, resumed=True, user=user, index=index)
         return workflow_context
 
     def execute(self, workflow_id, workflow_execution_id, start, start_arguments=None, resume=False,
@@ -190,38 +425,129 @@ class WorkflowExecutor(object):
         if workflow_status.status == WorkflowStatusEnum.aborted:
             return
 
-        workflow = self.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+        plan = self.get_execution_plan(workflow_id)
 
+        if plan is None:
+            logger.error('Attempted to execute workflow {}, but no such workflow found'.format(workflow_id))
+            return
+
+        workflow = plan.workflow
         if not workflow.is_valid:
             logger.error('Workflow is invalid, yet executor attempted to execute.')
             return
 
         if resume:
-            workflow_context = self.make_resumed_context(workflow, workflow_execution_id, user)
+            workflow_context = self.make_resumed_context(workflow, workflow_execution_id, user, index=plan.index)
             if workflow_context is None:
                 return
         else:
-            workflow_context = self.make_new_context(workflow, workflow_execution_id, user)
+            workflow_context = self.make_new_context(workflow, workflow_execution_id, user, index=plan.index)
 
         start = start if start else workflow.start
 
+        with self.track_thread(workflow_context):
+            action_execution_strategy = make_execution_strategy(self.config, workflow_context)
+            workflow_execution_strategy = self.make_workflow_execution_strategy(workflow, action_execution_strategy)
+            workflow_execution_strategy.execute(workflow_context, start=start,
+                                                start_arguments=start_arguments, resume=resume,
+                                                environment_variables=environment_variables)
+            self.log_pure_results(workflow_context, action_execution_strategy)
+
+    @staticmethod
+    def log_pure_results(workflow_context, action_execution_strategy):
+        """Logs how often the results of pure Conditions and Transforms were reused during an execution
+
+        Args:
+            workflow_context (WorkflowExecutionContext): The context of the executed workflow
+            action_execution_strategy: The strategy the actions were executed with
+        """
+        pure_results = getattr(action_execution_strategy, 'pure_results', None)
+        if pure_results is None or not (pure_results.hits or pure_results.misses):
+            return
+        logger.debug('Workflow {0} (execution {1}) reused {2} results of pure conditions and transforms and '
+                     'computed {3}'.format(workflow_context.name, workflow_context.execution_id, pure_results.hits,
+                                           pure_results.misses))
+
+    def make_workflow_execution_strategy(self, workflow, action_execution_strategy):
+        """Makes the strategy a Workflow is executed with
+
+        Args:
+            workflow (Workflow): The Workflow to execute
+            action_execution_strategy: The strategy with which to execute the actions
+
+        Returns:
+            The strategy with which to execute the Workflow
+        """
+        strategy = self.workflow_execution_strategies[workflow.execution_strategy]
+        if strategy is ParallelWorkflowExecutionStrategy:
+            return strategy(action_execution_strategy, max_actions=self.config.WORKFLOW_PARALLEL_ACTIONS,
+                            track_thread=self.track_action_thread)
+        return strategy(action_execution_strategy)
+
+    @contextmanager
+    def track_thread(self, workflow_context):
+        """Associates the current thread with an executing workflow, so that the events sent from it are attributed
+            to the workflow
+
+        Args:
+            workflow_context (WorkflowExecutionContext): The context of the executing workflow
+        """
+        thread_name = threading.current_thread().name
         with self._lock:
-            self.executing_workflows[threading.current_thread().name] = workflow_context
+            self.executing_workflows[thread_name] = workflow_context
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.executing_workflows.pop(thread_name, None)
+
+    @contextmanager
+    def track_action_thread(self, workflow_context):
+        """Associates the current thread with the workflow whose Action it is executing, so that the events sent
+            from it are attributed to the workflow without counting it as another executing workflow
 
-        action_execution_strategy = make_execution_strategy(self.config, workflow_context)
-        workflow_execution_strategy = self.workflow_execution_strategies['serial'](action_execution_strategy)
-        workflow_execution_strategy.execute(workflow_context, start=start,
-                                            start_arguments=start_arguments, resume=resume,
-                                            environment_variables=environment_variables)
+        Args:
+            workflow_context (WorkflowExecutionContext): The context of the executing workflow
+        """
+        thread_name = threading.current_thread().name
+        with self._lock:
+            self.action_threads[thread_name] = workflow_context
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.action_threads.pop(thread_name, None)
+
+    def get_execution_plan(self, workflow_id):
+        """Gets the execution plan of a Workflow, from the execution plan cache if there is one
+
+        Args:
+            workflow_id (UUID): The ID of the Workflow
+
+        Returns:
+            (ExecutionPlan): The execution plan, or None if the Workflow does not exist
+        """
+        if self.plan_cache is not None:
+            return self.plan_cache.get(workflow_id)
+        workflow = self.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+        return ExecutionPlan(workflow) if workflow is not None else None
+
+    def get_executing_count(self):
+        """Gets the number of workflows being executed
+
+        Returns:
+            (int): The number of workflows being executed
+        """
         with self._lock:
-            self.executing_workflows.pop(threading.current_thread().name)
+            return len(self.executing_workflows)
 
     def get_current_workflow(self):
         with self._lock:
-            if threading.currentThread().name in self.executing_workflows:
-                return self.executing_workflows[threading.currentThread().name]
+            thread_name = threading.currentThread().name
+            if thread_name in self.executing_workflows:
+                return self.executing_workflows[thread_name]
             else:
-                return None
+                return self.action_threads.get(thread_name)
 
     def get_workflow_by_execution_id(self, workflow_execution_id):
         with self._lock:
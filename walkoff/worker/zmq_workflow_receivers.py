@@ -1,4 +1,5 @@
 import logging
+import time
 from collections import namedtuple
 
 import zmq
@@ -7,6 +8,7 @@ from google.protobuf.json_format import MessageToDict
 from google.protobuf.message import DecodeError
 from nacl.exceptions import CryptoError
 from nacl.public import Box
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
 from zmq import ZMQError
 
 import walkoff.cache
@@ -14,10 +16,15 @@ import walkoff.config
 from walkoff.executiondb.argument import Argument
 from walkoff.executiondb.environment_variable import EnvironmentVariable
 from walkoff.multiprocessedexecutor.protoconverter import ProtobufWorkflowCommunicationConverter
+from walkoff.multiprocessedexecutor.requestqueue import in_flight_key, heartbeat_key, redeliveries_key, \
+    make_worker_queue_id, get_workflow_priority, record_wait_times, LaneScheduler
 from walkoff.proto.build.data_pb2 import CommunicationPacket, WorkflowControl, ExecuteWorkflowMessage
 
 logger = logging.getLogger(__name__)
 
+min_error_backoff = 0.5
+max_error_backoff = 30
+
 
 class WorkerCommunicationMessageType(Enum):
     workflow = 1
@@ -112,7 +119,8 @@ class ZmqWorkflowCommunicationReceiver(object):
 
 
 class WorkflowReceiver(object):
-    def __init__(self, key, server_key, cache_config):
+    def __init__(self, key, server_key, cache_config, dispatch_mode=None, dispatch_timeout=None, reliable=None,
+                 worker_id=None, lane_scheduler=None):
         """Initializes a WorkflowReceiver object, which receives workflow execution requests and ships them off to a
             worker to execute
 
@@ -120,14 +128,48 @@ class WorkflowReceiver(object):
             key (PrivateKey): The NaCl PrivateKey generated by the Worker
             server_key (PrivateKey): The NaCl PrivateKey generated by the Worker
             cache_config (dict): Cache configuration
+            dispatch_mode (str, optional): Either 'blocking' or 'polling'. Defaults to the WORKFLOW_DISPATCH_MODE
+                configuration value
+            dispatch_timeout (int, optional): The maximum number of seconds to block on the request queue in
+                'blocking' mode. Defaults to the WORKFLOW_DISPATCH_TIMEOUT configuration value
+            reliable (bool, optional): Should requests be held in an in-flight list until they are acknowledged, so
+                that they can be redelivered if this worker dies? Defaults to the RELIABLE_WORKFLOW_QUEUE configuration
+                value
+            worker_id (str, optional): The ID used for this worker's in-flight list and heartbeat. Defaults to an ID
+                made from the host name and process ID
+            lane_scheduler (LaneScheduler, optional): Decides the order in which the priority lanes are read. Defaults
+                to a LaneScheduler using the WORKFLOW_QUEUE_SCHEDULING and WORKFLOW_QUEUE_WEIGHTS configuration values
         """
         self._ready = False
         self._exit = False
 
         self.key = key
         self.server_key = server_key
+        self.box = Box(self.key, self.server_key)
         self.cache = walkoff.cache.make_cache(cache_config)
 
+        self.dispatch_mode = dispatch_mode or walkoff.config.Config.WORKFLOW_DISPATCH_MODE
+        if self.dispatch_mode not in ('blocking', 'polling'):
+            logger.error('Unknown workflow dispatch mode {}. Using blocking dispatch'.format(self.dispatch_mode))
+            self.dispatch_mode = 'blocking'
+        self.dispatch_timeout = (dispatch_timeout if dispatch_timeout is not None
+                                 else walkoff.config.Config.WORKFLOW_DISPATCH_TIMEOUT)
+        cache_timeout = (cache_config or {}).get('timeout', 0)
+        if self.is_blocking and 0 < cache_timeout <= self.dispatch_timeout:
+            logger.error('Workflow dispatch timeout {0} must be less than the cache timeout {1}. '
+                         'Using a dispatch timeout of {2}'.format(self.dispatch_timeout, cache_timeout,
+                                                                  max(int(cache_timeout) - 1, 1)))
+            self.dispatch_timeout = max(int(cache_timeout) - 1, 1)
+
+        self.reliable = reliable if reliable is not None else walkoff.config.Config.RELIABLE_WORKFLOW_QUEUE
+        self.worker_id = worker_id or make_worker_queue_id()
+        self.in_flight_key = in_flight_key(self.worker_id)
+        self.heartbeat_key = heartbeat_key(self.worker_id)
+        self._in_flight = {}
+        self._error_backoff = 0
+        self.lane_scheduler = lane_scheduler or LaneScheduler(walkoff.config.Config.WORKFLOW_QUEUE_SCHEDULING,
+                                                              walkoff.config.Config.WORKFLOW_QUEUE_WEIGHTS)
+
         if self.check_status():
             self._ready = True
 
@@ -145,44 +187,157 @@ class WorkflowReceiver(object):
     def receive_workflows(self):
         """Receives requests to execute workflows, and sends them off to worker threads"""
         logger.info('Starting workflow receiver')
-        box = Box(self.key, self.server_key)
         while not self._exit:
-            received_message = self.cache.rpop("request_queue")
-            if received_message is not None:
-                try:
-                    decrypted_msg = box.decrypt(received_message)
-                except CryptoError:
-                    logger.error('Worker could not decrypt received workflow message')
-                    continue
-                try:
-                    message = ExecuteWorkflowMessage()
-                    message.ParseFromString(decrypted_msg)
-                except DecodeError:
-                    logger.error('Workflow could not decode received workflow message')
-                else:
-                    start = message.start if hasattr(message, 'start') else None
-
-                    start_arguments = []
-                    if hasattr(message, 'arguments'):
-                        for arg in message.arguments:
-                            start_arguments.append(
-                                Argument(**(MessageToDict(arg, preserving_proto_field_name=True))))
-
-                    env_vars = []
-                    if hasattr(message, 'environment_variables'):
-                        for env_var in message.environment_variables:
-                            env_vars.append(
-                                EnvironmentVariable(**(MessageToDict(env_var, preserving_proto_field_name=True))))
-
-                    user = None
-                    if hasattr(message, 'user'):
-                        user = message.user
-
-                    yield message.workflow_id, message.workflow_execution_id, start, start_arguments, message.resume, \
-                          env_vars, user
+            workflows = self.receive_workflow_batch(1)
+            if workflows:
+                yield workflows[0]
             else:
                 yield None
         return
 
+    def receive_workflow_batch(self, count):
+        """Receives up to a number of requests to execute workflows in a single round trip to the cache
+
+        The priority lanes are read in the order given by the lane scheduler. In 'blocking' mode this waits for the
+        first request to arrive, then takes up to count - 1 more requests which are already waiting in the lanes.
+
+        Args:
+            count (int): The maximum number of requests to receive
+
+        Returns:
+            (list[tuple]): The decoded workflow execution requests, oldest first. Requests which could not be
+                decrypted or decoded are dropped
+        """
+        workflows = []
+        wait_times = []
+        now = time.time()
+        for received_message in self._pop_requests(count):
+            message = self._parse_request(received_message)
+            if self.reliable:
+                if message is None:
+                    self.cache.lrem(self.in_flight_key, received_message, count=-1)
+                else:
+                    self._in_flight[message.workflow_execution_id] = received_message
+            if message is not None:
+                workflows.append(self._format_request(message))
+                if message.enqueued_at:
+                    wait_times.append((get_workflow_priority(message.priority), now - message.enqueued_at))
+        if wait_times:
+            try:
+                record_wait_times(self.cache, wait_times)
+            except (RedisTimeoutError, RedisConnectionError):
+                logger.exception('Workflow receiver could not record request queue wait times')
+        return workflows
+
+    def acknowledge(self, workflow_execution_id):
+        """Acknowledges that a workflow execution request has been handled, removing it from the in-flight list
+
+        Args:
+            workflow_execution_id (str): The execution ID of the workflow
+        """
+        received_message = self._in_flight.pop(workflow_execution_id, None)
+        if received_message is None:
+            return
+        try:
+            self.cache.lrem(self.in_flight_key, received_message, count=-1)
+            self.cache.delete(redeliveries_key(workflow_execution_id))
+        except (RedisTimeoutError, RedisConnectionError):
+            logger.exception('Workflow receiver could not acknowledge workflow {}'.format(workflow_execution_id))
+
+    def send_heartbeat(self):
+        """Marks this worker as alive for WORKFLOW_VISIBILITY_TIMEOUT seconds"""
+        try:
+            self.cache.set(self.heartbeat_key, 1, expire=walkoff.config.Config.WORKFLOW_VISIBILITY_TIMEOUT * 1000)
+        except (RedisTimeoutError, RedisConnectionError):
+            logger.exception('Workflow receiver could not send heartbeat')
+
+    def _parse_request(self, received_message):
+        if not isinstance(received_message, bytes):
+            received_message = received_message.encode('utf-8')
+        try:
+            decrypted_msg = self.box.decrypt(received_message)
+        except CryptoError:
+            logger.error('Worker could not decrypt received workflow message')
+            return None
+        try:
+            message = ExecuteWorkflowMessage()
+            message.ParseFromString(decrypted_msg)
+        except DecodeError:
+            logger.error('Workflow could not decode received workflow message')
+            return None
+        return message
+
+    @staticmethod
+    def _format_request(message):
+        start = message.start if hasattr(message, 'start') else None
+
+        start_arguments = []
+        if hasattr(message, 'arguments'):
+            for arg in message.arguments:
+                start_arguments.append(
+                    Argument(**(MessageToDict(arg, preserving_proto_field_name=True))))
+
+        env_vars = []
+        if hasattr(message, 'environment_variables'):
+            for env_var in message.environment_variables:
+                env_vars.append(
+                    EnvironmentVariable(**(MessageToDict(env_var, preserving_proto_field_name=True))))
+
+        user = None
+        if hasattr(message, 'user'):
+            user = message.user
+
+        return message.workflow_id, message.workflow_execution_id, start, start_arguments, message.resume, \
+            env_vars, user
+
+    @property
+    def is_blocking(self):
+        return self.dispatch_mode == 'blocking'
+
+    def _pop_requests(self, count):
+        if count < 1:
+            return []
+        try:
+            received_messages = self._pop_from_queue(count)
+        except (RedisTimeoutError, RedisConnectionError):
+            # Back off so that an unreachable cache is not retried in a tight loop
+            self._error_backoff = min(max(self._error_backoff * 2, min_error_backoff), max_error_backoff)
+            logger.exception('Workflow receiver could not pop from the request queue. Retrying in {} seconds'.format(
+                self._error_backoff))
+            time.sleep(self._error_backoff)
+            return []
+        self._error_backoff = 0
+        return received_messages
+
+    def _pop_from_queue(self, count):
+        lanes = self.lane_scheduler.next_order()
+        if self.is_blocking and not self.reliable:
+            # BRPOP pops from the first non-empty lane in the order given
+            response = self.cache.brpop(lanes, timeout=self.dispatch_timeout)
+            if response is None:
+                return []
+            return [response[1]] + self._pop_from_lanes(lanes, count - 1)
+        received_messages = self._pop_from_lanes(lanes, count)
+        if received_messages or not self.is_blocking:
+            return received_messages
+        # BRPOPLPUSH can only wait on a single list, so wait on the first lane for at most a second before the
+        # lanes are polled again
+        first = self.cache.brpoplpush(lanes[0], self.in_flight_key, timeout=min(self.dispatch_timeout, 1))
+        if first is None:
+            return []
+        return [first] + self._pop_from_lanes(lanes, count - 1)
+
+    def _pop_from_lanes(self, lanes, count):
+        received_messages = []
+        for lane in lanes:
+            remaining = count - len(received_messages)
+            if remaining < 1:
+                break
+            if self.reliable:
+                received_messages.extend(self.cache.rpoplpush_multiple(lane, self.in_flight_key, remaining))
+            else:
+                received_messages.extend(self.cache.rpop_multiple(lane, remaining))
+        return received_messages
+
     def is_ready(self):
         return self._ready